@@ -8,8 +8,28 @@ e suas classes relacionadas de maneira simplificada.
 
 Classes e Objetos Disponíveis:
     - `LexicalAnalyzer`: Classe responsável por realizar a análise léxica do código-fonte.
-    - `SymbolTable`: Classe que implementa a tabela de símbolos para armazenamento e gerenciamento de identificadores.
+    - `SymbolTable`: Classe que implementa a tabela de símbolos, com escopos, para armazenamento e gerenciamento de identificadores.
+    - `TokenCursor`: Cursor com antecipação e recuo sobre os tokens, criado por `LexicalAnalyzer.cursor`; `UnexpectedToken` é o erro de `expect`.
+    - `Diagnostic`: Problema encontrado no código fonte, registrado em vez de impresso.
+    - `DiagnosticBuffer`: Buffer limitado dos erros léxicos, com a política de tratamento; `LexicalError` interrompe a análise.
+    - `InternPool`: Conjunto de lexemas internados, compartilhável entre analisadores.
     - `TokenType`: Classe que representa os diferentes tipos de tokens suportados.
+    - `Token`: Token específico, com seu lexema (ou padrão regex) e tipo.
+    - `TokenSpec`: Especificação declarativa de uma tabela de tokens; `LPD` e `DIALECTS` reúnem as disponíveis.
+    - `Scanner`: Motor de varredura de passagem única utilizado por `LexicalAnalyzer.scan`.
+    - `Profiler`: Instrumentação opcional das etapas da análise (veja `LexicalAnalyzer.enable_profiling`).
+    - `TokenStream`: Sequência de tokens em colunas compactas, produzida por `LexicalAnalyzer.scan_stream`.
+    - `SourceIndex`: Índice das linhas de um código fonte, com conversão de posições em linha, coluna e bytes.
+    - `Span`: Posição de um token em caracteres, linhas, colunas e bytes.
 """
 
-from .analyzer import LexicalAnalyzer, SymbolTable, TokenType
+from .analyzer import LexicalAnalyzer, SymbolTable
+from .cursor import TokenCursor, UnexpectedToken
+from .diagnostics import Diagnostic, DiagnosticBuffer, LexicalError
+from .interning import InternPool
+from .profiling import Profiler
+from .scanner import Scanner
+from .source import SourceIndex, Span
+from .spec import DIALECTS, LPD, TokenSpec
+from .stream import TokenStream
+from .tokens import Token, TokenType
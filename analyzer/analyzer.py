@@ -5,266 +5,739 @@ Este módulo implementa o analisador léxico para a linguagem LPD (Linguagem de
 O analisador léxico é responsável por processar o código-fonte e identificar tokens, seus tipos, 
 e estruturas léxicas, fornecendo suporte para análise posterior no processo de compilação.
 
+A tabela de tokens de cada analisador é construída a partir de uma especificação declarativa
+(`analyzer.spec.TokenSpec`, por padrão `LPD`). `TokenType` e `Token` são definidos em
+`analyzer.tokens` e também podem ser importados deste módulo.
+
+Os erros léxicos (lexemas desconhecidos, literais de texto e comentários não fechados) são
+registrados, com linha e coluna, em `LexicalAnalyzer.diagnostics`, conforme a política escolhida
+na construção (veja `analyzer.diagnostics.DiagnosticBuffer`).
+
+Um analisador sintático pode consumir os tokens sob demanda, com antecipação e recuo limitados, por
+meio de `LexicalAnalyzer.cursor` (veja `analyzer.cursor.TokenCursor`).
+
 Classes:
-    - TokenType: Representa um tipo genérico de token.
-    - Token: Representa um token específico com seu valor (lexema) e tipo.
     - LexicalAnalyzer: Realiza a análise léxica, identificando tokens em código fonte.
     - SymbolTable: Implementa uma tabela de símbolos para gerenciamento de identificadores.
 """
 
-from typing import Union, Optional
+from typing import IO, Iterator, Union, Optional
+from mmap import ACCESS_READ, mmap as memory_map
+import codecs
+import os
 import re
+import sys
+import time
+
+from .cursor import TokenCursor
+from .diagnostics import Diagnostic, DiagnosticBuffer, LexicalError
+from .interning import InternPool
+from .profiling import Profiler
+from .scanner import NEWLINE_CHARS, Scanner, blank_comments, compile_patterns, count_breaks, find_boundary
+from .source import SourceIndex
+from .spec import LPD, TokenSpec
+from .stream import TokenStream
+from .tokens import ERROR_TOKEN, Token, TokenType
+
+# Lexemas formados apenas por letras, dígitos e `_`; os demais lexemas literais são operadores.
+_WORD = re.compile(r"\w+")
 
-# Define um tipo de token, que representa uma categoria de lexemas
-class TokenType:
+class LexicalAnalyzer:
     """
-    Representa o tipo de um token, armazenando seu nome.
+    Implementa o analisador léxico para identificar tokens em um código fonte.
 
     Attributes:
-        name (str): O nome que descreve o tipo do token.
+        spec (TokenSpec): Especificação a partir da qual `tokens` foi construída.
+        tokens (list[Token]): Lista de tokens disponíveis para análise, em ordem de prioridade.
+        case_sensitive (bool): Indica se as palavras reservadas diferenciam maiúsculas de minúsculas.
+        operators (tuple[str, ...]): Operadores de mais de um caractere de `tokens`, reconhecidos como um único lexema.
+        word_pattern (re.Pattern): Expressão que separa os lexemas de cada linha em `tokenize`.
+        scanner (Scanner): Motor de varredura de passagem única construído a partir de `tokens`.
+        intern_pool (InternPool): Conjunto em que os lexemas do resultado são internados, compartilhado com `scanner`.
+        index_fingerprint (str): Impressão digital de `tokens` no momento da construção dos índices.
+        literal_index (dict): Índice `lexema -> (posição, Token)` dos tokens literais.
+        pattern_tokens (list[tuple[int, Token]]): Tokens identificados por regex, com sua posição em `tokens`.
+        profiler (Profiler | None): Instrumentação das etapas da análise, ou `None` se desativada.
+        unterminated_comment (tuple[int, int] | None): Linha e coluna (a partir de 1) do `{` de um
+            comentário não fechado encontrado pela última análise, ou `None`.
+        diagnostics (DiagnosticBuffer): Erros léxicos da última análise e a política de tratamento,
+            compartilhado com `scanner`.
     """
-    def __init__(self, name: str) -> None:
+    def __init__(self, intern_pool: Optional[InternPool] = None, spec: Optional[TokenSpec] = None,
+                 error_policy: str = "skip", max_errors: int = 1, max_diagnostics: int = 100) -> None:
         """
-        Inicializa um novo tipo de token.
+        Inicializa o analisador léxico com os tokens suportados.
 
         Args:
-            name (str): O nome que descreve o tipo do token.
+            intern_pool (InternPool | None): Conjunto de lexemas internados, que pode ser compartilhado
+                entre analisadores (padrão: um conjunto exclusivo). Com `InternPool(limit=0)`, os
+                lexemas não são internados.
+            spec (TokenSpec | None): Especificação da tabela de tokens (padrão: `LPD`). A tabela
+                compilada é compartilhada entre os analisadores; cada um recebe uma cópia da lista,
+                de modo que inserir ou remover tokens não afeta os demais.
+            error_policy (str): Tratamento dos lexemas desconhecidos: `"skip"` os descarta, `"token"`
+                os emite com o tipo `serro` (`ERROR_TOKEN`) e `"abort"` interrompe a análise com um
+                `LexicalError`. Em todos os casos, os erros são registrados em `diagnostics`.
+            max_errors (int): Quantidade de erros que interrompe a análise com a política `"abort"`.
+            max_diagnostics (int): Quantidade máxima de diagnósticos guardados por análise; os
+                excedentes são apenas contados.
+
+        Raises:
+            ValueError: Se a política de erros ou os limites forem inválidos.
         """
-        self.name = name
-
-    def __str__(self) -> str:
-        """Retorna o nome do tipo do token como string."""
-        return self.name  
-    
-    def __repr__(self) -> str:
-        """Retorna a representação textual do tipo do token."""
-        return self.name
+        self.spec = LPD if spec is None else spec
+        self.tokens = list(self.spec.compile())
+        self.case_sensitive = self.spec.case_sensitive
+        self.intern_pool = InternPool() if intern_pool is None else intern_pool
+        self.scanner = Scanner(self.classify, pool=self.intern_pool)
+        self.diagnostics = self.scanner.diagnostics = DiagnosticBuffer(error_policy, max_diagnostics, max_errors)
+        self.profiler = None
+        self.unterminated_comment = None
+        self.build_index()
+
+    def build_index(self) -> None:
+        """
+        Constrói os índices de classificação a partir de `self.tokens`.
 
-class Token:
-    """
-    Representa um token específico com seu lexema e tipo, incluindo o uso de regex.
+        Palavras reservadas, operadores e delimitadores são indexados em um dicionário, de modo que
+        a classificação exige uma única consulta; apenas identificadores, números e textos recorrem
+        aos padrões regex. Os operadores de mais de um caractere determinam as expressões que
+        separam os lexemas, tanto em `tokenize` quanto no `Scanner`. Deve ser chamado novamente caso
+        `self.tokens` ou `self.case_sensitive` seja alterado (veja `ensure_index`).
+        """
+        self._index_key = self._table_key()
+        self._index_fingerprint = None
+        self.literal_index = {}
+        self.pattern_tokens = []
+        operators = set()
+        for position, token in enumerate(self.tokens):
+            lexeme = token.lexeme
+            if token.use_regex:
+                self.pattern_tokens.append((position, token))
+                continue
+            if isinstance(lexeme, str):
+                if not self.case_sensitive:
+                    lexeme = lexeme.lower()
+                if len(lexeme) > 1 and _WORD.fullmatch(lexeme) is None:
+                    operators.add(lexeme)
+            self.literal_index.setdefault(lexeme, (position, token))
+            # As palavras reservadas e os operadores do resultado passam a ser o próprio lexema do token.
+            self.intern_pool.add(token.lexeme)
+        self.operators = tuple(sorted(operators))
+        self.word_pattern = compile_patterns(self.operators)[0]
+        self.scanner.set_operators(self.operators)
+
+    def _table_key(self) -> tuple:
+        """
+        Retorna a descrição da tabela de tokens usada para detectar alterações.
 
-    Attributes:
-        lexeme (str | int): O valor literal ou padrão do token.
-        type (TokenType): O tipo do token, representado por um objeto `TokenType`.
-        use_regex (bool): Indica se o token deve ser identificado por regex.
-    """
-    # Define os principais tipos de tokens suportados
-    SPROGRAM = TokenType("sprogram")
-    SBEGIN = TokenType("sbegin")
-    SEND = TokenType("send")
-    SPROCEDURE = TokenType("sprocedure")
-    SFUNCTION = TokenType("sfunction")
-    SIF = TokenType("sif")
-    STHEN = TokenType("sthen")
-    SELSE = TokenType("selse")
-    SWHILE = TokenType("swhile")
-    SDO = TokenType("sdo")
-    SREPEAT = TokenType("srepeat")
-    SUNTIL = TokenType("suntil")
-    SATRIBUICAO = TokenType("satribuição")
-    SWRITEC = TokenType("swritec")
-    SWRITED = TokenType("swrited")
-    SREADC = TokenType("sreadc")
-    SREADD = TokenType("sreadd")
-    SVAR = TokenType("svar")
-    SINT = TokenType("sint")
-    SFLOAT = TokenType("sfloat")
-    SCHAR = TokenType("schar")
-    SIDENTIFICADOR = TokenType("sidentificador")
-    SNUMERO = TokenType("snúmero")
-    SPONTO = TokenType("sponto")
-    SPONTO_VIRGULA = TokenType("sponto_virgula")
-    SVIRGULA = TokenType("svírgula")
-    SABRE_PARENTESES = TokenType("sabre_parênteses")
-    SFECHA_PARENTESES = TokenType("sfecha_parênteses")
-    SABRE_COLCHETE = TokenType("sabre_colchete")
-    SFECHA_COLCHETE = TokenType("sfecha_colchete")
-    SAND = TokenType("sand")
-    SOR = TokenType("sor")
-    SNOT = TokenType("snot")
-    SMAIOR = TokenType("smaior")
-    SMENOR = TokenType("smenor")
-    SIGUAL = TokenType("sigual")
-    SDIFERENTE = TokenType("sdiferente")
-    SMAIOR_IGUAL = TokenType("smaior_igual")
-    SMENOR_IGUAL = TokenType("smenor_igual")
-    SMAIS = TokenType("smais")
-    SMENOS = TokenType("smenos")
-    SVEZES = TokenType("svezes")
-    SDIV = TokenType("sdiv")
-    SDIV_FLUTUANTE = TokenType("sdiv_flutuante")
-    STEXTO = TokenType("stexto")
-
-    def __init__(self, lexeme: Union[str, int], ttype: TokenType, use_regex=False) -> None:
-        """
-        Inicializa um token específico.
+        Returns:
+            tuple: Lexema, nome do tipo e modo de reconhecimento de cada token, seguidos de `case_sensitive`
+            quando as palavras reservadas não diferenciam maiúsculas de minúsculas.
+        """
+        key = tuple((token.lexeme, token.type.name, token.use_regex) for token in self.tokens)
+        return key if self.case_sensitive else key + (False,)
+
+    @property
+    def index_fingerprint(self) -> str:
+        """Impressão digital da tabela de tokens no momento da construção dos índices, calculada na primeira consulta."""
+        if self._index_fingerprint is None:
+            self._index_fingerprint = self._digest(self._index_key)
+        return self._index_fingerprint
+
+    @staticmethod
+    def _digest(key: tuple) -> str:
+        """
+        Calcula o resumo hexadecimal de uma descrição da tabela de tokens.
 
         Args:
-            lexeme (str | int): O valor literal ou padrão do token.
-            ttype (TokenType): O tipo do token.
-            use_regex (bool): Indica se o token será identificado por regex.
+            key (tuple): Descrição retornada por `_table_key`.
+
+        Returns:
+            str: Resumo hexadecimal.
         """
-        self.lexeme = lexeme
-        self.type = ttype
-        self.use_regex = use_regex
+        # Importado apenas quando necessário: carregar o `hashlib` custa alguns milissegundos a cada
+        # execução da linha de comando, e a impressão digital só é usada pelo cache.
+        import hashlib
+
+        digest = hashlib.blake2b(digest_size=16)
+        for entry in key:
+            digest.update(repr(entry).encode("utf-8"))
+        return digest.hexdigest()
 
-    def is_(self, tk: Union[str, int]):
+    def fingerprint(self) -> str:
         """
-        Verifica se o lexema do token corresponde ao valor fornecido.
+        Calcula uma impressão digital da tabela de tokens.
+
+        A impressão digital muda sempre que um token é adicionado, removido, reordenado ou tem
+        seu lexema, tipo ou modo de reconhecimento alterado, e quando `case_sensitive` muda.
+
+        Returns:
+            str: Resumo hexadecimal da tabela de tokens.
+        """
+        key = self._table_key()
+        return self.index_fingerprint if key == self._index_key else self._digest(key)
+
+    def ensure_index(self) -> str:
+        """
+        Reconstrói os índices de classificação caso `self.tokens` tenha sido alterado.
+
+        Returns:
+            str: Impressão digital atual da tabela de tokens.
+        """
+        if self._table_key() != self._index_key:
+            self.build_index()
+        return self.index_fingerprint
+
+    def enable_profiling(self, profiler: Optional[Profiler] = None) -> Profiler:
+        """
+        Ativa a instrumentação de `tokenize`, `scan`, `tokenize_file` e `iter_tokens`.
 
         Args:
-            tk (str | int): O valor a ser comparado.
+            profiler (Profiler | None): Perfil que recebe as medições (padrão: um novo `Profiler`).
 
         Returns:
-            bool: `True` se corresponder, `False` caso contrário.
+            Profiler: O perfil ativo.
         """
-        if self.use_regex:
-            return re.match(self.lexeme, tk, re.I) is not None
-        return self.lexeme == tk
+        self.profiler = profiler or Profiler()
+        return self.profiler
 
-    def __str__(self) -> str:
-        """Retorna o nome do tipo do token."""
-        return self.type.name
+    def disable_profiling(self) -> Optional[Profiler]:
+        """
+        Desativa a instrumentação.
 
-class LexicalAnalyzer:
-    """
-    Implementa o analisador léxico para identificar tokens em um código fonte.
+        Returns:
+            Profiler | None: O perfil que estava ativo, com as medições acumuladas.
+        """
+        profiler, self.profiler = self.profiler, None
+        return profiler
 
-    Attributes:
-        tokens (list[Token]): Lista de tokens disponíveis para análise.
-    """
-    def __init__(self) -> None:
+    def classify(self, lexeme: Union[str, int]) -> Optional[Token]:
         """
-        Inicializa o analisador léxico com os tokens suportados.
+        Classifica um lexema, respeitando a ordem de prioridade de `self.tokens`.
+
+        Args:
+            lexeme (str | int): O lexema a ser classificado.
+
+        Returns:
+            Optional[Token]: O primeiro token correspondente ou `None`.
         """
-        self.tokens = [
-            Token("and", Token.SAND),
-            Token("or", Token.SOR),
-            Token("not", Token.SNOT),
-            Token("==", Token.SIGUAL),
-            Token("<>", Token.SDIFERENTE),
-            Token(">=", Token.SMAIOR_IGUAL),
-            Token("<=", Token.SMENOR_IGUAL),
-            Token(">", Token.SMAIOR),
-            Token("<", Token.SMENOR),
-            Token("program", Token.SPROGRAM),
-            Token("begin", Token.SBEGIN),
-            Token("end", Token.SEND),
-            Token("procedure", Token.SPROCEDURE),
-            Token("function", Token.SFUNCTION),
-            Token("if", Token.SIF),
-            Token("then", Token.STHEN),
-            Token("else", Token.SELSE),
-            Token("while", Token.SWHILE),
-            Token("do", Token.SDO),
-            Token("repeat", Token.SREPEAT),
-            Token("until", Token.SUNTIL),
-            Token(":=", Token.SATRIBUICAO),
-            Token("writec", Token.SWRITEC),
-            Token("writed", Token.SWRITED),
-            Token("readc", Token.SREADC),
-            Token("readd", Token.SREADD),
-            Token("var", Token.SVAR),
-            Token("int", Token.SINT),
-            Token("float", Token.SFLOAT),
-            Token("char", Token.SCHAR),
-            Token(".", Token.SPONTO),
-            Token(";", Token.SPONTO_VIRGULA),
-            Token(",", Token.SVIRGULA),
-            Token("(", Token.SABRE_PARENTESES),
-            Token(")", Token.SFECHA_PARENTESES),
-            Token("[", Token.SABRE_COLCHETE),
-            Token("]", Token.SFECHA_COLCHETE),
-            Token("+", Token.SMAIS),
-            Token("-", Token.SMENOS),
-            Token("*", Token.SVEZES),
-            Token("div", Token.SDIV),
-            Token("/", Token.SDIV_FLUTUANTE),
-
-            # Captura identificadores alfanuméricos que começam com uma letra ou sublinhado.
-            Token(r"^[a-zA-Z_]\w*$", Token.SIDENTIFICADOR, use_regex=True),
-            
-            # Captura números inteiros ou de ponto flutuante.
-            Token(r"^\d+(\.\d+)?$", Token.SNUMERO, use_regex=True),
-            
-            # Captura literais de texto delimitados por aspas simples ou duplas.
-            Token(r"\'.{0,1}\'|\".*\"", Token.STEXTO, use_regex=True)
-        ]
+        entry = self.literal_index.get(lexeme)
+        if entry is None and not self.case_sensitive and isinstance(lexeme, str):
+            entry = self.literal_index.get(lexeme.lower())
+        limit = entry[0] if entry else len(self.tokens)
+        for position, token in self.pattern_tokens:
+            if position > limit:
+                break
+            if token.is_(lexeme):
+                return token
+        return entry[1] if entry else None
+
+    @property
+    def output_tokens(self) -> list[Token]:
+        """Tokens que podem aparecer no resultado: `tokens` e, com a política de erros `"token"`, `ERROR_TOKEN`."""
+        return self.tokens + [ERROR_TOKEN] if self.diagnostics.policy == "token" else self.tokens
+
+    def _unknown(self, lexeme: str, line_number: int, tokens: list, text: str, comment_ends: set) -> None:
+        """
+        Trata um lexema desconhecido de `tokenize` conforme a política de erros.
+
+        Args:
+            lexeme (str): Lexema desconhecido.
+            line_number (int): Linha do lexema.
+            tokens (list): Lista de tokens da análise, que recebe o token de erro com a política `"token"`.
+            text (str): Código fonte analisado, usado para calcular as colunas ao interromper a análise.
+            comment_ends (set[int]): Linhas em que terminam comentários de várias linhas (veja `Scanner.locate`).
+
+        Raises:
+            LexicalError: Se a análise deve ser interrompida pela política `"abort"`.
+        """
+        if self.scanner.report(lexeme, line_number):
+            self.scanner.locate(text, 1, comment_ends)
+            raise LexicalError(self.diagnostics)
+        if self.diagnostics.policy == "token":
+            tokens.append((lexeme, ERROR_TOKEN, line_number))
+
+    def _finish(self, comment: Optional[tuple[int, int]]) -> None:
+        """
+        Registra o comentário não fechado de uma análise, se houver, em `unterminated_comment` e nos diagnósticos.
+
+        Args:
+            comment (tuple[int, int] | None): Linha e coluna do `{` do comentário não fechado.
+
+        Raises:
+            LexicalError: Se a análise deve ser interrompida pela política `"abort"`.
+        """
+        self.unterminated_comment = comment
+        if comment is not None:
+            self.diagnostics.add("unterminated-comment", "Comentário não fechado.", *comment)
+            if self.diagnostics.exhausted:
+                raise LexicalError(self.diagnostics)
 
     def remove_comments(self, text: str) -> str:
         """
-        Remove comentários no formato `{...}` do código fonte.
+        Substitui os comentários no formato `{...}` do código fonte por espaços.
+
+        As quebras de linha dos comentários são mantidas, de modo que o resultado tem o mesmo tamanho
+        e as mesmas linhas e colunas do original. Um `{` dentro de um literal de texto não inicia um
+        comentário. A análise não utiliza este método: os comentários são descartados durante a
+        própria varredura, sem copiar o texto.
 
         Args:
             text (str): Código fonte de entrada.
 
         Returns:
-            str: Código fonte sem comentários.
+            str: Código fonte com os comentários em branco.
         """
-        return re.sub(r'\{.*?\}', '', text, flags=re.DOTALL)
+        return blank_comments(text)
 
     def tokenize(self, text: str) -> list[tuple[Union[str, int], Token, int]]:
         """
         Realiza a análise léxica, identificando tokens no código.
 
+        Os comentários são reconhecidos linha a linha e descartados, mantendo a numeração original
+        das linhas. Um comentário sem `}` se estende até o fim do texto e sua posição é registrada em
+        `self.unterminated_comment`. Os erros léxicos são registrados em `self.diagnostics`.
+
         Args:
             text (str): O código fonte a ser analisado.
 
         Returns:
             list[tuple[str, Token, int]]: Lista de tokens encontrados com a linha correspondente.
+
+        Raises:
+            LexicalError: Se a análise for interrompida pela política de erros `"abort"`.
         """
+        self.diagnostics.clear()
         tokens = []
-        text = self.remove_comments(text)
-        lines = text.splitlines()
+        comment = None
+        comment_ends = set()
+        # Com o perfil ativo, o mesmo laço mede cada etapa e o tempo de cada linha.
+        profiler = self.profiler
+        if profiler is not None:
+            clock = time.perf_counter
+            find_seconds = classify_seconds = 0.0
+            with profiler.stage("splitlines"):
+                lines = text.splitlines()
+            profiler.regex_calls += len(lines)
+        else:
+            lines = text.splitlines()
+        # `setdefault` interna o lexema; com o limite do conjunto atingido, `get` apenas reaproveita os já guardados.
+        pool = self.intern_pool
+        intern = pool.strings.setdefault if pool.enabled else pool.strings.get
+        known = len(pool)
+        findall = self.word_pattern.findall
 
         for line_number, line in enumerate(lines, start=1):
-            word_patterns = [
-                r"\w+",
-                r":=",
-                r"<>|[<>]={0,1}",
-                r"!=",
-                r"==",
-                r"\'.{0,1}\'|\".*\"",
-                r"/",
-                r"[^\s\w]"
-            ]
-            words = re.findall(r"|".join(word_patterns), line)
+            if profiler is not None:
+                start = clock()
+            position = 0
+            if comment is not None:
+                # Linha dentro de um comentário: a análise recomeça após o `}`.
+                position = line.find("}") + 1
+                if position:
+                    comment = None
+                    comment_ends.add(line_number)
+            words = findall(line, position) if comment is None else ()
+            # Um comentário não fechado é sempre o último lexema da linha.
+            if words and words[-1][0] == "{" and words[-1][-1] != "}":
+                comment = (line_number, len(line) - len(words[-1]) + 1)
+            if profiler is not None:
+                found = clock()
 
             for word in words:
-                for token in self.tokens:
-                    if token.is_(word):
-                        tokens.append((word, token, line_number))
-                        break
+                if word[0] == "{":
+                    continue
+                token = self.classify(word)
+                if token is not None:
+                    tokens.append((intern(word, word), token, line_number))
+                else:
+                    self._unknown(word, line_number, tokens, text, comment_ends)
+
+            if profiler is not None:
+                end = clock()
+                find_seconds += found - start
+                classify_seconds += end - found
+                profiler.classify_calls += sum(1 for word in words if word[0] != "{")
+                profiler.record_line(line_number, end - start, line)
+
+        if profiler is not None:
+            profiler.record("findall", find_seconds, len(lines))
+            profiler.record("classify", classify_seconds, len(lines))
+            profiler.count_tokens(tokens)
+        pool.record(len(tokens), len(pool) - known)
+        self.scanner.locate(text, 1, comment_ends)
+        self._finish(comment)
+        return tokens
+
+    def scan(self, text: str) -> list[tuple[Union[str, int], Token, int]]:
+        """
+        Realiza a análise léxica com o motor de passagem única (`Scanner`).
+
+        O resultado é idêntico ao de `tokenize`, porém o texto é percorrido uma única vez
+        por uma expressão regular pré-compilada, que também descarta os comentários, e cada lexema
+        distinto é classificado apenas uma vez.
+
+        Args:
+            text (str): O código fonte a ser analisado.
+
+        Returns:
+            list[tuple[str, Token, int]]: Lista de tokens encontrados com a linha correspondente.
+
+        Raises:
+            LexicalError: Se a análise for interrompida pela política de erros `"abort"`.
+        """
+        self.diagnostics.clear()
+        if self.profiler is not None:
+            profiler = self.profiler
+            with profiler.stage("scan"):
+                tokens = self.scanner.scan(text)
+            profiler.regex_calls += 1
+            profiler.count_tokens(tokens)
+        else:
+            tokens = self.scanner.scan(text)
+        self._finish(self.scanner.open_comment)
         return tokens
 
+    def scan_stream(self, text: str) -> TokenStream:
+        """
+        Realiza a análise léxica com o motor de passagem única, produzindo um `TokenStream`.
+
+        O resultado contém os mesmos tokens de `scan`, armazenados em colunas compactas. Os lexemas
+        são fatias do próprio texto, guardado em `TokenStream.source`, de modo que as posições
+        correspondem ao código original.
+
+        Args:
+            text (str): O código fonte a ser analisado.
+
+        Returns:
+            TokenStream: Sequência de tokens compatível com a lista de tuplas de `tokenize`. Com a
+            política de erros `"token"`, a tabela da sequência é `output_tokens`.
+
+        Raises:
+            LexicalError: Se a análise for interrompida pela política de erros `"abort"`.
+        """
+        self.diagnostics.clear()
+        table = self.output_tokens
+        stream = TokenStream(text, table)
+        positions = {id(token): position for position, token in enumerate(table)}
+        self.scanner.scan_columns(stream.source, positions, stream.type_ids, stream.lines, stream.starts, stream.ends)
+        self._finish(self.scanner.open_comment)
+        return stream
+
+    def tokenize_parallel(self, text: str, workers: Optional[int] = None, segment_size: int = 1 << 20) -> list[tuple[Union[str, int], Token, int]]:
+        """
+        Realiza a análise léxica de um código fonte grande em segmentos processados em paralelo.
+
+        O código é dividido em posições comprovadamente fora de comentários e de literais de texto,
+        os segmentos são analisados por processos distintos e os resultados são unidos com as linhas
+        corrigidas. A saída é idêntica à de `tokenize`. Veja `batch.tokenize_segments`.
+
+        Args:
+            text (str): O código fonte a ser analisado.
+            workers (int | None): Quantidade de processos (padrão: `os.cpu_count()`).
+            segment_size (int): Tamanho aproximado de cada segmento, em caracteres.
+
+        Returns:
+            list[tuple[str, Token, int]]: Lista de tokens encontrados com a linha correspondente.
+        """
+        from .batch import tokenize_segments
+
+        return tokenize_segments(text, workers, self, segment_size)
+
+    def tokenize_file(self, path: Union[str, os.PathLike], mmap: bool = True, block_size: int = 1 << 20) -> list[tuple[Union[str, int], Token, int]]:
+        """
+        Realiza a análise léxica de um arquivo.
+
+        Com `mmap=True`, o arquivo é mapeado em memória e varrido como bytes diretamente sobre o
+        buffer mapeado: apenas os lexemas emitidos são decodificados e as linhas são contadas pelas
+        quebras de linha encontradas, sem carregar o arquivo inteiro como `str`. Blocos que contêm
+        caracteres não ASCII fora de comentários são decodificados individualmente. A saída é
+        idêntica à de `tokenize` sobre o conteúdo do arquivo.
+
+        Args:
+            path (str | os.PathLike): Caminho do arquivo em UTF-8.
+            mmap (bool): Se `False`, lê o arquivo inteiro e utiliza `tokenize`.
+            block_size (int): Tamanho de cada bloco varrido no modo mapeado, em bytes.
+
+        Returns:
+            list[tuple[str, Token, int]]: Lista de tokens encontrados com a linha correspondente.
+        """
+        if not mmap:
+            with open(path, "r", encoding="utf-8") as file:
+                return self.tokenize(file.read())
+
+        tokens = []
+        self.unterminated_comment = None
+        self.diagnostics.clear()
+        start = time.perf_counter()
+        with open(path, "rb") as file:
+            # Arquivos vazios não podem ser mapeados.
+            if os.fstat(file.fileno()).st_size == 0:
+                return tokens
+            with memory_map(file.fileno(), 0, access=ACCESS_READ) as buffer:
+                self.scanner.scan_buffer(buffer, tokens, block_size)
+        self._finish(self.scanner.open_comment)
+        if self.profiler is not None:
+            self.profiler.record("scan_buffer", time.perf_counter() - start)
+            self.profiler.count_tokens(tokens)
+        return tokens
+
+    def iter_tokens(self, stream: Union[str, os.PathLike, IO], chunk_size: int = 1 << 16) -> Iterator[tuple[Union[str, int], Token, int]]:
+        """
+        Realiza a análise léxica de forma preguiçosa, lendo a entrada em blocos.
+
+        Cada bloco lido é acumulado até a última quebra de linha fora de comentários; esse trecho é
+        então varrido e seus tokens são produzidos, de modo que comentários e literais de texto que
+        atravessam o limite entre blocos são tratados corretamente. Enquanto um comentário não é
+        fechado, seu conteúdo é descartado à medida que é lido e apenas suas quebras de linha são
+        contadas, de modo que o uso de memória depende apenas de `chunk_size` e o tempo é linear
+        mesmo com um `{` sem fechamento. A saída é idêntica à de `tokenize`.
+
+        Args:
+            stream (str | os.PathLike | IO): Caminho de um arquivo ou objeto de arquivo, em modo texto
+                ou binário (UTF-8).
+            chunk_size (int): Quantidade de caracteres lidos por vez.
+
+        Yields:
+            tuple[str, Token, int]: Tokens encontrados com a linha correspondente.
+        """
+        if isinstance(stream, (str, os.PathLike)):
+            with open(stream, "r", encoding="utf-8") as file:
+                yield from self.iter_tokens(file, chunk_size)
+            return
+
+        self.unterminated_comment = None
+        self.diagnostics.clear()
+        line_number = 1
+        # Código pendente, sempre começando no início de uma linha. Dentro de um comentário não
+        # fechado, termina no `{`; do conteúdo já lido restam apenas a quantidade de quebras de
+        # linha, a coluna após a última delas e se ele termina em `\r`.
+        buffer = ""
+        opened = False
+        for chunk in _read_chunks(stream, chunk_size):
+            if not opened:
+                buffer += chunk
+                # Sem nova quebra de linha nem fechamento de comentário, não há nova posição segura.
+                if "\n" not in chunk and "}" not in chunk:
+                    continue
+                cut, opening = find_boundary(buffer)
+                if cut:
+                    tokens = []
+                    line_number = self._scan_piece(buffer[:cut], tokens, line_number)
+                    yield from tokens
+                # Um `{` seguido de uma quebra de linha está em uma linha completa e certamente
+                # inicia um comentário, cujo conteúdo pode ser descartado.
+                if opening < 0 or not count_breaks(buffer[opening:]):
+                    buffer = buffer[cut:]
+                    continue
+                chunk = buffer[opening + 1:]
+                buffer = buffer[cut:opening + 1]
+                opened, breaks, column, carriage = True, 0, 0, False
+
+            closing = chunk.find("}")
+            body = chunk if closing < 0 else chunk[:closing]
+            if body:
+                # Um `\r\n` dividido entre dois blocos é uma única quebra de linha.
+                breaks += count_breaks(body) - (carriage and body[0] == "\n")
+                last = max(body.rfind(newline) for newline in NEWLINE_CHARS)
+                column = column + len(body) if last < 0 else len(body) - last - 1
+                carriage = body[-1] == "\r"
+            if closing >= 0:
+                buffer += "\n" * breaks + " " * column + chunk[closing:]
+                opened = False
+
+        if opened:
+            buffer += "\n" * breaks + " " * column
+        if buffer:
+            tokens = []
+            self._scan_piece(buffer, tokens, line_number)
+            self._finish(self.scanner.open_comment)
+            yield from tokens
+
+    def cursor(self, stream: Union[str, os.PathLike, IO], lookahead: int = 4, backtrack: int = 64,
+               chunk_size: int = 1 << 16) -> TokenCursor:
+        """
+        Cria um cursor sobre os tokens de `iter_tokens`, para o consumo por um analisador sintático.
+
+        A entrada é lida à medida que o cursor avança, e apenas os últimos `lookahead + backtrack`
+        tokens ficam em memória (veja `analyzer.cursor.TokenCursor`).
+
+        Args:
+            stream (str | os.PathLike | IO): Caminho de um arquivo ou objeto de arquivo.
+            lookahead (int): Profundidade máxima de antecipação.
+            backtrack (int): Recuo máximo garantido para `TokenCursor.reset`.
+            chunk_size (int): Quantidade de caracteres lidos por vez.
+
+        Returns:
+            TokenCursor: Cursor posicionado no primeiro token.
+        """
+        return TokenCursor(self.iter_tokens(stream, chunk_size), lookahead, backtrack)
+
+    def _scan_piece(self, piece: str, tokens: list, line_number: int) -> int:
+        """
+        Varre um trecho de `iter_tokens`, registrando a etapa se instrumentado.
+
+        Args:
+            piece (str): Trecho que termina em uma posição segura (veja `safe_boundary`).
+            tokens (list): Lista que recebe os tokens encontrados.
+            line_number (int): Número da linha em que o trecho começa.
+
+        Returns:
+            int: Número da linha em que o próximo trecho começa.
+        """
+        if self.profiler is None:
+            return self.scanner.scan_into(piece, tokens, line_number)
+
+        profiler = self.profiler
+        with profiler.stage("scan"):
+            line_number = self.scanner.scan_into(piece, tokens, line_number)
+        profiler.regex_calls += 1
+        profiler.count_tokens(tokens)
+        return line_number
+
+
+def _read_chunks(stream: IO, chunk_size: int) -> Iterator[str]:
+    """
+    Lê um objeto de arquivo em blocos de texto, decodificando entradas binárias como UTF-8.
+
+    Args:
+        stream (IO): Objeto de arquivo em modo texto ou binário.
+        chunk_size (int): Quantidade de caracteres ou bytes lidos por vez.
+
+    Yields:
+        str: Blocos de texto consecutivos.
+    """
+    decoder = None
+    while True:
+        data = stream.read(chunk_size)
+        if not data:
+            break
+        if isinstance(data, bytes):
+            if decoder is None:
+                decoder = codecs.getincrementaldecoder("utf-8")()
+            data = decoder.decode(data)
+        if data:
+            yield data
+    if decoder is not None:
+        tail = decoder.decode(b"", final=True)
+        if tail:
+            yield tail
+
+# Tipos das rotinas, cujo identificador é declarado e abre um escopo.
+_ROUTINE_TYPES = frozenset((Token.SPROGRAM, Token.SPROCEDURE, Token.SFUNCTION))
+
+# Ação de `SymbolTable.populate` para cada tipo de token relevante; os demais tipos são ignorados.
+# Os tipos de variáveis e de rotinas são a própria ação: o tipo com que os identificadores seguintes
+# são declarados.
+_IDENTIFIER = object()
+_CLOSING = object()
+_POPULATE_ACTIONS = {
+    Token.SIDENTIFICADOR: _IDENTIFIER,
+    Token.SPONTO_VIRGULA: _CLOSING,
+    Token.SFECHA_PARENTESES: _CLOSING,
+    Token.SBEGIN: Token.SBEGIN,
+    Token.SEND: Token.SEND,
+    **{kind: kind for kind in (Token.SINT, Token.SFLOAT, Token.SCHAR, *_ROUTINE_TYPES)},
+}
+
 class SymbolTable:
     """
     Implementa a tabela de símbolos para armazenar e gerenciar identificadores.
 
+    Os símbolos ficam em uma pilha de escopos, um `dict` por escopo: abrir e fechar um escopo custa
+    O(1) e a busca percorre os escopos do mais interno para o mais externo. Os nomes declarados são
+    internados com `sys.intern`. Conflitos não são impressos: os métodos retornam se a operação foi
+    realizada e registram um `Diagnostic` em `diagnostics`.
+
     Attributes:
-        symbols (dict): Dicionário de símbolos com nome e tipo.
+        scopes (list[dict]): Pilha de escopos, do global ao atual, cada um com nome e tipo dos símbolos.
+        scope_names (list[str]): Nome da rotina de cada escopo da pilha (`""` para o global).
+        closed_scopes (list[tuple[str, dict]]): Escopos das rotinas fechados por `populate`, com seus símbolos.
+        diagnostics (list[Diagnostic]): Conflitos e usos de símbolos não declarados.
+        index (SourceIndex | None): Índice do código fonte, usado para registrar onde cada símbolo foi declarado.
     """
-    def __init__(self):
-        """Inicializa uma tabela de símbolos."""
-        self.symbols = {}
+    def __init__(self, index: Optional[SourceIndex] = None):
+        """
+        Inicializa uma tabela de símbolos com apenas o escopo global.
 
-    def add_symbol(self, name: str, type: TokenType):
+        Args:
+            index (SourceIndex | None): Índice do código fonte em que os símbolos são declarados.
         """
-        Adiciona um símbolo à tabela.
+        self.scopes = [{}]
+        self.scope_names = [""]
+        self.closed_scopes = []
+        self.diagnostics = []
+        self.index = index
+        self._sites = [{}]
+
+    @property
+    def symbols(self) -> dict:
+        """Símbolos do escopo atual, com nome e tipo."""
+        return self.scopes[-1]
+
+    @property
+    def sites(self) -> dict:
+        """Linha e coluna da declaração de cada símbolo do escopo atual adicionado com sua posição."""
+        return self._sites[-1]
+
+    @property
+    def depth(self) -> int:
+        """Quantidade de escopos abertos além do global."""
+        return len(self.scopes) - 1
+
+    def push_scope(self, name: str = "") -> None:
+        """
+        Abre um novo escopo dentro do atual.
+
+        Args:
+            name (str): Nome da rotina a que o escopo pertence.
+        """
+        self.scopes.append({})
+        self.scope_names.append(name)
+        self._sites.append({})
+
+    def pop_scope(self) -> tuple[str, dict]:
+        """
+        Fecha o escopo atual.
+
+        Returns:
+            tuple[str, dict]: Nome da rotina e símbolos do escopo fechado.
+
+        Raises:
+            IndexError: Se apenas o escopo global estiver aberto.
+        """
+        if len(self.scopes) == 1:
+            raise IndexError("O escopo global não pode ser fechado.")
+        self._sites.pop()
+        return self.scope_names.pop(), self.scopes.pop()
+
+    def add_symbol(self, name: str, type: TokenType, offset: Optional[int] = None, line: Optional[int] = None) -> bool:
+        """
+        Adiciona um símbolo ao escopo atual.
 
         Args:
             name (str): Nome do símbolo.
             type (TokenType): Tipo do símbolo.
+            offset (int | None): Posição da declaração no código fonte, registrada em `sites` quando há um `index`.
+            line (int | None): Linha da declaração, usada no diagnóstico de conflito.
+
+        Returns:
+            bool: `True` se o símbolo foi adicionado; `False` se já existia no escopo atual.
         """
-        if name not in self.symbols:
-            self.symbols[name] = type
-        else:
-            print(f"Warning: O Símbolo '{name}' já existe.")
+        scope = self.scopes[-1]
+        if name in scope:
+            self.diagnostics.append(Diagnostic("duplicate-symbol", f"O símbolo '{name}' já existe.", line))
+            return False
+        name = sys.intern(name)
+        scope[name] = type
+        if offset is not None and self.index is not None:
+            self._sites[-1][name] = self.index.position(offset)
+        return True
 
     def get_symbol(self, name: str) -> Optional[TokenType]:
         """
-        Recupera o tipo de um símbolo.
+        Recupera o tipo de um símbolo, buscando do escopo atual para o global.
 
         Args:
             name (str): Nome do símbolo.
@@ -272,17 +745,141 @@ class SymbolTable:
         Returns:
             Optional[TokenType]: Tipo do símbolo ou `None`.
         """
-        return self.symbols.get(name, None)
+        for scope in reversed(self.scopes):
+            type = scope.get(name)
+            if type is not None:
+                return type
+        return None
 
-    def update_symbol(self, name: str, new_type: TokenType):
+    def get_site(self, name: str) -> Optional[tuple[int, int]]:
         """
-        Atualiza o tipo de um símbolo na tabela.
+        Recupera a posição da declaração de um símbolo visível no escopo atual.
+
+        Args:
+            name (str): Nome do símbolo.
+
+        Returns:
+            Optional[tuple[int, int]]: Linha e coluna da declaração, ou `None`.
+        """
+        for scope, sites in zip(reversed(self.scopes), reversed(self._sites)):
+            if name in scope:
+                return sites.get(name)
+        return None
+
+    def update_symbol(self, name: str, new_type: TokenType) -> bool:
+        """
+        Atualiza o tipo de um símbolo, no escopo mais interno em que ele existe.
 
         Args:
             name (str): Nome do símbolo.
             new_type (TokenType): Novo tipo do símbolo.
+
+        Returns:
+            bool: `True` se o símbolo foi atualizado; `False` se não existia.
+        """
+        for scope in reversed(self.scopes):
+            if name in scope:
+                scope[name] = new_type
+                return True
+        self.diagnostics.append(Diagnostic("missing-symbol", f"O símbolo '{name}' não existe."))
+        return False
+
+    def populate(self, tokens) -> int:
         """
-        if name in self.symbols:
-            self.symbols[name] = new_type
+        Preenche a tabela diretamente com o resultado da análise léxica.
+
+        Os identificadores após `program`, `procedure` e `function` são declarados no escopo atual e
+        abrem o escopo da rotina, fechado pelo `end` do seu bloco e guardado em `closed_scopes`. Os
+        identificadores que seguem um tipo (`int`, `float`, `char`) até o próximo `;` ou `)` são
+        declarados com esse tipo, nas seções `var` e nos parâmetros. Os demais identificadores são
+        usos: os que não são encontrados em nenhum escopo aberto geram um diagnóstico.
+
+        Args:
+            tokens (list[tuple[str, Token, int]] | TokenStream): Resultado de `tokenize`, `scan` ou
+                `scan_stream`. Com um `TokenStream`, a posição de cada declaração é registrada em
+                `sites` e apenas os lexemas dos identificadores são criados.
+
+        Returns:
+            int: Quantidade de símbolos declarados.
+        """
+        actions = _POPULATE_ACTIONS
+        if isinstance(tokens, TokenStream):
+            # A ação de cada token é obtida pela posição do seu `Token` na tabela do analisador.
+            table_actions = [actions.get(token.type) for token in tokens.table]
+            kinds = map(table_actions.__getitem__, tokens.type_ids)
+            source, starts, ends, lines = tokens.source, tokens.starts, tokens.ends, tokens.lines
+            if self.index is None:
+                self.index = tokens.index
+            line_starts = self.index.line_starts
         else:
-            print(f"Warning: O Símbolo '{name}' não existe.")
+            kinds = (actions.get(token.type) for _, token, _ in tokens)
+            starts = line_starts = None
+        diagnostics = self.diagnostics
+        intern = sys.intern
+
+        scope, sites = self.scopes[-1], self._sites[-1]
+        # Para cada rotina aberta: profundidade de `begin` ao abri-la e se seu bloco já começou.
+        routines_open = []
+        depth = 0
+        declaring = None
+        declared = 0
+
+        for position, action in enumerate(kinds):
+            if action is None:
+                continue
+            if action is _IDENTIFIER:
+                if starts is None:
+                    lexeme, _, line = tokens[position]
+                else:
+                    lexeme, line = source[starts[position]:ends[position]], lines[position]
+                if declaring is None:
+                    if lexeme not in scope and self.get_symbol(lexeme) is None:
+                        diagnostics.append(Diagnostic("undeclared-symbol", f"O símbolo '{lexeme}' não foi declarado.",
+                                                      line, _column(starts, line_starts, position, line)))
+                    continue
+                if lexeme in scope:
+                    diagnostics.append(Diagnostic("duplicate-symbol", f"O símbolo '{lexeme}' já existe.",
+                                                  line, _column(starts, line_starts, position, line)))
+                else:
+                    lexeme = intern(lexeme)
+                    scope[lexeme] = declaring
+                    if starts is not None:
+                        sites[lexeme] = (line, starts[position] - line_starts[line - 1] + 1)
+                    declared += 1
+                if declaring in _ROUTINE_TYPES:
+                    self.push_scope(lexeme)
+                    scope, sites = self.scopes[-1], self._sites[-1]
+                    routines_open.append([depth, False])
+                    declaring = None
+            elif action is _CLOSING:
+                declaring = None
+            elif action is Token.SBEGIN:
+                if routines_open and routines_open[-1][0] == depth:
+                    routines_open[-1][1] = True
+                depth += 1
+            elif action is Token.SEND:
+                depth -= 1
+                if routines_open and routines_open[-1][1] and routines_open[-1][0] == depth:
+                    routines_open.pop()
+                    self.closed_scopes.append(self.pop_scope())
+                    scope, sites = self.scopes[-1], self._sites[-1]
+            else:
+                # Um tipo de declaração ou de rotina: os próximos identificadores são declarados com ele.
+                declaring = action
+        return declared
+
+
+def _column(starts, line_starts, position: int, line: int) -> Optional[int]:
+    """
+    Calcula a coluna de um token de `SymbolTable.populate`, quando as posições são conhecidas.
+
+    Args:
+        starts (array.array | None): Posição inicial de cada token no texto.
+        line_starts (array.array | None): Posição inicial de cada linha do texto.
+        position (int): Índice do token.
+        line (int): Linha do token.
+
+    Returns:
+        Optional[int]: Coluna do token, ou `None` sem as posições.
+    """
+    return None if starts is None else starts[position] - line_starts[line - 1] + 1
@@ -0,0 +1,399 @@
+"""
+Módulo `batch`
+
+Este módulo implementa a análise léxica de vários arquivos em paralelo, distribuindo-os entre os
+processos de um `concurrent.futures.ProcessPoolExecutor`, assim como a análise paralela de um único
+código fonte dividido em segmentos.
+
+Cada processo constrói um único `LexicalAnalyzer`, com a mesma tabela de tokens do analisador que
+iniciou o lote, e o reutiliza para todos os arquivos que receber. Os resultados são devolvidos na
+mesma ordem dos caminhos de entrada, à medida que ficam prontos, e a falha em um arquivo não
+interrompe os demais. A política de erros léxicos do analisador também é repassada aos processos,
+e os diagnósticos de cada processo são devolvidos junto com os tokens. Com um diretório de cache,
+os arquivos inalterados desde a execução anterior não são analisados novamente (ver
+`analyzer.cache`).
+
+Classes:
+    - FileResult: Resultado da análise de um único arquivo.
+    - BatchSummary: Totais acumulados de um lote (arquivos, tokens, MB/s).
+
+Funções:
+    - expand_paths(patterns): Expande diretórios e padrões glob em uma lista de arquivos.
+    - tokenize_many(paths, workers): Analisa vários arquivos em paralelo.
+    - tokenize_segments(text, workers, segment_size): Analisa um único código fonte em segmentos paralelos.
+"""
+
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Iterable, Iterator, Optional
+import glob
+import os
+import time
+
+from .analyzer import LexicalAnalyzer
+from .cache import TokenCache
+from .diagnostics import DiagnosticBuffer, LexicalError
+from .scanner import iter_blocks
+
+# Analisador reutilizado por todos os arquivos de um mesmo processo do pool.
+_worker_analyzer = None
+_worker_cache = None
+_worker_positions = {}
+
+
+class FileResult:
+    """
+    Resultado da análise léxica de um único arquivo.
+
+    Attributes:
+        path (str): Caminho do arquivo analisado.
+        tokens (list[tuple[str, Token, int]]): Tokens encontrados, vazio em caso de falha.
+        size (int): Tamanho do arquivo em bytes.
+        elapsed (float): Tempo gasto na análise, em segundos.
+        error (str | None): Mensagem de erro, caso a análise tenha falhado.
+        diagnostics (list[Diagnostic]): Erros léxicos da análise, inclusive os de uma análise
+            interrompida pela política `"abort"`.
+    """
+    def __init__(self, path: str, tokens: list, size: int, elapsed: float, error: Optional[str] = None,
+                 diagnostics: Optional[list] = None) -> None:
+        """
+        Inicializa o resultado de um arquivo.
+
+        Args:
+            path (str): Caminho do arquivo analisado.
+            tokens (list): Tokens encontrados.
+            size (int): Tamanho do arquivo em bytes.
+            elapsed (float): Tempo gasto na análise, em segundos.
+            error (str | None): Mensagem de erro, caso a análise tenha falhado.
+            diagnostics (list[Diagnostic] | None): Erros léxicos da análise.
+        """
+        self.path = path
+        self.tokens = tokens
+        self.size = size
+        self.elapsed = elapsed
+        self.error = error
+        self.diagnostics = diagnostics or []
+
+    @property
+    def ok(self) -> bool:
+        """Indica se a análise do arquivo foi concluída sem erros."""
+        return self.error is None
+
+    def __repr__(self) -> str:
+        """Retorna a representação textual do resultado."""
+        if self.error is not None:
+            return f"FileResult({self.path!r}, error={self.error!r})"
+        return f"FileResult({self.path!r}, tokens={len(self.tokens)}, elapsed={self.elapsed:.4f})"
+
+
+class BatchSummary:
+    """
+    Totais acumulados de um lote de arquivos.
+
+    Attributes:
+        files (int): Quantidade de arquivos processados.
+        failed (int): Quantidade de arquivos cuja análise falhou.
+        tokens (int): Quantidade total de tokens encontrados.
+        bytes (int): Tamanho total dos arquivos analisados com sucesso.
+        elapsed (float): Tempo total de parede do lote, em segundos.
+    """
+    def __init__(self) -> None:
+        """Inicializa um resumo vazio e começa a contagem do tempo."""
+        self.files = 0
+        self.failed = 0
+        self.tokens = 0
+        self.bytes = 0
+        self.elapsed = 0.0
+        self._start = time.perf_counter()
+
+    def add(self, result: FileResult) -> None:
+        """
+        Acumula o resultado de um arquivo.
+
+        Args:
+            result (FileResult): Resultado a ser acumulado.
+        """
+        self.files += 1
+        if result.ok:
+            self.tokens += len(result.tokens)
+            self.bytes += result.size
+        else:
+            self.failed += 1
+        self.elapsed = time.perf_counter() - self._start
+
+    @property
+    def mb_per_second(self) -> float:
+        """Vazão do lote em megabytes por segundo."""
+        return self.bytes / 1e6 / self.elapsed if self.elapsed else 0.0
+
+    def __str__(self) -> str:
+        """Retorna o resumo em uma linha."""
+        return (f"{self.files} arquivos ({self.failed} com falha), {self.tokens} tokens, "
+                f"{self.bytes / 1e6:.2f} MB em {self.elapsed:.2f}s ({self.mb_per_second:.2f} MB/s)")
+
+
+def expand_paths(patterns: Iterable[str], extension: str = ".lpd") -> list[str]:
+    """
+    Expande diretórios e padrões glob em uma lista de arquivos.
+
+    Diretórios são percorridos recursivamente em busca de arquivos com a extensão informada;
+    padrões glob aceitam `**`. Caminhos comuns são mantidos como estão, mesmo que não existam,
+    para que a falha seja reportada no resultado do arquivo.
+
+    Args:
+        patterns (Iterable[str]): Caminhos, diretórios ou padrões glob.
+        extension (str): Extensão dos arquivos procurados em diretórios.
+
+    Returns:
+        list[str]: Caminhos dos arquivos, sem repetições e na ordem em que foram encontrados.
+    """
+    paths = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            found = []
+            for directory, _, files in os.walk(pattern):
+                found.extend(os.path.join(directory, name) for name in files if name.endswith(extension))
+            paths.extend(sorted(found))
+        elif glob.has_magic(pattern):
+            paths.extend(sorted(path for path in glob.glob(pattern, recursive=True) if os.path.isfile(path)))
+        else:
+            paths.append(pattern)
+    return list(dict.fromkeys(os.path.normpath(path) for path in paths))
+
+
+def _encode(tokens: list) -> tuple:
+    """
+    Codifica tokens de forma compacta para envio entre processos.
+
+    Os lexemas são concatenados em uma única string e as posições dos objetos `Token` na tabela,
+    as linhas e os comprimentos dos lexemas são armazenados em arrays, evitando serializar uma
+    tupla por token.
+
+    Args:
+        tokens (list[tuple[str, Token, int]]): Tokens produzidos pelo analisador do processo.
+
+    Returns:
+        tuple: Lexemas concatenados, comprimentos, posições na tabela e linhas.
+    """
+    positions = _worker_positions
+    lexemes = [lexeme for lexeme, _, _ in tokens]
+    return ("".join(lexemes),
+            array("I", map(len, lexemes)),
+            array("H", [positions[id(token)] for _, token, _ in tokens]),
+            array("I", [line for _, _, line in tokens]))
+
+
+def _decode(encoded: tuple, table: list, offset: int = 0) -> list:
+    """
+    Reconstrói os tokens codificados por `_encode`, associando-os aos objetos `Token` de `table`.
+
+    Args:
+        encoded (tuple): Resultado de `_encode`.
+        table (list[Token]): Tabela de tokens do processo principal.
+        offset (int): Deslocamento somado ao número de cada linha.
+
+    Returns:
+        list[tuple[str, Token, int]]: Tokens reconstruídos.
+    """
+    text, lengths, positions, lines = encoded
+    tokens = []
+    append = tokens.append
+    start = 0
+    for length, position, line in zip(lengths, positions, lines):
+        end = start + length
+        append((text[start:end], table[position], line + offset))
+        start = end
+    return tokens
+
+
+def _init_worker(tokens: list, case_sensitive: bool = True, cache_dir: Optional[str] = None,
+                 policy: tuple = ("skip", 100, 1)) -> None:
+    """
+    Constrói o analisador de um processo do pool a partir da tabela de tokens recebida.
+
+    Args:
+        tokens (list[Token]): Tabela de tokens do analisador que iniciou o lote.
+        case_sensitive (bool): Indica se as palavras reservadas diferenciam maiúsculas de minúsculas.
+        cache_dir (str | None): Diretório do cache em disco, ou `None` para não utilizar cache.
+        policy (tuple[str, int, int]): Política de erros, limite de diagnósticos e quantidade de
+            erros que interrompe a análise (veja `_policy`).
+    """
+    global _worker_analyzer, _worker_cache, _worker_positions
+    _worker_analyzer = LexicalAnalyzer()
+    _worker_analyzer.tokens = tokens
+    _worker_analyzer.case_sensitive = case_sensitive
+    _worker_analyzer.diagnostics = _worker_analyzer.scanner.diagnostics = DiagnosticBuffer(*policy)
+    _worker_analyzer.build_index()
+    _worker_cache = TokenCache(_worker_analyzer, directory=cache_dir) if cache_dir is not None else _worker_analyzer
+    _worker_positions = {id(token): position for position, token in enumerate(_worker_analyzer.output_tokens)}
+
+
+def _policy(analyzer: LexicalAnalyzer) -> tuple[str, int, int]:
+    """Retorna os argumentos de `DiagnosticBuffer` da política de erros de um analisador, para `_init_worker`."""
+    diagnostics = analyzer.diagnostics
+    return diagnostics.policy, diagnostics.limit, diagnostics.max_errors
+
+
+def _merge_diagnostics(diagnostics: DiagnosticBuffer, items: list, count: int, offset: int = 0) -> None:
+    """
+    Acrescenta a um buffer os diagnósticos devolvidos por um processo do pool.
+
+    Args:
+        diagnostics (DiagnosticBuffer): Buffer do analisador que iniciou a análise.
+        items (list[Diagnostic]): Diagnósticos guardados pelo processo, em ordem.
+        count (int): Quantidade total de erros do processo, inclusive os não guardados.
+        offset (int): Deslocamento somado ao número da linha de cada diagnóstico.
+
+    Raises:
+        LexicalError: Se a análise deve ser interrompida pela política `"abort"`.
+    """
+    for diagnostic in items:
+        line = None if diagnostic.line is None else diagnostic.line + offset
+        diagnostics.add(diagnostic.code, diagnostic.message, line, diagnostic.column)
+        if diagnostics.exhausted:
+            raise LexicalError(diagnostics)
+    # Os erros que não couberam no buffer do processo também não cabem no buffer principal.
+    for _ in range(count - len(items)):
+        diagnostics.count += 1
+        if diagnostics.exhausted:
+            raise LexicalError(diagnostics)
+
+
+def _tokenize_path(path: str, mmap: bool = True) -> tuple:
+    """
+    Analisa um arquivo no processo do pool, capturando qualquer falha.
+
+    Os tokens são devolvidos codificados por `_encode`, para que o processo principal os associe
+    aos seus próprios objetos `Token`.
+
+    Args:
+        path (str): Caminho do arquivo.
+        mmap (bool): Indica se o arquivo deve ser mapeado em memória.
+
+    Returns:
+        tuple: Caminho, tokens codificados, tamanho, tempo gasto, mensagem de erro e diagnósticos.
+    """
+    start = time.perf_counter()
+    try:
+        size = os.path.getsize(path)
+        encoded = _encode(_worker_cache.tokenize_file(path, mmap=mmap))
+        return path, encoded, size, time.perf_counter() - start, None, list(_worker_analyzer.diagnostics)
+    except Exception as e:
+        diagnostics = e.diagnostics if isinstance(e, LexicalError) else []
+        return path, None, 0, time.perf_counter() - start, f"{type(e).__name__}: {e}", diagnostics
+
+
+def tokenize_many(paths: Iterable[str], workers: Optional[int] = None, analyzer: Optional[LexicalAnalyzer] = None,
+                  mmap: bool = True, chunksize: int = 1, cache_dir: Optional[str] = None) -> Iterator[FileResult]:
+    """
+    Analisa vários arquivos em paralelo, produzindo os resultados na ordem dos caminhos.
+
+    Args:
+        paths (Iterable[str]): Caminhos dos arquivos.
+        workers (int | None): Quantidade de processos (padrão: `os.cpu_count()`). Com `1`, os
+            arquivos são analisados no próprio processo, sem pool.
+        analyzer (LexicalAnalyzer | None): Analisador cuja tabela de tokens e política de erros são
+            utilizadas e a cujos objetos `Token` os resultados se referem (padrão: um novo `LexicalAnalyzer`).
+        mmap (bool): Indica se os arquivos devem ser mapeados em memória.
+        chunksize (int): Quantidade de arquivos enviada a cada processo por vez.
+        cache_dir (str | None): Diretório do cache em disco compartilhado entre execuções, ou `None`
+            para analisar todos os arquivos.
+
+    Yields:
+        FileResult: Resultado de cada arquivo, na mesma ordem de `paths`.
+    """
+    analyzer = analyzer or LexicalAnalyzer()
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1:
+        source = TokenCache(analyzer, directory=cache_dir) if cache_dir is not None else analyzer
+        for path in paths:
+            start = time.perf_counter()
+            try:
+                size = os.path.getsize(path)
+                found = source.tokenize_file(path, mmap=mmap)
+                yield FileResult(path, found, size, time.perf_counter() - start, None, list(analyzer.diagnostics))
+            except Exception as e:
+                diagnostics = e.diagnostics if isinstance(e, LexicalError) else []
+                yield FileResult(path, [], 0, time.perf_counter() - start, f"{type(e).__name__}: {e}", diagnostics)
+        return
+
+    table = analyzer.output_tokens
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(analyzer.tokens, analyzer.case_sensitive, cache_dir, _policy(analyzer))) as executor:
+        for path, encoded, size, elapsed, error, diagnostics in executor.map(_tokenize_path, paths, repeat(mmap),
+                                                                             chunksize=chunksize):
+            yield FileResult(path, [] if encoded is None else _decode(encoded, table), size, elapsed, error, diagnostics)
+
+
+def _tokenize_segment(text: str) -> tuple:
+    """
+    Analisa um segmento de código no processo do pool, com linhas relativas ao início do segmento.
+
+    Com a política `"abort"`, a interrupção do segmento não é propagada: seus diagnósticos são
+    devolvidos para que o processo principal decida, com a contagem de todos os segmentos, onde a
+    análise é interrompida.
+
+    Args:
+        text (str): Segmento de código que termina em uma posição segura.
+
+    Returns:
+        tuple: Tokens codificados por `_encode` (`None` se o segmento foi interrompido), quantidade
+        de linhas do segmento, posição relativa de um comentário não fechado, diagnósticos com
+        linhas relativas e quantidade total de erros.
+    """
+    diagnostics = _worker_analyzer.diagnostics
+    diagnostics.clear()
+    tokens = []
+    try:
+        lines = _worker_analyzer.scanner.scan_into(text, tokens) - 1
+    except LexicalError as e:
+        return None, 0, None, e.diagnostics, e.count
+    return _encode(tokens), lines, _worker_analyzer.scanner.open_comment, diagnostics.items, diagnostics.count
+
+
+def tokenize_segments(text: str, workers: Optional[int] = None, analyzer: Optional[LexicalAnalyzer] = None,
+                      segment_size: int = 1 << 20) -> list[tuple]:
+    """
+    Analisa um único código fonte dividindo-o em segmentos processados em paralelo.
+
+    Os segmentos terminam em quebras de linha fora de comentários (veja `scanner.safe_boundary`),
+    portanto nenhum comentário ou literal de texto é dividido. Cada segmento é analisado com linhas
+    relativas e os resultados são unidos em ordem, deslocando as linhas pela quantidade de linhas
+    dos segmentos anteriores. A saída, assim como os diagnósticos registrados em
+    `analyzer.diagnostics` conforme a sua política de erros, é idêntica à de `LexicalAnalyzer.tokenize`.
+
+    Args:
+        text (str): O código fonte a ser analisado.
+        workers (int | None): Quantidade de processos (padrão: `os.cpu_count()`).
+        analyzer (LexicalAnalyzer | None): Analisador cuja tabela de tokens é utilizada.
+        segment_size (int): Tamanho aproximado de cada segmento, em caracteres.
+
+    Returns:
+        list[tuple[str, Token, int]]: Lista de tokens encontrados com a linha correspondente.
+
+    Raises:
+        LexicalError: Se a análise for interrompida pela política de erros `"abort"`.
+    """
+    analyzer = analyzer or LexicalAnalyzer()
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(text) <= segment_size:
+        return analyzer.scan(text)
+    segments = [text[start:end] for start, end in iter_blocks(text, segment_size)]
+
+    table = analyzer.output_tokens
+    analyzer.diagnostics.clear()
+    merged = []
+    offset = 0
+    comment = None
+    with ProcessPoolExecutor(max_workers=min(workers, len(segments)), initializer=_init_worker,
+                             initargs=(analyzer.tokens, analyzer.case_sensitive, None, _policy(analyzer))) as executor:
+        for encoded, lines, comment, items, count in executor.map(_tokenize_segment, segments):
+            _merge_diagnostics(analyzer.diagnostics, items, count, offset)
+            merged.extend(_decode(encoded, table, offset))
+            # Apenas o último segmento pode terminar dentro de um comentário.
+            comment = comment and (comment[0] + offset, comment[1])
+            offset += lines
+    analyzer._finish(comment)
+    return merged
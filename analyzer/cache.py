@@ -0,0 +1,344 @@
+"""
+Módulo `cache`
+
+Este módulo implementa um cache de resultados da análise léxica, para que códigos fonte inalterados
+não sejam varridos novamente.
+
+Cada resultado é identificado por um resumo (BLAKE2b) dos bytes do código fonte combinado com a
+impressão digital da tabela de tokens do analisador (`LexicalAnalyzer.fingerprint`) e com a sua
+política de erros léxicos; assim, qualquer alteração em `LexicalAnalyzer.tokens` invalida
+automaticamente as entradas anteriores, e um resultado obtido com uma política não é servido a outra.
+Os resultados ficam em uma memória LRU de tamanho configurável e, opcionalmente, em um diretório em
+disco, em um formato binário compacto que referencia os objetos `Token` pela posição na tabela
+(`LexicalAnalyzer.output_tokens`, que inclui o token de erro da política `"token"`). Os diagnósticos
+da análise são guardados com os tokens e restaurados em `LexicalAnalyzer.diagnostics` a cada acerto.
+
+Classes:
+    - TokenCache: Cache LRU em memória, com armazenamento opcional em disco.
+
+Funções:
+    - pack_tokens(tokens, table, diagnostics): Serializa tokens e diagnósticos no formato binário do cache.
+    - unpack_tokens(data, table): Reconstrói tokens a partir do formato binário do cache.
+    - unpack_diagnostics(data): Reconstrói os diagnósticos guardados no formato binário do cache.
+"""
+
+from array import array
+from collections import OrderedDict
+from typing import Optional, Union
+import hashlib
+import json
+import os
+import struct
+import sys
+
+from .analyzer import LexicalAnalyzer
+from .diagnostics import Diagnostic, DiagnosticBuffer
+
+# Assinatura e versão do formato binário: `LPDT`, versão, quantidade de tokens, tamanho dos lexemas
+# e tamanho dos diagnósticos.
+_MAGIC = b"LPDT"
+_VERSION = 3
+_HEADER = struct.Struct("<4sBIII")
+
+
+def pack_tokens(tokens: list, table: list, diagnostics: Optional[DiagnosticBuffer] = None,
+                comment: Optional[tuple] = None) -> bytes:
+    """
+    Serializa tokens no formato binário do cache.
+
+    O formato é um cabeçalho seguido de três arrays de inteiros sem sinal em little-endian
+    (posição do `Token` em `table`, linha e comprimento do lexema), dos lexemas concatenados em UTF-8
+    e, se houver erros, dos diagnósticos em JSON.
+
+    Args:
+        tokens (list[tuple[str, Token, int]]): Tokens a serializar.
+        table (list[Token]): Tabela de tokens do analisador que os produziu (`output_tokens`).
+        diagnostics (DiagnosticBuffer | None): Erros léxicos da análise que produziu os tokens.
+        comment (tuple[int, int] | None): Linha e coluna do comentário não fechado da análise.
+
+    Returns:
+        bytes: Representação binária dos tokens.
+    """
+    positions = {id(token): position for position, token in enumerate(table)}
+    lexemes = [lexeme for lexeme, _, _ in tokens]
+    columns = [
+        array("H", [positions[id(token)] for _, token, _ in tokens]),
+        array("I", [line for _, _, line in tokens]),
+        array("I", map(len, lexemes)),
+    ]
+    if sys.byteorder != "little":
+        for column in columns:
+            column.byteswap()
+    text = "".join(lexemes).encode("utf-8")
+    errors = b""
+    if diagnostics is not None and diagnostics.count:
+        items = [[d.code, d.message, d.line, d.column] for d in diagnostics]
+        stored = {"count": diagnostics.count, "items": items, "comment": comment}
+        errors = json.dumps(stored, ensure_ascii=False).encode("utf-8")
+    header = _HEADER.pack(_MAGIC, _VERSION, len(tokens), len(text), len(errors))
+    return b"".join([header, *(column.tobytes() for column in columns), text, errors])
+
+
+def unpack_tokens(data: bytes, table: list) -> list:
+    """
+    Reconstrói tokens a partir do formato binário do cache.
+
+    Args:
+        data (bytes): Representação binária produzida por `pack_tokens`.
+        table (list[Token]): Tabela de tokens à qual as posições se referem.
+
+    Returns:
+        list[tuple[str, Token, int]]: Tokens reconstruídos.
+
+    Raises:
+        ValueError: Se os dados não estiverem no formato esperado.
+    """
+    magic, version, count, size, _ = _HEADER.unpack_from(data)
+    if magic != _MAGIC or version != _VERSION:
+        raise ValueError("Formato de cache inválido.")
+
+    offset = _HEADER.size
+    columns = []
+    for typecode in ("H", "I", "I"):
+        column = array(typecode)
+        column.frombytes(data[offset:offset + count * column.itemsize])
+        if sys.byteorder != "little":
+            column.byteswap()
+        offset += count * column.itemsize
+        columns.append(column)
+    text = data[offset:offset + size].decode("utf-8")
+
+    tokens = []
+    append = tokens.append
+    start = 0
+    for position, line, length in zip(*columns):
+        end = start + length
+        append((text[start:end], table[position], line))
+        start = end
+    return tokens
+
+
+def unpack_diagnostics(data: bytes) -> tuple[list[Diagnostic], int, Optional[tuple]]:
+    """
+    Reconstrói os diagnósticos guardados por `pack_tokens`.
+
+    Args:
+        data (bytes): Representação binária produzida por `pack_tokens`.
+
+    Returns:
+        tuple[list[Diagnostic], int, tuple[int, int] | None]: Diagnósticos guardados, quantidade total
+        de erros da análise e posição do comentário não fechado.
+
+    Raises:
+        ValueError: Se os dados não estiverem no formato esperado.
+    """
+    magic, version, count, size, errors = _HEADER.unpack_from(data)
+    if magic != _MAGIC or version != _VERSION:
+        raise ValueError("Formato de cache inválido.")
+    if not errors:
+        return [], 0, None
+    offset = _HEADER.size + count * (array("H").itemsize + 2 * array("I").itemsize) + size
+    stored = json.loads(data[offset:offset + errors].decode("utf-8"))
+    comment = tuple(stored["comment"]) if stored["comment"] else None
+    return [Diagnostic(*item) for item in stored["items"]], stored["count"], comment
+
+
+class TokenCache:
+    """
+    Cache de resultados da análise léxica com memória LRU e armazenamento opcional em disco.
+
+    Attributes:
+        analyzer (LexicalAnalyzer): Analisador utilizado nas análises que não estão no cache.
+        max_entries (int): Quantidade máxima de resultados mantidos em memória.
+        directory (str | None): Diretório do armazenamento em disco, ou `None` para desativá-lo.
+        hits (int): Consultas atendidas pela memória ou pelo disco.
+        disk_hits (int): Consultas atendidas pelo disco.
+        misses (int): Consultas que exigiram uma nova análise.
+        evictions (int): Resultados descartados da memória pela política LRU.
+    """
+    def __init__(self, analyzer: Optional[LexicalAnalyzer] = None, max_entries: int = 128, directory: Optional[str] = None) -> None:
+        """
+        Inicializa o cache.
+
+        Args:
+            analyzer (LexicalAnalyzer | None): Analisador utilizado (padrão: um novo `LexicalAnalyzer`).
+            max_entries (int): Quantidade máxima de resultados mantidos em memória.
+            directory (str | None): Diretório do armazenamento em disco, criado se não existir.
+        """
+        self.analyzer = analyzer or LexicalAnalyzer()
+        self.max_entries = max_entries
+        self.directory = directory
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def key(self, source: Union[str, bytes]) -> str:
+        """
+        Calcula a chave de um código fonte para a tabela de tokens e a política de erros atuais do analisador.
+
+        Args:
+            source (str | bytes): Código fonte ou seus bytes em UTF-8.
+
+        Returns:
+            str: Chave hexadecimal do resultado.
+        """
+        if isinstance(source, str):
+            source = source.encode("utf-8")
+        digest = hashlib.blake2b(source, digest_size=20)
+        digest.update(self.analyzer.ensure_index().encode("ascii"))
+        diagnostics = self.analyzer.diagnostics
+        digest.update(f"{diagnostics.policy}:{diagnostics.max_errors}:{diagnostics.limit}".encode("ascii"))
+        return digest.hexdigest()
+
+    def tokenize(self, text: str) -> list[tuple]:
+        """
+        Retorna os tokens de um código fonte, analisando-o apenas se não estiver no cache.
+
+        Args:
+            text (str): O código fonte a ser analisado.
+
+        Returns:
+            list[tuple[str, Token, int]]: Lista de tokens encontrados com a linha correspondente.
+
+        Raises:
+            LexicalError: Se a análise for interrompida pela política de erros `"abort"`.
+        """
+        key = self.key(text)
+        tokens = self._lookup(key)
+        if tokens is None:
+            tokens = self.analyzer.scan(text)
+            self._store(key, tokens)
+        return list(tokens)
+
+    def tokenize_file(self, path: Union[str, os.PathLike], mmap: bool = True) -> list[tuple]:
+        """
+        Retorna os tokens de um arquivo, analisando-o apenas se seu conteúdo não estiver no cache.
+
+        Args:
+            path (str | os.PathLike): Caminho do arquivo em UTF-8.
+            mmap (bool): Indica se o arquivo deve ser mapeado em memória quando precisar ser analisado.
+
+        Returns:
+            list[tuple[str, Token, int]]: Lista de tokens encontrados com a linha correspondente.
+
+        Raises:
+            LexicalError: Se a análise for interrompida pela política de erros `"abort"`.
+        """
+        with open(path, "rb") as file:
+            data = file.read()
+        key = self.key(data)
+        tokens = self._lookup(key)
+        if tokens is None:
+            tokens = self.analyzer.tokenize_file(path, mmap=mmap)
+            self._store(key, tokens)
+        return list(tokens)
+
+    def stats(self) -> dict:
+        """
+        Retorna os contadores do cache.
+
+        Returns:
+            dict: Acertos, acertos em disco, falhas, descartes e tamanho atual da memória.
+        """
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+        }
+
+    def clear(self) -> None:
+        """Descarta os resultados em memória, mantendo o armazenamento em disco."""
+        self._entries.clear()
+
+    def _path(self, key: str) -> str:
+        """Retorna o caminho do arquivo de uma chave no armazenamento em disco."""
+        return os.path.join(self.directory, f"{key}.lpdt")
+
+    def _lookup(self, key: str) -> Optional[list]:
+        """
+        Procura um resultado na memória e, em seguida, no disco.
+
+        Em um acerto, os diagnósticos e o comentário não fechado guardados com os tokens são
+        restaurados no analisador, como se o código fonte tivesse sido analisado novamente.
+
+        Args:
+            key (str): Chave do resultado.
+
+        Returns:
+            list | None: Tokens armazenados, ou `None` se não estiverem no cache.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._restore(entry)
+
+        if self.directory is not None:
+            try:
+                with open(self._path(key), "rb") as file:
+                    data = file.read()
+                entry = (unpack_tokens(data, self.analyzer.output_tokens), *unpack_diagnostics(data))
+            except (OSError, ValueError, IndexError, KeyError, TypeError, struct.error):
+                entry = None
+            if entry is not None:
+                self.hits += 1
+                self.disk_hits += 1
+                self._remember(key, entry)
+                return self._restore(entry)
+
+        self.misses += 1
+        return None
+
+    def _restore(self, entry: tuple) -> list:
+        """
+        Restaura no analisador os diagnósticos de um resultado do cache.
+
+        Args:
+            entry (tuple): Tokens, diagnósticos, quantidade de erros e comentário não fechado.
+
+        Returns:
+            list: Tokens armazenados.
+        """
+        tokens, items, count, comment = entry
+        self.analyzer.diagnostics.items = list(items)
+        self.analyzer.diagnostics.count = count
+        self.analyzer.unterminated_comment = comment
+        return tokens
+
+    def _store(self, key: str, tokens: list) -> None:
+        """
+        Armazena um resultado, com os diagnósticos da análise que o produziu, na memória e, se configurado, no disco.
+
+        Args:
+            key (str): Chave do resultado.
+            tokens (list): Tokens a armazenar.
+        """
+        diagnostics = self.analyzer.diagnostics
+        comment = self.analyzer.unterminated_comment
+        self._remember(key, (tokens, list(diagnostics.items), diagnostics.count, comment))
+        if self.directory is not None:
+            # Grava em um arquivo temporário e o renomeia, para que leitores concorrentes nunca vejam um arquivo parcial.
+            temporary = f"{self._path(key)}.{os.getpid()}.tmp"
+            with open(temporary, "wb") as file:
+                file.write(pack_tokens(tokens, self.analyzer.output_tokens, diagnostics, comment))
+            os.replace(temporary, self._path(key))
+
+    def _remember(self, key: str, entry: tuple) -> None:
+        """
+        Armazena um resultado na memória, descartando o menos usado recentemente se necessário.
+
+        Args:
+            key (str): Chave do resultado.
+            entry (tuple): Tokens, diagnósticos, quantidade de erros e comentário não fechado.
+        """
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
@@ -0,0 +1,260 @@
+"""
+Módulo `cursor`
+
+Este módulo implementa um cursor sobre a sequência de tokens, para o consumo incremental por um
+analisador sintático.
+
+Em vez de materializar a lista completa de `tokenize` e indexá-la, o `TokenCursor` puxa os tokens
+de um iterador preguiçoso (normalmente `LexicalAnalyzer.iter_tokens`) para um buffer circular de
+tamanho fixo, uma potência de dois, de modo que a memória depende apenas da profundidade de
+antecipação (`lookahead`) e do recuo permitido (`backtrack`), e não do tamanho da entrada. As
+posições são absolutas; o compartimento de cada uma no buffer é obtido com uma máscara de bits.
+
+O tipo de cada token é guardado também como inteiro (`TokenType.id`), em uma lista paralela, de
+modo que `kind`, `check`, `accept` e `expect` comparam inteiros. Um analisador sintático pode
+guardar os números dos tipos em constantes locais (`SIF = Token.SIF.id`).
+
+Classes:
+    - TokenCursor: Cursor com antecipação e recuo sobre um iterador de tokens.
+    - UnexpectedToken: Exceção de um token diferente do esperado por `expect`.
+
+Constantes:
+    - EOF: Número de tipo retornado por `kind` após o último token.
+"""
+
+from itertools import islice
+from typing import Iterable, Optional, Union
+
+from .tokens import TokenType
+
+# Tipo do fim da entrada; nenhum `TokenType` tem número negativo.
+EOF = -1
+
+
+class UnexpectedToken(ValueError):
+    """
+    Token diferente do esperado por `TokenCursor.expect`.
+
+    Attributes:
+        expected (int): Número do tipo esperado.
+        found (tuple[str, Token, int] | None): Token encontrado, ou `None` no fim da entrada.
+        line (int | None): Linha do token encontrado.
+    """
+    def __init__(self, expected: Union[TokenType, int], found: Optional[tuple], name: Optional[str] = None) -> None:
+        """
+        Inicializa a exceção.
+
+        Args:
+            expected (TokenType | int): Tipo esperado.
+            found (tuple | None): Token encontrado, ou `None` no fim da entrada.
+            name (str | None): Nome do tipo esperado, quando `expected` é um número.
+        """
+        if isinstance(expected, TokenType):
+            expected, name = expected.id, expected.name
+        self.expected = expected
+        self.found = found
+        self.line = None if found is None else found[2]
+        wanted = name or f"tipo {expected}"
+        if found is None:
+            message = f"esperado '{wanted}', encontrado o fim da entrada"
+        else:
+            message = f"linha {found[2]}: esperado '{wanted}', encontrado '{found[0]}' ({found[1].type.name})"
+        super().__init__(message)
+
+
+class TokenCursor:
+    """
+    Cursor com antecipação e recuo sobre um iterador de tokens `(lexema, Token, linha)`.
+
+    Attributes:
+        lookahead (int): Quantidade máxima de tokens à frente que podem ser consultados (`peek(k)`
+            com `k < lookahead`).
+        backtrack (int): Quantidade de tokens para trás até a qual uma marca continua válida.
+        position (int): Quantidade de tokens consumidos.
+    """
+    __slots__ = ("lookahead", "backtrack", "position", "_source", "_end", "_mask", "_limit", "_tokens", "_kinds")
+
+    def __init__(self, tokens: Iterable[tuple], lookahead: int = 4, backtrack: int = 64) -> None:
+        """
+        Inicializa o cursor sobre um iterador de tokens.
+
+        Args:
+            tokens (Iterable[tuple]): Tokens `(lexema, Token, linha)`, consumidos sob demanda.
+            lookahead (int): Profundidade máxima de antecipação.
+            backtrack (int): Recuo máximo garantido para `reset`.
+
+        Raises:
+            ValueError: Se `lookahead` não for positivo ou `backtrack` for negativo.
+        """
+        if lookahead < 1 or backtrack < 0:
+            raise ValueError("A antecipação deve ser positiva e o recuo não pode ser negativo.")
+        capacity = 1 << (lookahead + backtrack - 1).bit_length()
+        self.lookahead = lookahead
+        self.backtrack = backtrack
+        self.position = 0
+        self._source = iter(tokens)
+        # Posição seguinte ao último token lido do iterador.
+        self._end = 0
+        self._mask = capacity - 1
+        # Distância máxima entre `position` e `_end`: preencher além dela sobrescreveria o recuo garantido.
+        self._limit = capacity - backtrack
+        self._tokens = [None] * capacity
+        self._kinds = [EOF] * capacity
+
+    def _fill(self, count: int) -> bool:
+        """
+        Lê tokens do iterador até que haja `count` tokens à frente de `position`.
+
+        Lê de uma vez todos os tokens que cabem no buffer sem sobrescrever o recuo garantido.
+
+        Args:
+            count (int): Quantidade de tokens necessária à frente de `position`.
+
+        Returns:
+            bool: `False` se a entrada terminar antes.
+
+        Raises:
+            ValueError: Se `count` ultrapassar a antecipação disponível.
+        """
+        if count > self._limit:
+            raise ValueError(f"Antecipação de {count} tokens maior que o máximo ({self._limit}).")
+        if self._source is None:
+            return False
+        tokens, kinds, mask = self._tokens, self._kinds, self._mask
+        end = self._end
+        for token in islice(self._source, self.position + self._limit - end):
+            slot = end & mask
+            tokens[slot] = token
+            kinds[slot] = token[1].type.id
+            end += 1
+        if end - self.position < self._limit:
+            # O iterador terminou antes de preencher o buffer.
+            self._source = None
+        self._end = end
+        return end - self.position >= count
+
+    def peek(self, k: int = 0) -> Optional[tuple]:
+        """
+        Consulta um token à frente sem consumi-lo.
+
+        Args:
+            k (int): Distância a partir do próximo token (`0` é o próximo).
+
+        Returns:
+            tuple[str, Token, int] | None: O token, ou `None` após o fim da entrada.
+        """
+        index = self.position + k
+        if index >= self._end and not self._fill(k + 1):
+            return None
+        return self._tokens[index & self._mask]
+
+    def kind(self, k: int = 0) -> int:
+        """
+        Consulta o número do tipo de um token à frente.
+
+        Args:
+            k (int): Distância a partir do próximo token.
+
+        Returns:
+            int: `TokenType.id` do token, ou `EOF` após o fim da entrada.
+        """
+        index = self.position + k
+        if index >= self._end and not self._fill(k + 1):
+            return EOF
+        return self._kinds[index & self._mask]
+
+    def check(self, kind: int, k: int = 0) -> bool:
+        """
+        Verifica o tipo de um token à frente.
+
+        Args:
+            kind (int): Número do tipo (`TokenType.id`).
+            k (int): Distância a partir do próximo token.
+
+        Returns:
+            bool: `True` se o token existir e tiver o tipo informado.
+        """
+        index = self.position + k
+        if index >= self._end and not self._fill(k + 1):
+            return False
+        return self._kinds[index & self._mask] == kind
+
+    def advance(self) -> Optional[tuple]:
+        """
+        Consome o próximo token.
+
+        Returns:
+            tuple[str, Token, int] | None: O token consumido, ou `None` no fim da entrada.
+        """
+        position = self.position
+        if position >= self._end and not self._fill(1):
+            return None
+        self.position = position + 1
+        return self._tokens[position & self._mask]
+
+    def accept(self, kind: int) -> Optional[tuple]:
+        """
+        Consome o próximo token se ele tiver o tipo informado.
+
+        Args:
+            kind (int): Número do tipo (`TokenType.id`).
+
+        Returns:
+            tuple[str, Token, int] | None: O token consumido, ou `None` se o tipo for outro.
+        """
+        position = self.position
+        if position >= self._end and not self._fill(1):
+            return None
+        slot = position & self._mask
+        if self._kinds[slot] != kind:
+            return None
+        self.position = position + 1
+        return self._tokens[slot]
+
+    def expect(self, kind: Union[TokenType, int]) -> tuple:
+        """
+        Consome o próximo token, exigindo o tipo informado.
+
+        Args:
+            kind (TokenType | int): Tipo esperado, ou seu número.
+
+        Returns:
+            tuple[str, Token, int]: O token consumido.
+
+        Raises:
+            UnexpectedToken: Se o próximo token tiver outro tipo ou a entrada tiver terminado.
+        """
+        token = self.accept(kind if kind.__class__ is int else kind.id)
+        if token is None:
+            raise UnexpectedToken(kind, self.peek())
+        return token
+
+    @property
+    def at_end(self) -> bool:
+        """Indica se todos os tokens foram consumidos."""
+        return self.position >= self._end and not self._fill(1)
+
+    def mark(self) -> int:
+        """
+        Marca a posição atual, para um recuo posterior com `reset`.
+
+        Returns:
+            int: A posição marcada.
+        """
+        return self.position
+
+    def reset(self, mark: int) -> None:
+        """
+        Volta a uma posição marcada.
+
+        Uma marca continua válida enquanto o cursor não avançar mais de `backtrack` tokens além dela.
+
+        Args:
+            mark (int): Posição retornada por `mark`.
+
+        Raises:
+            ValueError: Se a posição já tiver saído do buffer ou estiver à frente dos tokens lidos.
+        """
+        if not self._end - len(self._tokens) <= mark <= self._end:
+            raise ValueError(f"Marca {mark} fora do buffer do cursor (tokens {max(0, self._end - len(self._tokens))} a {self._end}).")
+        self.position = mark
@@ -0,0 +1,181 @@
+"""
+Módulo `diagnostics`
+
+Este módulo define os diagnósticos produzidos pelo analisador, registrados em listas em vez de
+impressos na saída padrão, de modo que o chamador decide como e quando exibi-los.
+
+Os erros léxicos (lexemas desconhecidos, literais de texto e comentários não fechados) são
+acumulados em um `DiagnosticBuffer`, que guarda no máximo `limit` diagnósticos, mas conta todos, e
+define a política de tratamento: ignorar o lexema (`"skip"`), emiti-lo como um token de erro
+(`"token"`) ou interromper a análise com um `LexicalError` depois de `max_errors` erros (`"abort"`).
+
+Classes:
+    - Diagnostic: Problema encontrado no código fonte, com sua posição.
+    - DiagnosticBuffer: Buffer limitado de diagnósticos, com a política de tratamento de erros.
+    - LexicalError: Exceção de uma análise interrompida pela política `"abort"`.
+
+Constantes:
+    - ERROR_POLICIES: Políticas de tratamento de erros disponíveis.
+"""
+
+from typing import Iterator, Optional
+
+# Políticas de tratamento de erros léxicos.
+ERROR_POLICIES = ("skip", "token", "abort")
+
+
+class Diagnostic:
+    """
+    Problema encontrado no código fonte.
+
+    Attributes:
+        code (str): Identificador do tipo de problema, por exemplo `"duplicate-symbol"`.
+        message (str): Descrição legível do problema.
+        line (int | None): Linha do problema, a partir de 1, quando conhecida.
+        column (int | None): Coluna do problema, a partir de 1, quando conhecida.
+    """
+    __slots__ = ("code", "message", "line", "column")
+
+    def __init__(self, code: str, message: str, line: Optional[int] = None, column: Optional[int] = None) -> None:
+        """
+        Inicializa um diagnóstico.
+
+        Args:
+            code (str): Identificador do tipo de problema.
+            message (str): Descrição legível do problema.
+            line (int | None): Linha do problema.
+            column (int | None): Coluna do problema.
+        """
+        self.code = code
+        self.message = message
+        self.line = line
+        self.column = column
+
+    def __eq__(self, other) -> bool:
+        """Compara dois diagnósticos campo a campo."""
+        if not isinstance(other, Diagnostic):
+            return NotImplemented
+        return (self.code, self.message, self.line, self.column) == (other.code, other.message, other.line, other.column)
+
+    __hash__ = None
+
+    def __str__(self) -> str:
+        """Formata o diagnóstico com sua posição, como em `linha 3, coluna 5: mensagem`."""
+        if self.line is None:
+            return self.message
+        if self.column is None:
+            return f"linha {self.line}: {self.message}"
+        return f"linha {self.line}, coluna {self.column}: {self.message}"
+
+    def __repr__(self) -> str:
+        """Retorna a representação textual do diagnóstico."""
+        return f"Diagnostic({self.code!r}, {self.message!r}, line={self.line}, column={self.column})"
+
+
+class DiagnosticBuffer:
+    """
+    Buffer limitado de diagnósticos, com a política de tratamento de erros.
+
+    Attributes:
+        policy (str): Uma das políticas de `ERROR_POLICIES`.
+        limit (int): Quantidade máxima de diagnósticos guardados.
+        max_errors (int): Com a política `"abort"`, quantidade de erros que interrompe a análise.
+        items (list[Diagnostic]): Diagnósticos guardados, em ordem.
+        count (int): Quantidade total de erros, inclusive os que não couberam no buffer.
+    """
+    __slots__ = ("policy", "limit", "max_errors", "items", "count")
+
+    def __init__(self, policy: str = "skip", limit: int = 100, max_errors: int = 1) -> None:
+        """
+        Inicializa um buffer vazio.
+
+        Args:
+            policy (str): Política de tratamento de erros.
+            limit (int): Quantidade máxima de diagnósticos guardados.
+            max_errors (int): Quantidade de erros que interrompe a análise com a política `"abort"`.
+
+        Raises:
+            ValueError: Se a política não existir ou se `limit` ou `max_errors` não forem positivos.
+        """
+        if policy not in ERROR_POLICIES:
+            raise ValueError(f"Política de erros inválida: {policy!r}")
+        if limit < 1 or max_errors < 1:
+            raise ValueError("O limite de diagnósticos e a quantidade de erros devem ser positivos.")
+        self.policy = policy
+        self.limit = limit
+        self.max_errors = max_errors
+        self.items = []
+        self.count = 0
+
+    def clear(self) -> None:
+        """Descarta os diagnósticos, no início de uma nova análise."""
+        self.items = []
+        self.count = 0
+
+    def add(self, code: str, message: str, line: Optional[int] = None, column: Optional[int] = None) -> Optional[Diagnostic]:
+        """
+        Registra um erro.
+
+        Args:
+            code (str): Identificador do tipo de problema.
+            message (str): Descrição legível do problema.
+            line (int | None): Linha do problema.
+            column (int | None): Coluna do problema.
+
+        Returns:
+            Diagnostic | None: O diagnóstico guardado, ou `None` se o buffer estiver cheio.
+        """
+        self.count += 1
+        if len(self.items) >= self.limit:
+            return None
+        diagnostic = Diagnostic(code, message, line, column)
+        self.items.append(diagnostic)
+        return diagnostic
+
+    @property
+    def exhausted(self) -> bool:
+        """Indica se a análise deve ser interrompida pela política `"abort"`."""
+        return self.policy == "abort" and self.count >= self.max_errors
+
+    @property
+    def dropped(self) -> int:
+        """Quantidade de erros contados, mas não guardados por falta de espaço."""
+        return self.count - len(self.items)
+
+    def mark(self) -> tuple[int, int]:
+        """Retorna o estado atual, para descartar os erros de uma varredura refeita (veja `rollback`)."""
+        return len(self.items), self.count
+
+    def rollback(self, mark: tuple[int, int]) -> None:
+        """Restaura o estado retornado por `mark`."""
+        size, self.count = mark
+        del self.items[size:]
+
+    def __len__(self) -> int:
+        """Retorna a quantidade de diagnósticos guardados."""
+        return len(self.items)
+
+    def __iter__(self) -> Iterator[Diagnostic]:
+        """Percorre os diagnósticos guardados."""
+        return iter(self.items)
+
+
+class LexicalError(ValueError):
+    """
+    Análise interrompida pela política `"abort"`.
+
+    Attributes:
+        diagnostics (list[Diagnostic]): Diagnósticos registrados até a interrupção.
+        count (int): Quantidade total de erros encontrados.
+    """
+    def __init__(self, buffer: DiagnosticBuffer) -> None:
+        """
+        Inicializa a exceção a partir do buffer da análise interrompida.
+
+        Args:
+            buffer (DiagnosticBuffer): Buffer com os erros encontrados.
+        """
+        self.diagnostics = list(buffer.items)
+        self.count = buffer.count
+        first = f": {self.diagnostics[0]}" if self.diagnostics else ""
+        super().__init__(f"Análise interrompida após {self.count} erro(s) léxico(s){first}")
@@ -0,0 +1,339 @@
+"""
+Módulo `export`
+
+Este módulo implementa a exportação não interativa dos tokens encontrados pelo `LexicalAnalyzer`.
+
+Os tokens são escritos à medida que são produzidos por `LexicalAnalyzer.iter_tokens`, em lotes,
+sem montar a lista completa nem formatar tabelas, de modo que a exportação de arquivos grandes é
+limitada pela escrita e não pela formatação. O código fonte completo só é incluído quando pedido.
+
+Formatos:
+    - `csv`: Colunas `Token`, `Tipo` e `Linha` (e `Código Completo` na primeira coluna, se incluído).
+    - `jsonl`: Um objeto JSON `{"lexeme", "type", "line"}` por linha.
+    - `binary`: Formato binário compacto com inteiros de tamanho variável (veja `write_binary`).
+    - `table`: Tabela formatada com `tabulate`, como na saída interativa.
+    - `none`: Apenas realiza a análise, sem escrever os tokens.
+
+Funções:
+    - export_file(analyzer, path, output, format, include_source): Exporta os tokens de um arquivo.
+    - write_csv(tokens, file, source): Escreve tokens em CSV.
+    - write_jsonl(tokens, file, source): Escreve tokens em JSON Lines.
+    - write_binary(tokens, file, table, source): Escreve tokens no formato binário.
+    - write_table(tokens, file, source): Escreve tokens como uma tabela formatada.
+    - read_binary(file): Lê tokens do formato binário.
+"""
+
+from itertools import islice
+from typing import IO, BinaryIO, Iterable, Iterator, Optional, Union
+import csv
+import io
+import json
+import os
+import sys
+
+from .analyzer import LexicalAnalyzer
+
+# Quantidade de tokens escritos por vez.
+BATCH_SIZE = 1 << 13
+
+# Assinatura e versão do formato binário.
+BINARY_MAGIC = b"LPDB"
+BINARY_VERSION = 1
+
+
+def _batches(tokens: Iterable[tuple]) -> Iterator[list]:
+    """
+    Agrupa os tokens em listas de até `BATCH_SIZE` elementos.
+
+    Args:
+        tokens (Iterable[tuple]): Tokens no formato `(lexema, Token, linha)`.
+
+    Yields:
+        list[tuple]: Lotes consecutivos de tokens.
+    """
+    iterator = iter(tokens)
+    while True:
+        batch = list(islice(iterator, BATCH_SIZE))
+        if not batch:
+            return
+        yield batch
+
+
+def write_csv(tokens: Iterable[tuple], file: IO[str], source: Optional[str] = None) -> int:
+    """
+    Escreve tokens em CSV.
+
+    O início de cada linha (lexema e tipo, já com as aspas necessárias) é codificado uma única vez
+    por lexema distinto.
+
+    Args:
+        tokens (Iterable[tuple]): Tokens no formato `(lexema, Token, linha)`.
+        file (IO[str]): Arquivo de texto aberto com `newline=''`.
+        source (str | None): Código fonte completo, incluído na primeira linha se fornecido.
+
+    Returns:
+        int: Quantidade de tokens escritos.
+    """
+    writer = csv.writer(file)
+    if source is None:
+        writer.writerow(["Token", "Tipo", "Linha"])
+    else:
+        writer.writerow(["Código Completo", "Token", "Tipo", "Linha"])
+        writer.writerow([source, "", "", ""])
+
+    buffer = io.StringIO()
+    encoder = csv.writer(buffer)
+    empty = [""] if source is not None else []
+    prefixes = {}
+    count = 0
+    for batch in _batches(tokens):
+        rows = []
+        append = rows.append
+        for lexeme, token, line in batch:
+            entry = prefixes.get(lexeme)
+            if entry is None or entry[0] is not token:
+                buffer.seek(0)
+                buffer.truncate()
+                encoder.writerow([*empty, lexeme, token.type.name, ""])
+                entry = prefixes[lexeme] = (token, buffer.getvalue()[:-len(encoder.dialect.lineterminator)])
+            append(f"{entry[1]}{line}\r\n")
+        file.write("".join(rows))
+        count += len(batch)
+    return count
+
+
+def write_jsonl(tokens: Iterable[tuple], file: IO[str], source: Optional[str] = None) -> int:
+    """
+    Escreve tokens em JSON Lines.
+
+    O início de cada objeto é codificado uma única vez por lexema distinto.
+
+    Args:
+        tokens (Iterable[tuple]): Tokens no formato `(lexema, Token, linha)`.
+        file (IO[str]): Arquivo de texto.
+        source (str | None): Código fonte completo, escrito como `{"source": ...}` na primeira linha se fornecido.
+
+    Returns:
+        int: Quantidade de tokens escritos.
+    """
+    if source is not None:
+        file.write(json.dumps({"source": source}, ensure_ascii=False) + "\n")
+
+    prefixes = {}
+    count = 0
+    for batch in _batches(tokens):
+        lines = []
+        append = lines.append
+        for lexeme, token, line in batch:
+            entry = prefixes.get(lexeme)
+            if entry is None or entry[0] is not token:
+                entry = prefixes[lexeme] = (token, '{"lexeme": %s, "type": %s, "line": ' % (
+                    json.dumps(lexeme, ensure_ascii=False), json.dumps(token.type.name, ensure_ascii=False)))
+            append(f"{entry[1]}{line}}}\n")
+        file.write("".join(lines))
+        count += len(batch)
+    return count
+
+
+def _varint(value: int) -> bytes:
+    """
+    Codifica um inteiro não negativo com 7 bits por byte (LEB128).
+
+    Args:
+        value (int): Inteiro a codificar.
+
+    Returns:
+        bytes: Representação de tamanho variável.
+    """
+    result = bytearray()
+    while value >= 0x80:
+        result.append((value & 0x7F) | 0x80)
+        value >>= 7
+    result.append(value)
+    return bytes(result)
+
+
+# Codificação dos inteiros que ocupam um único byte, usada nos incrementos de linha.
+_SMALL_VARINTS = [bytes((value,)) for value in range(0x80)]
+
+
+def write_binary(tokens: Iterable[tuple], file: BinaryIO, table: list, source: Optional[str] = None) -> int:
+    """
+    Escreve tokens no formato binário compacto.
+
+    O arquivo começa com `LPDB`, a versão e a lista de nomes de tipo da tabela. Em seguida vem o
+    código fonte (tamanho `0` se não incluído) e, para cada token, o incremento da linha em relação
+    ao token anterior, a posição do seu tipo na lista e o lexema em UTF-8 precedido do tamanho,
+    todos os inteiros codificados em LEB128.
+
+    Args:
+        tokens (Iterable[tuple]): Tokens no formato `(lexema, Token, linha)`.
+        file (BinaryIO): Arquivo binário.
+        table (list[Token]): Tabela de tokens do analisador que produziu os tokens.
+        source (str | None): Código fonte completo, incluído no cabeçalho se fornecido.
+
+    Returns:
+        int: Quantidade de tokens escritos.
+    """
+    names = list(dict.fromkeys(token.type.name for token in table))
+    type_ids = {id(token): names.index(token.type.name) for token in table}
+
+    header = bytearray(BINARY_MAGIC)
+    header.append(BINARY_VERSION)
+    header += _varint(len(names))
+    for name in names:
+        encoded = name.encode("utf-8")
+        header += _varint(len(encoded)) + encoded
+    encoded = (source or "").encode("utf-8")
+    header += _varint(len(encoded)) + encoded
+    file.write(header)
+
+    records = {}
+    previous = 0
+    count = 0
+    for batch in _batches(tokens):
+        data = bytearray()
+        for lexeme, token, line in batch:
+            entry = records.get(lexeme)
+            if entry is None or entry[0] is not token:
+                encoded = lexeme.encode("utf-8")
+                entry = records[lexeme] = (token, _varint(type_ids[id(token)]) + _varint(len(encoded)) + encoded)
+            delta = line - previous
+            data += _SMALL_VARINTS[delta] if delta < 0x80 else _varint(delta)
+            data += entry[1]
+            previous = line
+        file.write(data)
+        count += len(batch)
+    return count
+
+
+def read_binary(file: BinaryIO) -> tuple[Optional[str], list[tuple[str, str, int]]]:
+    """
+    Lê tokens do formato binário de `write_binary`.
+
+    Args:
+        file (BinaryIO): Arquivo binário.
+
+    Returns:
+        tuple[str | None, list[tuple[str, str, int]]]: Código fonte (ou `None`, se não incluído) e
+        os tokens no formato `(lexema, nome do tipo, linha)`.
+
+    Raises:
+        ValueError: Se os dados não estiverem no formato esperado.
+    """
+    data = file.read()
+    if data[:4] != BINARY_MAGIC or data[4:5] != bytes((BINARY_VERSION,)):
+        raise ValueError("Formato binário inválido.")
+    position = 5
+
+    def read_int() -> int:
+        nonlocal position
+        value = shift = 0
+        while True:
+            byte = data[position]
+            position += 1
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return value
+            shift += 7
+
+    def read_text() -> str:
+        nonlocal position
+        size = read_int()
+        position += size
+        return data[position - size:position].decode("utf-8")
+
+    names = [read_text() for _ in range(read_int())]
+    source = read_text() or None
+    tokens = []
+    line = 0
+    while position < len(data):
+        line += read_int()
+        name = names[read_int()]
+        tokens.append((read_text(), name, line))
+    return source, tokens
+
+
+def write_table(tokens: Iterable[tuple], file: IO[str], source: Optional[str] = None) -> int:
+    """
+    Escreve tokens como uma tabela formatada com `tabulate`.
+
+    Diferente dos demais formatos, a tabela exige todos os tokens em memória.
+
+    Args:
+        tokens (Iterable[tuple]): Tokens no formato `(lexema, Token, linha)`.
+        file (IO[str]): Arquivo de texto.
+        source (str | None): Código fonte completo, exibido em uma tabela própria se fornecido.
+
+    Returns:
+        int: Quantidade de tokens escritos.
+    """
+    from tabulate import tabulate
+
+    if source is not None:
+        file.write(tabulate([(source,)], headers=["Código LPD"], tablefmt="fancy_grid", stralign="left"))
+        file.write("\n\n")
+    token_table = [(lexeme, token.type.name, line) for lexeme, token, line in tokens]
+    file.write(tabulate(token_table, headers=["Tokens", "Tipos", "Linha"], tablefmt="fancy_grid", stralign="center", colalign=("center", "center", "center")))
+    file.write("\n")
+    return len(token_table)
+
+
+# Formatos disponíveis e se cada um escreve bytes.
+FORMATS = {
+    "csv": False,
+    "jsonl": False,
+    "binary": True,
+    "table": False,
+    "none": False,
+}
+
+
+def export_file(analyzer: LexicalAnalyzer, path: Union[str, os.PathLike], output: Optional[str] = None,
+                format: str = "csv", include_source: bool = False) -> int:
+    """
+    Exporta os tokens de um arquivo, escrevendo-os à medida que são encontrados.
+
+    Args:
+        analyzer (LexicalAnalyzer): Analisador utilizado.
+        path (str | os.PathLike): Caminho do arquivo de código em UTF-8.
+        output (str | None): Caminho do arquivo de saída, ou `None`/`-` para a saída padrão.
+        format (str): Um dos formatos de `FORMATS`.
+        include_source (bool): Indica se o código fonte completo deve ser incluído na saída.
+
+    Returns:
+        int: Quantidade de tokens exportados.
+
+    Raises:
+        ValueError: Se o formato não for suportado.
+    """
+    if format not in FORMATS:
+        raise ValueError(f"Formato de exportação inválido: {format}")
+
+    tokens = analyzer.iter_tokens(path)
+    if format == "none":
+        return sum(1 for _ in tokens)
+
+    source = None
+    if include_source:
+        with open(path, "r", encoding="utf-8") as file:
+            source = file.read()
+
+    to_stdout = output is None or output == "-"
+    if FORMATS[format]:
+        file = sys.stdout.buffer if to_stdout else open(output, "wb")
+    else:
+        file = sys.stdout if to_stdout else open(output, "w", newline="", encoding="utf-8")
+    try:
+        if format == "csv":
+            return write_csv(tokens, file, source)
+        if format == "jsonl":
+            return write_jsonl(tokens, file, source)
+        if format == "binary":
+            return write_binary(tokens, file, analyzer.output_tokens, source)
+        return write_table(tokens, file, source)
+    finally:
+        if to_stdout:
+            file.flush()
+        else:
+            file.close()
@@ -0,0 +1,225 @@
+"""
+Módulo `incremental`
+
+Este módulo implementa a análise léxica incremental de um buffer editado, para uso em editores que
+precisam dos tokens atualizados a cada alteração sem reanalisar o arquivo inteiro.
+
+O buffer é mantido como uma lista de linhas físicas. Como os comentários `{...}` não alteram a
+numeração das linhas, cada linha é analisada isoladamente a partir do estado do analisador no seu
+início (dentro ou fora de um comentário). Para cada linha são guardados seus tokens e o estado ao
+final dela.
+
+Uma edição reanalisa apenas a partir da primeira linha alterada, até que, após a região editada,
+o estado no início de uma linha coincida com o estado anterior à edição. A partir desse ponto os
+tokens antigos continuam válidos; apenas a numeração das linhas pode mudar.
+
+Classes:
+    - TokenDiff: Diferença entre os tokens antes e depois de uma edição.
+    - IncrementalTokenizer: Mantém os tokens de um buffer e os atualiza a cada edição.
+"""
+
+from typing import Optional, Union
+
+from .analyzer import LexicalAnalyzer
+from .scanner import NEWLINE_CHARS
+
+
+class TokenDiff:
+    """
+    Diferença entre os tokens antes e depois de uma edição.
+
+    Attributes:
+        first_line (int): Primeira linha (a partir de 1) reanalisada.
+        removed (list[tuple[str, Token, int]]): Tokens substituídos, com a numeração anterior à edição.
+        inserted (list[tuple[str, Token, int]]): Tokens novos, com a numeração posterior à edição.
+        line_delta (int): Deslocamento aplicado à linha de todos os tokens posteriores aos reanalisados.
+    """
+    def __init__(self, first_line: int, removed: list, inserted: list, line_delta: int) -> None:
+        """
+        Inicializa a diferença de uma edição.
+
+        Args:
+            first_line (int): Primeira linha reanalisada.
+            removed (list): Tokens substituídos.
+            inserted (list): Tokens novos.
+            line_delta (int): Deslocamento das linhas dos tokens posteriores.
+        """
+        self.first_line = first_line
+        self.removed = removed
+        self.inserted = inserted
+        self.line_delta = line_delta
+
+    def __repr__(self) -> str:
+        """Retorna a representação textual da diferença."""
+        return (f"TokenDiff(first_line={self.first_line}, removed={len(self.removed)}, "
+                f"inserted={len(self.inserted)}, line_delta={self.line_delta})")
+
+
+class IncrementalTokenizer:
+    """
+    Mantém os tokens de um buffer de código e os atualiza a cada edição.
+
+    Attributes:
+        analyzer (LexicalAnalyzer): Analisador utilizado para classificar os lexemas.
+    """
+    def __init__(self, text: str = "", analyzer: Optional[LexicalAnalyzer] = None) -> None:
+        """
+        Inicializa o buffer e realiza a análise completa do texto inicial.
+
+        Args:
+            text (str): Conteúdo inicial do buffer.
+            analyzer (LexicalAnalyzer | None): Analisador utilizado (padrão: um novo `LexicalAnalyzer`).
+        """
+        self.analyzer = analyzer or LexicalAnalyzer()
+        self.set_text(text)
+
+    def set_text(self, text: str) -> None:
+        """
+        Substitui todo o conteúdo do buffer, reanalisando-o por completo.
+
+        Args:
+            text (str): Novo conteúdo do buffer.
+        """
+        self._lines = text.splitlines(keepends=True)
+        self._tokens = []
+        self._open = []
+
+        opened = False
+        for line in self._lines:
+            line_tokens, opened = self._lex_line(line, opened)
+            self._tokens.append(line_tokens)
+            self._open.append(opened)
+
+    @property
+    def text(self) -> str:
+        """Conteúdo atual do buffer."""
+        return "".join(self._lines)
+
+    def tokens(self) -> list[tuple[Union[str, int], object, int]]:
+        """
+        Monta a lista completa de tokens do buffer, no mesmo formato de `LexicalAnalyzer.tokenize`.
+
+        Returns:
+            list[tuple[str, Token, int]]: Lista de tokens encontrados com a linha correspondente.
+        """
+        return _number(self._tokens, 1)
+
+    def edit(self, start: tuple[int, int], end: tuple[int, int], replacement: str) -> TokenDiff:
+        """
+        Substitui um trecho do buffer e reanalisa apenas as linhas afetadas.
+
+        Args:
+            start (tuple[int, int]): Linha física e coluna iniciais do trecho, a partir de 0.
+            end (tuple[int, int]): Linha física e coluna finais (exclusivas) do trecho.
+            replacement (str): Texto que substitui o trecho.
+
+        Returns:
+            TokenDiff: Tokens substituídos e inseridos pela edição.
+
+        Raises:
+            ValueError: Se o trecho estiver fora do buffer ou se `end` vier antes de `start`.
+        """
+        (a, a_col), (b, b_col) = start, end
+        lines = self._lines
+        n = len(lines)
+        if not (0 <= a <= b <= n) or (a == b and a_col > b_col):
+            raise ValueError(f"Trecho inválido: {start} - {end}")
+        for line, col in (start, end):
+            if not 0 <= col <= len(_content(lines[line]) if line < n else ""):
+                raise ValueError(f"Coluna inválida: {(line, col)}")
+
+        # Texto das linhas afetadas após a edição, estendido para não separar `\r\n`
+        # nem deixar a última linha sem quebra separada do texto inserido.
+        low, high = a, min(b + 1, n)
+        text = (lines[a][:a_col] if a < n else "") + replacement + (lines[b][b_col:] if b < n else "")
+        if text.endswith("\r") and high < n and lines[high].startswith("\n"):
+            text += lines[high]
+            high += 1
+        if low > 0 and (lines[low - 1] == _content(lines[low - 1]) or (lines[low - 1].endswith("\r") and text.startswith("\n"))):
+            low -= 1
+            text = lines[low] + text
+
+        new_lines = text.splitlines(keepends=True)
+        region_end = low + len(new_lines)
+        opened = self._open[low - 1] if low > 0 else False
+        # Estado anterior à edição no início da primeira linha posterior à região editada.
+        old_state = self._open[high - 1] if high > low else opened
+
+        removed = self._tokens[low:high]
+        self._lines[low:high] = new_lines
+        self._tokens[low:high] = [[] for _ in new_lines]
+        self._open[low:high] = [False] * len(new_lines)
+
+        line = low
+        while line < len(self._lines):
+            # Converge quando uma linha posterior à região começa no mesmo estado de antes da edição.
+            if line >= region_end:
+                if opened == old_state:
+                    break
+                removed.append(self._tokens[line])
+                old_state = self._open[line]
+            self._tokens[line], opened = self._lex_line(self._lines[line], opened)
+            self._open[line] = opened
+            line += 1
+
+        return TokenDiff(low + 1, _number(removed, low + 1), _number(self._tokens[low:line], low + 1),
+                         len(new_lines) - (high - low))
+
+    def _lex_line(self, line: str, opened: bool) -> tuple[list, bool]:
+        """
+        Analisa uma linha física a partir do estado no seu início.
+
+        Args:
+            line (str): Linha física, incluindo a quebra de linha.
+            opened (bool): Indica se a linha começa dentro de um comentário.
+
+        Returns:
+            tuple[list, bool]: Tokens `(lexema, Token)` da linha e o estado ao final dela.
+        """
+        if opened:
+            position = line.find("}") + 1
+            if not position:
+                return [], True
+            line = line[position:]
+
+        scanner = self.analyzer.scanner
+        found = []
+        # As linhas são analisadas isoladamente: os erros léxicos não são registrados nos diagnósticos do analisador.
+        diagnostics, scanner.diagnostics = scanner.diagnostics, None
+        try:
+            scanner.scan_into(line, found)
+        finally:
+            scanner.diagnostics = diagnostics
+        return [(lexeme, token) for lexeme, token, _ in found], scanner.open_comment is not None
+
+
+def _content(line: str) -> str:
+    """
+    Remove a quebra de linha do final de uma linha física.
+
+    Args:
+        line (str): Linha física, possivelmente terminada por uma quebra de linha.
+
+    Returns:
+        str: Conteúdo da linha sem a quebra.
+    """
+    if line.endswith("\r\n"):
+        return line[:-2]
+    if line and line[-1] in NEWLINE_CHARS:
+        return line[:-1]
+    return line
+
+
+def _number(rows, first_line: int) -> list:
+    """
+    Numera os tokens de linhas físicas consecutivas.
+
+    Args:
+        rows (Iterable[list]): Tokens `(lexema, Token)` de cada linha.
+        first_line (int): Número da primeira linha.
+
+    Returns:
+        list[tuple[str, Token, int]]: Tokens com a linha correspondente.
+    """
+    return [(lexeme, token, line_number) for line_number, line_tokens in enumerate(rows, start=first_line)
+            for lexeme, token in line_tokens]
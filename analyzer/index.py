@@ -0,0 +1,662 @@
+"""
+Módulo `index`
+
+Este módulo implementa um índice invertido persistente dos identificadores de um conjunto de
+arquivos LPD: para cada identificador, as ocorrências `(arquivo, linha, coluna)` em todos os
+arquivos, com consultas exatas e por prefixo que não leem os códigos fonte.
+
+Os identificadores ficam ordenados, de modo que uma consulta exata ou por prefixo é uma busca
+binária. As ocorrências de cada identificador (a lista de postings) são agrupadas por arquivo, em
+ordem crescente do número do arquivo, e codificadas como inteiros de tamanho variável (LEB128) com
+codificação por diferença. Cada grupo guarda a diferença para o número do arquivo anterior e o
+tamanho em bytes das suas ocorrências, para que os grupos de arquivos removidos sejam pulados sem
+decodificação. Cada ocorrência guarda a diferença de linha e a coluna, ou a diferença de coluna na
+mesma linha. No arquivo do índice, as listas ficam concatenadas em um único bloco, e a leitura
+decodifica apenas as listas consultadas.
+
+A atualização é incremental, como no modo de observação (`analyzer.watch`): apenas os arquivos com
+metadados diferentes são lidos, e apenas os com conteúdo diferente são reanalisados. Um arquivo
+alterado recebe um número novo, maior que os existentes, de modo que suas ocorrências são
+acrescentadas ao fim das listas. O número antigo é marcado como removido, e suas ocorrências são
+ignoradas nas consultas até uma compactação, feita ao gravar quando os arquivos removidos passam
+de `COMPACT_RATIO` do total.
+
+O índice guarda a impressão digital da tabela de tokens do analisador (`LexicalAnalyzer.fingerprint`);
+um índice gravado com outra tabela, ou corrompido, é descartado na abertura e reconstruído na
+próxima atualização.
+
+Classes:
+    - IdentifierIndex: Índice invertido persistente dos identificadores de vários arquivos.
+
+Constantes:
+    - COMPACT_RATIO: Fração de arquivos removidos a partir da qual `save` compacta o índice.
+"""
+
+from array import array
+from bisect import bisect_left
+from typing import Iterable, Optional, Union
+import hashlib
+import os
+import struct
+import sys
+import time
+
+from .analyzer import LexicalAnalyzer
+from .diagnostics import LexicalError
+from .tokens import Token
+from .watch import RACY_NS, WatchUpdate, stat_tree
+
+COMPACT_RATIO = 0.25
+
+# Assinatura, versão, quantidade de arquivos e de identificadores e tamanhos da impressão digital, dos
+# caminhos, dos identificadores e das listas de ocorrências.
+_MAGIC = b"LPDX"
+_VERSION = 1
+_HEADER = struct.Struct("<4sBIIIIIQ")
+_DIGEST_SIZE = 16
+
+
+def _put(out: bytearray, value: int) -> None:
+    """Acrescenta um inteiro não negativo em LEB128."""
+    while value > 0x7F:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _get(data, position: int) -> tuple[int, int]:
+    """
+    Lê um inteiro em LEB128.
+
+    Args:
+        data (bytes | bytearray | memoryview): Dados codificados.
+        position (int): Posição do primeiro byte.
+
+    Returns:
+        tuple[int, int]: O inteiro e a posição seguinte a ele.
+    """
+    byte = data[position]
+    if byte < 0x80:
+        return byte, position + 1
+    value, shift = byte & 0x7F, 7
+    while True:
+        position += 1
+        byte = data[position]
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, position + 1
+        shift += 7
+
+
+def _encode_group(out: bytearray, file_delta: int, positions: list) -> None:
+    """
+    Acrescenta o grupo de ocorrências de um identificador em um arquivo.
+
+    Args:
+        out (bytearray): Lista de ocorrências do identificador.
+        file_delta (int): Diferença para o número do arquivo do grupo anterior.
+        positions (list[tuple[int, int]]): Linha e coluna de cada ocorrência, em ordem.
+    """
+    body = bytearray()
+    previous_line = previous_column = 0
+    for line, column in positions:
+        if line != previous_line:
+            _put(body, line - previous_line)
+            _put(body, column)
+        else:
+            _put(body, 0)
+            _put(body, column - previous_column)
+        previous_line, previous_column = line, column
+    _put(out, file_delta)
+    _put(out, len(body))
+    out += body
+
+
+class IdentifierIndex:
+    """
+    Índice invertido persistente dos identificadores de vários arquivos.
+
+    Attributes:
+        path (str | None): Arquivo do índice, ou `None` para um índice apenas em memória.
+        analyzer (LexicalAnalyzer): Analisador utilizado para encontrar os identificadores.
+        fingerprint (str): Impressão digital da tabela de tokens do analisador.
+        discarded (bool): Indica se um arquivo de índice existente foi descartado na abertura, por
+            ter outra tabela de tokens ou estar corrompido.
+    """
+    def __init__(self, path: Optional[Union[str, os.PathLike]] = None, analyzer: Optional[LexicalAnalyzer] = None) -> None:
+        """
+        Abre o índice gravado em `path`, ou cria um índice vazio.
+
+        Args:
+            path (str | os.PathLike | None): Arquivo do índice; se não existir, é criado por `save`.
+            analyzer (LexicalAnalyzer | None): Analisador utilizado (padrão: um novo `LexicalAnalyzer`).
+        """
+        self.path = None if path is None else os.fspath(path)
+        self.analyzer = analyzer or LexicalAnalyzer()
+        self.fingerprint = self.analyzer.ensure_index()
+        self.discarded = False
+        self._reset()
+        if self.path is not None and os.path.exists(self.path):
+            try:
+                with open(self.path, "rb") as file:
+                    self._load(file.read())
+            except (OSError, ValueError, struct.error):
+                self._reset()
+                self.discarded = True
+
+    def _reset(self) -> None:
+        """Esvazia o índice."""
+        # Arquivos, pelo número: caminho (`None` se removido), metadados e resumo do conteúdo.
+        self._paths = []
+        self._file_ids = {}
+        self._mtimes = array("q")
+        self._sizes = array("q")
+        self._checked = array("q")
+        self._digests = []
+        self._dead = 0
+        # Identificadores gravados, em ordem, e suas listas de ocorrências no bloco `_blob`.
+        self._terms = []
+        self._offsets = array("Q", [0])
+        self._blob = b""
+        # Número do último arquivo de cada identificador, para acrescentar um grupo.
+        self._last = array("I")
+        # Identificadores acrescentados desde a última gravação e listas de ocorrências modificadas.
+        self._extra = {}
+        self._postings = {}
+        self._dirty = False
+
+    def __len__(self) -> int:
+        """Retorna a quantidade de arquivos indexados."""
+        return len(self._file_ids)
+
+    def __contains__(self, path: str) -> bool:
+        """Indica se um arquivo está indexado."""
+        return os.path.normpath(path) in self._file_ids
+
+    @property
+    def dirty(self) -> bool:
+        """Indica se o índice foi modificado desde a abertura ou a última gravação."""
+        return self._dirty
+
+    def stats(self) -> dict:
+        """
+        Retorna os tamanhos do índice.
+
+        Returns:
+            dict: Arquivos indexados e removidos, identificadores e bytes das listas de ocorrências.
+        """
+        postings = len(self._blob) + sum(len(data) - len(self._stored(term_id)) for term_id, data in self._postings.items())
+        return {
+            "files": len(self._file_ids),
+            "removed": self._dead,
+            "identifiers": len(self._terms) + len(self._extra),
+            "postings_bytes": postings,
+        }
+
+    # Atualização
+
+    def refresh(self, roots: Iterable[str], extension: str = ".lpd") -> WatchUpdate:
+        """
+        Atualiza o índice com os arquivos novos, alterados e removidos de uma árvore.
+
+        Os arquivos indexados que não estão mais na árvore são removidos do índice.
+
+        Args:
+            roots (Iterable[str]): Diretórios, arquivos ou padrões glob (veja `analyzer.watch.stat_tree`).
+            extension (str): Extensão dos arquivos procurados nos diretórios.
+
+        Returns:
+            WatchUpdate: Arquivos afetados pela atualização.
+        """
+        start = time.perf_counter()
+        update = WatchUpdate()
+        found = stat_tree(roots, extension)
+        update.scanned = len(found)
+
+        for path in [path for path in self._file_ids if path not in found]:
+            self.remove(path)
+            update.removed.append(path)
+
+        for path in sorted(found):
+            mtime_ns, size = found[path]
+            file_id = self._file_ids.get(path)
+            if (file_id is not None and self._mtimes[file_id] == mtime_ns and self._sizes[file_id] == size
+                    and mtime_ns < self._checked[file_id] - RACY_NS):
+                continue
+            try:
+                with open(path, "rb") as file:
+                    data = file.read()
+            except OSError:
+                if file_id is not None:
+                    self.remove(path)
+                    update.removed.append(path)
+                continue
+            digest = hashlib.blake2b(data, digest_size=_DIGEST_SIZE).digest()
+            if file_id is not None and self._digests[file_id] == digest:
+                if (self._mtimes[file_id], self._sizes[file_id]) != (mtime_ns, size):
+                    update.touched.append(path)
+                self._mtimes[file_id], self._sizes[file_id], self._checked[file_id] = mtime_ns, size, time.time_ns()
+                self._dirty = True
+                continue
+
+            (update.added if file_id is None else update.modified).append(path)
+            if self._add(path, data, mtime_ns, size, digest) is not None:
+                update.failed.append(path)
+
+        update.elapsed = time.perf_counter() - start
+        return update
+
+    def add_file(self, path: Union[str, os.PathLike]) -> Optional[str]:
+        """
+        Indexa um arquivo, substituindo suas ocorrências anteriores.
+
+        Args:
+            path (str | os.PathLike): Caminho do arquivo.
+
+        Returns:
+            str | None: Mensagem de erro, se o arquivo não pôde ser analisado; ele continua
+            registrado, sem ocorrências, até ser alterado.
+
+        Raises:
+            OSError: Se o arquivo não puder ser lido.
+        """
+        path = os.path.normpath(os.fspath(path))
+        with open(path, "rb") as file:
+            stat = os.fstat(file.fileno())
+            data = file.read()
+        digest = hashlib.blake2b(data, digest_size=_DIGEST_SIZE).digest()
+        return self._add(path, data, stat.st_mtime_ns, stat.st_size, digest)
+
+    def remove(self, path: Union[str, os.PathLike]) -> bool:
+        """
+        Remove um arquivo do índice.
+
+        Args:
+            path (str | os.PathLike): Caminho do arquivo.
+
+        Returns:
+            bool: `True` se o arquivo estava indexado.
+        """
+        file_id = self._file_ids.pop(os.path.normpath(os.fspath(path)), None)
+        if file_id is None:
+            return False
+        self._paths[file_id] = None
+        self._dead += 1
+        self._dirty = True
+        return True
+
+    def _add(self, path: str, data: bytes, mtime_ns: int, size: int, digest: bytes) -> Optional[str]:
+        """
+        Registra um arquivo com um número novo e acrescenta suas ocorrências às listas.
+
+        Args:
+            path (str): Caminho normalizado do arquivo.
+            data (bytes): Conteúdo do arquivo.
+            mtime_ns (int): `mtime` do arquivo, em nanossegundos.
+            size (int): Tamanho do arquivo, em bytes.
+            digest (bytes): Resumo do conteúdo.
+
+        Returns:
+            str | None: Mensagem de erro, se o arquivo não pôde ser analisado.
+        """
+        self.remove(path)
+        file_id = len(self._paths)
+        self._paths.append(path)
+        self._file_ids[path] = file_id
+        self._mtimes.append(mtime_ns)
+        self._sizes.append(size)
+        self._checked.append(time.time_ns())
+        self._digests.append(digest)
+        self._dirty = True
+
+        try:
+            stream = self.analyzer.scan_stream(data.decode("utf-8"))
+        except (UnicodeDecodeError, LexicalError) as e:
+            return str(e)
+
+        identifiers = {position for position, token in enumerate(stream.table) if token.type is Token.SIDENTIFICADOR}
+        line_starts = stream.index.line_starts
+        source = stream.source
+        occurrences = {}
+        for type_id, line, start, end in zip(stream.type_ids, stream.lines, stream.starts, stream.ends):
+            if type_id in identifiers:
+                position = (line, start - line_starts[line - 1] + 1)
+                lexeme = source[start:end]
+                found = occurrences.get(lexeme)
+                if found is None:
+                    occurrences[lexeme] = [position]
+                else:
+                    found.append(position)
+
+        last = self._last
+        for lexeme, positions in occurrences.items():
+            term_id = self._term_id(lexeme)
+            if term_id is None:
+                term_id = self._extra[lexeme] = len(last)
+                last.append(0)
+                postings = self._postings[term_id] = bytearray()
+            else:
+                postings = self._postings.get(term_id)
+                if postings is None:
+                    postings = self._postings[term_id] = bytearray(self._stored(term_id))
+            _encode_group(postings, file_id - last[term_id], positions)
+            last[term_id] = file_id
+        return None
+
+    # Consultas
+
+    def find(self, identifier: str) -> list[tuple[str, int, int]]:
+        """
+        Retorna as ocorrências de um identificador.
+
+        Args:
+            identifier (str): Lexema do identificador, como escrito no código fonte.
+
+        Returns:
+            list[tuple[str, int, int]]: Caminho, linha e coluna (a partir de 1) de cada ocorrência,
+            ordenados.
+        """
+        term_id = self._term_id(identifier)
+        if term_id is None:
+            return []
+        return sorted(self._decode(term_id))
+
+    def files(self, identifier: str) -> list[str]:
+        """
+        Retorna os arquivos em que um identificador aparece, sem decodificar as ocorrências.
+
+        Args:
+            identifier (str): Lexema do identificador.
+
+        Returns:
+            list[str]: Caminhos dos arquivos, em ordem alfabética.
+        """
+        term_id = self._term_id(identifier)
+        if term_id is None:
+            return []
+        return sorted(self._decode_files(term_id))
+
+    def identifiers(self, prefix: str = "", limit: Optional[int] = None) -> list[str]:
+        """
+        Retorna os identificadores indexados que começam com um prefixo.
+
+        Args:
+            prefix (str): Prefixo procurado (padrão: todos os identificadores).
+            limit (int | None): Quantidade máxima de identificadores retornados.
+
+        Returns:
+            list[str]: Identificadores presentes em algum arquivo indexado, em ordem.
+        """
+        found = []
+        for identifier, term_id in self._prefix_range(prefix):
+            if self._decode_files(term_id, first=True):
+                found.append(identifier)
+                if limit is not None and len(found) >= limit:
+                    break
+        return found
+
+    def search(self, prefix: str, limit: Optional[int] = None) -> dict[str, list[tuple[str, int, int]]]:
+        """
+        Retorna as ocorrências de todos os identificadores que começam com um prefixo.
+
+        Args:
+            prefix (str): Prefixo procurado.
+            limit (int | None): Quantidade máxima de identificadores retornados.
+
+        Returns:
+            dict[str, list[tuple[str, int, int]]]: Ocorrências de cada identificador, como em `find`.
+        """
+        return {identifier: self.find(identifier) for identifier in self.identifiers(prefix, limit)}
+
+    def _term_id(self, identifier: str) -> Optional[int]:
+        """Retorna o número de um identificador, ou `None` se ele não estiver indexado."""
+        terms = self._terms
+        position = bisect_left(terms, identifier)
+        if position < len(terms) and terms[position] == identifier:
+            return position
+        return self._extra.get(identifier)
+
+    def _prefix_range(self, prefix: str) -> list[tuple[str, int]]:
+        """Retorna os identificadores com um prefixo e seus números, em ordem."""
+        terms = self._terms
+        start = bisect_left(terms, prefix)
+        # Todo identificador com o prefixo é menor que o prefixo seguido do maior caractere.
+        end = bisect_left(terms, prefix + "\U0010ffff", start)
+        found = [(terms[term_id], term_id) for term_id in range(start, end)]
+        if self._extra:
+            found.extend((term, term_id) for term, term_id in self._extra.items() if term.startswith(prefix))
+            found.sort()
+        return found
+
+    def _stored(self, term_id: int) -> memoryview:
+        """Retorna a lista de ocorrências gravada de um identificador, sem cópia."""
+        if term_id >= len(self._terms):
+            return memoryview(b"")
+        return memoryview(self._blob)[self._offsets[term_id]:self._offsets[term_id + 1]]
+
+    def _encoded(self, term_id: int):
+        """Retorna a lista de ocorrências atual de um identificador."""
+        postings = self._postings.get(term_id)
+        return self._stored(term_id) if postings is None else postings
+
+    def _decode(self, term_id: int) -> list[tuple[str, int, int]]:
+        """Decodifica as ocorrências de um identificador nos arquivos indexados."""
+        data = self._encoded(term_id)
+        paths = self._paths
+        found = []
+        position, size, file_id = 0, len(data), 0
+        while position < size:
+            delta, position = _get(data, position)
+            length, position = _get(data, position)
+            file_id += delta
+            end = position + length
+            path = paths[file_id]
+            if path is None:
+                position = end
+                continue
+            line = column = 0
+            while position < end:
+                line_delta, position = _get(data, position)
+                value, position = _get(data, position)
+                if line_delta:
+                    line += line_delta
+                    column = value
+                else:
+                    column += value
+                found.append((path, line, column))
+        return found
+
+    def _decode_files(self, term_id: int, first: bool = False) -> list[str]:
+        """
+        Decodifica os arquivos indexados em que um identificador aparece.
+
+        Args:
+            term_id (int): Número do identificador.
+            first (bool): Indica se a decodificação termina no primeiro arquivo encontrado.
+
+        Returns:
+            list[str]: Caminhos dos arquivos.
+        """
+        data = self._encoded(term_id)
+        paths = self._paths
+        found = []
+        position, size, file_id = 0, len(data), 0
+        while position < size:
+            delta, position = _get(data, position)
+            length, position = _get(data, position)
+            file_id += delta
+            position += length
+            if paths[file_id] is not None:
+                found.append(paths[file_id])
+                if first:
+                    break
+        return found
+
+    # Persistência
+
+    def compact(self) -> None:
+        """
+        Renumera os arquivos indexados e descarta as ocorrências dos removidos.
+
+        Os grupos de ocorrências são copiados sem decodificação; apenas a diferença entre os números
+        dos arquivos é recalculada.
+        """
+        renumbered = array("i", [-1]) * len(self._paths)
+        paths = []
+        for file_id, path in enumerate(self._paths):
+            if path is not None:
+                renumbered[file_id] = len(paths)
+                paths.append(path)
+        live = [file_id for file_id, path in enumerate(self._paths) if path is not None]
+
+        terms, chunks, offsets, last = [], [], array("Q", [0]), array("I")
+        total = 0
+        for term, term_id in self._sorted_terms():
+            data = self._encoded(term_id)
+            out = bytearray()
+            position, size, file_id, previous = 0, len(data), 0, 0
+            while position < size:
+                delta, position = _get(data, position)
+                length, position = _get(data, position)
+                file_id += delta
+                new_id = renumbered[file_id]
+                if new_id >= 0:
+                    _put(out, new_id - previous)
+                    _put(out, length)
+                    out += data[position:position + length]
+                    previous = new_id
+                position += length
+            if out:
+                terms.append(term)
+                chunks.append(out)
+                total += len(out)
+                offsets.append(total)
+                last.append(previous)
+
+        self._paths = paths
+        self._file_ids = {path: file_id for file_id, path in enumerate(paths)}
+        self._mtimes = array("q", [self._mtimes[file_id] for file_id in live])
+        self._sizes = array("q", [self._sizes[file_id] for file_id in live])
+        self._checked = array("q", [self._checked[file_id] for file_id in live])
+        self._digests = [self._digests[file_id] for file_id in live]
+        self._dead = 0
+        self._terms, self._offsets, self._last, self._blob = terms, offsets, last, b"".join(chunks)
+        self._extra, self._postings = {}, {}
+        self._dirty = True
+
+    def _sorted_terms(self) -> list[tuple[str, int]]:
+        """Retorna todos os identificadores e seus números, em ordem."""
+        found = list(zip(self._terms, range(len(self._terms))))
+        if self._extra:
+            found.extend(self._extra.items())
+            found.sort()
+        return found
+
+    def _merge(self) -> None:
+        """Incorpora os identificadores e as listas modificadas ao bloco gravado, em ordem."""
+        if not self._extra and not self._postings:
+            return
+        terms, chunks, offsets, last = [], [], array("Q", [0]), array("I")
+        total = 0
+        for term, term_id in self._sorted_terms():
+            data = self._encoded(term_id)
+            terms.append(term)
+            chunks.append(data)
+            total += len(data)
+            offsets.append(total)
+            last.append(self._last[term_id])
+        self._terms, self._offsets, self._last, self._blob = terms, offsets, last, b"".join(chunks)
+        self._extra, self._postings = {}, {}
+
+    def save(self, path: Optional[Union[str, os.PathLike]] = None) -> None:
+        """
+        Grava o índice, compactando-o antes se houver muitos arquivos removidos.
+
+        A gravação é feita em um arquivo temporário renomeado ao final, de modo que leitores
+        concorrentes nunca veem um índice parcial.
+
+        Args:
+            path (str | os.PathLike | None): Arquivo do índice (padrão: `self.path`).
+
+        Raises:
+            ValueError: Se nenhum arquivo for informado.
+        """
+        path = self.path if path is None else os.fspath(path)
+        if path is None:
+            raise ValueError("O índice não tem um arquivo associado.")
+        if self._dead and self._dead >= COMPACT_RATIO * len(self._paths):
+            self.compact()
+        else:
+            self._merge()
+
+        fingerprint = self.fingerprint.encode("ascii")
+        paths = "\0".join(path or "" for path in self._paths).encode("utf-8")
+        terms = "\0".join(self._terms).encode("utf-8")
+        columns = [self._mtimes, self._sizes, self._checked, self._offsets, self._last]
+        if sys.byteorder != "little":
+            columns = [array(column.typecode, column) for column in columns]
+            for column in columns:
+                column.byteswap()
+        mtimes, sizes, checked, offsets, last = columns
+        header = _HEADER.pack(_MAGIC, _VERSION, len(self._paths), len(self._terms), len(fingerprint), len(paths),
+                              len(terms), len(self._blob))
+
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, "wb") as file:
+            for part in (header, fingerprint, paths, mtimes, sizes, checked, b"".join(self._digests), terms,
+                         offsets, last, self._blob):
+                file.write(part)
+        os.replace(temporary, path)
+        self.path = path
+        self._dirty = False
+
+    def _load(self, data: bytes) -> None:
+        """
+        Lê um índice gravado por `save`.
+
+        Args:
+            data (bytes): Conteúdo do arquivo do índice.
+
+        Raises:
+            ValueError: Se o arquivo não for um índice válido ou tiver outra tabela de tokens.
+            struct.error: Se o cabeçalho estiver truncado.
+        """
+        magic, version, files, term_count, fingerprint_size, paths_size, terms_size, blob_size = _HEADER.unpack_from(data)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("Arquivo de índice inválido.")
+        view = memoryview(data)
+        position = _HEADER.size
+
+        def take(size: int) -> memoryview:
+            nonlocal position
+            if position + size > len(data):
+                raise ValueError("Arquivo de índice truncado.")
+            part = view[position:position + size]
+            position += size
+            return part
+
+        def column(typecode: str, count: int) -> array:
+            values = array(typecode)
+            values.frombytes(take(count * values.itemsize))
+            if sys.byteorder != "little":
+                values.byteswap()
+            return values
+
+        if str(take(fingerprint_size), "ascii") != self.fingerprint:
+            raise ValueError("O índice foi construído com outra tabela de tokens.")
+        paths = str(take(paths_size), "utf-8").split("\0") if files else []
+        self._mtimes = column("q", files)
+        self._sizes = column("q", files)
+        self._checked = column("q", files)
+        digests = bytes(take(files * _DIGEST_SIZE))
+        self._terms = str(take(terms_size), "utf-8").split("\0") if term_count else []
+        self._offsets = column("Q", term_count + 1)
+        self._last = column("I", term_count)
+        self._blob = bytes(take(blob_size))
+        if len(paths) != files or len(self._terms) != term_count or self._offsets[-1] != blob_size:
+            raise ValueError("Arquivo de índice inconsistente.")
+
+        self._paths = [path or None for path in paths]
+        self._file_ids = {path: file_id for file_id, path in enumerate(self._paths) if path is not None}
+        self._dead = files - len(self._file_ids)
+        self._digests = [digests[start:start + _DIGEST_SIZE] for start in range(0, len(digests), _DIGEST_SIZE)]
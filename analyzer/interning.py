@@ -0,0 +1,134 @@
+"""
+Módulo `interning`
+
+Este módulo implementa o conjunto de lexemas internados utilizado pelo `LexicalAnalyzer`.
+
+Sem internação, cada ocorrência de `Contador`, `begin` ou `;` no resultado da análise é uma `str`
+nova, criada pela expressão regular. Com um `InternPool`, a primeira ocorrência de cada lexema é
+guardada e as seguintes são substituídas por ela, de modo que lexemas repetidos compartilham um único
+objeto: a memória do resultado passa a depender da quantidade de lexemas distintos e a comparação
+por identidade (`is`) passa a valer entre tokens do mesmo conjunto.
+
+O conjunto pode ser exclusivo de um analisador (o padrão) ou compartilhado entre vários, passando o
+mesmo `InternPool` a cada `LexicalAnalyzer`. Os motores de análise contam os lexemas em lote, a cada
+chamada, sem custo adicional por token.
+
+Classes:
+    - InternPool: Conjunto de lexemas internados, com tamanho e taxa de acerto.
+"""
+
+
+class InternPool:
+    """
+    Conjunto de lexemas internados.
+
+    Attributes:
+        strings (dict[str, str]): Lexema canônico de cada lexema distinto.
+        limit (int): Quantidade máxima de lexemas guardados; ao atingi-la, novos lexemas não são
+            internados (com `0`, a internação é desativada).
+        requests (int): Quantidade de lexemas consultados.
+        misses (int): Quantidade de lexemas consultados que ainda não estavam no conjunto.
+    """
+    __slots__ = ("strings", "limit", "requests", "misses")
+
+    def __init__(self, limit: int = 1 << 20) -> None:
+        """
+        Inicializa um conjunto vazio.
+
+        Args:
+            limit (int): Quantidade máxima de lexemas guardados.
+        """
+        self.strings = {}
+        self.limit = limit
+        self.requests = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Retorna a quantidade de lexemas guardados."""
+        return len(self.strings)
+
+    def __contains__(self, lexeme: str) -> bool:
+        """Indica se o lexema já está no conjunto."""
+        return lexeme in self.strings
+
+    @property
+    def enabled(self) -> bool:
+        """Indica se ainda há espaço para novos lexemas."""
+        return len(self.strings) < self.limit
+
+    @property
+    def hits(self) -> int:
+        """Quantidade de lexemas consultados que já estavam no conjunto."""
+        return self.requests - self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Fração dos lexemas consultados que já estavam no conjunto (`0.0` sem consultas)."""
+        return self.hits / self.requests if self.requests else 0.0
+
+    def intern(self, lexeme: str) -> str:
+        """
+        Retorna o lexema canônico, guardando `lexeme` se ele ainda não estiver no conjunto.
+
+        Args:
+            lexeme (str): Lexema encontrado na análise.
+
+        Returns:
+            str: O objeto guardado para o lexema, ou o próprio `lexeme` se o limite foi atingido.
+        """
+        self.requests += 1
+        canonical = self.strings.get(lexeme)
+        if canonical is not None:
+            return canonical
+        if len(self.strings) >= self.limit:
+            return lexeme
+        self.misses += 1
+        self.strings[lexeme] = lexeme
+        return lexeme
+
+    def record(self, requests: int, misses: int = 0) -> None:
+        """
+        Contabiliza um lote de consultas feitas diretamente em `strings` por um motor de análise.
+
+        Args:
+            requests (int): Quantidade de lexemas consultados.
+            misses (int): Quantidade de lexemas acrescentados ao conjunto.
+        """
+        self.requests += requests
+        self.misses += misses
+
+    def add(self, lexeme: str) -> str:
+        """
+        Guarda um lexema sem contá-lo como consulta, como as palavras reservadas da tabela de tokens.
+
+        Args:
+            lexeme (str): Lexema a guardar.
+
+        Returns:
+            str: O objeto guardado para o lexema.
+        """
+        if len(self.strings) >= self.limit:
+            return self.strings.get(lexeme, lexeme)
+        return self.strings.setdefault(lexeme, lexeme)
+
+    def clear(self) -> None:
+        """Descarta os lexemas guardados e os contadores."""
+        self.strings.clear()
+        self.requests = 0
+        self.misses = 0
+
+    def summary(self) -> dict:
+        """
+        Retorna o tamanho e os contadores do conjunto em um `dict` serializável em JSON.
+
+        Returns:
+            dict: Tamanho, limite, consultas, acertos, falhas e taxa de acerto.
+        """
+        return {
+            "size": len(self.strings),
+            "limit": self.limit,
+            "requests": self.requests,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+        }
@@ -0,0 +1,184 @@
+"""
+Módulo `profiling`
+
+Este módulo implementa a instrumentação opcional do `LexicalAnalyzer`.
+
+Um `Profiler` associado ao analisador (veja `LexicalAnalyzer.enable_profiling`) acumula o tempo e a
+quantidade de chamadas de cada etapa da análise (divisão em linhas, busca de lexemas,
+classificação, varredura), a quantidade de chamadas de expressões regulares e de
+classificação, os tokens por tipo e as linhas mais lentas. Sem um `Profiler`, o analisador executa
+apenas uma comparação com `None` por chamada.
+
+O resumo pode ser obtido como `dict` (`summary`), como texto (`format`) ou no formato do `cProfile`:
+`pstats.Stats(profiler)` e `dump_stats(path)` funcionam como com um `cProfile.Profile`, com uma
+entrada por etapa.
+
+Classes:
+    - Profiler: Acumula as medições das etapas da análise léxica.
+"""
+
+from collections import Counter
+from contextlib import contextmanager
+from typing import Callable, Iterator
+import heapq
+import marshal
+import time
+
+
+class Profiler:
+    """
+    Acumula as medições das etapas da análise léxica.
+
+    Attributes:
+        stage_seconds (Counter): Tempo acumulado de cada etapa, em segundos.
+        stage_calls (Counter): Quantidade de execuções de cada etapa.
+        regex_calls (int): Quantidade de chamadas a expressões regulares.
+        classify_calls (int): Quantidade de lexemas classificados.
+        tokens_by_type (Counter): Quantidade de tokens de cada tipo.
+        slow_line_limit (int): Quantidade de linhas mais lentas mantidas.
+        hooks (list[callable]): Funções chamadas com `(etapa, segundos)` a cada medição.
+    """
+    def __init__(self, slow_line_limit: int = 10) -> None:
+        """
+        Inicializa um perfil vazio.
+
+        Args:
+            slow_line_limit (int): Quantidade de linhas mais lentas mantidas.
+        """
+        self.slow_line_limit = slow_line_limit
+        self.hooks = []
+        self.reset()
+
+    def reset(self) -> None:
+        """Descarta todas as medições, mantendo os hooks."""
+        self.stage_seconds = Counter()
+        self.stage_calls = Counter()
+        self.regex_calls = 0
+        self.classify_calls = 0
+        self.tokens_by_type = Counter()
+        self._slow_lines = []
+
+    def add_hook(self, hook: Callable[[str, float], None]) -> None:
+        """
+        Registra uma função chamada a cada medição de etapa.
+
+        Args:
+            hook (callable): Função que recebe o nome da etapa e o tempo gasto, em segundos.
+        """
+        self.hooks.append(hook)
+
+    def record(self, stage: str, seconds: float, calls: int = 1) -> None:
+        """
+        Registra a execução de uma etapa.
+
+        Args:
+            stage (str): Nome da etapa.
+            seconds (float): Tempo gasto, em segundos.
+            calls (int): Quantidade de execuções representadas pela medição.
+        """
+        self.stage_seconds[stage] += seconds
+        self.stage_calls[stage] += calls
+        for hook in self.hooks:
+            hook(stage, seconds)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        Mede o bloco de código como uma execução da etapa `name`.
+
+        Args:
+            name (str): Nome da etapa.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def record_line(self, line_number: int, seconds: float, text: str) -> None:
+        """
+        Registra o tempo de análise de uma linha, mantendo apenas as mais lentas.
+
+        Args:
+            line_number (int): Número da linha.
+            seconds (float): Tempo gasto na linha, em segundos.
+            text (str): Conteúdo da linha.
+        """
+        entry = (seconds, line_number, text)
+        if len(self._slow_lines) < self.slow_line_limit:
+            heapq.heappush(self._slow_lines, entry)
+        elif seconds > self._slow_lines[0][0]:
+            heapq.heapreplace(self._slow_lines, entry)
+
+    def count_tokens(self, tokens) -> None:
+        """
+        Acumula a quantidade de tokens de cada tipo.
+
+        Args:
+            tokens (Iterable[tuple[str, Token, int]]): Tokens encontrados.
+        """
+        self.tokens_by_type.update(token.type.name for _, token, _ in tokens)
+
+    def slowest_lines(self) -> list[tuple[float, int, str]]:
+        """
+        Retorna as linhas mais lentas, da mais lenta para a mais rápida.
+
+        Returns:
+            list[tuple[float, int, str]]: Tempo, número e conteúdo de cada linha.
+        """
+        return sorted(self._slow_lines, reverse=True)
+
+    def summary(self) -> dict:
+        """
+        Retorna todas as medições em um `dict` serializável em JSON.
+
+        Returns:
+            dict: Etapas, contadores, tokens por tipo e linhas mais lentas.
+        """
+        return {
+            "stages": {name: {"calls": self.stage_calls[name], "seconds": self.stage_seconds[name]}
+                       for name in self.stage_seconds},
+            "regex_calls": self.regex_calls,
+            "classify_calls": self.classify_calls,
+            "tokens_by_type": dict(self.tokens_by_type.most_common()),
+            "slowest_lines": [{"line": line, "seconds": seconds, "text": text}
+                              for seconds, line, text in self.slowest_lines()],
+        }
+
+    def format(self) -> str:
+        """
+        Formata o resumo das medições como texto.
+
+        Returns:
+            str: Resumo legível das medições.
+        """
+        total = sum(self.stage_seconds.values()) or 1.0
+        lines = ["Perfil da análise léxica:", f"  {'etapa':<18}{'chamadas':>10}{'tempo (ms)':>14}{'%':>8}"]
+        for name, seconds in self.stage_seconds.most_common():
+            lines.append(f"  {name:<18}{self.stage_calls[name]:>10}{seconds * 1000:>14.2f}{seconds / total * 100:>8.1f}")
+        lines.append(f"  Chamadas de regex: {self.regex_calls}, classificações: {self.classify_calls}")
+        if self.tokens_by_type:
+            lines.append("  Tokens por tipo: " + ", ".join(f"{name}={count}" for name, count in self.tokens_by_type.most_common()))
+        for seconds, line, text in self.slowest_lines():
+            lines.append(f"  Linha {line}: {seconds * 1e6:.1f} µs  {text.strip()[:60]}")
+        return "\n".join(lines)
+
+    def create_stats(self) -> None:
+        """
+        Preenche `self.stats` no formato do `cProfile`, permitindo `pstats.Stats(profiler)`.
+
+        Cada etapa é uma função fictícia `("analyzer", 0, etapa)` sem chamadores.
+        """
+        self.stats = {("analyzer", 0, name): (calls, calls, self.stage_seconds[name], self.stage_seconds[name], {})
+                      for name, calls in self.stage_calls.items()}
+
+    def dump_stats(self, path: str) -> None:
+        """
+        Grava as medições no formato de arquivo do `cProfile`, legível por `pstats` e visualizadores.
+
+        Args:
+            path (str): Caminho do arquivo de saída.
+        """
+        self.create_stats()
+        with open(path, "wb") as file:
+            marshal.dump(self.stats, file)
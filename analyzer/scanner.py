@@ -0,0 +1,712 @@
+"""
+Módulo `scanner`
+
+Este módulo implementa o motor de varredura de passagem única utilizado pelo `LexicalAnalyzer`.
+
+Em vez de dividir o código em linhas e separar as palavras de cada uma, o `Scanner` compila, na construção,
+uma única expressão regular de alternância que reconhece os comentários, os lexemas e as quebras de linha.
+O texto inteiro é percorrido uma única vez, sem cópia prévia para remover comentários, e cada lexema é
+classificado por meio de uma tabela de consulta preenchida sob demanda, de modo que lexemas repetidos
+custam apenas um acesso a dicionário. A tabela guarda o lexema internado no `InternPool` do `Scanner`,
+de modo que todas as ocorrências de um lexema no resultado compartilham o mesmo objeto.
+
+Os comentários `{...}` são reconhecidos durante a própria varredura: são ignorados, mas as quebras de
+linha que contêm continuam sendo contadas, de modo que linhas e colunas correspondem sempre ao código
+original. Um `{` dentro de um literal de texto não inicia um comentário, pois o literal é reconhecido
+antes. Um comentário sem `}` se estende até o fim do texto e sua posição é registrada em
+`Scanner.open_comment`. Como `[^}]*` nunca retrocede, a varredura é linear mesmo com milhares de `{`
+sem fechamento.
+
+Com um `DiagnosticBuffer` em `Scanner.diagnostics`, os lexemas desconhecidos (caracteres fora da
+tabela e aspas de literais de texto não fechados) são registrados como diagnósticos, conforme a
+política do buffer. O registro só acontece no ramo dos lexemas desconhecidos, que a tabela de
+consulta já separa dos demais; sem erros, a varredura executa exatamente as mesmas operações. As
+varreduras com `findall` não conhecem a posição dos lexemas: as colunas dos erros são calculadas
+depois da varredura, analisando novamente apenas as linhas em que há erros (veja `Scanner.locate`).
+
+A saída é idêntica à de `LexicalAnalyzer.tokenize`: as duas expressões são montadas por
+`compile_patterns` com as mesmas alternativas, incluindo os operadores de mais de um caractere da
+tabela de tokens, apenas restritas a caracteres que não quebram linha no `Scanner`, e as quebras de
+linha seguem a mesma regra de `str.splitlines`.
+
+Classes:
+    - Scanner: Motor de varredura baseado em uma expressão regular mestre pré-compilada.
+
+Funções:
+    - compile_patterns(operators): Compila as expressões que separam os lexemas para um conjunto de operadores.
+    - count_breaks(text): Conta as quebras de linha de um trecho.
+    - blank_comments(text): Substitui os comentários por espaços, preservando linhas e colunas.
+    - iter_blocks(buffer, block_size): Divide um buffer em blocos que terminam em posições seguras.
+    - find_boundary(buffer): Localiza a última posição segura e um comentário não fechado.
+    - safe_boundary(buffer): Localiza a última posição segura.
+"""
+
+from functools import lru_cache
+from typing import Callable, Iterator, Optional, Union
+import re
+
+from .diagnostics import DiagnosticBuffer, LexicalError
+from .interning import InternPool
+from .tokens import ERROR_TOKEN
+
+# Caracteres reconhecidos como quebra de linha por `str.splitlines`.
+NEWLINE_CHARS = "\n\r\x0b\x0c\x1c\x1d\x1e\x85  "
+
+# Quebra de linha no texto completo; `\r\n` conta como uma única quebra, assim como em `str.splitlines`.
+NEWLINE_PATTERN = r"\r\n|[\n\r\x0b\x0c\x1c\x1d\x1e\x85  ]"
+BYTES_NEWLINE_PATTERN = rb"\r\n|[\n\r\x0b\x0c\x1c\x1d\x1e]"
+
+# Equivalente a `.` quando o padrão é aplicado linha a linha.
+_NOT_NEWLINE = r"[^\n\r\x0b\x0c\x1c\x1d\x1e\x85  ]"
+
+# Conteúdo de um literal entre aspas duplas: qualquer caractere exceto a aspa e as quebras de linha.
+_NOT_QUOTE = r"[^\"\n\r\x0b\x0c\x1c\x1d\x1e\x85  ]"
+
+# Comentários no formato `{...}`. Sem `}` até o fim do texto, o comentário se estende até o fim.
+COMMENT_PATTERN = re.compile(r"\{[^}]*\}?")
+BYTES_COMMENT_PATTERN = re.compile(rb"\{[^}]*\}?")
+
+# Operadores de mais de um caractere da linguagem LPD, usados quando nenhum outro é informado.
+OPERATORS = (":=", "!=", "<=", "<>", "==", ">=")
+
+
+@lru_cache(maxsize=None)
+def compile_patterns(operators: tuple[str, ...] = OPERATORS) -> tuple[re.Pattern, re.Pattern, re.Pattern]:
+    """
+    Compila as expressões regulares que separam os lexemas, para um conjunto de operadores.
+
+    As alternativas são, em ordem: comentários, palavras (`\\w+`), os operadores de mais de um
+    caractere (do mais longo para o mais curto), literais de texto e, por último, qualquer outro
+    caractere isolado. Apenas os operadores variam entre tabelas de tokens; o resultado é guardado,
+    de modo que analisadores com os mesmos operadores compartilham as expressões compiladas.
+
+    Args:
+        operators (tuple[str, ...]): Operadores de mais de um caractere.
+
+    Returns:
+        tuple[re.Pattern, re.Pattern, re.Pattern]: Expressão aplicada linha a linha por
+        `LexicalAnalyzer.tokenize`, expressão mestre do `Scanner` (com as quebras de linha) e sua
+        versão para blocos de bytes.
+    """
+    operators = sorted(set(operators), key=lambda operator: (-len(operator), operator))
+    alternatives = [re.escape(operator) for operator in operators]
+    bytes_alternatives = [re.escape(operator.encode("utf-8")) for operator in operators]
+    words = [COMMENT_PATTERN.pattern, r"\w+", *alternatives, r"\'.{0,1}\'|\"[^\"]*\"", r"[^\s\w]"]
+    scanner = [COMMENT_PATTERN.pattern, NEWLINE_PATTERN, r"\w+", *alternatives,
+               rf"\'{_NOT_NEWLINE}{{0,1}}\'|\"{_NOT_QUOTE}*\"", r"[^\s\w]"]
+    # Em `bytes`, `\s` não inclui `\x1c`-`\x1f` e as quebras de linha não ASCII só aparecem em blocos
+    # decodificados como `str`.
+    bytes_scanner = [BYTES_COMMENT_PATTERN.pattern, BYTES_NEWLINE_PATTERN, rb"\w+", *bytes_alternatives,
+                     rb"\'[^\n\r\x0b\x0c\x1c\x1d\x1e]{0,1}\'|\"[^\"\n\r\x0b\x0c\x1c\x1d\x1e]*\"", rb"[^\s\x1c-\x1f\w]"]
+    return re.compile("|".join(words)), re.compile("|".join(scanner)), re.compile(b"|".join(bytes_scanner))
+
+
+# Código até o próximo comentário (grupo 1), com os literais de texto reconhecidos como na expressão
+# mestre, de modo que um `{` dentro de um literal não inicia um comentário. Os quantificadores
+# possessivos tornam cada busca linear. Em bytes, os literais são reconhecidos caractere a caractere
+# em UTF-8, incluindo as quebras de linha não ASCII.
+_NEXT_COMMENT = re.compile(
+    rf"(?:[^{{'\"]++|\'{_NOT_NEWLINE}{{0,1}}\'|\"{_NOT_QUOTE}*+\"|['\"])*+({COMMENT_PATTERN.pattern})")
+_BYTES_CHAR = (rb"[^\n\r\x0b\x0c\x1c\x1d\x1e\x80-\xff]|\xc2[\x80-\x84\x86-\xbf]|[\xc3-\xdf][\x80-\xbf]"
+               rb"|\xe2\x80[\x80-\xa7\xaa-\xbf]|\xe2[\x81-\xbf][\x80-\xbf]|[\xe0\xe1\xe3-\xef][\x80-\xbf]{2}"
+               rb"|[\xf0-\xf4][\x80-\xbf]{3}")
+_BYTES_NEXT_COMMENT = re.compile(
+    rb"(?:[^{'\"]++|\'(?:" + _BYTES_CHAR + rb")?\'"
+    rb"|\"(?:[^\"\n\r\x0b\x0c\x1c\x1d\x1e\xc2\xe2]++|\xc2(?!\x85)|\xe2(?!\x80[\xa8\xa9]))*+\"|['\"])*+"
+    rb"(" + BYTES_COMMENT_PATTERN.pattern + rb")")
+
+_BREAKS = re.compile(NEWLINE_PATTERN)
+_BYTES_BREAKS = re.compile(BYTES_NEWLINE_PATTERN)
+_BYTES_NEWLINE_CHARS = [newline.encode() for newline in NEWLINE_CHARS if newline.isascii()]
+_ANY_BREAK = re.compile(f"[{NEWLINE_CHARS}]")
+_BYTES_ANY_BREAK = re.compile(rb"[\n\r\x0b\x0c\x1c\x1d\x1e]")
+_NOT_BREAK = re.compile(_NOT_NEWLINE + "+")
+
+# Qualquer byte fora da faixa ASCII.
+_NON_ASCII = re.compile(rb"[\x80-\xff]")
+
+# Quebras de linha não ASCII em UTF-8 (U+0085, U+2028 e U+2029), que exigem varrer o bloco como `str`.
+_UNICODE_BREAKS = re.compile(rb"\xc2\x85|\xe2\x80[\xa8\xa9]")
+
+# Marcador usado na tabela de consulta para diferenciar quebras de linha de lexemas.
+_NEWLINE = object()
+
+# Marcador para lexemas ainda não classificados.
+_MISSING = object()
+
+
+class Scanner:
+    """
+    Motor de varredura de passagem única sobre o texto completo.
+
+    Attributes:
+        classify (callable): Função que classifica um lexema, retornando um `Token` ou `None`.
+        pattern (re.Pattern): Expressão regular mestre que reconhece comentários, lexemas e quebras de linha.
+        bytes_pattern (re.Pattern): Versão de `pattern` para blocos de bytes ASCII.
+        cache_limit (int): Quantidade máxima de lexemas distintos mantidos na tabela de consulta.
+        pool (InternPool): Conjunto em que os lexemas emitidos são internados.
+        open_comment (tuple[int, int] | None): Linha e coluna (a partir de 1) do `{` de um comentário
+            não fechado encontrado pela última varredura, ou `None`.
+        diagnostics (DiagnosticBuffer | None): Buffer que recebe os erros léxicos, ou `None` para
+            descartar os lexemas desconhecidos sem registrá-los.
+    """
+    def __init__(self, classify: Callable, cache_limit: int = 1 << 16, pool: Optional[InternPool] = None,
+                 operators: tuple[str, ...] = OPERATORS) -> None:
+        """
+        Compila a expressão regular mestre e prepara a tabela de consulta.
+
+        Args:
+            classify (callable): Função que classifica um lexema, normalmente `LexicalAnalyzer.classify`.
+            cache_limit (int): Quantidade máxima de lexemas distintos mantidos na tabela de consulta.
+            pool (InternPool | None): Conjunto de lexemas internados (padrão: um conjunto exclusivo).
+            operators (tuple[str, ...]): Operadores de mais de um caractere reconhecidos como um único lexema.
+        """
+        self.classify = classify
+        self.pool = InternPool() if pool is None else pool
+        _, self.pattern, self.bytes_pattern = compile_patterns(tuple(operators))
+        self.cache_limit = cache_limit
+        self.open_comment = None
+        self.diagnostics = None
+        # Diagnósticos da varredura atual cuja coluna ainda não foi calculada (veja `locate`).
+        self._pending = []
+        # Linhas em que terminam os comentários de várias linhas da varredura atual.
+        self._comment_ends = set()
+        self._lookup = {}
+        self._bytes_lookup = {}
+        self.clear()
+
+    def set_operators(self, operators: tuple[str, ...]) -> None:
+        """
+        Troca os operadores de mais de um caractere reconhecidos e descarta as tabelas de consulta.
+
+        Args:
+            operators (tuple[str, ...]): Operadores de mais de um caractere.
+        """
+        _, self.pattern, self.bytes_pattern = compile_patterns(tuple(operators))
+        self.clear()
+
+    def clear(self) -> None:
+        """Descarta as tabelas de consulta, mantendo apenas as quebras de linha."""
+        self._lookup = {newline: _NEWLINE for newline in ("\r\n", *NEWLINE_CHARS)}
+        self._bytes_lookup = {newline.encode(): _NEWLINE for newline in ("\r\n", *NEWLINE_CHARS) if newline.isascii()}
+
+    def scan(self, text: str) -> list[tuple[Union[str, int], object, int]]:
+        """
+        Varre o texto completo em uma única passagem.
+
+        Args:
+            text (str): Código fonte, incluindo os comentários.
+
+        Returns:
+            list[tuple[str, Token, int]]: Lista de tokens encontrados com a linha correspondente.
+        """
+        tokens = []
+        self.scan_into(text, tokens)
+        return tokens
+
+    def scan_into(self, text: str, tokens: list, line_number: int = 1) -> int:
+        """
+        Varre um trecho de código, acrescentando os tokens encontrados a uma lista existente.
+
+        Permite processar o código em blocos consecutivos, desde que cada bloco termine em uma
+        quebra de linha fora de comentários (veja `safe_boundary`).
+
+        Args:
+            text (str): Trecho de código, incluindo os comentários.
+            tokens (list): Lista que recebe as tuplas `(lexema, Token, linha)`.
+            line_number (int): Número da linha em que o trecho começa.
+
+        Returns:
+            int: Número da linha em que o próximo trecho começa.
+        """
+        append = tokens.append
+        lookup = self._lookup
+        has_break = _ANY_BREAK.search
+        self.open_comment = None
+        first, first_line = len(tokens), line_number
+        interned = 0
+        self._comment_ends = set()
+        diagnostics = self.diagnostics
+        error_token = _error_token(diagnostics)
+
+        for lexeme in self.pattern.findall(text):
+            entry = lookup.get(lexeme, _MISSING)
+            if entry is _MISSING:
+                if lexeme[0] == "{":
+                    # Comentários não entram na tabela; só os de várias linhas ou não fechados exigem atenção.
+                    if lexeme[-1] != "}" or has_break(lexeme):
+                        line_number = self._skip_comment(lexeme, text, len(text), line_number)
+                    continue
+                entry = self._entry(lexeme)
+                interned += entry is not None
+                if len(lookup) < self.cache_limit:
+                    lookup[lexeme] = entry
+            if entry is None:
+                if diagnostics is not None:
+                    if self.report(lexeme, line_number):
+                        self._abort(text, first_line)
+                    if error_token is not None:
+                        append((lexeme, error_token, line_number))
+                continue
+            if entry is _NEWLINE:
+                line_number += 1
+                continue
+            append((entry[0], entry[1], line_number))
+        # Os lexemas novos já foram contados por `InternPool.intern`.
+        self.pool.record(len(tokens) - first - interned)
+        if self._pending:
+            self.locate(text, first_line)
+        return line_number
+
+    def scan_columns(self, text: str, positions: dict, type_ids, lines, starts, ends, line_number: int = 1) -> int:
+        """
+        Varre um trecho de código, acrescentando os tokens encontrados a colunas paralelas.
+
+        Em vez de criar uma tupla e uma `str` por token, registra apenas a posição do `Token` na
+        tabela, a linha e as posições inicial e final do lexema em `text`.
+
+        Args:
+            text (str): Trecho de código, incluindo os comentários.
+            positions (dict): Mapeamento `id(Token) -> posição` na tabela de tokens, que inclui
+                `ERROR_TOKEN` com a política de erros `"token"`.
+            type_ids (array.array): Coluna que recebe a posição do `Token` de cada lexema.
+            lines (array.array): Coluna que recebe a linha de cada lexema.
+            starts (array.array): Coluna que recebe a posição inicial de cada lexema em `text`.
+            ends (array.array): Coluna que recebe a posição final de cada lexema em `text`.
+            line_number (int): Número da linha em que o trecho começa.
+
+        Returns:
+            int: Número da linha em que o próximo trecho começa.
+        """
+        lookup = self._lookup
+        add_type, add_line, add_start, add_end = type_ids.append, lines.append, starts.append, ends.append
+        has_break = _ANY_BREAK.search
+        self.open_comment = None
+        first_line = line_number
+        self._comment_ends = set()
+        diagnostics = self.diagnostics
+        error_token = _error_token(diagnostics)
+
+        for match in self.pattern.finditer(text):
+            lexeme = match.group()
+            entry = lookup.get(lexeme, _MISSING)
+            if entry is _MISSING:
+                if lexeme[0] == "{":
+                    # Comentários não entram na tabela; só os de várias linhas ou não fechados exigem atenção.
+                    if lexeme[-1] != "}" or has_break(lexeme):
+                        line_number = self._skip_comment(lexeme, text, match.end(), line_number)
+                    continue
+                entry = self._entry(lexeme)
+                if len(lookup) < self.cache_limit:
+                    lookup[lexeme] = entry
+            if entry is None:
+                if diagnostics is not None:
+                    if self.report(lexeme, line_number):
+                        self._abort(text, first_line)
+                    if error_token is not None:
+                        entry = (lexeme, error_token)
+                if entry is None:
+                    continue
+            elif entry is _NEWLINE:
+                line_number += 1
+                continue
+            start, end = match.span()
+            add_type(positions[id(entry[1])])
+            add_line(line_number)
+            add_start(start)
+            add_end(end)
+        if self._pending:
+            self.locate(text, first_line)
+        return line_number
+
+    def scan_bytes_into(self, data, tokens: list, line_number: int = 1, start: int = 0, end: Optional[int] = None) -> int:
+        """
+        Varre um trecho de um buffer de bytes sem decodificá-lo por completo.
+
+        Cada lexema distinto é decodificado uma única vez, no momento em que é classificado. Os
+        comentários podem conter qualquer byte, mas os lexemas precisam ser ASCII.
+
+        Args:
+            data (bytes | mmap.mmap): Buffer contendo código sem quebras de linha não ASCII.
+            tokens (list): Lista que recebe as tuplas `(lexema, Token, linha)`.
+            line_number (int): Número da linha em que o trecho começa.
+            start (int): Posição inicial do trecho no buffer.
+            end (int | None): Posição final do trecho no buffer (padrão: fim do buffer).
+
+        Returns:
+            int: Número da linha em que o próximo trecho começa.
+
+        Raises:
+            UnicodeDecodeError: Se um lexema fora de comentários contiver bytes não ASCII.
+        """
+        append = tokens.append
+        lookup = self._bytes_lookup
+        has_break = _BYTES_ANY_BREAK.search
+        end = len(data) if end is None else end
+        self.open_comment = None
+        first, first_line = len(tokens), line_number
+        interned = 0
+        self._comment_ends = set()
+        diagnostics = self.diagnostics
+        error_token = _error_token(diagnostics)
+
+        for raw in self.bytes_pattern.findall(data, start, end):
+            entry = lookup.get(raw, _MISSING)
+            if entry is _MISSING:
+                if raw[0] == 0x7B:
+                    if raw[-1] != 0x7D or has_break(raw):
+                        line_number = self._skip_comment(raw, data, end, line_number, start)
+                    continue
+                entry = self._entry(raw.decode("ascii"))
+                interned += entry is not None
+                if len(lookup) < self.cache_limit:
+                    lookup[raw] = entry
+            if entry is None:
+                if diagnostics is not None:
+                    lexeme = raw.decode("ascii")
+                    if self.report(lexeme, line_number):
+                        self._abort(data[start:end].decode("utf-8"), first_line)
+                    if error_token is not None:
+                        append((lexeme, error_token, line_number))
+                continue
+            if entry is _NEWLINE:
+                line_number += 1
+                continue
+            append((entry[0], entry[1], line_number))
+        # Os lexemas novos já foram contados por `InternPool.intern`.
+        self.pool.record(len(tokens) - first - interned)
+        if self._pending:
+            self.locate(data[start:end].decode("utf-8"), first_line)
+        return line_number
+
+    def report(self, lexeme: str, line_number: int, column: Optional[int] = None) -> bool:
+        """
+        Registra um lexema desconhecido em `self.diagnostics`.
+
+        Uma aspa isolada é o início de um literal de texto não fechado (ou com mais de um caractere
+        entre aspas simples); os demais lexemas são caracteres ou palavras fora da tabela. Sem a
+        coluna, o diagnóstico fica pendente até a chamada de `locate`.
+
+        Args:
+            lexeme (str): Lexema desconhecido.
+            line_number (int): Linha do lexema.
+            column (int | None): Coluna do lexema, a partir de 1, quando conhecida.
+
+        Returns:
+            bool: `True` se a análise deve ser interrompida pela política `"abort"`.
+        """
+        diagnostics = self.diagnostics
+        if lexeme in ("'", '"'):
+            diagnostic = diagnostics.add("unterminated-string", f"Literal de texto não fechado: {lexeme}", line_number, column)
+        else:
+            diagnostic = diagnostics.add("unknown-lexeme", f"Lexema desconhecido: {lexeme!r}", line_number, column)
+        if diagnostic is not None and column is None:
+            self._pending.append(diagnostic)
+        return diagnostics.exhausted
+
+    def locate(self, text: str, line_number: int = 1, comment_ends: Optional[set] = None) -> None:
+        """
+        Calcula as colunas dos diagnósticos pendentes de uma varredura sem posições.
+
+        Apenas as linhas com erros são analisadas novamente, com `finditer`: a posição de cada
+        lexema desconhecido, em ordem, é atribuída ao diagnóstico pendente correspondente. Uma linha
+        em que termina um comentário de várias linhas é analisada a partir do `}`.
+
+        Args:
+            text (str): Trecho varrido.
+            line_number (int): Número da linha em que o trecho começa.
+            comment_ends (set[int] | None): Linhas em que terminam comentários de várias linhas
+                (padrão: as registradas pela última varredura).
+        """
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+        if comment_ends is None:
+            comment_ends = self._comment_ends
+        # As linhas seguem a mesma regra de `str.splitlines` usada na contagem da varredura.
+        lines = text.splitlines()
+        by_line = {}
+        for diagnostic in pending:
+            by_line.setdefault(diagnostic.line, []).append(diagnostic)
+        for line, diagnostics in by_line.items():
+            content = lines[line - line_number]
+            position = content.find("}") + 1 if line in comment_ends else 0
+            for diagnostic, start in zip(diagnostics, self._unknown_positions(content, position)):
+                diagnostic.column = start + 1
+
+    def _unknown_positions(self, line: str, position: int = 0) -> Iterator[int]:
+        """
+        Produz as posições dos lexemas desconhecidos de uma linha.
+
+        Args:
+            line (str): Linha sem a quebra de linha.
+            position (int): Posição em que a análise começa.
+
+        Yields:
+            int: Posição inicial de cada lexema desconhecido.
+        """
+        lookup = self._lookup
+        for match in self.pattern.finditer(line, position):
+            lexeme = match.group()
+            entry = lookup.get(lexeme, _MISSING)
+            if entry is _MISSING:
+                if lexeme[0] == "{":
+                    continue
+                entry = self.classify(lexeme)
+            if entry is None:
+                yield match.start()
+
+    def _abort(self, text: str, line_number: int) -> None:
+        """
+        Interrompe a varredura pela política `"abort"`, calculando antes as colunas pendentes.
+
+        Raises:
+            LexicalError: Sempre.
+        """
+        self.locate(text, line_number)
+        raise LexicalError(self.diagnostics)
+
+    def _entry(self, lexeme: str) -> Optional[tuple]:
+        """
+        Classifica um lexema ausente da tabela de consulta, internando-o se ele for um token.
+
+        Args:
+            lexeme (str): Lexema encontrado na varredura.
+
+        Returns:
+            tuple[str, Token] | None: Lexema canônico e `Token`, ou `None` se o lexema não for reconhecido.
+        """
+        token = self.classify(lexeme)
+        return None if token is None else (self.pool.intern(lexeme), token)
+
+    def _skip_comment(self, comment, text, end: int, line_number: int, start: int = 0) -> int:
+        """
+        Conta as quebras de linha de um comentário e registra sua posição se ele não for fechado.
+
+        Args:
+            comment (str | bytes): O comentário, do `{` ao `}` ou ao fim do trecho.
+            text (str | bytes | mmap.mmap): Trecho varrido.
+            end (int): Posição final do comentário em `text`.
+            line_number (int): Número da linha em que o comentário começa.
+            start (int): Posição inicial do trecho varrido em `text`, que começa no início de uma linha.
+
+        Returns:
+            int: Número da linha em que o comentário termina.
+        """
+        if isinstance(comment, str):
+            closed = comment[-1] == "}"
+            breaks = len(_BREAKS.findall(comment))
+        else:
+            closed = comment[-1] == 0x7D
+            breaks = len(_BYTES_BREAKS.findall(comment))
+        if not closed:
+            position = end - len(comment)
+            newlines = NEWLINE_CHARS if isinstance(text, str) else _BYTES_NEWLINE_CHARS
+            line_start = max(start - 1, *(text.rfind(newline, start, position) for newline in newlines)) + 1
+            prefix = text[line_start:position]
+            if not isinstance(prefix, str):
+                prefix = prefix.decode("utf-8", "replace")
+            self.open_comment = (line_number, len(prefix) + 1)
+        elif breaks:
+            self._comment_ends.add(line_number + breaks)
+        return line_number + breaks
+
+    def scan_buffer(self, buffer, tokens: list, block_size: int = 1 << 20) -> int:
+        """
+        Varre um buffer de bytes UTF-8, como um arquivo mapeado em memória, em blocos.
+
+        Cada bloco termina em uma quebra de linha fora de comentários. Blocos cujos lexemas são
+        ASCII são varridos diretamente sobre o buffer, sem cópia, ainda que os comentários contenham
+        outros caracteres; os demais são copiados apenas na extensão do bloco e decodificados como `str`.
+
+        Args:
+            buffer (bytes | mmap.mmap): Conteúdo do arquivo em UTF-8.
+            tokens (list): Lista que recebe as tuplas `(lexema, Token, linha)`.
+            block_size (int): Tamanho inicial de cada bloco, em bytes.
+
+        Returns:
+            int: Número da linha seguinte à última linha do buffer.
+        """
+        line_number = 1
+        # Depois de um bloco com lexemas não ASCII, os blocos seguintes com caracteres não ASCII são
+        # decodificados diretamente, sem tentar a varredura de bytes.
+        prefer_text = False
+        for start, end in iter_blocks(buffer, block_size):
+            line_number, prefer_text = self._scan_block(buffer, start, end, tokens, line_number, prefer_text)
+        return line_number
+
+    def _scan_block(self, buffer, start: int, end: int, tokens: list, line_number: int, prefer_text: bool = False) -> tuple[int, bool]:
+        """
+        Varre um bloco de `scan_buffer`, escolhendo entre a varredura de bytes e a de texto.
+
+        Args:
+            buffer (bytes | mmap.mmap): Conteúdo do arquivo em UTF-8.
+            start (int): Posição inicial do bloco.
+            end (int): Posição final do bloco.
+            tokens (list): Lista que recebe as tuplas `(lexema, Token, linha)`.
+            line_number (int): Número da linha em que o bloco começa.
+            prefer_text (bool): Indica se blocos com caracteres não ASCII devem ser decodificados diretamente.
+
+        Returns:
+            tuple[int, bool]: Número da linha em que o próximo bloco começa e o novo valor de `prefer_text`.
+        """
+        # Sem comentários, um caractere não ASCII certamente pertence a um lexema.
+        textual = _NON_ASCII.search(buffer, start, end) is not None and (prefer_text or buffer.find(b"{", start, end) < 0)
+        if not textual and _UNICODE_BREAKS.search(buffer, start, end) is None:
+            found = len(tokens)
+            mark = None if self.diagnostics is None else self.diagnostics.mark()
+            try:
+                return self.scan_bytes_into(buffer, tokens, line_number, start, end), prefer_text
+            except UnicodeDecodeError:
+                # Um lexema não ASCII fora de comentários: o bloco é varrido novamente como texto.
+                del tokens[found:]
+                self._pending = []
+                if mark is not None:
+                    self.diagnostics.rollback(mark)
+                prefer_text = True
+        return self.scan_into(buffer[start:end].decode("utf-8"), tokens, line_number), prefer_text
+
+
+def _error_token(diagnostics: Optional[DiagnosticBuffer]):
+    """Retorna `ERROR_TOKEN` se a política de `diagnostics` for `"token"`, ou `None` caso contrário."""
+    return ERROR_TOKEN if diagnostics is not None and diagnostics.policy == "token" else None
+
+
+def count_breaks(text: str) -> int:
+    """
+    Conta as quebras de linha de um trecho, com a mesma regra de `str.splitlines`.
+
+    Args:
+        text (str): Trecho de código.
+
+    Returns:
+        int: Quantidade de quebras de linha.
+    """
+    return len(_BREAKS.findall(text))
+
+
+def blank_comments(text: str) -> str:
+    """
+    Substitui cada comentário por espaços, mantendo as quebras de linha que ele contém.
+
+    O resultado tem o mesmo tamanho do texto original, de modo que linhas e colunas são preservadas.
+    Um `{` dentro de um literal de texto não inicia um comentário.
+
+    Args:
+        text (str): Código fonte.
+
+    Returns:
+        str: Código fonte com os comentários em branco.
+    """
+    parts = []
+    position = 0
+    while True:
+        match = _NEXT_COMMENT.match(text, position)
+        if match is None:
+            break
+        parts.append(text[position:match.start(1)])
+        parts.append(_NOT_BREAK.sub(lambda run: " " * len(run.group()), match.group(1)))
+        position = match.end()
+    parts.append(text[position:])
+    return "".join(parts)
+
+
+def iter_blocks(buffer, block_size: int) -> Iterator[tuple[int, int]]:
+    """
+    Divide um buffer em blocos consecutivos que terminam em posições seguras (veja `safe_boundary`).
+
+    Cada bloco tem aproximadamente `block_size` elementos; quando não há posição segura dentro dessa
+    janela, ela é ampliada até encontrar uma ou atingir o fim do buffer. Blocos sem `{` são
+    delimitados sem copiar o buffer.
+
+    Args:
+        buffer (str | bytes | mmap.mmap): Código fonte completo.
+        block_size (int): Tamanho aproximado de cada bloco.
+
+    Yields:
+        tuple[int, int]: Posições inicial e final de cada bloco.
+    """
+    newline, brace = ("\n", "{") if isinstance(buffer, str) else (b"\n", b"{")
+    position = 0
+    size = len(buffer)
+    window = block_size
+
+    while position < size:
+        end = min(position + window, size)
+        if end == size:
+            cut = size
+        elif buffer.find(brace, position, end) < 0:
+            cut = buffer.rfind(newline, position, end) + 1
+        else:
+            cut = safe_boundary(buffer[position:end])
+            cut = cut and position + cut
+
+        # Sem posição segura na janela, amplia-a até encontrar uma ou atingir o fim.
+        if cut <= position:
+            window *= 2
+            continue
+
+        yield position, cut
+        position = cut
+        window = block_size
+
+
+def find_boundary(buffer: Union[str, bytes]) -> tuple[int, int]:
+    """
+    Encontra a última posição segura para dividir o buffer e o início de um comentário não fechado.
+
+    A posição segura fica logo após uma quebra de linha `\\n` que não está dentro de um comentário
+    `{...}`. Um `{` sem `}` correspondente no buffer pode ainda ser fechado por dados que não foram
+    lidos, portanto nenhuma divisão é feita a partir dele. Como literais de texto não atravessam
+    linhas, a divisão também nunca separa um literal, e um `{` dentro de um literal é ignorado.
+
+    Args:
+        buffer (str | bytes): Código fonte pendente, começando fora de comentários.
+
+    Returns:
+        tuple[int, int]: Posição da divisão (ou `0` se não houver posição segura) e posição do `{`
+        do comentário não fechado (ou `-1`).
+    """
+    if isinstance(buffer, str):
+        newline, brace, pattern = "\n", "{", _NEXT_COMMENT
+    else:
+        newline, brace, pattern = b"\n", b"{", _BYTES_NEXT_COMMENT
+
+    if brace not in buffer:
+        return buffer.rfind(newline) + 1, -1
+
+    # Intervalos de código fora de comentários, do início do buffer até o comentário não fechado.
+    gaps = []
+    position = 0
+    opening = -1
+    while True:
+        match = pattern.match(buffer, position)
+        if match is None:
+            gaps.append((position, len(buffer)))
+            break
+        gaps.append((position, match.start(1)))
+        if match.group(1)[-1:] not in ("}", b"}"):
+            opening = match.start(1)
+            break
+        position = match.end()
+
+    for start, end in reversed(gaps):
+        cut = buffer.rfind(newline, start, end)
+        if cut >= 0:
+            return cut + 1, opening
+    return 0, opening
+
+
+def safe_boundary(buffer: Union[str, bytes]) -> int:
+    """
+    Encontra a última posição do buffer em que o código pode ser dividido com segurança.
+
+    Veja `find_boundary`.
+
+    Args:
+        buffer (str | bytes): Código fonte pendente, começando fora de comentários.
+
+    Returns:
+        int: Posição da divisão, ou `0` se não houver posição segura.
+    """
+    return find_boundary(buffer)[0]
@@ -0,0 +1,501 @@
+"""
+Módulo `server`
+
+Este módulo implementa o modo servidor do analisador: um processo de longa duração, baseado em
+`asyncio`, que atende pedidos de análise léxica por TCP ou por um socket Unix, sem pagar a cada
+pedido a inicialização do interpretador e a construção do `LexicalAnalyzer`.
+
+Protocolo (JSON delimitado por quebras de linha, um objeto por linha em cada sentido):
+    - `{"id": 1, "text": "program p; ..."}`: analisa o texto enviado.
+    - `{"id": 2, "path": "fonte.lpd"}`: analisa um arquivo acessível ao servidor.
+    - `{"id": 3, "op": "stats"}`: retorna os contadores do servidor.
+    - O campo opcional `"timeout"` define o prazo do pedido, em segundos (um número não negativo).
+
+Cada resposta repete o `id` do pedido e contém `"tokens"` (lista de `[lexema, tipo, linha]`) e
+`"unterminated_comment"` (`[linha, coluna]` ou `null`), ou `"error"` com a descrição da falha. Se
+houver erros léxicos, a resposta contém também `"diagnostics"` (lista de objetos com `code`,
+`message`, `line` e `column`), inclusive a de uma análise interrompida pela política `"abort"`,
+que é respondida com `"error"`. A política de erros do analisador do servidor vale tanto para a
+thread de análise quanto para os processos do pool. Os pedidos de uma mesma conexão são atendidos
+concorrentemente e as respostas seguem a ordem de conclusão.
+
+Os pedidos são enfileirados e agrupados em lotes (até `batch_size` pedidos ou `batch_bytes`
+caracteres, aguardando no máximo `batch_delay` segundos por pedidos concorrentes), de modo que
+muitos pedidos pequenos custam uma única ida e volta ao pool de processos. A análise e a
+serialização dos tokens em JSON são feitas nos processos do pool, cada um com um analisador
+construído uma única vez, e o laço de eventos apenas encaminha os bytes. A fila é limitada
+(`max_pending`), assim como os lotes em andamento e os pedidos em andamento por conexão
+(`max_inflight`): quando algum limite é atingido, o servidor deixa de ler da conexão e o próprio
+TCP propaga a contrapressão ao cliente.
+
+Classes:
+    - LexingServer: Servidor de análise léxica com lotes, pool de processos e prazos por pedido.
+
+Funções:
+    - parse_address(address): Interpreta um endereço `host:porta` ou `unix:caminho`.
+    - serve(address, analyzer, workers): Executa o servidor até ser interrompido.
+"""
+
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Optional, Union
+import asyncio
+import json
+import os
+import time
+
+from .analyzer import LexicalAnalyzer
+from .diagnostics import DiagnosticBuffer, LexicalError
+
+# Tamanho máximo de uma linha do protocolo, em bytes.
+DEFAULT_LIMIT = 16 << 20
+
+# Analisador de cada processo do pool, construído uma única vez por `_init_worker`.
+_worker_analyzer = None
+
+
+def parse_address(address: str) -> tuple[str, Union[str, tuple[str, int]]]:
+    """
+    Interpreta um endereço do servidor.
+
+    Args:
+        address (str): `unix:caminho` para um socket Unix, ou `host:porta`, `:porta` ou `porta` para
+            TCP (o host padrão é `127.0.0.1`).
+
+    Returns:
+        tuple[str, str | tuple[str, int]]: `("unix", caminho)` ou `("tcp", (host, porta))`.
+
+    Raises:
+        ValueError: Se a porta não for um número.
+    """
+    if address.startswith("unix:"):
+        return "unix", address[len("unix:"):]
+    host, _, port = address.rpartition(":")
+    if not port.isdigit():
+        raise ValueError(f"Endereço inválido: {address!r}")
+    return "tcp", (host or "127.0.0.1", int(port))
+
+
+def _init_worker(tokens: list, case_sensitive: bool = True, policy: tuple = ("skip", 100, 1)) -> None:
+    """
+    Constrói o analisador de um processo do pool a partir da tabela de tokens recebida.
+
+    Args:
+        tokens (list[Token]): Tabela de tokens do analisador do servidor.
+        case_sensitive (bool): Indica se as palavras reservadas diferenciam maiúsculas de minúsculas.
+        policy (tuple[str, int, int]): Política de erros, limite de diagnósticos e quantidade de
+            erros que interrompe a análise, como nos argumentos de `DiagnosticBuffer`.
+    """
+    global _worker_analyzer
+    _worker_analyzer = LexicalAnalyzer()
+    _worker_analyzer.tokens = tokens
+    _worker_analyzer.case_sensitive = case_sensitive
+    _worker_analyzer.diagnostics = _worker_analyzer.scanner.diagnostics = DiagnosticBuffer(*policy)
+    _worker_analyzer.build_index()
+
+
+def _tokens_json(tokens: list) -> str:
+    """
+    Serializa tokens como uma lista JSON de `[lexema, tipo, linha]`.
+
+    O início de cada elemento é codificado uma única vez por lexema distinto.
+
+    Args:
+        tokens (list[tuple[str, Token, int]]): Tokens encontrados.
+
+    Returns:
+        str: Lista JSON.
+    """
+    prefixes = {}
+    parts = []
+    append = parts.append
+    for lexeme, token, line in tokens:
+        entry = prefixes.get(lexeme)
+        if entry is None or entry[0] is not token:
+            entry = prefixes[lexeme] = (token, "[%s, %s, " % (json.dumps(lexeme, ensure_ascii=False),
+                                                               json.dumps(token.type.name, ensure_ascii=False)))
+        append(f"{entry[1]}{line}]")
+    return "[" + ", ".join(parts) + "]"
+
+
+def _diagnostics_json(diagnostics) -> Optional[str]:
+    """
+    Serializa diagnósticos como uma lista JSON de objetos.
+
+    Args:
+        diagnostics (Iterable[Diagnostic]): Diagnósticos da análise.
+
+    Returns:
+        str | None: Lista JSON, ou `None` se não houver diagnósticos.
+    """
+    items = [{"code": d.code, "message": d.message, "line": d.line, "column": d.column} for d in diagnostics]
+    return json.dumps(items, ensure_ascii=False) if items else None
+
+
+def _lex_jobs(jobs: list[tuple[str, str]], analyzer: Optional[LexicalAnalyzer] = None) -> list[tuple]:
+    """
+    Analisa um lote de pedidos, capturando a falha de cada um.
+
+    Args:
+        jobs (list[tuple[str, str]]): Pedidos `("text", código)` ou `("path", caminho)`.
+        analyzer (LexicalAnalyzer | None): Analisador utilizado (padrão: o do processo do pool).
+
+    Returns:
+        list[tuple[str | None, tuple | None, str | None, str | None]]: Para cada pedido, os tokens em
+        JSON, o comentário não fechado, a mensagem de erro e os diagnósticos em JSON.
+    """
+    analyzer = analyzer or _worker_analyzer
+    results = []
+    for kind, value in jobs:
+        try:
+            tokens = analyzer.scan(value) if kind == "text" else analyzer.tokenize_file(value)
+            results.append((_tokens_json(tokens), analyzer.unterminated_comment, None,
+                            _diagnostics_json(analyzer.diagnostics)))
+        except LexicalError as e:
+            results.append((None, None, f"{type(e).__name__}: {e}", _diagnostics_json(e.diagnostics)))
+        except Exception as e:
+            results.append((None, None, f"{type(e).__name__}: {e}", None))
+    return results
+
+
+class LexingServer:
+    """
+    Servidor de análise léxica com lotes, pool de processos e prazos por pedido.
+
+    Attributes:
+        analyzer (LexicalAnalyzer): Analisador cuja tabela de tokens é utilizada; com `workers=0`, é
+            o próprio analisador que atende os pedidos, em uma thread.
+        workers (int): Quantidade de processos do pool (`0` para analisar em uma thread do próprio processo).
+        batch_size (int): Quantidade máxima de pedidos em um lote.
+        batch_bytes (int): Tamanho total máximo dos textos de um lote, em caracteres; um pedido
+            maior forma um lote sozinho.
+        batch_delay (float): Tempo máximo de espera por pedidos concorrentes antes de enviar um lote, em segundos.
+        max_pending (int): Quantidade máxima de pedidos na fila.
+        max_inflight (int): Quantidade máxima de pedidos em andamento por conexão.
+        timeout (float): Prazo padrão de cada pedido, em segundos.
+        limit (int): Tamanho máximo de uma linha do protocolo, em bytes.
+        stats (dict): Contadores de pedidos, lotes, prazos esgotados e erros.
+    """
+    def __init__(self, analyzer: Optional[LexicalAnalyzer] = None, workers: Optional[int] = None,
+                 batch_size: int = 32, batch_bytes: int = 64 << 10, batch_delay: float = 0.001,
+                 max_pending: int = 1024, max_inflight: int = 64, timeout: float = 30.0,
+                 limit: int = DEFAULT_LIMIT) -> None:
+        """
+        Inicializa o servidor, sem abrir o socket nem o pool.
+
+        Args:
+            analyzer (LexicalAnalyzer | None): Analisador utilizado (padrão: um novo `LexicalAnalyzer`).
+            workers (int | None): Quantidade de processos (padrão: `os.cpu_count()`; `0` para uma thread).
+            batch_size (int): Quantidade máxima de pedidos em um lote.
+            batch_bytes (int): Tamanho total máximo dos textos de um lote, em caracteres.
+            batch_delay (float): Espera máxima por pedidos concorrentes, em segundos.
+            max_pending (int): Quantidade máxima de pedidos na fila.
+            max_inflight (int): Quantidade máxima de pedidos em andamento por conexão.
+            timeout (float): Prazo padrão de cada pedido, em segundos.
+            limit (int): Tamanho máximo de uma linha do protocolo, em bytes.
+        """
+        self.analyzer = analyzer or LexicalAnalyzer()
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.batch_size = batch_size
+        self.batch_bytes = batch_bytes
+        self.batch_delay = batch_delay
+        self.max_pending = max_pending
+        self.max_inflight = max_inflight
+        self.timeout = timeout
+        self.limit = limit
+        self.stats = {"connections": 0, "requests": 0, "batches": 0, "timeouts": 0, "errors": 0}
+        self._server = None
+        self._executor = None
+        self._queue = None
+        self._batcher = None
+        self._slots = None
+        self._running = set()
+
+    @property
+    def sockets(self) -> list:
+        """Sockets em que o servidor escuta, para obter a porta escolhida com `:0`."""
+        return list(self._server.sockets) if self._server is not None else []
+
+    def _create_executor(self) -> Executor:
+        """
+        Cria o executor que analisa os lotes.
+
+        Returns:
+            Executor: Pool de processos, ou uma única thread com `workers=0`.
+        """
+        if self.workers == 0:
+            return ThreadPoolExecutor(max_workers=1)
+        diagnostics = self.analyzer.diagnostics
+        policy = (diagnostics.policy, diagnostics.limit, diagnostics.max_errors)
+        return ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                   initargs=(self.analyzer.tokens, self.analyzer.case_sensitive, policy))
+
+    async def start(self, address: str) -> None:
+        """
+        Abre o socket, o pool e a fila, e aquece os analisadores do pool.
+
+        Args:
+            address (str): Endereço no formato de `parse_address`.
+        """
+        kind, where = parse_address(address)
+        loop = asyncio.get_running_loop()
+        self._executor = self._create_executor()
+        self._queue = asyncio.Queue(self.max_pending)
+        self._slots = asyncio.Semaphore(max(1, self.workers))
+        self._batcher = asyncio.create_task(self._batch_loop())
+
+        # Uma análise por processo, para que o primeiro pedido não pague a construção do analisador.
+        warmup = [("text", "program p; begin end.")]
+        await asyncio.gather(*(loop.run_in_executor(self._executor, self._job_function(), warmup)
+                               for _ in range(max(1, self.workers))))
+
+        if kind == "unix":
+            self._server = await asyncio.start_unix_server(self._handle, where, limit=self.limit)
+        else:
+            self._server = await asyncio.start_server(self._handle, *where, limit=self.limit)
+
+    async def serve_forever(self) -> None:
+        """Atende conexões até que a tarefa seja cancelada."""
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """Fecha o socket, interrompe o agrupamento de lotes e encerra o pool."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._batcher is not None:
+            self._batcher.cancel()
+            await asyncio.gather(self._batcher, return_exceptions=True)
+        if self._running:
+            await asyncio.gather(*self._running, return_exceptions=True)
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+
+    async def __aenter__(self) -> "LexingServer":
+        """Permite usar o servidor com `async with`, após `start`."""
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Fecha o servidor ao sair do bloco `async with`."""
+        await self.close()
+
+    def _job_function(self):
+        """Retorna a função executada no executor para cada lote."""
+        return partial(_lex_jobs, analyzer=self.analyzer) if self.workers == 0 else _lex_jobs
+
+    async def submit(self, kind: str, value: str, timeout: Optional[float] = None) -> tuple:
+        """
+        Enfileira um pedido e aguarda seu resultado.
+
+        Args:
+            kind (str): `"text"` ou `"path"`.
+            value (str): Código fonte ou caminho do arquivo.
+            timeout (float | None): Prazo do pedido, em segundos (padrão: `self.timeout`).
+
+        Returns:
+            tuple[str | None, tuple | None, str | None, str | None]: Tokens em JSON, comentário não
+            fechado, erro e diagnósticos em JSON.
+
+        Raises:
+            asyncio.TimeoutError: Se o prazo se esgotar antes da conclusão do pedido.
+        """
+        future = asyncio.get_running_loop().create_future()
+        size = len(value) if kind == "text" else self.batch_bytes
+        self.stats["requests"] += 1
+        # A espera pela fila cheia conta no prazo do pedido.
+        return await asyncio.wait_for(self._enqueue((kind, value), size, future), self.timeout if timeout is None else timeout)
+
+    async def _enqueue(self, job: tuple, size: int, future: asyncio.Future) -> tuple:
+        """
+        Coloca um pedido na fila, aguardando espaço, e aguarda seu resultado.
+
+        Args:
+            job (tuple[str, str]): Pedido no formato de `_lex_jobs`.
+            size (int): Tamanho do pedido, usado para limitar os lotes.
+            future (asyncio.Future): Futuro que recebe o resultado.
+
+        Returns:
+            tuple: Resultado do pedido no formato de `_lex_jobs`.
+        """
+        try:
+            await self._queue.put((job, size, future))
+            return await future
+        finally:
+            # Um pedido cancelado (por exemplo, pelo prazo) ainda na fila é descartado pelo agrupador.
+            future.cancel()
+
+    async def _batch_loop(self) -> None:
+        """Agrupa os pedidos da fila em lotes e os envia ao executor, respeitando o limite de lotes em andamento."""
+        queue = self._queue
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            size = batch[0][1]
+            deadline = loop.time() + self.batch_delay
+            while len(batch) < self.batch_size and size < self.batch_bytes:
+                if queue.empty():
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        item = await asyncio.wait_for(queue.get(), remaining)
+                    except asyncio.TimeoutError:
+                        break
+                else:
+                    item = queue.get_nowait()
+                batch.append(item)
+                size += item[1]
+
+            batch = [item for item in batch if not item[2].done()]
+            if not batch:
+                continue
+            # Aguarda um processo livre antes de enviar o lote; enquanto isso, a fila enche e os
+            # leitores das conexões param.
+            await self._slots.acquire()
+            task = asyncio.create_task(self._run_batch(batch))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+    async def _run_batch(self, batch: list) -> None:
+        """
+        Analisa um lote no executor e entrega o resultado de cada pedido.
+
+        Args:
+            batch (list[tuple]): Itens `(pedido, tamanho, futuro)` da fila.
+        """
+        try:
+            self.stats["batches"] += 1
+            jobs = [job for job, _, _ in batch]
+            try:
+                results = await asyncio.get_running_loop().run_in_executor(self._executor, self._job_function(), jobs)
+            except Exception as e:
+                results = [(None, None, f"{type(e).__name__}: {e}", None)] * len(batch)
+            for (_, _, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+        finally:
+            self._slots.release()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Atende uma conexão, lendo pedidos enquanto houver espaço para pedidos em andamento.
+
+        Args:
+            reader (asyncio.StreamReader): Leitura da conexão.
+            writer (asyncio.StreamWriter): Escrita da conexão.
+        """
+        self.stats["connections"] += 1
+        inflight = asyncio.Semaphore(self.max_inflight)
+        lock = asyncio.Lock()
+        tasks = set()
+        try:
+            while True:
+                await inflight.acquire()
+                try:
+                    line = await reader.readline()
+                except (ValueError, asyncio.LimitOverrunError):
+                    inflight.release()
+                    await self._write(writer, lock, self._error(None, f"Pedido maior que {self.limit} bytes."))
+                    break
+                if not line:
+                    inflight.release()
+                    break
+                task = asyncio.create_task(self._respond(line, writer, lock))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+                task.add_done_callback(lambda _: inflight.release())
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+        except ConnectionError:
+            pass
+        finally:
+            for task in tasks:
+                task.cancel()
+            writer.close()
+
+    async def _respond(self, line: bytes, writer: asyncio.StreamWriter, lock: asyncio.Lock) -> None:
+        """
+        Atende um pedido e escreve sua resposta.
+
+        Args:
+            line (bytes): Linha do pedido.
+            writer (asyncio.StreamWriter): Escrita da conexão.
+            lock (asyncio.Lock): Trava que serializa as escritas da conexão.
+        """
+        request_id = None
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("o pedido deve ser um objeto JSON")
+            request_id = request.get("id")
+            if request.get("op") == "stats":
+                response = self._response(request_id, {"stats": self.summary()})
+            else:
+                kind = "text" if "text" in request else "path" if "path" in request else None
+                if kind is None or not isinstance(request[kind], str):
+                    raise ValueError("o pedido deve conter 'text' ou 'path'")
+                timeout = request.get("timeout")
+                if timeout is not None and (isinstance(timeout, bool) or not isinstance(timeout, (int, float))
+                                            or not timeout >= 0):
+                    raise ValueError("'timeout' deve ser um número não negativo")
+                tokens, comment, error, diagnostics = await self.submit(kind, request[kind], timeout)
+                extra = f', "diagnostics": {diagnostics}' if diagnostics is not None else ""
+                if error is not None:
+                    self.stats["errors"] += 1
+                    response = (f'{{"id": {json.dumps(request_id)}, "error": {json.dumps(error, ensure_ascii=False)}'
+                                f'{extra}}}\n').encode("utf-8")
+                else:
+                    response = (f'{{"id": {json.dumps(request_id)}, "tokens": {tokens}, '
+                                f'"unterminated_comment": {json.dumps(comment)}{extra}}}\n').encode("utf-8")
+        except asyncio.TimeoutError:
+            self.stats["timeouts"] += 1
+            response = self._error(request_id, "Prazo esgotado.")
+        except ValueError as e:
+            self.stats["errors"] += 1
+            response = self._error(request_id, f"Pedido inválido: {e}")
+        await self._write(writer, lock, response)
+
+    @staticmethod
+    def _response(request_id, fields: dict) -> bytes:
+        """Codifica uma resposta com o `id` do pedido e os campos informados."""
+        return (json.dumps({"id": request_id, **fields}, ensure_ascii=False) + "\n").encode("utf-8")
+
+    def _error(self, request_id, message: str) -> bytes:
+        """Codifica uma resposta de erro."""
+        return self._response(request_id, {"error": message})
+
+    @staticmethod
+    async def _write(writer: asyncio.StreamWriter, lock: asyncio.Lock, data: bytes) -> None:
+        """Escreve uma resposta, aguardando o esvaziamento do buffer de escrita."""
+        async with lock:
+            writer.write(data)
+            await writer.drain()
+
+    def summary(self) -> dict:
+        """
+        Retorna os contadores do servidor.
+
+        Returns:
+            dict: Contadores de `stats`, pedidos na fila e tamanho médio dos lotes.
+        """
+        batches = self.stats["batches"]
+        return {**self.stats, "pending": self._queue.qsize() if self._queue is not None else 0,
+                "mean_batch": self.stats["requests"] / batches if batches else 0.0}
+
+
+async def serve(address: str, analyzer: Optional[LexicalAnalyzer] = None, workers: Optional[int] = None, **options) -> None:
+    """
+    Executa o servidor até que a tarefa seja cancelada (por exemplo, com Ctrl+C em `asyncio.run`).
+
+    Args:
+        address (str): Endereço no formato de `parse_address`.
+        analyzer (LexicalAnalyzer | None): Analisador utilizado.
+        workers (int | None): Quantidade de processos do pool.
+        **options: Demais parâmetros de `LexingServer`.
+    """
+    server = LexingServer(analyzer, workers, **options)
+    start = time.perf_counter()
+    await server.start(address)
+    print(f"Servidor pronto em {address} ({server.workers} processos, {time.perf_counter() - start:.2f}s).", flush=True)
+    async with server:
+        await server.serve_forever()
@@ -0,0 +1,260 @@
+"""
+Módulo `source`
+
+Este módulo implementa o índice de linhas de um código fonte, usado para converter posições no texto em
+linhas e colunas sem percorrer o texto novamente.
+
+O `SourceIndex` é construído em uma única passagem pelas quebras de linha, com a mesma regra de
+`str.splitlines` utilizada pelo analisador, e guarda em `array.array` a posição inicial e final de cada
+linha. A linha de uma posição é obtida por busca binária (O(log n)) e o conteúdo de uma linha é uma
+fatia direta do texto (O(1)). As posições em bytes (UTF-8) são calculadas a partir da linha, sem
+codificar o texto inteiro.
+
+Classes:
+    - SourceIndex: Índice das linhas de um texto.
+    - Span: Posição de um trecho do texto em caracteres, linhas, colunas e bytes.
+"""
+
+from array import array
+from bisect import bisect_right
+import re
+
+from .scanner import NEWLINE_PATTERN
+
+_BREAKS = re.compile(NEWLINE_PATTERN)
+
+
+class Span:
+    """
+    Posição de um trecho do texto, como a de um token.
+
+    As linhas e colunas começam em 1, como em `LexicalAnalyzer.unterminated_comment`; as colunas
+    são contadas em caracteres. As posições em caracteres e em bytes começam em 0 e o final é
+    exclusivo.
+
+    Attributes:
+        start (int): Posição inicial no texto, em caracteres.
+        end (int): Posição final no texto, em caracteres.
+        line (int): Linha do início do trecho.
+        column (int): Coluna do início do trecho.
+        end_line (int): Linha do final do trecho.
+        end_column (int): Coluna do final do trecho.
+        start_byte (int): Posição inicial no texto codificado em UTF-8.
+        end_byte (int): Posição final no texto codificado em UTF-8.
+    """
+    __slots__ = ("start", "end", "line", "column", "end_line", "end_column", "start_byte", "end_byte")
+
+    def __init__(self, start: int, end: int, line: int, column: int, end_line: int, end_column: int,
+                 start_byte: int, end_byte: int) -> None:
+        """
+        Inicializa a posição de um trecho.
+
+        Args:
+            start (int): Posição inicial, em caracteres.
+            end (int): Posição final, em caracteres.
+            line (int): Linha do início.
+            column (int): Coluna do início.
+            end_line (int): Linha do final.
+            end_column (int): Coluna do final.
+            start_byte (int): Posição inicial, em bytes.
+            end_byte (int): Posição final, em bytes.
+        """
+        self.start = start
+        self.end = end
+        self.line = line
+        self.column = column
+        self.end_line = end_line
+        self.end_column = end_column
+        self.start_byte = start_byte
+        self.end_byte = end_byte
+
+    def _key(self) -> tuple:
+        """Retorna os campos da posição como tupla."""
+        return (self.start, self.end, self.line, self.column, self.end_line, self.end_column,
+                self.start_byte, self.end_byte)
+
+    def __eq__(self, other) -> bool:
+        """Compara duas posições campo a campo."""
+        if not isinstance(other, Span):
+            return NotImplemented
+        return self._key() == other._key()
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        """Retorna a representação textual da posição."""
+        return (f"Span({self.line}:{self.column}-{self.end_line}:{self.end_column}, "
+                f"chars {self.start}-{self.end}, bytes {self.start_byte}-{self.end_byte})")
+
+
+class SourceIndex:
+    """
+    Índice das linhas de um texto.
+
+    As linhas são numeradas a partir de 1. Um texto terminado em quebra de linha tem, ao final, uma
+    linha vazia, na qual fica a posição `len(text)`.
+
+    Attributes:
+        text (str): Texto indexado.
+        line_starts (array.array): Posição inicial de cada linha.
+        line_ends (array.array): Posição final do conteúdo de cada linha, antes da quebra de linha.
+    """
+    __slots__ = ("text", "line_starts", "line_ends", "_byte_starts")
+
+    def __init__(self, text: str) -> None:
+        """
+        Constrói o índice de um texto.
+
+        Args:
+            text (str): Texto a ser indexado.
+        """
+        self.text = text
+        breaks = [match.span() for match in _BREAKS.finditer(text)]
+        self.line_starts = array("I", [0])
+        self.line_starts.extend(end for _, end in breaks)
+        self.line_ends = array("I", [start for start, _ in breaks])
+        self.line_ends.append(len(text))
+        # Posição em bytes do início de cada linha, calculada na primeira consulta a um texto não ASCII.
+        self._byte_starts = None
+
+    def __len__(self) -> int:
+        """Retorna a quantidade de linhas."""
+        return len(self.line_starts)
+
+    def line_of(self, offset: int) -> int:
+        """
+        Retorna a linha de uma posição do texto.
+
+        Args:
+            offset (int): Posição no texto, em caracteres.
+
+        Returns:
+            int: Número da linha, a partir de 1.
+
+        Raises:
+            ValueError: Se a posição estiver fora do texto.
+        """
+        if not 0 <= offset <= len(self.text):
+            raise ValueError(f"Posição fora do texto: {offset}")
+        return bisect_right(self.line_starts, offset)
+
+    def position(self, offset: int) -> tuple[int, int]:
+        """
+        Converte uma posição do texto em linha e coluna.
+
+        Args:
+            offset (int): Posição no texto, em caracteres.
+
+        Returns:
+            tuple[int, int]: Linha e coluna, ambas a partir de 1.
+
+        Raises:
+            ValueError: Se a posição estiver fora do texto.
+        """
+        line = self.line_of(offset)
+        return line, offset - self.line_starts[line - 1] + 1
+
+    def offset(self, line: int, column: int) -> int:
+        """
+        Converte uma linha e coluna em posição do texto.
+
+        Args:
+            line (int): Número da linha, a partir de 1.
+            column (int): Coluna, a partir de 1; a coluna seguinte ao conteúdo da linha é aceita.
+
+        Returns:
+            int: Posição no texto, em caracteres.
+
+        Raises:
+            ValueError: Se a linha ou a coluna não existirem.
+        """
+        if not 1 <= line <= len(self.line_starts):
+            raise ValueError(f"Linha inválida: {line}")
+        start = self.line_starts[line - 1]
+        if not 1 <= column <= self.line_ends[line - 1] - start + 1:
+            raise ValueError(f"Coluna inválida: {(line, column)}")
+        return start + column - 1
+
+    def line(self, line: int, keepends: bool = False) -> str:
+        """
+        Retorna o conteúdo de uma linha.
+
+        Args:
+            line (int): Número da linha, a partir de 1.
+            keepends (bool): Indica se a quebra de linha deve ser incluída.
+
+        Returns:
+            str: Conteúdo da linha.
+
+        Raises:
+            ValueError: Se a linha não existir.
+        """
+        if not 1 <= line <= len(self.line_starts):
+            raise ValueError(f"Linha inválida: {line}")
+        end = self.line_starts[line] if keepends and line < len(self.line_starts) else self.line_ends[line - 1]
+        return self.text[self.line_starts[line - 1]:end]
+
+    def byte_offset(self, offset: int, line: int = 0) -> int:
+        """
+        Converte uma posição em caracteres na posição correspondente do texto codificado em UTF-8.
+
+        Args:
+            offset (int): Posição no texto, em caracteres.
+            line (int): Linha da posição, quando já conhecida; evita a busca binária.
+
+        Returns:
+            int: Posição em bytes.
+
+        Raises:
+            ValueError: Se a posição estiver fora do texto.
+        """
+        if self._byte_starts is None:
+            if self.text.isascii():
+                if not 0 <= offset <= len(self.text):
+                    raise ValueError(f"Posição fora do texto: {offset}")
+                return offset
+            self._byte_starts = self._build_byte_starts()
+        line = line or self.line_of(offset)
+        start = self.line_starts[line - 1]
+        return self._byte_starts[line - 1] + len(self.text[start:offset].encode("utf-8"))
+
+    def span(self, start: int, end: int, line: int = 0) -> Span:
+        """
+        Retorna a posição completa de um trecho do texto.
+
+        Args:
+            start (int): Posição inicial, em caracteres.
+            end (int): Posição final (exclusiva), em caracteres.
+            line (int): Linha do início, quando já conhecida; evita a busca binária.
+
+        Returns:
+            Span: Linhas, colunas e posições em bytes do trecho.
+
+        Raises:
+            ValueError: Se o trecho estiver fora do texto ou se `end` vier antes de `start`.
+        """
+        if not 0 <= start <= end <= len(self.text):
+            raise ValueError(f"Trecho inválido: {start} - {end}")
+        line = line or self.line_of(start)
+        starts = self.line_starts
+        # Um token nunca contém quebras de linha; só outros trechos exigem uma segunda busca.
+        end_line = line if line == len(starts) or end < starts[line] else self.line_of(end)
+        start_byte = self.byte_offset(start, line)
+        end_byte = start_byte + (end - start if self._byte_starts is None else len(self.text[start:end].encode("utf-8")))
+        return Span(start, end, line, start - starts[line - 1] + 1, end_line, end - starts[end_line - 1] + 1,
+                    start_byte, end_byte)
+
+    def _build_byte_starts(self) -> array:
+        """
+        Calcula a posição em bytes do início de cada linha.
+
+        Returns:
+            array.array: Posição em bytes do início de cada linha.
+        """
+        text, starts = self.text, self.line_starts
+        byte_starts = array("Q", [0])
+        total = 0
+        for previous, start in zip(starts, starts[1:]):
+            total += len(text[previous:start].encode("utf-8"))
+            byte_starts.append(total)
+        return byte_starts
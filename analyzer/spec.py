@@ -0,0 +1,201 @@
+"""
+Módulo `spec`
+
+Este módulo define a especificação declarativa das tabelas de tokens e os dialetos da linguagem LPD.
+
+Uma `TokenSpec` lista as palavras reservadas, os operadores e delimitadores e as classes regex
+(identificadores, números, textos) com o nome do tipo de cada um, além de indicar se as palavras
+reservadas diferenciam maiúsculas de minúsculas. A prioridade é a ordem da tabela compilada: as
+palavras reservadas e os operadores, que são reconhecidos por consulta exata, precedem as classes
+regex, que são testadas na ordem declarada.
+
+`TokenSpec.compile` constrói os objetos `Token` (com os padrões regex já compilados) uma única vez
+por especificação; as chamadas seguintes, inclusive de outros analisadores, reutilizam a mesma
+tabela. As expressões que separam os lexemas são derivadas dos operadores da própria tabela
+(veja `scanner.compile_patterns`), de modo que um operador declarado é sempre reconhecido como um
+único lexema. Um dialeto é apenas outra especificação, em geral derivada de `LPD` com `extend`, e
+não acrescenta nenhum custo por token à análise.
+
+Classes:
+    - TokenSpec: Especificação declarativa de uma tabela de tokens.
+
+Constantes:
+    - LPD: Especificação padrão da linguagem LPD.
+    - LPD_FOR: Dialeto com o laço `for ... to ... do`.
+    - LPD_CASELESS: Dialeto em que as palavras reservadas não diferenciam maiúsculas de minúsculas.
+    - DIALECTS: Especificações disponíveis, por nome.
+"""
+
+from typing import Iterable, Optional
+import re
+
+from .tokens import Token, token_type
+
+# Caracteres que não podem fazer parte de um operador: iniciam comentários ou literais de texto.
+_RESERVED_CHARS = set("{}'\"")
+_WORD = re.compile(r"\w+")
+
+
+class TokenSpec:
+    """
+    Especificação declarativa de uma tabela de tokens.
+
+    Attributes:
+        name (str): Nome da especificação (ou do dialeto).
+        keywords (tuple[tuple[str, str], ...]): Palavras reservadas e os nomes de seus tipos.
+        operators (tuple[tuple[str, str], ...]): Operadores e delimitadores e os nomes de seus tipos.
+        patterns (tuple[tuple[str, str], ...]): Classes regex e os nomes de seus tipos, em ordem de prioridade.
+        case_sensitive (bool): Indica se as palavras reservadas diferenciam maiúsculas de minúsculas.
+    """
+    __slots__ = ("name", "keywords", "operators", "patterns", "case_sensitive")
+
+    def __init__(self, name: str, keywords: Iterable[tuple[str, str]] = (), operators: Iterable[tuple[str, str]] = (),
+                 patterns: Iterable[tuple[str, str]] = (), case_sensitive: bool = True) -> None:
+        """
+        Inicializa e valida uma especificação.
+
+        Args:
+            name (str): Nome da especificação.
+            keywords (Iterable[tuple[str, str]]): Pares `(palavra, nome do tipo)`.
+            operators (Iterable[tuple[str, str]]): Pares `(operador, nome do tipo)`.
+            patterns (Iterable[tuple[str, str]]): Pares `(expressão regular, nome do tipo)`.
+            case_sensitive (bool): Indica se as palavras reservadas diferenciam maiúsculas de minúsculas.
+
+        Raises:
+            ValueError: Se uma palavra reservada não for formada apenas por letras, dígitos e `_`, se um
+                operador contiver letras, espaços, chaves ou aspas, se um lexema for declarado mais de
+                uma vez ou se uma expressão regular for inválida.
+        """
+        self.name = name
+        self.keywords = tuple((lexeme, type_name) for lexeme, type_name in keywords)
+        self.operators = tuple((lexeme, type_name) for lexeme, type_name in operators)
+        self.patterns = tuple((pattern, type_name) for pattern, type_name in patterns)
+        self.case_sensitive = case_sensitive
+
+        seen = set()
+        for lexeme, _ in self.keywords:
+            if _WORD.fullmatch(lexeme) is None:
+                raise ValueError(f"Palavra reservada inválida em '{name}': {lexeme!r}")
+            self._check_unique(lexeme if case_sensitive else lexeme.lower(), seen)
+        for lexeme, _ in self.operators:
+            if not lexeme or _WORD.search(lexeme) or any(char.isspace() or char in _RESERVED_CHARS for char in lexeme):
+                raise ValueError(f"Operador inválido em '{name}': {lexeme!r}")
+            self._check_unique(lexeme, seen)
+        for pattern, _ in self.patterns:
+            try:
+                re.compile(pattern)
+            except re.error as e:
+                raise ValueError(f"Expressão regular inválida em '{name}': {pattern!r} ({e})") from None
+
+    def _check_unique(self, lexeme: str, seen: set) -> None:
+        """Registra um lexema em `seen`, rejeitando repetições."""
+        if lexeme in seen:
+            raise ValueError(f"Lexema declarado mais de uma vez em '{self.name}': {lexeme!r}")
+        seen.add(lexeme)
+
+    @property
+    def key(self) -> tuple:
+        """Descrição imutável da especificação, usada na comparação e no cache das tabelas compiladas."""
+        return self.keywords, self.operators, self.patterns, self.case_sensitive
+
+    def __eq__(self, other: object) -> bool:
+        """Compara duas especificações pelo conteúdo, ignorando o nome."""
+        return isinstance(other, TokenSpec) and self.key == other.key
+
+    def __hash__(self) -> int:
+        """Retorna o hash do conteúdo da especificação."""
+        return hash(self.key)
+
+    def __repr__(self) -> str:
+        """Retorna a representação textual da especificação."""
+        return (f"TokenSpec({self.name!r}, {len(self.keywords)} palavras reservadas, {len(self.operators)} operadores, "
+                f"{len(self.patterns)} padrões, case_sensitive={self.case_sensitive})")
+
+    def extend(self, name: str, keywords: Iterable[tuple[str, str]] = (), operators: Iterable[tuple[str, str]] = (),
+               patterns: Iterable[tuple[str, str]] = (), remove: Iterable[str] = (),
+               case_sensitive: Optional[bool] = None) -> "TokenSpec":
+        """
+        Cria um dialeto a partir desta especificação.
+
+        Um lexema ou padrão já declarado tem apenas o tipo substituído, mantendo sua posição; os
+        novos são acrescentados ao final do respectivo grupo.
+
+        Args:
+            name (str): Nome do dialeto.
+            keywords (Iterable[tuple[str, str]]): Palavras reservadas acrescentadas ou redefinidas.
+            operators (Iterable[tuple[str, str]]): Operadores acrescentados ou redefinidos.
+            patterns (Iterable[tuple[str, str]]): Classes regex acrescentadas ou redefinidas.
+            remove (Iterable[str]): Palavras reservadas, operadores ou padrões removidos.
+            case_sensitive (bool | None): Novo valor de `case_sensitive` (padrão: o desta especificação).
+
+        Returns:
+            TokenSpec: A nova especificação.
+        """
+        removed = set(remove)
+
+        def merge(entries, changes):
+            merged = {lexeme: type_name for lexeme, type_name in entries if lexeme not in removed}
+            merged.update(changes)
+            return merged.items()
+
+        return TokenSpec(name, merge(self.keywords, keywords), merge(self.operators, operators),
+                         merge(self.patterns, patterns),
+                         self.case_sensitive if case_sensitive is None else case_sensitive)
+
+    def compile(self) -> tuple[Token, ...]:
+        """
+        Constrói a tabela de tokens da especificação, uma única vez por conteúdo.
+
+        Returns:
+            tuple[Token, ...]: Palavras reservadas, operadores e classes regex, nessa ordem. Sem
+            diferenciar maiúsculas de minúsculas, as palavras reservadas ficam em minúsculas.
+        """
+        table = _COMPILED.get(self)
+        if table is None:
+            fold = str if self.case_sensitive else str.lower
+            table = _COMPILED[self] = (
+                *(Token(fold(lexeme), token_type(type_name)) for lexeme, type_name in self.keywords),
+                *(Token(lexeme, token_type(type_name)) for lexeme, type_name in self.operators),
+                *(Token(pattern, token_type(type_name), use_regex=True) for pattern, type_name in self.patterns),
+            )
+        return table
+
+
+# Tabelas compiladas por especificação.
+_COMPILED = {}
+
+LPD = TokenSpec(
+    "lpd",
+    keywords=[
+        ("and", "sand"), ("or", "sor"), ("not", "snot"),
+        ("program", "sprogram"), ("begin", "sbegin"), ("end", "send"),
+        ("procedure", "sprocedure"), ("function", "sfunction"),
+        ("if", "sif"), ("then", "sthen"), ("else", "selse"),
+        ("while", "swhile"), ("do", "sdo"), ("repeat", "srepeat"), ("until", "suntil"),
+        ("writec", "swritec"), ("writed", "swrited"), ("readc", "sreadc"), ("readd", "sreadd"),
+        ("var", "svar"), ("int", "sint"), ("float", "sfloat"), ("char", "schar"),
+        ("div", "sdiv"),
+    ],
+    operators=[
+        ("==", "sigual"), ("=", "sigual"), ("<>", "sdiferente"), ("!=", "sdiferente"),
+        (">=", "smaior_igual"), ("<=", "smenor_igual"), (">", "smaior"), ("<", "smenor"),
+        (":=", "satribuição"),
+        (".", "sponto"), (";", "sponto_virgula"), (",", "svírgula"),
+        ("(", "sabre_parênteses"), (")", "sfecha_parênteses"), ("[", "sabre_colchete"), ("]", "sfecha_colchete"),
+        ("+", "smais"), ("-", "smenos"), ("*", "svezes"), ("/", "sdiv_flutuante"),
+    ],
+    patterns=[
+        # Identificadores alfanuméricos que começam com uma letra ou sublinhado.
+        (r"^[a-zA-Z_]\w*$", "sidentificador"),
+        # Números inteiros ou de ponto flutuante.
+        (r"^\d+(\.\d+)?$", "snúmero"),
+        # Literais de texto delimitados por aspas simples ou duplas.
+        (r"\'.{0,1}\'|\".*\"", "stexto"),
+    ],
+)
+
+LPD_FOR = LPD.extend("lpd-for", keywords=[("for", "sfor"), ("to", "sto")])
+
+LPD_CASELESS = LPD.extend("lpd-caseless", case_sensitive=False)
+
+DIALECTS = {spec.name: spec for spec in (LPD, LPD_FOR, LPD_CASELESS)}
@@ -0,0 +1,196 @@
+"""
+Módulo `stats`
+
+Este módulo calcula estatísticas de tokens de um ou mais códigos fonte com NumPy e pandas.
+
+As colunas de cada `TokenStream` (produzido por `LexicalAnalyzer.scan_stream`) são vistas como
+arrays NumPy sem cópia e concatenadas em um único `pandas.DataFrame`, sobre o qual as contagens
+por tipo, a densidade de tokens por linha e as linhas mais longas são calculadas com agrupamentos
+vetorizados. Os tipos aparecem com os nomes de `TokenType` (por exemplo, `sidentificador`). Apenas
+a tabela de frequência de identificadores precisa criar as `str` dos lexemas, e somente dos
+identificadores.
+
+Classes:
+    - TokenStatistics: Acumula os tokens de vários arquivos e produz relatórios de frequência.
+"""
+
+from typing import Optional, Union
+import operator
+import os
+
+import numpy as np
+import pandas as pd
+
+from .analyzer import LexicalAnalyzer, Token
+from .stream import TokenStream
+from .tokens import ERROR_TOKEN
+
+
+class TokenStatistics:
+    """
+    Acumula os tokens de vários códigos fonte e produz relatórios vetorizados.
+
+    Attributes:
+        analyzer (LexicalAnalyzer): Analisador utilizado por `add_file` e cuja tabela (`output_tokens`)
+            define os tipos.
+        type_names (list[str]): Nomes distintos dos tipos de token, na ordem das categorias.
+        files (list[str]): Nome de cada código fonte acumulado, na ordem em que foi adicionado.
+    """
+    def __init__(self, analyzer: Optional[LexicalAnalyzer] = None) -> None:
+        """
+        Inicializa as estatísticas vazias.
+
+        Args:
+            analyzer (LexicalAnalyzer | None): Analisador utilizado (padrão: um novo `LexicalAnalyzer`).
+        """
+        self.analyzer = analyzer or LexicalAnalyzer()
+        # Vários tokens da tabela podem compartilhar o mesmo tipo; cada posição é associada ao código do seu nome.
+        names = [token.type.name for token in self.analyzer.output_tokens]
+        self.type_names, self._type_codes = np.unique(np.array(names, dtype=object), return_inverse=True)
+        self.type_names = list(self.type_names)
+        self.files = []
+        self._streams = []
+        self._frame = None
+
+    def add(self, stream: TokenStream, name: Optional[str] = None) -> None:
+        """
+        Acrescenta os tokens de um código fonte.
+
+        Args:
+            stream (TokenStream): Tokens produzidos por `LexicalAnalyzer.scan_stream` com o mesmo analisador.
+            name (str | None): Nome do código fonte nos relatórios (padrão: `<n>`, sua posição).
+        """
+        # Com a política de erros `"token"`, cada `scan_stream` recebe uma nova lista: `tokens` seguida de `ERROR_TOKEN`.
+        table, tokens = stream.table, self.analyzer.tokens
+        if table is not tokens and not (len(table) == len(tokens) + 1 and table[-1] is ERROR_TOKEN
+                                        and all(map(operator.is_, table, tokens))):
+            raise ValueError("O TokenStream foi produzido com outra tabela de tokens.")
+        self.files.append(name if name is not None else f"<{len(self.files)}>")
+        self._streams.append(stream)
+        self._frame = None
+
+    def add_file(self, path: Union[str, os.PathLike]) -> None:
+        """
+        Analisa um arquivo e acrescenta seus tokens.
+
+        Args:
+            path (str | os.PathLike): Caminho do arquivo em UTF-8.
+        """
+        with open(path, "r", encoding="utf-8") as file:
+            self.add(self.analyzer.scan_stream(file.read()), os.fspath(path))
+
+    @property
+    def frame(self) -> pd.DataFrame:
+        """
+        Tabela com um token por linha e as colunas `file`, `type`, `line`, `start` e `end`.
+
+        `file` e `type` são categóricas; as demais são inteiras. A tabela é montada uma única vez a
+        partir das colunas dos `TokenStream`, sem percorrer os tokens em Python.
+        """
+        if self._frame is None:
+            arrays = [_arrays(stream) for stream in self._streams]
+            sizes = np.fromiter((len(stream) for stream in self._streams), dtype=np.int64, count=len(self._streams))
+            type_ids = _concatenate([a[0] for a in arrays], np.uint16)
+            self._frame = pd.DataFrame({
+                "file": pd.Categorical.from_codes(np.repeat(np.arange(len(self.files)), sizes), categories=self.files),
+                "type": pd.Categorical.from_codes(self._type_codes[type_ids], categories=self.type_names),
+                "line": _concatenate([a[1] for a in arrays], np.uint32),
+                "start": _concatenate([a[2] for a in arrays], np.uint32),
+                "end": _concatenate([a[3] for a in arrays], np.uint32),
+            })
+        return self._frame
+
+    def type_counts(self) -> pd.Series:
+        """
+        Conta os tokens de cada tipo em todos os códigos fonte.
+
+        Returns:
+            pandas.Series: Quantidade de tokens por nome de tipo, em ordem decrescente.
+        """
+        return self.frame["type"].value_counts()
+
+    def type_counts_by_file(self) -> pd.DataFrame:
+        """
+        Conta os tokens de cada tipo em cada código fonte.
+
+        Returns:
+            pandas.DataFrame: Uma linha por código fonte e uma coluna por nome de tipo.
+        """
+        return pd.crosstab(self.frame["file"], self.frame["type"], dropna=False)
+
+    def line_density(self) -> pd.DataFrame:
+        """
+        Calcula a quantidade de tokens e a extensão de cada linha que contém tokens.
+
+        A extensão é a distância, em caracteres, do início do primeiro ao fim do último token da linha.
+
+        Returns:
+            pandas.DataFrame: Colunas `tokens` e `span`, indexadas por `(file, line)`.
+        """
+        grouped = self.frame.groupby(["file", "line"], observed=True, sort=True)
+        result = grouped.agg(tokens=("type", "size"), first=("start", "min"), last=("end", "max"))
+        result["span"] = result["last"].astype(np.int64) - result["first"].astype(np.int64)
+        return result[["tokens", "span"]]
+
+    def longest_lines(self, count: int = 10, by: str = "span") -> pd.DataFrame:
+        """
+        Seleciona as linhas mais longas de todos os códigos fonte.
+
+        Args:
+            count (int): Quantidade de linhas retornadas.
+            by (str): Critério de comparação, `span` (caracteres) ou `tokens`.
+
+        Returns:
+            pandas.DataFrame: As linhas selecionadas, no formato de `line_density`.
+        """
+        return self.line_density().nlargest(count, by)
+
+    def identifier_frequencies(self, top: Optional[int] = None) -> pd.Series:
+        """
+        Conta as ocorrências de cada identificador em todos os códigos fonte.
+
+        Args:
+            top (int | None): Quantidade máxima de identificadores retornados (padrão: todos).
+
+        Returns:
+            pandas.Series: Quantidade de ocorrências por identificador, em ordem decrescente.
+        """
+        if Token.SIDENTIFICADOR.name not in self.type_names:
+            return pd.Series(dtype=np.int64, name="count")
+        code = self.type_names.index(Token.SIDENTIFICADOR.name)
+        lexemes = []
+        for stream in self._streams:
+            type_ids, _, starts, ends = _arrays(stream)
+            mask = self._type_codes[type_ids] == code
+            source = stream.source
+            lexemes.extend(source[start:end] for start, end in zip(starts[mask].tolist(), ends[mask].tolist()))
+        counts = pd.Series(lexemes, dtype=object).value_counts()
+        return counts if top is None else counts.head(top)
+
+
+def _arrays(stream: TokenStream) -> tuple:
+    """
+    Vê as colunas de um `TokenStream` como arrays NumPy, sem cópia.
+
+    Args:
+        stream (TokenStream): Sequência de tokens.
+
+    Returns:
+        tuple[numpy.ndarray, ...]: Posições na tabela, linhas, inícios e fins.
+    """
+    return (np.frombuffer(stream.type_ids, dtype=np.uint16), np.frombuffer(stream.lines, dtype=np.uint32),
+            np.frombuffer(stream.starts, dtype=np.uint32), np.frombuffer(stream.ends, dtype=np.uint32))
+
+
+def _concatenate(arrays: list, dtype) -> np.ndarray:
+    """
+    Concatena arrays, retornando um array vazio do tipo indicado quando não há nenhum.
+
+    Args:
+        arrays (list[numpy.ndarray]): Arrays a concatenar.
+        dtype (numpy.dtype): Tipo do resultado.
+
+    Returns:
+        numpy.ndarray: Array concatenado.
+    """
+    return np.concatenate(arrays).astype(dtype, copy=False) if arrays else np.empty(0, dtype=dtype)
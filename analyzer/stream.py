@@ -0,0 +1,149 @@
+"""
+Módulo `stream`
+
+Este módulo implementa uma representação colunar e compacta do resultado da análise léxica.
+
+Em vez de uma lista de tuplas `(lexema, Token, linha)`, com uma `str` nova e uma tupla por token,
+`TokenStream` guarda em `array.array` a posição do `Token` na tabela do analisador, a linha e as
+posições inicial e final de cada lexema no texto varrido. O lexema só é criado, como uma fatia do
+texto, quando o token é acessado. As colunas suportam o protocolo de buffer e podem ser vistas sem
+cópia como arrays NumPy (`numpy.frombuffer(stream.lines, dtype=numpy.uint32)`).
+
+As colunas e as posições em bytes de cada token são obtidas por `span`, a partir de um `SourceIndex`
+do texto construído na primeira consulta, sem varrer novamente as linhas.
+
+Classes:
+    - TokenStream: Sequência de tokens armazenada em colunas, compatível com a lista de tuplas.
+"""
+
+from array import array
+from typing import Iterator, Union
+
+from .source import SourceIndex, Span
+
+
+class TokenStream:
+    """
+    Sequência de tokens armazenada em colunas.
+
+    A iteração, o acesso por índice e a comparação se comportam como na lista de tuplas
+    `(lexema, Token, linha)` retornada por `LexicalAnalyzer.tokenize`.
+
+    Attributes:
+        source (str): Texto varrido, do qual os lexemas são fatias.
+        table (list[Token]): Tabela de tokens do analisador que produziu a sequência.
+        type_ids (array.array): Posição em `table` do `Token` de cada lexema.
+        lines (array.array): Linha de cada lexema.
+        starts (array.array): Posição inicial de cada lexema em `source`.
+        ends (array.array): Posição final de cada lexema em `source`.
+    """
+    __slots__ = ("source", "table", "type_ids", "lines", "starts", "ends", "_index")
+
+    def __init__(self, source: str, table: list) -> None:
+        """
+        Inicializa uma sequência vazia sobre um texto.
+
+        Args:
+            source (str): Texto varrido, do qual os lexemas são fatias.
+            table (list[Token]): Tabela de tokens do analisador.
+        """
+        self.source = source
+        self.table = table
+        self.type_ids = array("H")
+        self.lines = array("I")
+        self.starts = array("I")
+        self.ends = array("I")
+        self._index = None
+
+    def __len__(self) -> int:
+        """Retorna a quantidade de tokens."""
+        return len(self.type_ids)
+
+    def __getitem__(self, index: Union[int, slice]):
+        """
+        Retorna a tupla `(lexema, Token, linha)` de um índice, ou uma nova sequência para uma fatia.
+
+        Args:
+            index (int | slice): Índice ou fatia.
+
+        Returns:
+            tuple | TokenStream: Token no formato de `tokenize`, ou os tokens da fatia.
+        """
+        if isinstance(index, slice):
+            result = TokenStream(self.source, self.table)
+            result.type_ids = self.type_ids[index]
+            result.lines = self.lines[index]
+            result.starts = self.starts[index]
+            result.ends = self.ends[index]
+            result._index = self._index
+            return result
+        return self.source[self.starts[index]:self.ends[index]], self.table[self.type_ids[index]], self.lines[index]
+
+    def __iter__(self) -> Iterator[tuple]:
+        """Percorre os tokens no formato `(lexema, Token, linha)`."""
+        source, table = self.source, self.table
+        for type_id, line, start, end in zip(self.type_ids, self.lines, self.starts, self.ends):
+            yield source[start:end], table[type_id], line
+
+    def __eq__(self, other) -> bool:
+        """Compara com outra sequência ou com uma lista de tuplas, token a token."""
+        if not isinstance(other, (TokenStream, list)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        """Retorna a representação textual da sequência."""
+        return f"TokenStream({len(self)} tokens)"
+
+    def lexeme(self, index: int) -> str:
+        """
+        Retorna o lexema de um token.
+
+        Args:
+            index (int): Índice do token.
+
+        Returns:
+            str: Fatia de `source` correspondente ao lexema.
+        """
+        return self.source[self.starts[index]:self.ends[index]]
+
+    @property
+    def index(self) -> SourceIndex:
+        """Índice das linhas de `source`, construído na primeira consulta."""
+        if self._index is None:
+            self._index = SourceIndex(self.source)
+        return self._index
+
+    def span(self, index: int) -> Span:
+        """
+        Retorna a posição de um token em linhas, colunas e bytes.
+
+        Args:
+            index (int): Índice do token.
+
+        Returns:
+            Span: Posição do lexema em `source`.
+        """
+        return self.index.span(self.starts[index], self.ends[index], self.lines[index])
+
+    def spans(self) -> Iterator[Span]:
+        """Percorre as posições de todos os tokens, na ordem da sequência."""
+        source_index = self.index
+        for line, start, end in zip(self.lines, self.starts, self.ends):
+            yield source_index.span(start, end, line)
+
+    def to_list(self) -> list[tuple]:
+        """
+        Converte a sequência para o formato de `LexicalAnalyzer.tokenize`.
+
+        Returns:
+            list[tuple[str, Token, int]]: Lista de tokens encontrados com a linha correspondente.
+        """
+        return list(self)
+
+    @property
+    def nbytes(self) -> int:
+        """Quantidade de bytes ocupada pelas colunas, sem contar `source`."""
+        return sum(len(column) * column.itemsize for column in (self.type_ids, self.lines, self.starts, self.ends))
@@ -0,0 +1,175 @@
+"""
+Módulo `tokens`
+
+Este módulo define os tipos de token da linguagem LPD e a classe `Token`, que associa um lexema (ou
+um padrão regex) a um tipo. As tabelas de tokens são construídas a partir de uma especificação
+declarativa (veja `analyzer.spec`).
+
+Classes:
+    - TokenType: Representa um tipo genérico de token.
+    - Token: Representa um token específico com seu valor (lexema) e tipo.
+
+Funções:
+    - token_type(name): Retorna o tipo de token com o nome informado, criando-o se necessário.
+
+Constantes:
+    - ERROR_TOKEN: Token dos lexemas desconhecidos, emitido com a política de erros `"token"`.
+"""
+
+from itertools import count
+from typing import Union
+import re
+
+# Números sequenciais dos tipos de token, na ordem de criação.
+_TYPE_IDS = count()
+
+# Define um tipo de token, que representa uma categoria de lexemas
+class TokenType:
+    """
+    Representa o tipo de um token, armazenando seu nome.
+
+    Attributes:
+        name (str): O nome que descreve o tipo do token.
+        id (int): Número inteiro exclusivo do tipo, que permite comparar tipos como inteiros (veja
+            `analyzer.cursor.TokenCursor`). É atribuído na criação e não é estável entre execuções.
+    """
+    __slots__ = ("name", "id")
+
+    def __init__(self, name: str) -> None:
+        """
+        Inicializa um novo tipo de token.
+
+        Args:
+            name (str): O nome que descreve o tipo do token.
+        """
+        self.name = name
+        self.id = next(_TYPE_IDS)
+
+    def __str__(self) -> str:
+        """Retorna o nome do tipo do token como string."""
+        return self.name  
+    
+    def __repr__(self) -> str:
+        """Retorna a representação textual do tipo do token."""
+        return self.name
+
+class Token:
+    """
+    Representa um token específico com seu lexema e tipo, incluindo o uso de regex.
+
+    Attributes:
+        lexeme (str | int): O valor literal ou padrão do token.
+        type (TokenType): O tipo do token, representado por um objeto `TokenType`.
+        use_regex (bool): Indica se o token deve ser identificado por regex.
+        pattern (re.Pattern | None): Expressão regular pré-compilada, quando `use_regex` é verdadeiro.
+    """
+    __slots__ = ("lexeme", "type", "use_regex", "pattern")
+
+    # Define os principais tipos de tokens suportados
+    SPROGRAM = TokenType("sprogram")
+    SBEGIN = TokenType("sbegin")
+    SEND = TokenType("send")
+    SPROCEDURE = TokenType("sprocedure")
+    SFUNCTION = TokenType("sfunction")
+    SIF = TokenType("sif")
+    STHEN = TokenType("sthen")
+    SELSE = TokenType("selse")
+    SWHILE = TokenType("swhile")
+    SDO = TokenType("sdo")
+    SREPEAT = TokenType("srepeat")
+    SUNTIL = TokenType("suntil")
+    SATRIBUICAO = TokenType("satribuição")
+    SWRITEC = TokenType("swritec")
+    SWRITED = TokenType("swrited")
+    SREADC = TokenType("sreadc")
+    SREADD = TokenType("sreadd")
+    SVAR = TokenType("svar")
+    SINT = TokenType("sint")
+    SFLOAT = TokenType("sfloat")
+    SCHAR = TokenType("schar")
+    SIDENTIFICADOR = TokenType("sidentificador")
+    SNUMERO = TokenType("snúmero")
+    SPONTO = TokenType("sponto")
+    SPONTO_VIRGULA = TokenType("sponto_virgula")
+    SVIRGULA = TokenType("svírgula")
+    SABRE_PARENTESES = TokenType("sabre_parênteses")
+    SFECHA_PARENTESES = TokenType("sfecha_parênteses")
+    SABRE_COLCHETE = TokenType("sabre_colchete")
+    SFECHA_COLCHETE = TokenType("sfecha_colchete")
+    SAND = TokenType("sand")
+    SOR = TokenType("sor")
+    SNOT = TokenType("snot")
+    SMAIOR = TokenType("smaior")
+    SMENOR = TokenType("smenor")
+    SIGUAL = TokenType("sigual")
+    SDIFERENTE = TokenType("sdiferente")
+    SMAIOR_IGUAL = TokenType("smaior_igual")
+    SMENOR_IGUAL = TokenType("smenor_igual")
+    SMAIS = TokenType("smais")
+    SMENOS = TokenType("smenos")
+    SVEZES = TokenType("svezes")
+    SDIV = TokenType("sdiv")
+    SDIV_FLUTUANTE = TokenType("sdiv_flutuante")
+    STEXTO = TokenType("stexto")
+    SERRO = TokenType("serro")
+
+    def __init__(self, lexeme: Union[str, int], ttype: TokenType, use_regex=False) -> None:
+        """
+        Inicializa um token específico.
+
+        Args:
+            lexeme (str | int): O valor literal ou padrão do token.
+            ttype (TokenType): O tipo do token.
+            use_regex (bool): Indica se o token será identificado por regex.
+        """
+        self.lexeme = lexeme
+        self.type = ttype
+        self.use_regex = use_regex
+        self.pattern = re.compile(lexeme, re.I) if use_regex else None
+
+    def is_(self, tk: Union[str, int]):
+        """
+        Verifica se o lexema do token corresponde ao valor fornecido.
+
+        Args:
+            tk (str | int): O valor a ser comparado.
+
+        Returns:
+            bool: `True` se corresponder, `False` caso contrário.
+        """
+        if self.use_regex:
+            return self.pattern.match(tk) is not None
+        return self.lexeme == tk
+
+    def __str__(self) -> str:
+        """Retorna o nome do tipo do token."""
+        return self.type.name
+
+
+# Tipos de token por nome, incluindo os criados pelas especificações de dialetos.
+_TYPES = {value.name: value for value in vars(Token).values() if isinstance(value, TokenType)}
+
+
+def token_type(name: str) -> TokenType:
+    """
+    Retorna o tipo de token com o nome informado, criando-o na primeira consulta.
+
+    Os tipos de `Token` (como `Token.SIDENTIFICADOR`) são encontrados pelo nome (`"sidentificador"`),
+    de modo que a comparação por identidade (`token.type is Token.SIDENTIFICADOR`) continua valendo
+    para tabelas construídas a partir de uma especificação.
+
+    Args:
+        name (str): Nome do tipo, por exemplo `"sfor"`.
+
+    Returns:
+        TokenType: O tipo registrado com esse nome.
+    """
+    found = _TYPES.get(name)
+    if found is None:
+        found = _TYPES[name] = TokenType(name)
+    return found
+
+
+# Token emitido para os lexemas desconhecidos com a política de erros `"token"`. Não pertence a
+# nenhuma tabela e seu lexema vazio não corresponde a nenhum lexema encontrado.
+ERROR_TOKEN = Token("", Token.SERRO)
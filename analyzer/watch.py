@@ -0,0 +1,387 @@
+"""
+Módulo `watch`
+
+Este módulo implementa o modo de observação: um analisador residente que acompanha uma árvore de
+arquivos `.lpd`, reanalisa apenas os arquivos alterados e mantém em memória um índice dos tokens de
+cada arquivo, que pode ser consultado entre as atualizações (por exemplo, quais arquivos usam um
+identificador ou quantos tokens de cada tipo existem).
+
+A cada consulta (`TreeWatcher.refresh`), a árvore é percorrida com `os.scandir` e apenas os
+metadados dos arquivos são lidos. Um arquivo com o mesmo `mtime` e tamanho da análise anterior não é
+aberto; um arquivo com metadados diferentes é lido e comparado pelo resumo BLAKE2b do conteúdo, e só
+é reanalisado se o conteúdo tiver mudado. O índice é atualizado subtraindo as contribuições antigas
+do arquivo e somando as novas, de modo que o custo de uma atualização depende dos arquivos alterados,
+e não do tamanho da árvore; a única parte proporcional à árvore é a leitura dos metadados.
+
+Um arquivo cujo `mtime` não é anterior ao momento da leitura (menos `RACY_NS`) pode ter sido
+alterado de novo sem que o `mtime` mude, na resolução do sistema de arquivos; nesse caso, seu
+conteúdo é comparado outra vez nas consultas seguintes, como no índice do Git.
+
+Classes:
+    - WatchedFile: Resumo dos tokens de um arquivo observado.
+    - WatchUpdate: Arquivos novos, alterados e removidos em uma atualização.
+    - TreeWatcher: Observa uma árvore de arquivos e mantém o índice dos tokens.
+
+Funções:
+    - stat_tree(roots, extension): Lê os metadados dos arquivos de uma árvore.
+
+Constantes:
+    - RACY_NS: Margem, em nanossegundos, em que um `mtime` recente não basta para descartar uma alteração.
+"""
+
+from collections import Counter
+from typing import Iterable, Iterator, Optional
+import glob
+import hashlib
+import os
+import threading
+import time
+
+from .analyzer import LexicalAnalyzer
+from .diagnostics import LexicalError
+from .tokens import Token
+
+# Resolução de `mtime` mais grosseira entre os sistemas de arquivos comuns (FAT: 2 segundos).
+RACY_NS = 2_000_000_000
+
+
+class WatchedFile:
+    """
+    Resumo dos tokens de um arquivo observado.
+
+    Attributes:
+        path (str): Caminho do arquivo.
+        mtime_ns (int): `mtime` do arquivo na última leitura, em nanossegundos.
+        size (int): Tamanho do arquivo na última leitura, em bytes.
+        digest (bytes): Resumo BLAKE2b do conteúdo lido.
+        checked_ns (int): Momento da última leitura, em nanossegundos.
+        tokens (int): Quantidade de tokens.
+        counts (dict[str, int]): Quantidade de tokens por nome de tipo.
+        identifiers (dict[str, list[int]]): Linhas de cada identificador, em ordem.
+        diagnostics (list[Diagnostic]): Erros léxicos da análise.
+        error (str | None): Mensagem de erro, caso a leitura ou a análise tenha falhado.
+    """
+    __slots__ = ("path", "mtime_ns", "size", "digest", "checked_ns", "tokens", "counts", "identifiers",
+                 "diagnostics", "error")
+
+    def __init__(self, path: str, mtime_ns: int, size: int, digest: bytes) -> None:
+        """
+        Inicializa o resumo vazio de um arquivo lido.
+
+        Args:
+            path (str): Caminho do arquivo.
+            mtime_ns (int): `mtime` do arquivo, em nanossegundos.
+            size (int): Tamanho do arquivo, em bytes.
+            digest (bytes): Resumo do conteúdo.
+        """
+        self.path = path
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.digest = digest
+        self.checked_ns = time.time_ns()
+        self.tokens = 0
+        self.counts = {}
+        self.identifiers = {}
+        self.diagnostics = []
+        self.error = None
+
+    @property
+    def racy(self) -> bool:
+        """Indica se uma alteração pode ter ocorrido sem mudar o `mtime` (veja `RACY_NS`)."""
+        return self.mtime_ns >= self.checked_ns - RACY_NS
+
+    def __repr__(self) -> str:
+        """Retorna a representação textual do resumo."""
+        if self.error is not None:
+            return f"WatchedFile({self.path!r}, error={self.error!r})"
+        return f"WatchedFile({self.path!r}, tokens={self.tokens}, identifiers={len(self.identifiers)})"
+
+
+class WatchUpdate:
+    """
+    Resultado de uma atualização de `TreeWatcher`.
+
+    Attributes:
+        added (list[str]): Arquivos novos.
+        modified (list[str]): Arquivos com o conteúdo alterado, reanalisados.
+        removed (list[str]): Arquivos removidos do índice.
+        touched (list[str]): Arquivos com metadados alterados, mas o mesmo conteúdo, não reanalisados.
+        failed (list[str]): Arquivos novos ou alterados cuja leitura ou análise falhou.
+        scanned (int): Quantidade de arquivos encontrados na árvore.
+        elapsed (float): Duração da atualização, em segundos.
+    """
+    __slots__ = ("added", "modified", "removed", "touched", "failed", "scanned", "elapsed")
+
+    def __init__(self) -> None:
+        """Inicializa uma atualização sem alterações."""
+        self.added = []
+        self.modified = []
+        self.removed = []
+        self.touched = []
+        self.failed = []
+        self.scanned = 0
+        self.elapsed = 0.0
+
+    @property
+    def changed(self) -> list[str]:
+        """Arquivos reanalisados, novos ou alterados."""
+        return self.added + self.modified
+
+    def __bool__(self) -> bool:
+        """Indica se o índice mudou."""
+        return bool(self.added or self.modified or self.removed)
+
+    def __str__(self) -> str:
+        """Retorna o resumo em uma linha."""
+        return (f"{len(self.added)} novos, {len(self.modified)} alterados, {len(self.removed)} removidos, "
+                f"{len(self.touched)} com o mesmo conteúdo, {len(self.failed)} com falha "
+                f"({self.scanned} arquivos em {self.elapsed * 1000:.1f} ms)")
+
+
+class TreeWatcher:
+    """
+    Observa uma árvore de arquivos, reanalisando os alterados e mantendo o índice dos seus tokens.
+
+    Attributes:
+        roots (list[str]): Diretórios, arquivos ou padrões glob observados.
+        analyzer (LexicalAnalyzer): Analisador residente, reutilizado em todas as análises.
+        extension (str): Extensão dos arquivos procurados nos diretórios.
+        files (dict[str, WatchedFile]): Resumo de cada arquivo observado, pelo caminho.
+        analyses (int): Quantidade de análises realizadas desde a criação.
+    """
+    def __init__(self, roots: Iterable[str], analyzer: Optional[LexicalAnalyzer] = None, extension: str = ".lpd") -> None:
+        """
+        Inicializa o observador, sem analisar nenhum arquivo (veja `refresh`).
+
+        Args:
+            roots (Iterable[str]): Diretórios, arquivos ou padrões glob observados.
+            analyzer (LexicalAnalyzer | None): Analisador utilizado (padrão: um novo `LexicalAnalyzer`).
+            extension (str): Extensão dos arquivos procurados nos diretórios.
+        """
+        self.roots = list(roots)
+        self.analyzer = analyzer or LexicalAnalyzer()
+        self.extension = extension
+        self.files = {}
+        self.analyses = 0
+        # Índices globais: arquivos de cada identificador e quantidade de tokens por tipo.
+        self._users = {}
+        self._counts = Counter()
+
+    def refresh(self) -> WatchUpdate:
+        """
+        Atualiza o índice com os arquivos novos, alterados e removidos desde a última atualização.
+
+        Returns:
+            WatchUpdate: Arquivos afetados pela atualização.
+        """
+        start = time.perf_counter()
+        update = WatchUpdate()
+        found = stat_tree(self.roots, self.extension)
+        update.scanned = len(found)
+
+        for path in [path for path in self.files if path not in found]:
+            self._drop(path)
+            update.removed.append(path)
+
+        for path in sorted(found):
+            mtime_ns, size = found[path]
+            entry = self.files.get(path)
+            if entry is not None and entry.mtime_ns == mtime_ns and entry.size == size and not entry.racy:
+                continue
+            try:
+                with open(path, "rb") as file:
+                    data = file.read()
+            except OSError:
+                # O arquivo foi removido entre a leitura dos metadados e a do conteúdo.
+                if entry is not None:
+                    self._drop(path)
+                    update.removed.append(path)
+                continue
+            digest = hashlib.blake2b(data, digest_size=16).digest()
+            if entry is not None and entry.digest == digest:
+                if (entry.mtime_ns, entry.size) != (mtime_ns, size):
+                    update.touched.append(path)
+                entry.mtime_ns, entry.size, entry.checked_ns = mtime_ns, size, time.time_ns()
+                continue
+
+            if entry is not None:
+                self._drop(path)
+            (update.added if entry is None else update.modified).append(path)
+            entry = self._analyze(WatchedFile(path, mtime_ns, size, digest), data)
+            if entry.error is not None:
+                update.failed.append(path)
+            self._add(entry)
+
+        update.elapsed = time.perf_counter() - start
+        return update
+
+    def watch(self, interval: float = 1.0, stop: Optional[threading.Event] = None) -> Iterator[WatchUpdate]:
+        """
+        Atualiza o índice periodicamente, produzindo cada atualização que o modifica.
+
+        A primeira atualização, que analisa a árvore inteira, é sempre produzida.
+
+        Args:
+            interval (float): Intervalo entre as consultas, em segundos.
+            stop (threading.Event | None): Evento que encerra a observação (padrão: observar até a
+                interrupção do gerador).
+
+        Yields:
+            WatchUpdate: Atualizações com arquivos novos, alterados ou removidos.
+        """
+        stop = stop or threading.Event()
+        yield self.refresh()
+        while not stop.wait(interval):
+            update = self.refresh()
+            if update:
+                yield update
+
+    def files_using(self, identifier: str) -> list[str]:
+        """
+        Retorna os arquivos em que um identificador aparece.
+
+        Args:
+            identifier (str): Lexema do identificador, como escrito no código fonte.
+
+        Returns:
+            list[str]: Caminhos dos arquivos, em ordem alfabética.
+        """
+        return sorted(self._users.get(identifier, ()))
+
+    def occurrences(self, identifier: str) -> dict[str, list[int]]:
+        """
+        Retorna as linhas em que um identificador aparece em cada arquivo.
+
+        Args:
+            identifier (str): Lexema do identificador.
+
+        Returns:
+            dict[str, list[int]]: Linhas de cada arquivo, pelo caminho, em ordem alfabética.
+        """
+        return {path: self.files[path].identifiers[identifier] for path in self.files_using(identifier)}
+
+    def type_counts(self, path: Optional[str] = None) -> dict[str, int]:
+        """
+        Retorna a quantidade de tokens por tipo, em toda a árvore ou em um arquivo.
+
+        Args:
+            path (str | None): Caminho de um arquivo observado (padrão: todos os arquivos).
+
+        Returns:
+            dict[str, int]: Quantidade de tokens por nome de tipo, da maior para a menor.
+
+        Raises:
+            KeyError: Se o arquivo não estiver sendo observado.
+        """
+        counts = self._counts if path is None else self.files[os.path.normpath(path)].counts
+        return dict(sorted(counts.items(), key=lambda item: (-item[1], item[0])))
+
+    def _analyze(self, entry: WatchedFile, data: bytes) -> WatchedFile:
+        """
+        Analisa o conteúdo de um arquivo e preenche seu resumo.
+
+        Args:
+            entry (WatchedFile): Resumo do arquivo, com os metadados já preenchidos.
+            data (bytes): Conteúdo do arquivo.
+
+        Returns:
+            WatchedFile: O próprio `entry`.
+        """
+        self.analyses += 1
+        try:
+            tokens = self.analyzer.scan(data.decode("utf-8"))
+        except (UnicodeDecodeError, LexicalError) as e:
+            entry.error = str(e)
+            entry.diagnostics = list(self.analyzer.diagnostics)
+            return entry
+
+        counts = Counter()
+        identifiers = {}
+        identifier = Token.SIDENTIFICADOR
+        for lexeme, token, line in tokens:
+            ttype = token.type
+            counts[ttype] += 1
+            if ttype is identifier:
+                lines = identifiers.get(lexeme)
+                if lines is None:
+                    identifiers[lexeme] = [line]
+                elif lines[-1] != line:
+                    lines.append(line)
+        entry.tokens = len(tokens)
+        entry.counts = {ttype.name: count for ttype, count in counts.items()}
+        entry.identifiers = identifiers
+        entry.diagnostics = list(self.analyzer.diagnostics)
+        return entry
+
+    def _add(self, entry: WatchedFile) -> None:
+        """Acrescenta as contribuições de um arquivo aos índices globais."""
+        self.files[entry.path] = entry
+        self._counts.update(entry.counts)
+        users = self._users
+        for lexeme in entry.identifiers:
+            paths = users.get(lexeme)
+            if paths is None:
+                users[lexeme] = {entry.path}
+            else:
+                paths.add(entry.path)
+
+    def _drop(self, path: str) -> None:
+        """Remove as contribuições de um arquivo dos índices globais."""
+        entry = self.files.pop(path)
+        self._counts.subtract(entry.counts)
+        for name in entry.counts:
+            if self._counts[name] <= 0:
+                del self._counts[name]
+        users = self._users
+        for lexeme in entry.identifiers:
+            paths = users[lexeme]
+            paths.discard(path)
+            if not paths:
+                del users[lexeme]
+
+
+def stat_tree(roots: Iterable[str], extension: str = ".lpd") -> dict[str, tuple[int, int]]:
+    """
+    Lê os metadados dos arquivos de uma árvore, sem abri-los.
+
+    Diretórios são percorridos recursivamente com `os.scandir` em busca de arquivos com a extensão
+    informada, sem seguir links simbólicos para diretórios; padrões glob aceitam `**`; arquivos
+    comuns são incluídos como estão. Caminhos que não existem são ignorados.
+
+    Args:
+        roots (Iterable[str]): Diretórios, arquivos ou padrões glob.
+        extension (str): Extensão dos arquivos procurados nos diretórios.
+
+    Returns:
+        dict[str, tuple[int, int]]: `mtime` em nanossegundos e tamanho de cada arquivo, pelo caminho normalizado.
+    """
+    found = {}
+    for root in roots:
+        if os.path.isdir(root):
+            directories = [root]
+            while directories:
+                try:
+                    entries = os.scandir(directories.pop())
+                except OSError:
+                    continue
+                with entries:
+                    for entry in entries:
+                        try:
+                            # Como em `os.walk`, links simbólicos para diretórios não são seguidos, o que evita ciclos.
+                            if entry.is_dir(follow_symlinks=False):
+                                directories.append(entry.path)
+                            elif entry.name.endswith(extension) and entry.is_file():
+                                stat = entry.stat()
+                                found[os.path.normpath(entry.path)] = (stat.st_mtime_ns, stat.st_size)
+                        except OSError:
+                            continue
+            continue
+        paths = glob.glob(root, recursive=True) if glob.has_magic(root) else [root]
+        for path in paths:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            if not os.path.isdir(path):
+                found[os.path.normpath(path)] = (stat.st_mtime_ns, stat.st_size)
+    return found
@@ -0,0 +1,99 @@
+"""
+Benchmark do cursor de tokens
+
+Compara duas formas de um analisador sintático consumir os tokens de um arquivo: indexar a lista
+completa de `LexicalAnalyzer.tokenize_file`, comparando `token.type` com os objetos `TokenType`, e
+percorrer o `TokenCursor` de `LexicalAnalyzer.cursor`, comparando os números dos tipos. O consumo
+simula um analisador descendente que, a cada comando, consulta o próximo token e o seguinte
+(atribuição ou chamada). São medidos o tempo e o pico de memória com `tracemalloc`, em passagens
+separadas, para que a instrumentação não distorça o tempo.
+
+Uso:
+    python -m benchmarks.bench_cursor [--size BYTES] [--repeat N]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+from analyzer.analyzer import LexicalAnalyzer
+from analyzer.tokens import Token
+from benchmarks.corpus import generate_corpus
+
+
+def consume_list(analyzer: LexicalAnalyzer, path: str) -> int:
+    """Consome a lista completa de tokens por índice, retornando a quantidade de atribuições."""
+    tokens = analyzer.tokenize_file(path)
+    identifier, assignment = Token.SIDENTIFICADOR, Token.SATRIBUICAO
+    found = 0
+    index, size = 0, len(tokens)
+    while index < size:
+        _, token, _ = tokens[index]
+        if token.type is identifier and index + 1 < size and tokens[index + 1][1].type is assignment:
+            found += 1
+            index += 2
+        else:
+            index += 1
+    return found
+
+
+def consume_cursor(analyzer: LexicalAnalyzer, path: str) -> int:
+    """Consome os tokens pelo cursor, com os tipos comparados como inteiros."""
+    cursor = analyzer.cursor(path)
+    identifier, assignment = Token.SIDENTIFICADOR.id, Token.SATRIBUICAO.id
+    found = 0
+    while not cursor.at_end:
+        if cursor.check(identifier) and cursor.check(assignment, 1):
+            found += 1
+            cursor.advance()
+        cursor.advance()
+    return found
+
+
+def measure(function, analyzer: LexicalAnalyzer, path: str, repeat: int) -> tuple:
+    """
+    Mede o melhor tempo de `repeat` execuções e o pico de memória de uma execução adicional.
+
+    Returns:
+        tuple: Resultado, tempo em segundos e pico de memória em bytes.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function(analyzer, path)
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    function(analyzer, path)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, best, peak
+
+
+def main():
+    """Executa o benchmark e imprime o tempo e o pico de memória de cada forma de consumo."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=8 << 20, help="tamanho do corpus em bytes (padrão: 8 MiB)")
+    parser.add_argument("--repeat", type=int, default=3, help="execuções cronometradas de cada forma (padrão: 3)")
+    args = parser.parse_args()
+
+    with tempfile.NamedTemporaryFile("w", suffix=".lpd", encoding="utf-8", delete=False) as file:
+        file.write(generate_corpus(args.size, seed=1))
+    try:
+        analyzer = LexicalAnalyzer()
+        results = {}
+        for name, function in (("lista indexada", consume_list), ("cursor", consume_cursor)):
+            results[name] = measure(function, analyzer, file.name, args.repeat)
+    finally:
+        os.remove(file.name)
+
+    if len({found for found, _, _ in results.values()}) != 1:
+        raise SystemExit("Erro: as duas formas de consumo encontraram quantidades diferentes de atribuições.")
+    print(f"Corpus: {args.size / (1 << 20):.1f} MiB, {next(iter(results.values()))[0]:,} atribuições")
+    for name, (_, elapsed, peak) in results.items():
+        print(f"{name:15} {elapsed:7.3f}s  pico de memória {peak / (1 << 20):8.2f} MiB")
+
+
+if __name__ == "__main__":
+    main()
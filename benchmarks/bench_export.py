@@ -0,0 +1,48 @@
+"""
+Benchmark da exportação
+
+Gera um arquivo grande a partir dos exemplos `codigo*.lpd` e mede o tempo de `export_file` em cada
+formato, comparando com a análise sem escrita (`none`) e, sobre uma fração da entrada, com a tabela
+formatada por `tabulate` utilizada anteriormente na exportação TXT.
+
+Uso:
+    python -m benchmarks.bench_export [--scale N]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from analyzer.analyzer import LexicalAnalyzer
+from analyzer.export import export_file
+from benchmarks.samples import load_samples
+
+
+def main():
+    """Gera a entrada e imprime o tempo e a vazão de cada formato."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=int, default=2000, help="repetições dos exemplos (padrão: 2000)")
+    args = parser.parse_args()
+
+    analyzer = LexicalAnalyzer()
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "corpus.lpd")
+        small = os.path.join(directory, "pequeno.lpd")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(load_samples(args.scale))
+        with open(small, "w", encoding="utf-8") as file:
+            file.write(load_samples(max(1, args.scale // 100)))
+
+        for format, source in [("none", path), ("csv", path), ("jsonl", path), ("binary", path), ("table", small)]:
+            output = os.path.join(directory, f"saida.{format}")
+            start = time.perf_counter()
+            count = export_file(analyzer, source, output, format)
+            elapsed = time.perf_counter() - start
+            size = os.path.getsize(output) / 1e6 if os.path.exists(output) else 0
+            print(f"{format:>6}: {count:>10,} tokens em {elapsed:.3f}s "
+                  f"({count / elapsed:,.0f} tokens/s, {size:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()
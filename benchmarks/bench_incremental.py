@@ -0,0 +1,55 @@
+"""
+Benchmark da análise incremental
+
+Mede a latência de edições pontuais com `IncrementalTokenizer` sobre um arquivo de `--lines` linhas,
+gerado a partir dos exemplos `codigo*.lpd`, e a compara com a reanálise completa por `tokenize`.
+
+Uso:
+    python -m benchmarks.bench_incremental [--lines N] [--edits N]
+"""
+
+import argparse
+import random
+import time
+
+from analyzer.analyzer import LexicalAnalyzer
+from analyzer.incremental import IncrementalTokenizer
+from benchmarks.samples import load_samples
+
+
+def main():
+    """Executa o benchmark e imprime a latência média de cada estratégia."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lines", type=int, default=100000, help="linhas do arquivo (padrão: 100000)")
+    parser.add_argument("--edits", type=int, default=200, help="edições aleatórias (padrão: 200)")
+    args = parser.parse_args()
+
+    sample = load_samples(1)
+    text = sample * (args.lines // sample.count("\n") + 1)
+    text = "".join(text.splitlines(keepends=True)[:args.lines])
+
+    analyzer = LexicalAnalyzer()
+    start = time.perf_counter()
+    tokenizer = IncrementalTokenizer(text, analyzer)
+    print(f"Análise inicial de {args.lines} linhas: {time.perf_counter() - start:.3f}s")
+
+    start = time.perf_counter()
+    analyzer.tokenize(tokenizer.text)
+    full = time.perf_counter() - start
+
+    rng = random.Random(0)
+    edits = ["A", "; ", ":= 1", "{", "}", "\n", ""]
+    start = time.perf_counter()
+    for _ in range(args.edits):
+        line = rng.randrange(args.lines)
+        column = rng.randint(0, len(tokenizer._lines[line].rstrip("\r\n")))
+        tokenizer.edit((line, column), (line, column), rng.choice(edits))
+    incremental = (time.perf_counter() - start) / args.edits
+
+    print(f"tokenize completo:   {full * 1000:.2f} ms por edição")
+    print(f"IncrementalTokenizer: {incremental * 1000:.3f} ms por edição")
+    print(f"Aceleração: {full / incremental:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
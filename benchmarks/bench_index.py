@@ -0,0 +1,92 @@
+"""
+Benchmark do índice de identificadores
+
+Cria uma árvore temporária com `--files` programas LPD sintéticos, constrói e grava o
+`IdentifierIndex` e mede a abertura do índice gravado, as consultas exatas (de um identificador
+raro e de um comum) e por prefixo, e uma atualização com 10 arquivos alterados. Como referência, a
+mesma consulta exata é feita lendo todos os arquivos com uma expressão regular, como um `grep`.
+
+Uso:
+    python -m benchmarks.bench_index [--files N] [--statements N]
+"""
+
+import argparse
+import os
+import re
+import tempfile
+import time
+
+from analyzer.index import IdentifierIndex
+from analyzer.watch import RACY_NS
+from benchmarks.corpus import generate_program
+
+
+def timed(function, *args):
+    """Executa uma função e retorna seu resultado e a duração em milissegundos."""
+    start = time.perf_counter()
+    result = function(*args)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def grep(paths: list, identifier: str) -> int:
+    """Conta as ocorrências de um identificador lendo todos os arquivos."""
+    pattern = re.compile(rf"\b{re.escape(identifier)}\b")
+    count = 0
+    for path in paths:
+        with open(path, encoding="utf-8") as file:
+            count += sum(1 for _ in pattern.finditer(file.read()))
+    return count
+
+
+def main():
+    """Executa o benchmark e imprime a duração de cada operação."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=10000, help="quantidade de arquivos da árvore (padrão: 10000)")
+    parser.add_argument("--statements", type=int, default=20, help="comandos por programa (padrão: 20)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        old = time.time_ns() - 2 * RACY_NS
+        paths = []
+        for number in range(args.files):
+            directory = os.path.join(root, f"modulo{number % 100:02}")
+            os.makedirs(directory, exist_ok=True)
+            path = os.path.join(directory, f"programa{number}.lpd")
+            with open(path, "w", encoding="utf-8") as file:
+                file.write(generate_program(args.statements, number=number))
+            os.utime(path, ns=(old, old))
+            paths.append(path)
+        index_path = os.path.join(root, "identificadores.lpdx")
+
+        index = IdentifierIndex(index_path)
+        update, elapsed = timed(index.refresh, [root])
+        _, saved = timed(index.save)
+        print(f"Construção: {elapsed:9.1f} ms ({update.scanned} arquivos), gravação {saved:.1f} ms, "
+              f"{os.path.getsize(index_path) / (1 << 20):.2f} MiB, {index.stats()}")
+
+        index, opened = timed(IdentifierIndex, index_path)
+        print(f"Abertura:   {opened:9.1f} ms")
+        # Identificadores exclusivos de um programa e comuns a todos (veja `benchmarks.corpus`).
+        rare = min(index.identifiers("Programa"), key=lambda name: len(index.files(name)), default="Programa1")
+        common = max(index.identifiers(), key=lambda name: len(index.files(name)))
+        for name in (rare, common):
+            found, elapsed = timed(index.find, name)
+            files, files_elapsed = timed(index.files, name)
+            print(f"find({name!r}): {elapsed:9.2f} ms, {len(found)} ocorrências; "
+                  f"files: {files_elapsed:.2f} ms, {len(files)} arquivos")
+        found, elapsed = timed(index.identifiers, "Cont")
+        print(f"identifiers('Cont'): {elapsed:.2f} ms, {len(found)} identificadores")
+        count, elapsed = timed(grep, paths, rare)
+        print(f"grep({rare!r}): {elapsed:9.1f} ms, {count} ocorrências")
+
+        for number, path in enumerate(paths[:10]):
+            with open(path, "a", encoding="utf-8") as file:
+                file.write(f"\n{{ alteração }} Extra{number} := 1;\n")
+            os.utime(path, ns=(old + 1, old + 1))
+        update, elapsed = timed(index.refresh, [root])
+        _, saved = timed(index.save)
+        print(f"Atualização: {elapsed:8.1f} ms ({update}), gravação {saved:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
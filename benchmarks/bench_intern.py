@@ -0,0 +1,100 @@
+"""
+Benchmark da internação de lexemas
+
+Gera um corpus sintético de `--size` caracteres e o analisa com `tokenize` e `scan` com a
+internação ativa (o padrão) e desativada (`InternPool(limit=0)`). Cada combinação é executada em um
+processo separado, que reporta o tempo, a memória alocada que permanece no resultado (medida com
+`tracemalloc`), a quantidade de objetos `str` distintos entre os lexemas e o pico de memória
+residente (RSS) do processo. Com a internação, também são exibidos o tamanho e a taxa de acerto do
+conjunto.
+
+Uso:
+    python -m benchmarks.bench_intern [--size 16M] [--shape mixed]
+"""
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from analyzer.analyzer import LexicalAnalyzer
+from analyzer.interning import InternPool
+from benchmarks.corpus import SHAPES, generate_corpus, parse_size
+
+
+def run(engine: str, interned: bool, size: int, shape: str) -> dict:
+    """
+    Analisa um corpus e mede o resultado, no processo atual.
+
+    Args:
+        engine (str): `tokenize` ou `scan`.
+        interned (bool): Indica se os lexemas são internados.
+        size (int): Tamanho do corpus, em caracteres.
+        shape (str): Perfil do corpus.
+
+    Returns:
+        dict: Tempo, memória retida em MB, objetos `str` distintos, pico de RSS em MB e o resumo do conjunto.
+    """
+    text = generate_corpus(size, shape)
+    analyzer = LexicalAnalyzer(InternPool() if interned else InternPool(limit=0))
+    analyze = getattr(analyzer, engine)
+
+    start = time.perf_counter()
+    analyze(text)
+    elapsed = time.perf_counter() - start
+
+    # Uma segunda análise, sob `tracemalloc`, mede apenas a memória que permanece no resultado.
+    tracemalloc.start()
+    tokens = analyze(text)
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    return {
+        "engine": engine,
+        "interned": interned,
+        "tokens": len(tokens),
+        "seconds": elapsed,
+        "retained_mb": retained / (1 << 20),
+        "distinct_strings": len({id(lexeme) for lexeme, _, _ in tokens}),
+        "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "pool": analyzer.intern_pool.summary(),
+    }
+
+
+def main():
+    """Executa cada combinação em um processo separado e imprime a comparação."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", default="16M", help="tamanho do corpus (padrão: 16M)")
+    parser.add_argument("--shape", default="mixed", choices=SHAPES, help="perfil do corpus (padrão: mixed)")
+    parser.add_argument("--child", nargs=2, metavar=("ENGINE", "INTERNED"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    size = parse_size(args.size)
+
+    if args.child:
+        engine, interned = args.child
+        print(json.dumps(run(engine, interned == "1", size, args.shape)))
+        return
+
+    print(f"Corpus: {size:,} caracteres, perfil {args.shape}")
+    for engine in ("tokenize", "scan"):
+        results = {}
+        for interned in (False, True):
+            output = subprocess.run([sys.executable, "-m", "benchmarks.bench_intern", "--size", args.size,
+                                     "--shape", args.shape, "--child", engine, str(int(interned))],
+                                    check=True, capture_output=True, text=True).stdout
+            results[interned] = result = json.loads(output)
+            print(f"{engine:<9}{'internado' if interned else 'sem internação':<16}{result['seconds']:>8.3f}s"
+                  f"{result['retained_mb']:>10.1f} MB retidos{result['distinct_strings']:>12,} str"
+                  f"{result['max_rss_mb']:>10.1f} MB RSS")
+        plain, interned = results[False], results[True]
+        pool = interned["pool"]
+        print(f"{'':<9}redução: {1 - interned['retained_mb'] / plain['retained_mb']:.1%} da memória retida, "
+              f"{1 - interned['max_rss_mb'] / plain['max_rss_mb']:.1%} do RSS; conjunto com {pool['size']:,} "
+              f"lexemas, taxa de acerto {pool['hit_rate']:.2%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Microbenchmark da classificação de lexemas
+
+Compara a varredura linear sobre `LexicalAnalyzer.tokens` (comportamento anterior de `tokenize`)
+com a consulta ao índice construído por `LexicalAnalyzer.build_index`, sobre os lexemas dos
+exemplos `codigo*.lpd` repetidos `--scale` vezes.
+
+Uso:
+    python -m benchmarks.bench_lookup [--scale N]
+"""
+
+import argparse
+import time
+
+from analyzer.analyzer import LexicalAnalyzer
+from benchmarks.samples import load_samples
+
+
+def linear_classify(tokens: list, lexeme: str):
+    """
+    Classifica um lexema percorrendo toda a lista de tokens.
+
+    Args:
+        tokens (list[Token]): Lista de tokens do analisador.
+        lexeme (str): O lexema a ser classificado.
+
+    Returns:
+        Optional[Token]: O primeiro token correspondente ou `None`.
+    """
+    for token in tokens:
+        if token.is_(lexeme):
+            return token
+    return None
+
+
+def main():
+    """Executa o microbenchmark e imprime o tempo de cada estratégia."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=int, default=10000, help="repetições dos exemplos (padrão: 10000)")
+    args = parser.parse_args()
+
+    analyzer = LexicalAnalyzer()
+    words = analyzer.word_pattern.findall(analyzer.remove_comments(load_samples(args.scale)))
+    tokens = analyzer.tokens
+
+    start = time.perf_counter()
+    linear = [linear_classify(tokens, word) for word in words]
+    linear_time = time.perf_counter() - start
+
+    classify = analyzer.classify
+    start = time.perf_counter()
+    indexed = [classify(word) for word in words]
+    indexed_time = time.perf_counter() - start
+
+    if linear != indexed:
+        raise SystemExit("Erro: a classificação pelo índice difere da varredura linear.")
+
+    print(f"Lexemas: {len(words):,}")
+    print(f"Varredura linear: {linear_time:.3f}s ({len(words) / linear_time:,.0f} lexemas/s)")
+    print(f"Índice:           {indexed_time:.3f}s ({len(words) / indexed_time:,.0f} lexemas/s)")
+    print(f"Aceleração: {linear_time / indexed_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
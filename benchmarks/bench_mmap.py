@@ -0,0 +1,84 @@
+"""
+Benchmark da leitura mapeada em memória
+
+Gera um arquivo grande a partir dos exemplos `codigo*.lpd` e compara, em processos separados,
+o tempo de execução e o pico de memória residente (RSS) de `LexicalAnalyzer.tokenize_file`
+com `mmap=True` e com `mmap=False` (leitura completa do arquivo seguida de `tokenize`).
+
+Uso:
+    python -m benchmarks.bench_mmap [--scale N]
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.samples import load_samples
+
+
+def child(path: str, use_mmap: bool):
+    """
+    Executa a tokenização em um processo isolado e imprime as medições em JSON.
+
+    Args:
+        path (str): Caminho do arquivo a ser analisado.
+        use_mmap (bool): Indica se o modo mapeado em memória deve ser utilizado.
+    """
+    from analyzer.analyzer import LexicalAnalyzer
+
+    analyzer = LexicalAnalyzer()
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    tokens = analyzer.tokenize_file(path, mmap=use_mmap)
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({"tokens": len(tokens), "seconds": elapsed, "rss_kb": peak, "rss_delta_kb": peak - baseline}))
+
+
+def run(path: str, use_mmap: bool) -> dict:
+    """
+    Executa `child` em um novo interpretador e retorna suas medições.
+
+    Args:
+        path (str): Caminho do arquivo a ser analisado.
+        use_mmap (bool): Indica se o modo mapeado em memória deve ser utilizado.
+
+    Returns:
+        dict: Quantidade de tokens, tempo em segundos e pico de RSS em KB.
+    """
+    mode = "mmap" if use_mmap else "read"
+    output = subprocess.check_output([sys.executable, "-m", "benchmarks.bench_mmap", "--child", mode, path])
+    return json.loads(output)
+
+
+def main():
+    """Gera o arquivo de entrada e compara os dois modos de leitura."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=int, default=2000, help="repetições dos exemplos (padrão: 2000)")
+    parser.add_argument("--child", nargs=2, metavar=("MODO", "ARQUIVO"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child[1], args.child[0] == "mmap")
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "corpus.lpd")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(load_samples(args.scale))
+
+        print(f"Entrada: {os.path.getsize(path) / 1e6:.2f} MB")
+        for use_mmap in (False, True):
+            result = run(path, use_mmap)
+            label = "mmap=True " if use_mmap else "mmap=False"
+            print(f"{label}: {result['seconds']:.3f}s, {result['tokens']} tokens, "
+                  f"pico de RSS {result['rss_kb'] / 1024:.1f} MB (+{result['rss_delta_kb'] / 1024:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Benchmark do motor de varredura
+
+Compara a vazão (tokens/s) de `LexicalAnalyzer.tokenize` com a de `LexicalAnalyzer.scan`
+sobre os exemplos `codigo*.lpd` concatenados e verifica que ambos produzem a mesma saída.
+
+Uso:
+    python -m benchmarks.bench_scanner [--scale N] [--repeat N]
+"""
+
+import argparse
+import time
+
+from analyzer.analyzer import LexicalAnalyzer
+from benchmarks.samples import load_samples
+
+
+def measure(function, text: str, repeat: int) -> tuple[float, list]:
+    """
+    Executa `function(text)` `repeat` vezes e retorna o melhor tempo.
+
+    Args:
+        function (callable): Função de tokenização a ser medida.
+        text (str): Código fonte de entrada.
+        repeat (int): Quantidade de repetições.
+
+    Returns:
+        tuple[float, list]: Melhor tempo em segundos e a saída da última execução.
+    """
+    best = float("inf")
+    result = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function(text)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    """Executa o benchmark e imprime a vazão de cada motor."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=int, default=1000, help="repetições dos exemplos (padrão: 1000)")
+    parser.add_argument("--repeat", type=int, default=3, help="execuções por motor (padrão: 3)")
+    args = parser.parse_args()
+
+    analyzer = LexicalAnalyzer()
+    text = load_samples(args.scale)
+
+    reference_time, reference = measure(analyzer.tokenize, text, args.repeat)
+    scanner_time, scanned = measure(analyzer.scan, text, args.repeat)
+
+    if scanned != reference:
+        raise SystemExit("Erro: a saída de scan difere da saída de tokenize.")
+
+    print(f"Entrada: {len(text) / 1e6:.2f} MB, {len(reference)} tokens")
+    print(f"tokenize: {reference_time:.3f}s ({len(reference) / reference_time:,.0f} tokens/s)")
+    print(f"scan:     {scanner_time:.3f}s ({len(scanned) / scanner_time:,.0f} tokens/s)")
+    print(f"Aceleração: {reference_time / scanner_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""
+Cliente de carga do modo servidor
+
+Abre `--connections` conexões com o servidor de análise léxica e envia, por cada uma, pedidos
+`{"id", "text"}` com programas sintéticos de `--statements` comandos, mantendo até `--pipeline`
+pedidos em andamento por conexão, até completar `--requests` pedidos. Reporta a vazão e as latências
+p50, p99 e máxima, além dos contadores do servidor (lotes, tamanho médio dos lotes, prazos esgotados).
+
+Sem `--address`, um `LexingServer` com `--workers` processos é iniciado no próprio processo, em uma
+porta livre. Com `--spawn N`, também mede N execuções de `python main.py arquivo --format none`,
+equivalentes a um processo por pedido.
+
+Uso:
+    python -m benchmarks.bench_server [--address HOST:PORTA|unix:CAMINHO] [--connections 8]
+        [--pipeline 4] [--requests 2000] [--statements 20] [--workers N] [--spawn 5]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from analyzer.server import LexingServer
+from benchmarks.corpus import generate_program
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    """
+    Retorna o percentil de uma lista de valores, pelo método do posto mais próximo.
+
+    Args:
+        values (list[float]): Valores em ordem crescente.
+        fraction (float): Percentil desejado, entre `0` e `1`.
+
+    Returns:
+        float: Valor do percentil.
+    """
+    return values[min(len(values) - 1, max(0, round(fraction * len(values)) - 1))]
+
+
+async def client(address: str, texts: list[str], requests: int, pipeline: int, latencies: list[float]) -> None:
+    """
+    Envia pedidos por uma conexão, com até `pipeline` pedidos em andamento, registrando as latências.
+
+    Args:
+        address (str): Endereço do servidor.
+        texts (list[str]): Programas enviados, em rodízio.
+        requests (int): Quantidade de pedidos desta conexão.
+        pipeline (int): Quantidade máxima de pedidos em andamento.
+        latencies (list[float]): Lista que recebe a latência de cada pedido, em segundos.
+    """
+    if address.startswith("unix:"):
+        reader, writer = await asyncio.open_unix_connection(address[len("unix:"):], limit=1 << 26)
+    else:
+        host, _, port = address.rpartition(":")
+        reader, writer = await asyncio.open_connection(host or "127.0.0.1", int(port), limit=1 << 26)
+    sent = {}
+    window = asyncio.Semaphore(pipeline)
+
+    async def receive():
+        for _ in range(requests):
+            response = json.loads(await reader.readline())
+            latencies.append(time.perf_counter() - sent.pop(response["id"]))
+            if "error" in response:
+                print(f"Erro no pedido {response['id']}: {response['error']}", file=sys.stderr)
+            window.release()
+
+    receiver = asyncio.create_task(receive())
+    for number in range(requests):
+        await window.acquire()
+        sent[number] = time.perf_counter()
+        writer.write(json.dumps({"id": number, "text": texts[number % len(texts)]}).encode("utf-8") + b"\n")
+        await writer.drain()
+    await receiver
+    writer.close()
+    await writer.wait_closed()
+
+
+async def stats(address: str) -> dict:
+    """Consulta os contadores do servidor."""
+    if address.startswith("unix:"):
+        reader, writer = await asyncio.open_unix_connection(address[len("unix:"):])
+    else:
+        host, _, port = address.rpartition(":")
+        reader, writer = await asyncio.open_connection(host or "127.0.0.1", int(port))
+    writer.write(b'{"id": "stats", "op": "stats"}\n')
+    response = json.loads(await reader.readline())
+    writer.close()
+    await writer.wait_closed()
+    return response["stats"]
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Executa a carga contra o servidor indicado, ou contra um servidor local."""
+    texts = [generate_program(args.statements, seed=seed, number=seed) for seed in range(16)]
+    server = None
+    address = args.address
+    if address is None:
+        server = LexingServer(workers=args.workers)
+        await server.start("127.0.0.1:0")
+        address = "127.0.0.1:%d" % server.sockets[0].getsockname()[1]
+
+    try:
+        latencies = []
+        share, extra = divmod(args.requests, args.connections)
+        start = time.perf_counter()
+        await asyncio.gather(*(client(address, texts, share + (number < extra), args.pipeline, latencies)
+                               for number in range(args.connections)))
+        elapsed = time.perf_counter() - start
+        summary = await stats(address)
+    finally:
+        if server is not None:
+            await server.close()
+
+    latencies.sort()
+    print(f"Pedidos: {len(latencies):,} em {args.connections} conexões ({args.pipeline} em andamento por conexão), "
+          f"{sum(map(len, texts)) // len(texts):,} caracteres cada")
+    print(f"Vazão: {len(latencies) / elapsed:,.0f} pedidos/s")
+    print(f"Latência: p50 {percentile(latencies, 0.5) * 1000:.2f} ms, p99 {percentile(latencies, 0.99) * 1000:.2f} ms, "
+          f"máxima {latencies[-1] * 1000:.2f} ms")
+    print(f"Servidor: {summary['batches']:,} lotes, {summary['mean_batch']:.1f} pedidos por lote, "
+          f"{summary['timeouts']} prazos esgotados, {summary['errors']} erros")
+
+    if args.spawn:
+        with tempfile.NamedTemporaryFile("w", suffix=".lpd", delete=False, encoding="utf-8") as file:
+            file.write(texts[0])
+        try:
+            main = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "main.py")
+            start = time.perf_counter()
+            for _ in range(args.spawn):
+                subprocess.run([sys.executable, main, file.name, "--format", "none"], check=True, capture_output=True)
+            print(f"Um processo por pedido: {(time.perf_counter() - start) / args.spawn * 1000:.1f} ms por pedido")
+        finally:
+            os.remove(file.name)
+
+
+def main():
+    """Interpreta os argumentos e executa a carga."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--address", default=None, help="endereço do servidor (padrão: inicia um servidor local)")
+    parser.add_argument("--connections", type=int, default=8, help="quantidade de conexões (padrão: 8)")
+    parser.add_argument("--pipeline", type=int, default=4, help="pedidos em andamento por conexão (padrão: 4)")
+    parser.add_argument("--requests", type=int, default=2000, help="quantidade total de pedidos (padrão: 2000)")
+    parser.add_argument("--statements", type=int, default=20, help="comandos de cada programa (padrão: 20)")
+    parser.add_argument("--workers", type=int, default=None, help="processos do servidor local (padrão: número de núcleos)")
+    parser.add_argument("--spawn", type=int, default=5, help="execuções de main.py para comparação (padrão: 5)")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Verificação do tempo de inicialização da linha de comando
+
+Executa `--runs` vezes `python -X importtime main.py arquivo --format none` sobre um arquivo pequeno
+(o primeiro exemplo `codigo*.lpd`) e reporta a mediana do tempo total do processo e do tempo de
+importação, além dos módulos que mais pesam na importação. A verificação falha (código de saída
+`1`) se a mediana do tempo total ultrapassar `--budget` milissegundos ou se algum módulo de
+`HEAVY_MODULES` for importado, o que indica que uma importação adiada voltou a ser feita no
+carregamento de `main.py`.
+
+Uso:
+    python -m benchmarks.bench_startup [--runs 10] [--budget 150] [--top 10] [arquivo]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from benchmarks.samples import sample_paths
+
+# Orçamento padrão do tempo total do processo, em milissegundos.
+STARTUP_BUDGET_MS = 150.0
+
+# Módulos que a análise de um arquivo com `--format none` não deve importar.
+HEAVY_MODULES = ("tabulate", "asyncio", "concurrent.futures", "hashlib", "pandas", "numpy")
+
+MAIN = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "main.py")
+
+
+def parse_importtime(output: str) -> dict[str, tuple[int, int]]:
+    """
+    Interpreta a saída de `python -X importtime`.
+
+    Args:
+        output (str): Saída de erro do processo.
+
+    Returns:
+        dict[str, tuple[int, int]]: Tempo próprio e acumulado de cada módulo, em microssegundos,
+        com os módulos importados diretamente marcados pela ausência de recuo no nome.
+    """
+    times = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|")
+        if not own.strip().isdigit():
+            continue
+        times[name.rstrip()[1:]] = (int(own), int(cumulative))
+    return times
+
+
+def heavy_modules(names) -> list[str]:
+    """
+    Seleciona os módulos de `HEAVY_MODULES`, ou seus submódulos, entre os importados.
+
+    Args:
+        names (Iterable[str]): Nomes dos módulos importados.
+
+    Returns:
+        list[str]: Módulos que deveriam ter sido adiados, em ordem alfabética.
+    """
+    return sorted(name for name in (name.strip() for name in names)
+                  if any(name == heavy or name.startswith(heavy + ".") for heavy in HEAVY_MODULES))
+
+
+def measure(path: str) -> tuple[float, dict[str, tuple[int, int]]]:
+    """
+    Executa a linha de comando uma vez sobre um arquivo.
+
+    Args:
+        path (str): Arquivo analisado.
+
+    Returns:
+        tuple[float, dict]: Tempo total do processo, em milissegundos, e os tempos de importação.
+    """
+    start = time.perf_counter()
+    process = subprocess.run([sys.executable, "-X", "importtime", MAIN, path, "--format", "none"],
+                             check=True, capture_output=True, text=True)
+    return (time.perf_counter() - start) * 1000, parse_importtime(process.stderr)
+
+
+def main():
+    """Executa as medições, imprime o resumo e encerra com `1` se o orçamento for ultrapassado."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("path", nargs="?", default=None, help="arquivo analisado (padrão: o primeiro exemplo)")
+    parser.add_argument("--runs", type=int, default=10, help="quantidade de execuções (padrão: 10)")
+    parser.add_argument("--budget", type=float, default=STARTUP_BUDGET_MS,
+                        help=f"orçamento do tempo total, em ms (padrão: {STARTUP_BUDGET_MS:.0f})")
+    parser.add_argument("--top", type=int, default=10, help="módulos exibidos (padrão: 10)")
+    args = parser.parse_args()
+    path = args.path or sample_paths()[0]
+
+    walls, imports, modules = [], [], {}
+    for _ in range(args.runs):
+        wall, times = measure(path)
+        walls.append(wall)
+        # Os módulos sem recuo são os importados diretamente; a soma de seus tempos acumulados é o total.
+        imports.append(sum(cumulative for name, (_, cumulative) in times.items() if not name.startswith(" ")) / 1000)
+        for name, (own, _) in times.items():
+            modules.setdefault(name.strip(), []).append(own)
+
+    wall, imported = statistics.median(walls), statistics.median(imports)
+    print(f"Arquivo: {path} ({args.runs} execuções)")
+    print(f"Tempo total: mediana {wall:.1f} ms (orçamento {args.budget:.0f} ms); importações: {imported:.1f} ms")
+    print("Módulos mais lentos (tempo próprio):")
+    for name, values in sorted(modules.items(), key=lambda item: -statistics.median(item[1]))[:args.top]:
+        print(f"  {statistics.median(values) / 1000:>7.2f} ms  {name}")
+
+    heavy = heavy_modules(modules)
+    if heavy:
+        print(f"Módulos que deveriam ser adiados: {', '.join(heavy)}")
+    if wall > args.budget:
+        print("Orçamento ultrapassado.")
+    sys.exit(1 if heavy or wall > args.budget else 0)
+
+
+if __name__ == "__main__":
+    main()
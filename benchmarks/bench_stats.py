@@ -0,0 +1,50 @@
+"""
+Benchmark das estatísticas vetorizadas
+
+Gera `--files` códigos fonte a partir dos exemplos `codigo*.lpd` e compara o tempo de
+`LexicalAnalyzer.scan_stream` sobre todos eles com o tempo dos relatórios de `TokenStatistics`
+(contagens por tipo, densidade por linha, linhas mais longas e frequência de identificadores).
+
+Uso:
+    python -m benchmarks.bench_stats [--files N] [--scale N]
+"""
+
+import argparse
+import time
+
+from analyzer.analyzer import LexicalAnalyzer
+from analyzer.stats import TokenStatistics
+from benchmarks.samples import load_samples
+
+
+def main():
+    """Executa o benchmark e imprime o tempo da análise léxica e dos relatórios."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=2000, help="quantidade de códigos fonte (padrão: 2000)")
+    parser.add_argument("--scale", type=int, default=1, help="repetições dos exemplos em cada código (padrão: 1)")
+    args = parser.parse_args()
+
+    analyzer = LexicalAnalyzer()
+    text = load_samples(args.scale)
+
+    start = time.perf_counter()
+    streams = [analyzer.scan_stream(text) for _ in range(args.files)]
+    tokenize_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    stats = TokenStatistics(analyzer)
+    for number, stream in enumerate(streams):
+        stats.add(stream, f"arquivo{number}.lpd")
+    stats.type_counts()
+    stats.line_density()
+    stats.longest_lines()
+    stats.identifier_frequencies(20)
+    stats_time = time.perf_counter() - start
+
+    print(f"Arquivos: {args.files:,}, tokens: {len(stats.frame):,}")
+    print(f"Análise léxica: {tokenize_time:.3f}s")
+    print(f"Estatísticas:   {stats_time:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Benchmark de memória da representação colunar
+
+Compara a memória alocada por token pela lista de tuplas de `LexicalAnalyzer.scan` com a do
+`TokenStream` de `LexicalAnalyzer.scan_stream`, sobre os exemplos `codigo*.lpd` repetidos
+`--scale` vezes. A memória é medida com `tracemalloc`, sem contar o texto de entrada; no
+`TokenStream` é incluído o texto sem comentários que ele mantém para fatiar os lexemas.
+
+Uso:
+    python -m benchmarks.bench_stream [--scale N]
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from analyzer.analyzer import LexicalAnalyzer
+from benchmarks.samples import load_samples
+
+
+def measure(function, text: str) -> tuple:
+    """
+    Executa uma análise medindo o tempo e a memória alocada que permanece no resultado.
+
+    Args:
+        function (callable): Método de análise a medir.
+        text (str): Código fonte de entrada.
+
+    Returns:
+        tuple: Resultado, tempo em segundos e bytes alocados.
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = function(text)
+    elapsed = time.perf_counter() - start
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, elapsed, allocated
+
+
+def main():
+    """Executa o benchmark e imprime a memória por token de cada representação."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=int, default=2000, help="repetições dos exemplos (padrão: 2000)")
+    args = parser.parse_args()
+
+    analyzer = LexicalAnalyzer()
+    text = load_samples(args.scale)
+    # Aquece a tabela de consulta do `Scanner` para que ela não seja contada em nenhuma das medições.
+    analyzer.scan(text[:1 << 16])
+
+    tokens, list_time, list_bytes = measure(analyzer.scan, text)
+    count = len(tokens)
+    del tokens
+    stream, stream_time, stream_bytes = measure(analyzer.scan_stream, text)
+    if len(stream) != count:
+        raise SystemExit("Erro: as duas representações têm quantidades diferentes de tokens.")
+
+    print(f"Tokens: {count:,}")
+    print(f"Lista de tuplas: {list_bytes / count:6.1f} bytes/token, {list_time:.3f}s")
+    print(f"TokenStream:     {stream_bytes / count:6.1f} bytes/token, {stream_time:.3f}s "
+          f"(colunas: {stream.nbytes / count:.1f} bytes/token)")
+
+
+if __name__ == "__main__":
+    main()
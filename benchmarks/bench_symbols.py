@@ -0,0 +1,79 @@
+"""
+Benchmark da tabela de símbolos
+
+Gera programas LPD sintéticos com o perfil `identifiers` até reunir `--identifiers` ocorrências de
+identificadores e compara o preenchimento da `SymbolTable` por `populate`, em uma única passagem
+sobre os tokens, com o preenchimento chamada a chamada (`get_symbol` a cada uso e `add_symbol` na
+primeira ocorrência), como na etapa `symbols` anterior da suíte.
+
+Uso:
+    python -m benchmarks.bench_symbols [--identifiers N]
+"""
+
+import argparse
+import time
+
+from analyzer.analyzer import LexicalAnalyzer, SymbolTable, Token
+from benchmarks.corpus import generate_corpus
+
+
+def fill_by_calls(tokens) -> SymbolTable:
+    """
+    Preenche uma tabela plana com uma chamada por identificador.
+
+    Args:
+        tokens (list[tuple[str, Token, int]]): Resultado da análise léxica.
+
+    Returns:
+        SymbolTable: Tabela com todos os identificadores no escopo global.
+    """
+    table = SymbolTable()
+    for lexeme, token, _ in tokens:
+        if token.type is Token.SIDENTIFICADOR and table.get_symbol(lexeme) is None:
+            table.add_symbol(lexeme, token.type)
+    return table
+
+
+def main():
+    """Executa o benchmark e imprime o tempo de cada forma de preenchimento."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--identifiers", type=int, default=1_000_000, help="ocorrências de identificadores (padrão: 1000000)")
+    args = parser.parse_args()
+
+    analyzer = LexicalAnalyzer()
+    # Estima o tamanho do corpus pela proporção de identificadores em uma amostra.
+    sample = analyzer.scan(generate_corpus(1 << 20, "identifiers"))
+    ratio = sum(1 for _, token, _ in sample if token.type is Token.SIDENTIFICADOR) / (1 << 20)
+    size = int(args.identifiers / ratio)
+    while True:
+        stream = analyzer.scan_stream(generate_corpus(size, "identifiers"))
+        tokens = stream.to_list()
+        identifiers = sum(1 for _, token, _ in tokens if token.type is Token.SIDENTIFICADOR)
+        if identifiers >= args.identifiers:
+            break
+        size = size * 11 // 10
+
+    start = time.perf_counter()
+    calls = fill_by_calls(tokens)
+    calls_time = time.perf_counter() - start
+
+    table = SymbolTable()
+    start = time.perf_counter()
+    declared = table.populate(tokens)
+    populate_time = time.perf_counter() - start
+
+    sited = SymbolTable()
+    start = time.perf_counter()
+    sited.populate(stream)
+    sites_time = time.perf_counter() - start
+
+    print(f"Tokens: {len(tokens):,}, identificadores: {identifiers:,}")
+    print(f"Chamada a chamada:       {calls_time:.3f}s ({identifiers / calls_time:,.0f} identificadores/s, "
+          f"{len(calls.symbols):,} símbolos)")
+    print(f"populate:                {populate_time:.3f}s ({identifiers / populate_time:,.0f} identificadores/s, "
+          f"{declared:,} declarações, {len(table.closed_scopes):,} escopos, {len(table.diagnostics):,} diagnósticos)")
+    print(f"populate (com posições): {sites_time:.3f}s ({identifiers / sites_time:,.0f} identificadores/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Benchmark do modo de observação
+
+Cria uma árvore temporária com `--files` programas LPD sintéticos e mede, com o `TreeWatcher`, a
+análise inicial, uma atualização sem alterações (apenas a leitura dos metadados) e atualizações com
+1, 10 e 100 arquivos alterados. Os `mtime` são recuados para que nenhum arquivo seja considerado
+recente (veja `analyzer.watch.RACY_NS`), como em uma árvore que já existia antes da observação.
+
+Uso:
+    python -m benchmarks.bench_watch [--files N] [--statements N]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from analyzer.watch import TreeWatcher
+from benchmarks.corpus import generate_program
+
+# Recuo aplicado aos `mtime`, maior que `RACY_NS`.
+_AGE_NS = 60 * 1_000_000_000
+
+
+def main():
+    """Executa o benchmark e imprime a duração de cada atualização."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=2000, help="quantidade de arquivos da árvore (padrão: 2000)")
+    parser.add_argument("--statements", type=int, default=100, help="comandos por programa (padrão: 100)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        old = time.time_ns() - _AGE_NS
+        paths = []
+        for number in range(args.files):
+            directory = os.path.join(root, f"modulo{number % 20:02}")
+            os.makedirs(directory, exist_ok=True)
+            path = os.path.join(directory, f"programa{number}.lpd")
+            with open(path, "w", encoding="utf-8") as file:
+                file.write(generate_program(args.statements, number=number))
+            os.utime(path, ns=(old, old))
+            paths.append(path)
+
+        watcher = TreeWatcher([root])
+        update = watcher.refresh()
+        print(f"Análise inicial: {update}")
+        print(f"Sem alterações:  {watcher.refresh()}")
+        for changed in (1, 10, 100):
+            for number, path in enumerate(paths[:changed]):
+                with open(path, "a", encoding="utf-8") as file:
+                    file.write(f"\n{{ alteração {changed} }} Extra{number} := 1;\n")
+                stamp = old + changed
+                os.utime(path, ns=(stamp, stamp))
+            print(f"{changed:3} alterados:   {watcher.refresh()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,251 @@
+"""
+Gerador de corpus LPD sintético
+
+Gera programas LPD com a mesma estrutura dos exemplos `codigo*.lpd` (cabeçalho `program`,
+declarações `var`, procedimentos, funções e um bloco principal com atribuições, `if`, `while`,
+`repeat` e chamadas), com tamanho e perfil configuráveis. O gerador é determinístico para uma
+mesma semente.
+
+Perfis:
+    - `mixed`: Proporção semelhante à dos exemplos.
+    - `comments`: Comentários em quase todas as linhas, inclusive de várias linhas.
+    - `identifiers`: Muitas variáveis e expressões longas com identificadores distintos.
+    - `operators`: Expressões densas em operadores aritméticos, relacionais e lógicos.
+    - `strings`: Literais de texto longos entre aspas duplas.
+
+Uso:
+    python -m benchmarks.corpus [--shape PERFIL] [--size BYTES] [--seed N] [--output ARQUIVO]
+"""
+
+import argparse
+import random
+import sys
+
+SHAPES = ("mixed", "comments", "identifiers", "operators", "strings")
+
+# Peso de cada tipo de comando e probabilidade de comentário por linha em cada perfil.
+_PROFILES = {
+    "mixed": {"weights": {"assign": 5, "write": 3, "if": 2, "while": 1, "repeat": 1, "call": 2, "text": 1}, "comments": 0.5},
+    "comments": {"weights": {"assign": 3, "write": 2, "if": 1, "while": 1, "repeat": 1, "call": 1, "text": 0}, "comments": 0.95},
+    "identifiers": {"weights": {"assign": 8, "write": 2, "if": 1, "while": 1, "repeat": 0, "call": 3, "text": 0}, "comments": 0.05},
+    "operators": {"weights": {"assign": 6, "write": 0, "if": 3, "while": 2, "repeat": 1, "call": 0, "text": 0}, "comments": 0.05},
+    "strings": {"weights": {"assign": 2, "write": 1, "if": 1, "while": 0, "repeat": 0, "call": 0, "text": 6}, "comments": 0.1},
+}
+
+_WORDS = ["Contador", "Resultado", "Soma", "Valor", "Indice", "Total", "Limite", "Media", "Temp", "Achei",
+          "Numero", "Linha", "Coluna", "Maximo", "Minimo", "Passo", "Chave", "Estado"]
+_COMMENT_WORDS = ["Atualiza", "o", "valor", "de", "controle", "Verifica", "se", "a", "condição", "é",
+                  "verdadeira", "Exibe", "resultado", "laço", "principal", "Inicialização", "cálculo"]
+_ARITHMETIC = ["+", "-", "*", "div", "/"]
+_RELATIONAL = ["<", ">", "<=", ">=", "<>", "=="]
+_LOGICAL = ["and", "or"]
+
+
+class _Generator:
+    """Estado de geração de um programa: aleatoriedade, perfil e identificadores declarados."""
+
+    def __init__(self, rng: random.Random, shape: str) -> None:
+        """Inicializa o estado com os identificadores declarados pelo programa."""
+        self.rng = rng
+        self.profile = _PROFILES[shape]
+        self.shape = shape
+        count = 40 if shape == "identifiers" else 8
+        self.variables = [f"{rng.choice(_WORDS)}{index}" for index in range(count)]
+        self.procedures = []
+        self.functions = []
+
+    def comment(self, multiline: bool = False) -> str:
+        """Gera um comentário `{...}`, opcionalmente de duas linhas."""
+        words = " ".join(self.rng.choice(_COMMENT_WORDS) for _ in range(self.rng.randint(2, 8)))
+        if multiline:
+            return "{ " + words + "\n  " + " ".join(self.rng.choice(_COMMENT_WORDS) for _ in range(4)) + " }"
+        return "{ " + words + " }"
+
+    def line(self, indent: int, code: str) -> str:
+        """Formata uma linha de código, acrescentando um comentário conforme o perfil."""
+        text = "    " * indent + code
+        if self.rng.random() < self.profile["comments"]:
+            text += " " + self.comment(self.shape == "comments" and self.rng.random() < 0.2)
+        return text + "\n"
+
+    def operand(self) -> str:
+        """Gera um número ou uma variável declarada."""
+        if self.rng.random() < 0.3:
+            return str(self.rng.randint(0, 1000))
+        return self.rng.choice(self.variables)
+
+    def expression(self) -> str:
+        """Gera uma expressão aritmética."""
+        terms = {"operators": 8, "identifiers": 6}.get(self.shape, 2)
+        parts = [self.operand()]
+        for _ in range(self.rng.randint(0, terms)):
+            parts += [self.rng.choice(_ARITHMETIC), self.operand()]
+        if self.shape == "operators" and self.rng.random() < 0.5:
+            return f"({' '.join(parts)})"
+        return " ".join(parts)
+
+    def condition(self) -> str:
+        """Gera uma condição relacional, combinada com operadores lógicos no perfil `operators`."""
+        condition = f"{self.operand()} {self.rng.choice(_RELATIONAL)} {self.operand()}"
+        if self.shape == "operators":
+            for _ in range(self.rng.randint(1, 3)):
+                condition += f" {self.rng.choice(_LOGICAL)} {self.operand()} {self.rng.choice(_RELATIONAL)} {self.expression()}"
+        return condition
+
+    def text(self) -> str:
+        """Gera um literal de texto entre aspas duplas."""
+        length = self.rng.randint(40, 200) if self.shape == "strings" else self.rng.randint(3, 20)
+        return '"' + " ".join(self.rng.choice(_COMMENT_WORDS) for _ in range(length // 5 + 1)) + '"'
+
+    def statements(self, indent: int, count: int, depth: int = 0) -> list[str]:
+        """Gera `count` comandos, aninhando blocos até a profundidade 2."""
+        kinds = list(self.profile["weights"])
+        weights = list(self.profile["weights"].values())
+        lines = []
+        for _ in range(count):
+            kind = self.rng.choices(kinds, weights)[0]
+            if depth >= 2 and kind in ("if", "while", "repeat"):
+                kind = "assign"
+            if kind == "assign":
+                lines.append(self.line(indent, f"{self.rng.choice(self.variables)} := {self.expression()};"))
+            elif kind == "write":
+                lines.append(self.line(indent, f"{self.rng.choice(['writed', 'writec'])}({self.operand()});"))
+            elif kind == "text":
+                lines.append(self.line(indent, f"writec({self.text()});"))
+            elif kind == "call" and (self.procedures or self.functions):
+                if self.functions and self.rng.random() < 0.5:
+                    name = self.rng.choice(self.functions)
+                    lines.append(self.line(indent, f"{self.rng.choice(self.variables)} := {name}({self.operand()}, {self.operand()});"))
+                else:
+                    lines.append(self.line(indent, f"{self.rng.choice(self.procedures)}({self.operand()}, {self.operand()});"))
+            elif kind == "if":
+                lines.append(self.line(indent, f"if {self.condition()} then"))
+                lines.append(self.line(indent, "begin"))
+                lines += self.statements(indent + 1, self.rng.randint(1, 3), depth + 1)
+                lines.append(self.line(indent, "end"))
+                lines.append(self.line(indent, "else"))
+                lines += self.statements(indent + 1, 1, depth + 1)
+            elif kind == "while":
+                lines.append(self.line(indent, f"while {self.condition()} do"))
+                lines.append(self.line(indent, "begin"))
+                lines += self.statements(indent + 1, self.rng.randint(1, 3), depth + 1)
+                lines.append(self.line(indent, "end;"))
+            elif kind == "repeat":
+                lines.append(self.line(indent, "repeat"))
+                lines += self.statements(indent + 1, self.rng.randint(1, 3), depth + 1)
+                lines.append(self.line(indent, f"until {self.condition()};"))
+            else:
+                lines.append(self.line(indent, f"{self.rng.choice(self.variables)} := {self.operand()};"))
+        return lines
+
+    def program(self, number: int, statements: int) -> str:
+        """Gera um programa completo com declarações, rotinas e bloco principal."""
+        lines = [f"program Programa{number};\n", "\n", "var\n"]
+        for start in range(0, len(self.variables), 4):
+            kind = self.rng.choice(["int", "int", "float", "char"])
+            lines.append(self.line(1, f"{kind} {', '.join(self.variables[start:start + 4])};"))
+
+        for index in range(max(1, statements // 40)):
+            name = f"Procedimento{number}_{index}"
+            lines.append("\n")
+            lines.append(self.line(0, f"procedure {name}(int a, int b);"))
+            lines.append(self.line(0, "begin"))
+            lines += self.statements(1, self.rng.randint(2, 6))
+            lines.append(self.line(0, "end;"))
+            self.procedures.append(name)
+
+            name = f"Funcao{number}_{index}"
+            lines.append("\n")
+            lines.append(self.line(0, f"function {name}(int x, int y): int;"))
+            lines.append(self.line(0, "begin"))
+            lines += self.statements(1, self.rng.randint(1, 4))
+            lines.append(self.line(1, f"{name} := {self.expression()};"))
+            lines.append(self.line(0, "end;"))
+            self.functions.append(name)
+
+        lines.append("\n")
+        lines.append(self.line(0, "begin"))
+        lines += self.statements(1, statements)
+        lines.append("end.\n")
+        return "".join(lines)
+
+
+def generate_program(statements: int = 100, shape: str = "mixed", seed: int = 0, number: int = 1) -> str:
+    """
+    Gera um único programa LPD sintético.
+
+    Args:
+        statements (int): Quantidade aproximada de comandos no bloco principal.
+        shape (str): Perfil do programa (veja `SHAPES`).
+        seed (int): Semente do gerador de números aleatórios.
+        number (int): Número usado no nome do programa e de suas rotinas.
+
+    Returns:
+        str: Código fonte do programa.
+
+    Raises:
+        ValueError: Se o perfil não existir.
+    """
+    if shape not in _PROFILES:
+        raise ValueError(f"Perfil inválido: {shape}")
+    return _Generator(random.Random(f"{seed}:{shape}:{number}"), shape).program(number, statements)
+
+
+def generate_corpus(size: int, shape: str = "mixed", seed: int = 0, statements: int = 200) -> str:
+    """
+    Gera um corpus de programas LPD concatenados com aproximadamente `size` caracteres.
+
+    Args:
+        size (int): Tamanho mínimo do corpus, em caracteres.
+        shape (str): Perfil dos programas (veja `SHAPES`).
+        seed (int): Semente do gerador de números aleatórios.
+        statements (int): Quantidade aproximada de comandos por programa.
+
+    Returns:
+        str: Código fonte do corpus.
+    """
+    programs = []
+    total = 0
+    number = 1
+    while total < size:
+        program = generate_program(statements, shape, seed, number)
+        programs.append(program)
+        total += len(program) + 1
+        number += 1
+    return "\n".join(programs)
+
+
+def parse_size(text: str) -> int:
+    """
+    Interpreta um tamanho com sufixo opcional `K`, `M` ou `G` (potências de 1024).
+
+    Args:
+        text (str): Tamanho, por exemplo `512K` ou `10M`.
+
+    Returns:
+        int: Tamanho em unidades.
+    """
+    text = text.strip().upper().removesuffix("B")
+    multiplier = {"K": 1 << 10, "M": 1 << 20, "G": 1 << 30}.get(text[-1:], 1)
+    return int(float(text.rstrip("KMG")) * multiplier)
+
+
+def main():
+    """Gera um corpus e o escreve em um arquivo ou na saída padrão."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--shape", choices=SHAPES, default="mixed", help="perfil do corpus (padrão: mixed)")
+    parser.add_argument("--size", type=parse_size, default=1 << 20, help="tamanho aproximado, ex.: 512K, 10M (padrão: 1M)")
+    parser.add_argument("--seed", type=int, default=0, help="semente do gerador (padrão: 0)")
+    parser.add_argument("--output", default=None, help="arquivo de saída (padrão: saída padrão)")
+    args = parser.parse_args()
+
+    text = generate_corpus(args.size, args.shape, args.seed)
+    if args.output is None:
+        sys.stdout.write(text)
+    else:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(text)
+
+
+if __name__ == "__main__":
+    main()
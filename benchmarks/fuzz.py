@@ -0,0 +1,433 @@
+"""
+Fuzzing diferencial dos motores de análise léxica
+
+Gera entradas LPD aleatórias e executa, lado a lado, a implementação de referência
+(`LexicalAnalyzer.tokenize`) e os motores alternativos (`scan`, `scan_stream`, `tokenize_file`,
+`iter_tokens` com blocos pequenos e qualquer função informada com `--engine modulo:funcao`). Os
+resultados comparados são os tokens `(lexema, tipo, linha)`, os diagnósticos (código, linha e
+coluna) e a posição de um comentário não fechado; uma exceção também é um resultado. Além da
+comparação, cada entrada é verificada contra propriedades da referência (veja `PROPERTIES`).
+
+As entradas vêm de dois geradores, alternados: `random_text` sorteia caracteres de um alfabeto
+concentrado nos que importam para a análise (chaves, aspas, operadores, todas as quebras de linha
+de `str.splitlines`, letras não ASCII), e `grammar_text` monta fragmentos da linguagem:
+palavras reservadas, identificadores Unicode e com maiúsculas, números, literais de texto
+fechados ou não, comentários aninhados, de várias linhas ou sem `}` e sequências de operadores
+como `<>=` e `:==`. Cada divergência é reduzida por `minimize` (delta debugging) a uma entrada
+mínima, que pode ser gravada com `--save`.
+
+A execução é limitada por `--seconds` e `--cases` e termina com uma verificação de vazão, também
+limitada no tempo (`--bench-seconds`), de cada motor sobre um corpus de `benchmarks.corpus`. Nada é
+baixado nem instalado: tudo roda sobre a árvore local. O código de saída é `1` se houver alguma divergência.
+
+Uso:
+    python -m benchmarks.fuzz [--seconds 10] [--cases N] [--seed 0] [--engine modulo:funcao]
+                              [--bench-seconds 2] [--save DIR]
+"""
+
+import argparse
+import importlib
+import inspect
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+from typing import Callable, Optional
+
+from analyzer.analyzer import LexicalAnalyzer
+from analyzer.scanner import NEWLINE_CHARS, blank_comments
+from benchmarks.corpus import generate_corpus
+
+# Alfabeto de `random_text`, com os caracteres repetidos conforme o peso desejado.
+_ALPHABET = ("abcxyzBEGINend_019" * 2 + "    " * 3 + "\n" * 6 + "\r\n" + NEWLINE_CHARS
+             + "{{}}''\"\"" * 2 + ":=<>!.;,()[]+-*/" * 2 + "@?#$%&\\~^`|\t" + "çãéÇΩß中")
+
+_KEYWORDS = ["program", "begin", "end", "var", "int", "if", "then", "else", "while", "do", "repeat", "until",
+             "procedure", "function", "writec", "readd", "div", "and", "or", "not", "Begin", "END", "for", "to"]
+_IDENTIFIERS = ["a", "x1", "_tmp", "Contador", "ação", "Ωmega", "naïve", "x_y_z", "mañana", "1abc", "ß"]
+_NUMBERS = ["0", "7", "42", "3.14", "1.", ".5", "1..2", "10.0.1"]
+_OPERATORS = [":=", "=", "==", "!=", "<>", "<=", ">=", "<", ">", "<>=", ":==", "!==", "<<>>", "=:", ":",
+              "!", ".", ";", ",", "(", ")", "[", "]", "+", "-", "*", "/", "**", "@", "?"]
+_NEWLINES = ["\n", "\n", "\n", "\r\n", "\r", "\x0b", "\x0c", "\x1c", "\x85", " ", " "]
+
+
+def random_text(rng: random.Random, length: int) -> str:
+    """
+    Gera uma sequência de caracteres sorteados de um alfabeto voltado à análise léxica.
+
+    Args:
+        rng (random.Random): Gerador de números aleatórios.
+        length (int): Quantidade de caracteres.
+
+    Returns:
+        str: Texto gerado.
+    """
+    return "".join(rng.choice(_ALPHABET) for _ in range(length))
+
+
+def grammar_text(rng: random.Random, fragments: int) -> str:
+    """
+    Gera uma entrada a partir de fragmentos da linguagem LPD, válidos ou propositalmente malformados.
+
+    Args:
+        rng (random.Random): Gerador de números aleatórios.
+        fragments (int): Quantidade de fragmentos.
+
+    Returns:
+        str: Texto gerado.
+    """
+    def comment() -> str:
+        body = " ".join(rng.choice(_KEYWORDS + _IDENTIFIERS) for _ in range(rng.randint(0, 3)))
+        kind = rng.randrange(5)
+        if kind == 0:
+            # Chaves aninhadas: o comentário termina no primeiro `}`.
+            return "{ " + body + " { " + body + " } " + body + " }"
+        if kind == 1:
+            return "{" + body + rng.choice(_NEWLINES) + body + "}"
+        if kind == 2:
+            return "{" + body
+        return "{" + body + "}"
+
+    def text() -> str:
+        content = "".join(rng.choice("ab {}'\":=") for _ in range(rng.randint(0, 4)))
+        return rng.choice(['"' + content.replace('"', "") + '"', "'" + content[:1].replace("'", "") + "'",
+                           '"' + content, "'" + content, "''", '""'])
+
+    choices = [
+        lambda: rng.choice(_KEYWORDS),
+        lambda: rng.choice(_IDENTIFIERS),
+        lambda: rng.choice(_NUMBERS),
+        lambda: rng.choice(_OPERATORS),
+        lambda: rng.choice(_OPERATORS) + rng.choice(_OPERATORS),
+        comment,
+        text,
+        lambda: rng.choice(_NEWLINES),
+    ]
+    parts = []
+    for _ in range(fragments):
+        parts.append(rng.choice(choices)())
+        parts.append(rng.choice(["", " ", " ", "\t", rng.choice(_NEWLINES)]))
+    return "".join(parts)
+
+
+def _result(analyzer: LexicalAnalyzer, tokens) -> tuple:
+    """Normaliza o resultado de um motor: tokens, diagnósticos e comentário não fechado."""
+    return ([(lexeme, token.type.name, line) for lexeme, token, line in tokens],
+            [(diagnostic.code, diagnostic.line, diagnostic.column) for diagnostic in analyzer.diagnostics],
+            analyzer.unterminated_comment)
+
+
+def _tokenize_file(analyzer: LexicalAnalyzer, text: str, block_size: int = 1 << 20) -> list:
+    """Grava o texto em um arquivo temporário e o analisa com `tokenize_file` (mapeamento em memória)."""
+    with tempfile.NamedTemporaryFile("w", suffix=".lpd", encoding="utf-8", newline="", delete=False) as file:
+        file.write(text)
+    try:
+        return analyzer.tokenize_file(file.name, block_size=block_size)
+    finally:
+        os.remove(file.name)
+
+
+# Motores comparados com a referência, com blocos pequenos para exercitar as divisões do texto.
+ENGINES = {
+    "scan": lambda analyzer, text: analyzer.scan(text),
+    "scan_stream": lambda analyzer, text: list(analyzer.scan_stream(text)),
+    "tokenize_file": lambda analyzer, text: _tokenize_file(analyzer, text, block_size=64),
+    "iter_tokens": lambda analyzer, text: list(analyzer.iter_tokens(io.StringIO(text, newline=""), chunk_size=7)),
+}
+
+# Os mesmos motores, com os tamanhos de bloco padrão, para a verificação de vazão.
+BENCH_ENGINES = {
+    "scan": ENGINES["scan"],
+    "scan_stream": ENGINES["scan_stream"],
+    "tokenize_file": _tokenize_file,
+    "iter_tokens": lambda analyzer, text: list(analyzer.iter_tokens(io.StringIO(text, newline=""))),
+}
+
+
+def load_engine(spec: str) -> Callable:
+    """
+    Carrega um motor externo no formato `modulo:funcao`.
+
+    A função recebe o texto e retorna os tokens `(lexema, Token, linha)`; se aceitar um segundo
+    argumento, recebe também o analisador, cujos diagnósticos são então comparados. Caso
+    contrário, apenas os tokens são comparados.
+
+    Args:
+        spec (str): Módulo importável e nome da função, separados por `:`.
+
+    Returns:
+        callable: Motor no formato de `ENGINES`.
+
+    Raises:
+        ValueError: Se `spec` não estiver no formato esperado.
+    """
+    module, _, name = spec.partition(":")
+    if not module or not name:
+        raise ValueError(f"Motor inválido: {spec!r} (formato: modulo:funcao)")
+    function = getattr(importlib.import_module(module), name)
+    try:
+        takes_analyzer = len(inspect.signature(function).parameters) >= 2
+    except (TypeError, ValueError):
+        takes_analyzer = False
+    if takes_analyzer:
+        return lambda analyzer, text: function(text, analyzer)
+
+    def engine(analyzer: LexicalAnalyzer, text: str) -> list:
+        tokens = function(text)
+        # Os diagnósticos do resultado passam a ser os da referência.
+        analyzer.tokenize(text)
+        return tokens
+
+    return engine
+
+
+def run_engine(engine: Callable, analyzer: LexicalAnalyzer, text: str, diagnostics: bool = True) -> tuple:
+    """
+    Executa um motor sobre um texto, convertendo exceções em resultados comparáveis.
+
+    Args:
+        engine (callable): Motor de `ENGINES`, ou `None` para a referência.
+        analyzer (LexicalAnalyzer): Analisador usado pelo motor.
+        text (str): Entrada.
+        diagnostics (bool): Indica se os diagnósticos e o comentário não fechado entram no resultado.
+
+    Returns:
+        tuple: Resultado normalizado, ou `("exceção", nome da classe)`.
+    """
+    try:
+        tokens = analyzer.tokenize(text) if engine is None else engine(analyzer, text)
+    except Exception as e:
+        return ("exceção", type(e).__name__)
+    result = _result(analyzer, tokens)
+    return result if diagnostics else result[0]
+
+
+def _lines_ordered(text: str, tokens: list) -> bool:
+    """As linhas são crescentes e não ultrapassam a quantidade de linhas do texto."""
+    lines = [line for _, _, line in tokens]
+    return lines == sorted(lines) and all(1 <= line <= max(1, len(text.splitlines())) for line in lines)
+
+
+def _lexemes_in_order(text: str, tokens: list) -> bool:
+    """Cada lexema aparece no texto, depois do anterior."""
+    position = 0
+    for lexeme, _, _ in tokens:
+        found = text.find(lexeme, position)
+        if found < 0:
+            return False
+        position = found + len(lexeme)
+    return True
+
+
+def _comments_blanked(text: str, tokens: list, analyzer: LexicalAnalyzer) -> bool:
+    """Substituir os comentários por espaços não altera os tokens."""
+    return analyzer.tokenize(blank_comments(text)) == tokens
+
+
+# Propriedades verificadas sobre o resultado da referência.
+PROPERTIES = {
+    "linhas-ordenadas": lambda analyzer, text, tokens: _lines_ordered(text, tokens),
+    "lexemas-em-ordem": lambda analyzer, text, tokens: _lexemes_in_order(text, tokens),
+    "comentarios-em-branco": lambda analyzer, text, tokens: _comments_blanked(text, tokens, analyzer),
+}
+
+
+def check(analyzer: LexicalAnalyzer, engines: dict, text: str, diagnostics: bool = True) -> list[str]:
+    """
+    Compara os motores com a referência e verifica as propriedades sobre uma entrada.
+
+    Args:
+        analyzer (LexicalAnalyzer): Analisador compartilhado pelos motores.
+        engines (dict): Motores comparados, por nome.
+        text (str): Entrada.
+        diagnostics (bool): Indica se os diagnósticos também são comparados.
+
+    Returns:
+        list[str]: Nomes dos motores divergentes e das propriedades violadas.
+    """
+    reference = run_engine(None, analyzer, text, diagnostics)
+    failures = [name for name, engine in engines.items() if run_engine(engine, analyzer, text, diagnostics) != reference]
+    tokens = analyzer.tokenize(text)
+    failures += [name for name, holds in PROPERTIES.items() if not holds(analyzer, text, tokens)]
+    return failures
+
+
+def minimize(text: str, failing: Callable[[str], bool]) -> str:
+    """
+    Reduz uma entrada que falha a uma entrada mínima que ainda falha (delta debugging).
+
+    Remove linhas inteiras e, depois, trechos de caracteres cada vez menores, mantendo cada remoção
+    que preserva a falha, até que nenhum caractere isolado possa ser removido.
+
+    Args:
+        text (str): Entrada que falha.
+        failing (callable): Predicado que indica se uma entrada falha.
+
+    Returns:
+        str: Entrada reduzida.
+    """
+    def reduce(parts: list) -> list:
+        size = max(1, len(parts) // 2)
+        while parts:
+            start = 0
+            removed = False
+            while start < len(parts):
+                candidate = parts[:start] + parts[start + size:]
+                if failing("".join(candidate)):
+                    parts = candidate
+                    removed = True
+                else:
+                    start += size
+            if size > 1:
+                size //= 2
+            elif not removed:
+                break
+        return parts
+
+    text = "".join(reduce(text.splitlines(keepends=True)))
+    return "".join(reduce(list(text)))
+
+
+class Failure:
+    """
+    Divergência encontrada pelo fuzzing.
+
+    Attributes:
+        names (list[str]): Motores divergentes e propriedades violadas.
+        text (str): Entrada original.
+        minimized (str): Entrada reduzida por `minimize`.
+        seed (int): Semente do caso.
+    """
+    __slots__ = ("names", "text", "minimized", "seed")
+
+    def __init__(self, names: list[str], text: str, minimized: str, seed: int) -> None:
+        """
+        Inicializa a divergência.
+
+        Args:
+            names (list[str]): Motores divergentes e propriedades violadas.
+            text (str): Entrada original.
+            minimized (str): Entrada reduzida.
+            seed (int): Semente do caso.
+        """
+        self.names = names
+        self.text = text
+        self.minimized = minimized
+        self.seed = seed
+
+    def __str__(self) -> str:
+        """Resume a divergência com a entrada reduzida."""
+        return f"caso {self.seed}: {', '.join(self.names)} com {self.minimized!r}"
+
+
+def fuzz(seconds: float = 10.0, cases: Optional[int] = None, seed: int = 0, engines: Optional[dict] = None,
+         analyzer: Optional[LexicalAnalyzer] = None, diagnostics: bool = True, max_failures: int = 10) -> tuple[int, list[Failure]]:
+    """
+    Executa o fuzzing diferencial até esgotar o tempo ou a quantidade de casos.
+
+    Args:
+        seconds (float): Tempo máximo, em segundos.
+        cases (int | None): Quantidade máxima de casos (padrão: sem limite).
+        seed (int): Semente inicial; o caso `n` usa a semente `seed + n`, de modo que pode ser reproduzido.
+        engines (dict | None): Motores comparados (padrão: `ENGINES`).
+        analyzer (LexicalAnalyzer | None): Analisador compartilhado (padrão: um novo, com a política `"token"`).
+        diagnostics (bool): Indica se os diagnósticos também são comparados.
+        max_failures (int): Quantidade de divergências que encerra o fuzzing.
+
+    Returns:
+        tuple[int, list[Failure]]: Quantidade de casos executados e as divergências encontradas.
+    """
+    engines = ENGINES if engines is None else engines
+    # Com a política `"token"`, os lexemas desconhecidos também são comparados entre os motores.
+    analyzer = analyzer or LexicalAnalyzer(error_policy="token")
+    deadline = time.perf_counter() + seconds
+    failures = []
+    count = 0
+    while time.perf_counter() < deadline and (cases is None or count < cases) and len(failures) < max_failures:
+        case = seed + count
+        rng = random.Random(case)
+        text = random_text(rng, rng.randint(0, 120)) if case % 2 else grammar_text(rng, rng.randint(1, 30))
+        count += 1
+        names = check(analyzer, engines, text, diagnostics)
+        if names:
+            def failing(candidate: str, expected=set(names)) -> bool:
+                return bool(expected & set(check(analyzer, engines, candidate, diagnostics)))
+            failures.append(Failure(names, text, minimize(text, failing), case))
+    return count, failures
+
+
+def throughput(engines: dict, seconds: float = 2.0, size: int = 256 << 10) -> dict[str, float]:
+    """
+    Mede a vazão de cada motor e da referência, com o tempo total limitado.
+
+    Cada motor é executado repetidamente sobre um corpus de `benchmarks.corpus` durante a sua
+    parcela de `seconds`, e o melhor tempo é convertido em MB/s.
+
+    Args:
+        engines (dict): Motores medidos, por nome.
+        seconds (float): Tempo total da medição.
+        size (int): Tamanho do corpus, em caracteres.
+
+    Returns:
+        dict[str, float]: MB/s de `tokenize` (a referência) e de cada motor.
+    """
+    text = generate_corpus(size)
+    megabytes = len(text.encode("utf-8")) / 1e6
+    measured = {"tokenize": None, **engines}
+    share = seconds / len(measured)
+    results = {}
+    for name, engine in measured.items():
+        analyzer = LexicalAnalyzer()
+        best = float("inf")
+        deadline = time.perf_counter() + share
+        while True:
+            start = time.perf_counter()
+            run_engine(engine, analyzer, text)
+            end = time.perf_counter()
+            best = min(best, end - start)
+            if end >= deadline:
+                break
+        results[name] = megabytes / best
+    return results
+
+
+def main():
+    """Executa o fuzzing e a verificação de vazão, e encerra com `1` se houver divergências."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=10.0, help="tempo do fuzzing, em segundos (padrão: 10)")
+    parser.add_argument("--cases", type=int, default=None, help="quantidade máxima de casos (padrão: sem limite)")
+    parser.add_argument("--seed", type=int, default=0, help="semente do primeiro caso (padrão: 0)")
+    parser.add_argument("--engine", action="append", default=[], metavar="MODULO:FUNCAO",
+                        help="motor adicional comparado com a referência (pode ser repetido)")
+    parser.add_argument("--only", action="store_true", help="compara apenas os motores de --engine")
+    parser.add_argument("--no-diagnostics", action="store_true", help="compara apenas os tokens")
+    parser.add_argument("--bench-seconds", type=float, default=2.0,
+                        help="tempo da verificação de vazão; 0 a desativa (padrão: 2)")
+    parser.add_argument("--save", metavar="DIR", default=None, help="grava as entradas reduzidas neste diretório")
+    args = parser.parse_args()
+
+    external = {spec: load_engine(spec) for spec in args.engine}
+    engines = external if args.only else {**ENGINES, **external}
+
+    count, failures = fuzz(args.seconds, args.cases, args.seed, engines, diagnostics=not args.no_diagnostics)
+    print(f"Casos: {count}, divergências: {len(failures)}")
+    for failure in failures:
+        print(f"  {failure}")
+        if args.save:
+            os.makedirs(args.save, exist_ok=True)
+            with open(os.path.join(args.save, f"caso-{failure.seed}.lpd"), "w", encoding="utf-8", newline="") as file:
+                file.write(failure.minimized)
+
+    if args.bench_seconds > 0:
+        results = throughput(external if args.only else {**BENCH_ENGINES, **external}, args.bench_seconds)
+        reference = results["tokenize"]
+        print("Vazão:")
+        for name, speed in results.items():
+            print(f"  {name:>16}: {speed:6.2f} MB/s ({speed / reference:.2f}x)")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Módulo `samples`
+
+Utilitários compartilhados pelos benchmarks para carregar os exemplos `codigo*.lpd` do repositório.
+
+Funções:
+    - sample_paths(): Retorna os caminhos dos exemplos LPD incluídos no repositório.
+    - load_samples(scale): Concatena os exemplos, repetindo-os `scale` vezes.
+"""
+
+import glob
+import os
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def sample_paths() -> list[str]:
+    """
+    Retorna os caminhos dos exemplos LPD incluídos no repositório.
+
+    Returns:
+        list[str]: Caminhos de `codigo*.lpd`, em ordem alfabética.
+    """
+    return sorted(glob.glob(os.path.join(ROOT, "codigo*.lpd")))
+
+
+def load_samples(scale: int = 1) -> str:
+    """
+    Concatena os exemplos LPD, repetindo-os `scale` vezes.
+
+    Args:
+        scale (int): Quantidade de repetições do conjunto de exemplos.
+
+    Returns:
+        str: Código fonte resultante.
+    """
+    sources = []
+    for path in sample_paths():
+        with open(path, "r", encoding="utf-8") as file:
+            sources.append(file.read())
+    return "\n".join(sources) * scale
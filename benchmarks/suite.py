@@ -0,0 +1,208 @@
+"""
+Suíte de benchmarks do analisador léxico
+
+Gera corpora sintéticos com `benchmarks.corpus` e mede cada etapa do analisador (remoção de
+comentários, `tokenize`, `scan`, `scan_stream`, `tokenize_file`, `iter_tokens` e a tabela de
+símbolos) em cada perfil. Para cada medição são reportados o melhor tempo entre `--repeat`
+execuções, tokens/s, MB/s e o pico de memória alocada (medido com `tracemalloc` em uma execução
+separada, para não distorcer o tempo). O resultado é impresso em JSON ou gravado com `--output`.
+
+Com `--compare`, os resultados são comparados com os de um arquivo anterior: uma queda de vazão
+ou um aumento do pico de memória acima de `--threshold` é reportado como regressão e o processo
+termina com código `1`.
+
+Uso:
+    python -m benchmarks.suite [--size 1M] [--shapes mixed,comments] [--stages tokenize,scan]
+                               [--output atual.json] [--compare base.json] [--threshold 0.1]
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from analyzer.analyzer import LexicalAnalyzer, SymbolTable
+from benchmarks.corpus import SHAPES, generate_corpus, parse_size
+
+
+def _remove_comments(analyzer: LexicalAnalyzer, text: str, path: str) -> None:
+    """Remove os comentários do texto; a etapa não produz tokens."""
+    analyzer.remove_comments(text)
+
+
+def _symbols(analyzer: LexicalAnalyzer, text: str, path: str) -> int:
+    """Analisa o texto e preenche a tabela de símbolos com as declarações e os usos de cada escopo."""
+    tokens = analyzer.scan(text)
+    SymbolTable().populate(tokens)
+    return len(tokens)
+
+
+# Etapas medidas: cada uma recebe o analisador, o texto e o caminho de um arquivo com o mesmo
+# conteúdo, e retorna a quantidade de tokens produzidos (ou `None` se não produzir tokens).
+STAGES = {
+    "remove_comments": _remove_comments,
+    "tokenize": lambda analyzer, text, path: len(analyzer.tokenize(text)),
+    "scan": lambda analyzer, text, path: len(analyzer.scan(text)),
+    "scan_stream": lambda analyzer, text, path: len(analyzer.scan_stream(text)),
+    "tokenize_file": lambda analyzer, text, path: len(analyzer.tokenize_file(path)),
+    "iter_tokens": lambda analyzer, text, path: sum(1 for _ in analyzer.iter_tokens(path)),
+    "symbols": _symbols,
+}
+
+
+def measure(stage: str, text: str, path: str, repeat: int = 3) -> dict:
+    """
+    Mede uma etapa sobre um corpus.
+
+    Args:
+        stage (str): Nome da etapa em `STAGES`.
+        text (str): Conteúdo do corpus.
+        path (str): Arquivo com o mesmo conteúdo, em UTF-8.
+        repeat (int): Quantidade de execuções cronometradas.
+
+    Returns:
+        dict: Tempo, tokens, tokens/s, MB/s e pico de memória em KB.
+    """
+    function = STAGES[stage]
+    size = len(text.encode("utf-8"))
+    best = float("inf")
+    tokens = None
+    for _ in range(repeat):
+        # Um analisador novo por execução, para que a tabela de consulta do `Scanner` não seja reaproveitada.
+        analyzer = LexicalAnalyzer()
+        start = time.perf_counter()
+        tokens = function(analyzer, text, path)
+        best = min(best, time.perf_counter() - start)
+
+    analyzer = LexicalAnalyzer()
+    tracemalloc.start()
+    function(analyzer, text, path)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return {
+        "seconds": round(best, 6),
+        "tokens": tokens,
+        "tokens_per_second": round(tokens / best) if tokens is not None else None,
+        "mb_per_second": round(size / 1e6 / best, 3),
+        "peak_kb": round(peak / 1024, 1),
+    }
+
+
+def run(size: int, shapes: list[str], stages: list[str], repeat: int, seed: int) -> dict:
+    """
+    Executa a suíte completa.
+
+    Args:
+        size (int): Tamanho de cada corpus, em caracteres.
+        shapes (list[str]): Perfis de corpus.
+        stages (list[str]): Etapas medidas.
+        repeat (int): Quantidade de execuções cronometradas por medição.
+        seed (int): Semente do gerador de corpus.
+
+    Returns:
+        dict: Metadados da execução e uma lista de resultados por perfil e etapa.
+    """
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for shape in shapes:
+            text = generate_corpus(size, shape, seed)
+            path = os.path.join(directory, f"{shape}.lpd")
+            with open(path, "w", encoding="utf-8", newline="") as file:
+                file.write(text)
+            for stage in stages:
+                result = {"shape": shape, "stage": stage, "bytes": len(text.encode("utf-8"))}
+                result.update(measure(stage, text, path, repeat))
+                results.append(result)
+                print(f"{shape:>12} {stage:>16}: {result['seconds']:.4f}s, {result['mb_per_second']:.2f} MB/s, "
+                      f"pico {result['peak_kb'] / 1024:.1f} MB", file=sys.stderr)
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "size": size,
+            "seed": seed,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float = 0.1) -> list[str]:
+    """
+    Compara duas execuções da suíte, listando as regressões.
+
+    Uma regressão é uma queda de MB/s ou um aumento do pico de memória maior que `threshold`
+    (fração) em um mesmo perfil e etapa. Medições presentes em apenas uma das execuções são ignoradas.
+
+    Args:
+        current (dict): Resultado de `run`.
+        baseline (dict): Resultado anterior de `run`, usado como referência.
+        threshold (float): Variação relativa tolerada.
+
+    Returns:
+        list[str]: Descrição de cada regressão encontrada.
+    """
+    reference = {(result["shape"], result["stage"]): result for result in baseline["results"]}
+    regressions = []
+    for result in current["results"]:
+        base = reference.get((result["shape"], result["stage"]))
+        if base is None:
+            continue
+        name = f"{result['shape']}/{result['stage']}"
+        if result["mb_per_second"] < base["mb_per_second"] * (1 - threshold):
+            regressions.append(f"{name}: vazão {base['mb_per_second']:.2f} -> {result['mb_per_second']:.2f} MB/s")
+        if result["peak_kb"] > base["peak_kb"] * (1 + threshold):
+            regressions.append(f"{name}: pico de memória {base['peak_kb']:.0f} -> {result['peak_kb']:.0f} KB")
+    return regressions
+
+
+def _names(text: str, valid) -> list[str]:
+    """Interpreta uma lista separada por vírgulas, validando cada nome."""
+    names = [name.strip() for name in text.split(",") if name.strip()]
+    for name in names:
+        if name not in valid:
+            raise argparse.ArgumentTypeError(f"nome inválido: {name} (opções: {', '.join(valid)})")
+    return names
+
+
+def main():
+    """Executa a suíte, grava o resultado e, opcionalmente, compara com uma referência."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=parse_size, default=1 << 20, help="tamanho de cada corpus, ex.: 512K, 4M (padrão: 1M)")
+    parser.add_argument("--shapes", type=lambda text: _names(text, SHAPES), default=list(SHAPES),
+                        help="perfis separados por vírgula (padrão: todos)")
+    parser.add_argument("--stages", type=lambda text: _names(text, STAGES), default=list(STAGES),
+                        help="etapas separadas por vírgula (padrão: todas)")
+    parser.add_argument("--repeat", type=int, default=3, help="execuções cronometradas por medição (padrão: 3)")
+    parser.add_argument("--seed", type=int, default=0, help="semente do gerador de corpus (padrão: 0)")
+    parser.add_argument("--output", default=None, help="arquivo JSON de saída (padrão: saída padrão)")
+    parser.add_argument("--compare", metavar="BASE", default=None, help="arquivo JSON de referência")
+    parser.add_argument("--threshold", type=float, default=0.1, help="variação tolerada na comparação (padrão: 0.1)")
+    args = parser.parse_args()
+
+    current = run(args.size, args.shapes, args.stages, args.repeat, args.seed)
+    if args.output is None:
+        print(json.dumps(current, indent=2, ensure_ascii=False))
+    else:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(current, file, indent=2, ensure_ascii=False)
+
+    if args.compare is not None:
+        with open(args.compare, "r", encoding="utf-8") as file:
+            regressions = compare(current, json.load(file), args.threshold)
+        for regression in regressions:
+            print(f"Regressão: {regression}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+        print("Nenhuma regressão encontrada.", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
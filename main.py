@@ -9,46 +9,333 @@ Principais funcionalidades:
 - Realizar a tokenização do código e identificar seus componentes léxicos, incluindo a linha.
 - Exibir o código analisado e os tokens encontrados em formato de tabela no terminal.
 - Exportar os resultados da análise em arquivos CSV ou TXT, de acordo com a escolha do usuário.
+- Analisar lotes de arquivos (diretórios e padrões glob) em paralelo, com um resumo de desempenho.
+- Exportar os tokens de forma não interativa (CSV, JSON Lines, binário ou tabela) com `--format`.
+- Exibir o perfil de tempo de cada etapa da análise com `--profile`.
+- Analisar dialetos da linguagem (por exemplo, com `for` ou sem diferenciar maiúsculas) com `--dialect`.
+- Relatar os erros léxicos com sua posição e escolher seu tratamento com `--errors` e `--max-errors`.
+- Atender pedidos de análise por TCP ou socket Unix, em JSON delimitado por linhas, com `--serve`.
+- Observar uma árvore de arquivos, reanalisando apenas os alterados, com `--watch`.
+- Manter um índice persistente dos identificadores e consultá-lo com `--index` e `--find`.
 
 Dependências:
+    - `argparse`: Para interpretação dos argumentos de linha de comando.
     - `csv`: Para manipulação e exportação de arquivos CSV.
     - `os`: Para manipulação de caminhos de arquivos.
     - `sys`: Para captura de argumentos de linha de comando.
     - `tabulate`: Para formatação de tabelas no terminal e nos arquivos exportados.
     - `LexicalAnalyzer`: Classe do módulo `analyzer` responsável pela análise léxica.
+    - `tokenize_many`: Função do módulo `analyzer.batch` responsável pela análise em lote.
+    - `export_file`: Função do módulo `analyzer.export` responsável pela exportação não interativa.
+    - `serve`: Função do módulo `analyzer.server` responsável pelo modo servidor.
+    - `TreeWatcher`: Classe do módulo `analyzer.watch` responsável pelo modo de observação.
+    - `IdentifierIndex`: Classe do módulo `analyzer.index` responsável pelo índice de identificadores.
+
+Apenas `argparse`, `glob`, `os`, `sys` e o `LexicalAnalyzer` são importados no carregamento do módulo; as
+demais dependências são importadas pelo modo de execução escolhido, de modo que analisar um arquivo
+pequeno não paga a importação do `tabulate`, do `asyncio` ou do pool de processos
+(veja `benchmarks/bench_startup.py`).
 
 Funções:
     - main(): Ponto de entrada principal para a execução do analisador.
+    - parse_args(argv): Interpreta os argumentos de linha de comando.
+    - run_batch(patterns, workers, cache_dir, analyzer): Analisa um lote de arquivos em paralelo.
+    - run_export(path, format, output, include_source, analyzer): Exporta os tokens de um arquivo sem interação.
+    - run_watch(paths, interval, analyzer): Observa uma árvore de arquivos e reanalisa os alterados.
+    - run_index(paths, index_path, query, analyzer): Atualiza e consulta o índice de identificadores.
+    - report_diagnostics(analyzer, file): Exibe os erros léxicos da última análise.
+    - analyze_file(file_path, analyzer): Analisa um único arquivo de forma interativa.
+
+Uso:
+    python main.py [arquivo]
+    python main.py <diretório|padrão glob|arquivo> ... [--workers N] [--cache DIR]
+    python main.py arquivo --format csv|jsonl|binary|table|none [--output ARQUIVO] [--include-source]
+    python main.py --serve 127.0.0.1:8765|unix:/tmp/lpd.sock [--workers N]
+    python main.py --watch [diretório|padrão glob|arquivo ...] [--interval SEGUNDOS]
+    python main.py [diretório|padrão glob|arquivo ...] --index ARQUIVO [--find NOME|PREFIXO*]
 """
 
-import csv
+import argparse
+import glob
 import os
 import sys
-from tabulate import tabulate
 from analyzer.analyzer import LexicalAnalyzer
+from analyzer.diagnostics import ERROR_POLICIES, LexicalError
+from analyzer.spec import DIALECTS
+
+# Formatos de `--format`, os mesmos de `analyzer.export.FORMATS`, listados aqui para que a
+# interpretação dos argumentos não importe o módulo de exportação.
+EXPORT_FORMATS = ("csv", "jsonl", "binary", "table", "none")
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """
+    Interpreta os argumentos de linha de comando.
+
+    Args:
+        argv (list[str] | None): Argumentos a interpretar (padrão: `sys.argv[1:]`).
+
+    Returns:
+        argparse.Namespace: Argumentos interpretados.
+    """
+    parser = argparse.ArgumentParser(description="Analisador léxico para a linguagem LPD.")
+    parser.add_argument("paths", nargs="*", metavar="caminho",
+                        help="arquivo, diretório ou padrão glob (ex.: 'fontes/**/*.lpd')")
+    parser.add_argument("-j", "--workers", type=int, default=None,
+                        help="quantidade de processos no modo em lote (padrão: número de núcleos)")
+    parser.add_argument("--cache", metavar="DIR", default=None,
+                        help="diretório do cache de tokens no modo em lote; arquivos inalterados não são reanalisados")
+    parser.add_argument("-f", "--format", choices=EXPORT_FORMATS, default=None,
+                        help="exporta os tokens de um arquivo sem interação, no formato indicado")
+    parser.add_argument("-o", "--output", metavar="ARQUIVO", default=None,
+                        help="arquivo de saída da exportação (padrão: saída padrão)")
+    parser.add_argument("--include-source", action="store_true",
+                        help="inclui o código fonte completo na exportação")
+    parser.add_argument("--profile", action="store_true",
+                        help="exibe o tempo de cada etapa da análise (no modo em lote, analisa no próprio processo)")
+    parser.add_argument("--profile-output", metavar="ARQUIVO", default=None,
+                        help="grava o perfil no formato do cProfile, legível por pstats")
+    parser.add_argument("--dialect", choices=list(DIALECTS), default="lpd",
+                        help="dialeto da linguagem (padrão: lpd)")
+    parser.add_argument("--errors", choices=ERROR_POLICIES, default="skip",
+                        help="tratamento dos lexemas desconhecidos: descartar, emitir um token 'serro' ou "
+                             "interromper a análise (padrão: skip)")
+    parser.add_argument("--max-errors", type=int, default=1, metavar="N",
+                        help="com --errors abort, quantidade de erros que interrompe a análise (padrão: 1)")
+    parser.add_argument("--serve", metavar="ENDEREÇO", default=None,
+                        help="atende pedidos em JSON delimitado por linhas em host:porta ou unix:caminho "
+                             "(com --workers 0, analisa no próprio processo)")
+    parser.add_argument("--watch", action="store_true",
+                        help="observa os caminhos (padrão: o diretório atual) e reanalisa os arquivos alterados")
+    parser.add_argument("--interval", type=float, default=1.0, metavar="SEGUNDOS",
+                        help="com --watch, intervalo entre as verificações (padrão: 1.0)")
+    parser.add_argument("--index", metavar="ARQUIVO", default=None,
+                        help="atualiza o índice de identificadores gravado no arquivo com os caminhos informados")
+    parser.add_argument("--find", metavar="NOME", default=None,
+                        help="com --index, exibe as ocorrências de um identificador (com '*' no fim, de um prefixo)")
+    args = parser.parse_args(argv)
+    if args.find is not None and args.index is None:
+        parser.error("--find exige --index")
+    if args.max_errors < 1:
+        parser.error("--max-errors deve ser positivo")
+    if args.interval <= 0:
+        parser.error("--interval deve ser positivo")
+    return args
+
+def run_batch(patterns: list[str], workers=None, cache_dir=None, analyzer=None) -> int:
+    """
+    Analisa um lote de arquivos em paralelo, exibindo o tempo de cada arquivo e um resumo.
+
+    Args:
+        patterns (list[str]): Arquivos, diretórios ou padrões glob.
+        workers (int | None): Quantidade de processos.
+        cache_dir (str | None): Diretório do cache de tokens, ou `None` para não utilizar cache.
+        analyzer (LexicalAnalyzer | None): Analisador utilizado (padrão: um novo `LexicalAnalyzer`).
+
+    Returns:
+        int: Código de saída (`1` se algum arquivo falhou, `0` caso contrário).
+    """
+    from analyzer.batch import BatchSummary, expand_paths, tokenize_many
+
+    summary = BatchSummary()
+    for result in tokenize_many(expand_paths(patterns), workers=workers, analyzer=analyzer, cache_dir=cache_dir):
+        summary.add(result)
+        if result.ok:
+            errors = f", {len(result.diagnostics)} erro(s) léxico(s)" if result.diagnostics else ""
+            print(f"{result.path}: {len(result.tokens)} tokens em {result.elapsed * 1000:.1f} ms{errors}")
+        else:
+            print(f"{result.path}: Erro - {result.error}")
+
+    print(f"\nResumo: {summary}")
+    return 1 if summary.failed else 0
+
+def run_export(path: str, format: str, output=None, include_source=False, analyzer=None) -> int:
+    """
+    Exporta os tokens de um arquivo sem interação, escrevendo-os à medida que são encontrados.
+
+    Args:
+        path (str): Caminho do arquivo a ser analisado.
+        format (str): Formato de exportação (veja `analyzer.export.FORMATS`).
+        output (str | None): Arquivo de saída, ou `None` para a saída padrão.
+        include_source (bool): Indica se o código fonte completo deve ser incluído.
+        analyzer (LexicalAnalyzer | None): Analisador utilizado (padrão: um novo `LexicalAnalyzer`).
+
+    Returns:
+        int: Código de saída (`1` em caso de falha, `0` caso contrário).
+    """
+    from analyzer.export import export_file
+
+    analyzer = analyzer or LexicalAnalyzer()
+    try:
+        count = export_file(analyzer, path, output, format, include_source)
+    except (OSError, UnicodeDecodeError, LexicalError) as e:
+        print(f"Erro: {e}", file=sys.stderr)
+        return 1
+    report_diagnostics(analyzer, sys.stderr)
+    if format == "none":
+        print(f"{count} tokens encontrados.", file=sys.stderr)
+    elif output not in (None, "-"):
+        print(f"{count} tokens exportados para '{os.path.abspath(output)}'.", file=sys.stderr)
+    return 0
+
+def run_watch(paths: list[str], interval: float = 1.0, analyzer=None, stop=None) -> int:
+    """
+    Observa uma árvore de arquivos, exibindo os arquivos reanalisados a cada alteração.
+
+    Args:
+        paths (list[str]): Diretórios, arquivos ou padrões glob observados.
+        interval (float): Intervalo entre as verificações, em segundos.
+        analyzer (LexicalAnalyzer | None): Analisador residente (padrão: um novo `LexicalAnalyzer`).
+        stop (threading.Event | None): Evento que encerra a observação (padrão: até Ctrl+C).
+
+    Returns:
+        int: Código de saída (`0`).
+    """
+    from analyzer.watch import TreeWatcher
+
+    watcher = TreeWatcher(paths, analyzer)
+    try:
+        for update in watcher.watch(interval, stop):
+            for path in update.changed:
+                entry = watcher.files[path]
+                if entry.error is not None:
+                    print(f"{path}: Erro - {entry.error}")
+                else:
+                    errors = f", {len(entry.diagnostics)} erro(s) léxico(s)" if entry.diagnostics else ""
+                    print(f"{path}: {entry.tokens} tokens{errors}")
+            for path in update.removed:
+                print(f"{path}: removido")
+            print(f"Atualização: {update}", flush=True)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+def run_index(paths: list[str], index_path: str, query=None, analyzer=None) -> int:
+    """
+    Atualiza o índice de identificadores com os caminhos informados e, opcionalmente, o consulta.
+
+    Args:
+        paths (list[str]): Diretórios, arquivos ou padrões glob indexados; sem caminhos, o índice
+            gravado é apenas consultado.
+        index_path (str): Arquivo do índice, criado se não existir.
+        query (str | None): Identificador procurado, ou prefixo terminado em `*`.
+        analyzer (LexicalAnalyzer | None): Analisador utilizado (padrão: um novo `LexicalAnalyzer`).
+
+    Returns:
+        int: Código de saída (`1` se a consulta não encontrou ocorrências, `0` caso contrário).
+    """
+    from analyzer.index import IdentifierIndex
+
+    index = IdentifierIndex(index_path, analyzer)
+    if index.discarded:
+        print(f"Aviso: o índice '{index_path}' era inválido ou de outra tabela de tokens e será reconstruído.", file=sys.stderr)
+    if paths:
+        update = index.refresh(paths)
+        print(f"Índice: {update}", file=sys.stderr)
+    if index.dirty:
+        index.save()
+    if query is None:
+        return 0
+
+    if query.endswith("*"):
+        found = index.search(query[:-1])
+    else:
+        found = {query: index.find(query)}
+    for identifier, occurrences in found.items():
+        for path, line, column in occurrences:
+            print(f"{path}:{line}:{column}: {identifier}")
+    return 0 if any(found.values()) else 1
+
+def report_diagnostics(analyzer: LexicalAnalyzer, file=None) -> None:
+    """
+    Exibe os erros léxicos da última análise, um por linha.
+
+    Args:
+        analyzer (LexicalAnalyzer): Analisador que realizou a análise.
+        file (IO[str] | None): Saída dos avisos (padrão: saída padrão).
+    """
+    diagnostics = analyzer.diagnostics
+    for diagnostic in diagnostics:
+        print(f"Aviso: {diagnostic}", file=file)
+    if diagnostics.dropped:
+        print(f"Aviso: mais {diagnostics.dropped} erros léxicos não exibidos.", file=file)
 
 def main():
+    """
+    Ponto de entrada do analisador.
+
+    Com `--serve`, atende pedidos de análise até ser interrompido; com `--watch`, observa os
+    caminhos e reanalisa os arquivos alterados até ser interrompido; com `--index`, atualiza e
+    consulta o índice de identificadores; com mais de um caminho, ou com um diretório ou padrão
+    glob, executa a análise em lote; com `--format`, exporta os tokens de um único arquivo sem
+    interação; caso contrário, analisa um único arquivo de forma interativa. Com `--profile`, o
+    perfil da análise é exibido ao final.
+    """
+    args = parse_args()
+    analyzer = LexicalAnalyzer(spec=DIALECTS[args.dialect], error_policy=args.errors, max_errors=args.max_errors)
+    if args.profile or args.profile_output:
+        analyzer.enable_profiling()
+
+    if args.serve is not None:
+        import asyncio
+        from analyzer.server import serve
+
+        try:
+            asyncio.run(serve(args.serve, analyzer, args.workers))
+        except KeyboardInterrupt:
+            pass
+        code = 0
+    elif args.watch:
+        code = run_watch(args.paths or ["."], args.interval, analyzer)
+    elif args.index is not None:
+        code = run_index(args.paths, args.index, args.find, analyzer)
+    elif len(args.paths) > 1 or any(os.path.isdir(path) or glob.has_magic(path) for path in args.paths):
+        # O perfil só é acumulado no próprio processo.
+        workers = 1 if analyzer.profiler is not None else args.workers
+        code = run_batch(args.paths, workers, args.cache, analyzer)
+    elif args.format is not None:
+        if not args.paths:
+            print("Erro: --format exige o caminho de um arquivo.", file=sys.stderr)
+            sys.exit(2)
+        code = run_export(args.paths[0], args.format, args.output, args.include_source, analyzer)
+    else:
+        # Solicita o caminho do arquivo a ser analisado
+        if args.paths:
+            file_path = args.paths[0]
+        else:
+            file_path = input("Digite o caminho do arquivo para análise: ")
+
+        analyze_file(file_path, analyzer)
+        code = 0
+
+    if analyzer.profiler is not None:
+        if args.profile:
+            print(analyzer.profiler.format(), file=sys.stderr)
+            pool = analyzer.intern_pool
+            print(f"  Lexemas internados: {len(pool)}, taxa de acerto: {pool.hit_rate:.1%}", file=sys.stderr)
+        if args.profile_output:
+            analyzer.profiler.dump_stats(args.profile_output)
+    sys.exit(code)
+
+def analyze_file(file_path: str, analyzer=None):
     """
     Executa a análise léxica em um arquivo de código fornecido pelo usuário.
 
-    Este método solicita o caminho de um arquivo, realiza a análise léxica utilizando
-    a classe `LexicalAnalyzer` e exibe os resultados no terminal. Opcionalmente,
-    o usuário pode exportar os resultados em formatos CSV ou TXT.
+    Este método realiza a análise léxica utilizando a classe `LexicalAnalyzer` e exibe os
+    resultados no terminal. Opcionalmente, o usuário pode exportar os resultados em formatos CSV ou TXT.
 
     Etapas:
-        1. Solicita o arquivo de entrada.
-        2. Verifica a existência e a legibilidade do arquivo.
-        3. Processa o código fonte para identificar tokens, tipos e linhas.
-        4. Exibe os resultados em formato tabular no terminal.
-        5. Oferece a opção de exportar os resultados em formato CSV ou TXT.
+        1. Verifica a existência e a legibilidade do arquivo.
+        2. Processa o código fonte para identificar tokens, tipos e linhas.
+        3. Exibe os resultados em formato tabular no terminal.
+        4. Oferece a opção de exportar os resultados em formato CSV ou TXT.
+
+    Args:
+        file_path (str): Caminho do arquivo a ser analisado.
+        analyzer (LexicalAnalyzer | None): Analisador utilizado (padrão: um novo `LexicalAnalyzer`).
     """
-    analyser = LexicalAnalyzer()
+    from tabulate import tabulate
 
-    # Solicita o caminho do arquivo a ser analisado
-    if len(sys.argv) > 1:
-        file_path = sys.argv[1]
-    else:
-        file_path = input("Digite o caminho do arquivo para análise: ")
+    analyser = analyzer or LexicalAnalyzer()
 
     # Verifica se o arquivo existe
     if not os.path.isfile(file_path):
@@ -67,7 +354,12 @@ def main():
     file_base_name = os.path.splitext(os.path.basename(file_path))[0]
 
     # Realiza a análise léxica para identificar tokens
-    tokens = analyser.tokenize(code)
+    try:
+        tokens = analyser.tokenize(code)
+    except LexicalError as e:
+        print(f"Erro: {e}")
+        return
+    report_diagnostics(analyser)
 
     # Exibe a tabela com o código completo no terminal
     code_table = [(code,)]
@@ -90,6 +382,8 @@ def main():
 
         try:
             if export_format == 'csv':
+                import csv
+
                 # Exporta para CSV
                 output_path = f"output-{file_base_name}.csv"
                 print("Exportando para CSV...")
@@ -101,9 +395,8 @@ def main():
                     # Primeira linha com o código completo
                     csvwriter.writerow([code, "", "", ""])
 
-                    # Tokens, tipos e linhas
-                    for lexeme, token, line in tokens:
-                        csvwriter.writerow(["", lexeme, token.type.name, line])
+                    # Tokens, tipos e linhas da análise exibida acima
+                    csvwriter.writerows(["", lexeme, name, line] for lexeme, name, line in token_table)
 
                 print(f"\nA análise foi exportada com sucesso para '{os.path.abspath(output_path)}'.")
 
@@ -15,6 +15,8 @@ Classes:
     - TestSymbolTable: Testa a funcionalidade da tabela de símbolos.
 """
 
+import contextlib
+import io
 import unittest
 import re
 from analyzer.analyzer import LexicalAnalyzer, SymbolTable, Token, TokenType
@@ -127,6 +129,28 @@ class TestLexicalAnalyzer(unittest.TestCase):
         self.assertNotIn("{", [lexeme for lexeme, _ in tokens])
         self.assertNotIn("}", [lexeme for lexeme, _ in tokens])
 
+    def test_classify_index(self):
+        """Teste: O índice de classificação respeita a ordem de prioridade de `tokens`."""
+        self.assertIs(self.analyzer.classify("div").type, Token.SDIV)
+        self.assertIs(self.analyzer.classify("Contador").type, Token.SIDENTIFICADOR)
+        self.assertIsNone(self.analyzer.classify("@"))
+
+        self.analyzer.tokens.insert(0, Token(r"^d\w*$", Token.SIDENTIFICADOR, use_regex=True))
+        self.analyzer.build_index()
+        self.assertIs(self.analyzer.classify("div").type, Token.SIDENTIFICADOR)
+
+    def test_shared_token_table(self):
+        """Teste: Cada analisador recebe uma cópia da tabela padrão; alterá-la não afeta os demais."""
+        other = LexicalAnalyzer()
+        self.assertIsNot(self.analyzer.tokens, other.tokens)
+        self.assertIs(self.analyzer.tokens[0], other.tokens[0])
+        fingerprint = other.fingerprint()
+
+        self.analyzer.tokens.insert(0, Token(r"^d\w*$", Token.SIDENTIFICADOR, use_regex=True))
+        self.assertNotEqual(self.analyzer.ensure_index(), fingerprint)
+        self.assertEqual(other.ensure_index(), fingerprint)
+        self.assertIs(other.classify("div").type, Token.SDIV)
+
     def test_unknown_token(self):
         """Teste: Verifica que tokens desconhecidos não são reconhecidos."""
         text = "@ # $ %"
@@ -182,6 +206,60 @@ class TestSymbolTable(unittest.TestCase):
         self.assertEqual(len(self.symbol_table.symbols), 1000)
         self.assertEqual(self.symbol_table.get_symbol("var999"), Token.SINT)
 
+    def test_conflicts_are_diagnostics(self):
+        """Teste: Conflitos são retornados e registrados como diagnósticos, sem impressão."""
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            self.assertTrue(self.symbol_table.add_symbol("var1", Token.SINT))
+            self.assertFalse(self.symbol_table.add_symbol("var1", Token.SFLOAT))
+            self.assertFalse(self.symbol_table.update_symbol("var2", Token.SINT))
+        self.assertEqual(output.getvalue(), "")
+        self.assertEqual([diagnostic.code for diagnostic in self.symbol_table.diagnostics],
+                         ["duplicate-symbol", "missing-symbol"])
+
+    def test_scopes(self):
+        """Teste: Símbolos de um escopo interno escondem os externos e somem ao fechá-lo."""
+        self.symbol_table.add_symbol("x", Token.SINT)
+        self.symbol_table.push_scope("Rotina")
+        self.assertTrue(self.symbol_table.add_symbol("x", Token.SCHAR))
+        self.symbol_table.add_symbol("y", Token.SINT)
+        self.assertEqual(self.symbol_table.get_symbol("x"), Token.SCHAR)
+        self.assertEqual(self.symbol_table.depth, 1)
+        self.assertEqual(self.symbol_table.pop_scope(), ("Rotina", {"x": Token.SCHAR, "y": Token.SINT}))
+        self.assertEqual(self.symbol_table.get_symbol("x"), Token.SINT)
+        self.assertIsNone(self.symbol_table.get_symbol("y"))
+        with self.assertRaises(IndexError):
+            self.symbol_table.pop_scope()
+
+    def test_populate(self):
+        """Teste: `populate` declara variáveis, parâmetros e rotinas em seus escopos e aponta usos indevidos."""
+        code = (
+            "program Teste;\n"
+            "var\n"
+            "    int a, b;\n"
+            "    char a;\n"
+            "function Dobro(int x): int;\n"
+            "begin\n"
+            "    if x > 0 then begin Dobro := x * 2 end;\n"
+            "end;\n"
+            "begin\n"
+            "    a := Dobro(b) + c;\n"
+            "end.\n"
+        )
+        analyzer = LexicalAnalyzer()
+        for tokens in (analyzer.tokenize(code), analyzer.scan_stream(code)):
+            table = SymbolTable()
+            self.assertEqual(table.populate(tokens), 5)
+            self.assertEqual(table.symbols, {"Teste": Token.SPROGRAM})
+            self.assertEqual(table.closed_scopes, [
+                ("Dobro", {"x": Token.SINT}),
+                ("Teste", {"a": Token.SINT, "b": Token.SINT, "Dobro": Token.SFUNCTION}),
+            ])
+            self.assertEqual([(diagnostic.code, diagnostic.line) for diagnostic in table.diagnostics],
+                             [("duplicate-symbol", 4), ("undeclared-symbol", 10)])
+        self.assertEqual(table.diagnostics[1].column, 21)
+        self.assertEqual(table.get_site("Teste"), (1, 9))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,132 @@
+"""
+Módulo de Testes da Análise em Lote
+
+Este módulo verifica a função `tokenize_many`, garantindo que os resultados sigam a ordem dos caminhos,
+sejam idênticos à análise individual de cada arquivo e que falhas fiquem isoladas no arquivo afetado,
+e verifica que `LexicalAnalyzer.tokenize_parallel` produz a mesma saída e os mesmos diagnósticos
+que `tokenize`, com qualquer política de erros.
+
+Classes:
+    - TestBatch: Testa a análise em lote e a expansão de caminhos.
+    - TestTokenizeParallel: Testes diferenciais entre a análise em segmentos paralelos e `tokenize`.
+"""
+
+import glob
+import os
+import random
+import tempfile
+import unittest
+from analyzer.analyzer import LexicalAnalyzer
+from analyzer.batch import BatchSummary, expand_paths, tokenize_many
+from analyzer.diagnostics import LexicalError
+from analyzer.spec import LPD_CASELESS
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TestBatch(unittest.TestCase):
+    """Testes de `tokenize_many` e `expand_paths`."""
+
+    def setUp(self):
+        """Inicializa o analisador léxico e a lista de exemplos antes de cada teste."""
+        self.analyzer = LexicalAnalyzer()
+        self.samples = sorted(glob.glob(os.path.join(ROOT, "codigo*.lpd")))
+
+    def test_expand_paths(self):
+        """Teste: Diretórios e padrões glob são expandidos sem repetições."""
+        paths = expand_paths([ROOT, os.path.join(ROOT, "codigo*.lpd")])
+        self.assertEqual(paths, [os.path.normpath(path) for path in self.samples])
+
+    def test_results_in_order_with_failure(self):
+        """Teste: Os resultados seguem a ordem de entrada e um arquivo inexistente não interrompe o lote."""
+        paths = self.samples[:2] + [os.path.join(ROOT, "inexistente.lpd")] + self.samples[2:]
+        for workers in (1, 2):
+            summary = BatchSummary()
+            results = list(tokenize_many(paths, workers=workers, analyzer=self.analyzer))
+            for result in results:
+                summary.add(result)
+
+            self.assertEqual([result.path for result in results], paths)
+            self.assertFalse(results[2].ok)
+            for result in results[:2] + results[3:]:
+                self.assertEqual(result.tokens, self.analyzer.tokenize_file(result.path, mmap=False))
+            self.assertEqual((summary.files, summary.failed), (len(paths), 1))
+
+
+    def test_dialect(self):
+        """Teste: Os processos do pool analisam com o mesmo dialeto do analisador informado."""
+        analyzer = LexicalAnalyzer(spec=LPD_CASELESS)
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "maiusculas.lpd")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write("PROGRAM Teste; BEGIN End.\n")
+        results = list(tokenize_many(self.samples + [path], workers=2, analyzer=analyzer))
+        for result in results:
+            self.assertEqual(result.tokens, analyzer.tokenize_file(result.path, mmap=False))
+        self.assertEqual([token.type.name for _, token, _ in results[-1].tokens],
+                         ["sprogram", "sidentificador", "sponto_virgula", "sbegin", "send", "sponto"])
+
+    def test_error_policy(self):
+        """Teste: Os processos do pool seguem a política de erros e devolvem os diagnósticos de cada arquivo."""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "erros.lpd")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write("A := 1 @ 2;\nB := ?;\n")
+        for policy in ("token", "abort"):
+            analyzer = LexicalAnalyzer(error_policy=policy)
+            expected = [list(tokenize_many([path], workers=1, analyzer=analyzer))[0]]
+            for workers in (1, 2):
+                results = list(tokenize_many([path], workers=workers, analyzer=analyzer))
+                self.assertEqual([(r.tokens, r.error, r.diagnostics) for r in results],
+                                 [(r.tokens, r.error, r.diagnostics) for r in expected], policy)
+            self.assertEqual(len(expected[0].diagnostics), 1 if policy == "abort" else 2)
+            self.assertEqual(expected[0].ok, policy == "token")
+
+
+class TestTokenizeParallel(unittest.TestCase):
+    """Testes diferenciais entre `tokenize_parallel` e `tokenize`."""
+
+    def setUp(self):
+        """Inicializa o analisador léxico antes de cada teste."""
+        self.analyzer = LexicalAnalyzer()
+
+    def test_samples(self):
+        """Teste: Os exemplos divididos em segmentos pequenos produzem a mesma saída que `tokenize`."""
+        for path in sorted(glob.glob(os.path.join(ROOT, "codigo*.lpd"))):
+            with open(path, "r", encoding="utf-8") as file:
+                code = file.read()
+            self.assertEqual(self.analyzer.tokenize_parallel(code, workers=2, segment_size=64), self.analyzer.tokenize(code), path)
+
+    def test_random_inputs(self):
+        """Teste: Entradas aleatórias com comentários e literais produzem a mesma saída que `tokenize`."""
+        pieces = ["A", "div", "12", " ", "\n", "\r\n", ":=", "<>", "{", "}", "{ x\n y }", "'a'", "\"b\"", "'", ";", "é"]
+        rng = random.Random(0)
+        for _ in range(10):
+            text = "".join(rng.choice(pieces) for _ in range(rng.randint(50, 400)))
+            self.assertEqual(self.analyzer.tokenize_parallel(text, workers=2, segment_size=16), self.analyzer.tokenize(text), repr(text))
+
+    def test_error_policies(self):
+        """Teste: Os tokens de erro e os diagnósticos dos segmentos são idênticos aos de `tokenize`."""
+        text = "".join(f"A{number} := {number} @ 1; {{ x\n }} B := ?\n" for number in range(40)) + "C := 1 {"
+        for policy, max_errors in (("skip", 1), ("token", 1), ("abort", 1), ("abort", 30)):
+            analyzer = LexicalAnalyzer(error_policy=policy, max_errors=max_errors, max_diagnostics=50)
+            if policy == "abort":
+                with self.assertRaises(LexicalError) as expected:
+                    analyzer.tokenize(text)
+                with self.assertRaises(LexicalError) as parallel:
+                    analyzer.tokenize_parallel(text, workers=2, segment_size=64)
+                self.assertEqual((parallel.exception.diagnostics, parallel.exception.count),
+                                 (expected.exception.diagnostics, expected.exception.count))
+                continue
+            expected = analyzer.tokenize(text)
+            diagnostics = (list(analyzer.diagnostics), analyzer.diagnostics.count, analyzer.unterminated_comment)
+            analyzer.diagnostics.add("stale", "Diagnóstico de uma análise anterior.")
+            self.assertEqual(analyzer.tokenize_parallel(text, workers=2, segment_size=64), expected, policy)
+            self.assertEqual((list(analyzer.diagnostics), analyzer.diagnostics.count, analyzer.unterminated_comment),
+                             diagnostics, policy)
+
+
+if __name__ == '__main__':
+    unittest.main()
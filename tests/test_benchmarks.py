@@ -0,0 +1,109 @@
+"""
+Módulo de Testes da Suíte de Benchmarks
+
+Este módulo verifica o gerador de corpus sintético, a comparação de resultados da suíte de
+benchmarks e o fuzzing diferencial, sem executar as medições.
+
+Classes:
+    - TestCorpus: Testa o determinismo e a validade léxica dos programas gerados.
+    - TestCompare: Testa a detecção de regressões.
+    - TestFuzz: Testa o fuzzing diferencial e a redução das entradas divergentes.
+"""
+
+import random
+import unittest
+from analyzer.analyzer import LexicalAnalyzer, Token
+from benchmarks.corpus import SHAPES, generate_corpus, generate_program, parse_size
+from benchmarks.fuzz import fuzz, grammar_text, load_engine, minimize, random_text
+from benchmarks.suite import compare
+
+
+class TestCorpus(unittest.TestCase):
+    """Testes do gerador de corpus."""
+
+    def setUp(self):
+        """Inicializa o analisador léxico antes de cada teste."""
+        self.analyzer = LexicalAnalyzer()
+
+    def test_shapes(self):
+        """Teste: Cada perfil gera um corpus determinístico, do tamanho pedido e com a mesma saída em `scan` e `tokenize`."""
+        for shape in SHAPES:
+            text = generate_corpus(20000, shape, seed=1)
+            self.assertGreaterEqual(len(text), 20000)
+            self.assertEqual(text, generate_corpus(20000, shape, seed=1))
+            tokens = self.analyzer.scan(text)
+            self.assertEqual(tokens, self.analyzer.tokenize(text), shape)
+            self.assertEqual(tokens[0][1].type, Token.SPROGRAM)
+
+    def test_profiles_differ(self):
+        """Teste: Os perfis enfatizam comentários e literais de texto conforme o nome."""
+        comments = generate_program(100, "comments")
+        strings = generate_program(100, "strings")
+        self.assertGreater(comments.count("{"), generate_program(100, "operators").count("{"))
+        texts = [lexeme for lexeme, token, _ in self.analyzer.scan(strings) if token.type is Token.STEXTO]
+        self.assertTrue(texts and max(map(len, texts)) > 40)
+
+    def test_parse_size(self):
+        """Teste: Tamanhos com sufixo são convertidos em potências de 1024."""
+        self.assertEqual(parse_size("512"), 512)
+        self.assertEqual(parse_size("2K"), 2048)
+        self.assertEqual(parse_size("1.5MB"), 3 << 19)
+
+
+class TestCompare(unittest.TestCase):
+    """Testes da comparação entre execuções."""
+
+    def test_regressions(self):
+        """Teste: Quedas de vazão e aumentos de memória acima do limite são reportados."""
+        baseline = {"results": [
+            {"shape": "mixed", "stage": "scan", "mb_per_second": 10.0, "peak_kb": 100.0},
+            {"shape": "mixed", "stage": "tokenize", "mb_per_second": 10.0, "peak_kb": 100.0},
+        ]}
+        current = {"results": [
+            {"shape": "mixed", "stage": "scan", "mb_per_second": 9.5, "peak_kb": 105.0},
+            {"shape": "mixed", "stage": "tokenize", "mb_per_second": 8.0, "peak_kb": 150.0},
+            {"shape": "strings", "stage": "scan", "mb_per_second": 1.0, "peak_kb": 1.0},
+        ]}
+        regressions = compare(current, baseline, threshold=0.1)
+        self.assertEqual(len(regressions), 2)
+        self.assertTrue(all(regression.startswith("mixed/tokenize") for regression in regressions))
+
+
+
+class TestFuzz(unittest.TestCase):
+    """Testes do fuzzing diferencial."""
+
+    def test_generators(self):
+        """Teste: Os geradores são determinísticos para uma mesma semente."""
+        self.assertEqual(random_text(random.Random(3), 80), random_text(random.Random(3), 80))
+        self.assertEqual(grammar_text(random.Random(3), 20), grammar_text(random.Random(3), 20))
+        self.assertEqual(len(random_text(random.Random(3), 80)), 80)
+
+    def test_engines_agree(self):
+        """Teste: Os motores alternativos produzem o mesmo resultado que `tokenize`, com os diagnósticos."""
+        count, failures = fuzz(seconds=60, cases=300)
+        self.assertEqual(count, 300)
+        self.assertEqual([str(failure) for failure in failures], [])
+
+    def test_minimize(self):
+        """Teste: A redução mantém apenas os caracteres necessários à falha."""
+        text = "program p;\nbegin a := @b;\n{ aberto\nend."
+        self.assertEqual(minimize(text, lambda candidate: "@" in candidate and "{" in candidate), "@{")
+
+    def test_divergence(self):
+        """Teste: Um motor que separa `<>` em dois lexemas é detectado e reduzido a `<>`."""
+        faulty = {"separado": lambda analyzer, text: analyzer.scan(text.replace("<>", "< >"))}
+        _, failures = fuzz(seconds=60, cases=200, engines=faulty, max_failures=2)
+        self.assertTrue(failures)
+        self.assertTrue(all(failure.names == ["separado"] and failure.minimized == "<>" for failure in failures))
+
+    def test_load_engine(self):
+        """Teste: Motores externos são carregados por `modulo:funcao`."""
+        engine = load_engine("benchmarks.samples:load_samples")
+        self.assertTrue(callable(engine))
+        with self.assertRaises(ValueError):
+            load_engine("benchmarks.samples")
+
+
+if __name__ == '__main__':
+    unittest.main()
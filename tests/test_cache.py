@@ -0,0 +1,94 @@
+"""
+Módulo de Testes do Cache de Tokens
+
+Este módulo verifica a classe `TokenCache`, garantindo que os resultados em cache sejam idênticos
+aos de `LexicalAnalyzer.scan`, que a política LRU e os contadores funcionem, que o armazenamento em
+disco sobreviva a uma nova instância, que alterações na tabela de tokens invalidem o cache e que
+a política de erros léxicos e os diagnósticos sejam respeitados.
+
+Classes:
+    - TestTokenCache: Testa o cache em memória e em disco.
+"""
+
+import glob
+import os
+import tempfile
+import unittest
+from analyzer.analyzer import LexicalAnalyzer, Token
+from analyzer.cache import TokenCache, pack_tokens, unpack_tokens
+from analyzer.diagnostics import LexicalError
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TestTokenCache(unittest.TestCase):
+    """Testes de `TokenCache`."""
+
+    def setUp(self):
+        """Inicializa o analisador léxico e a lista de exemplos antes de cada teste."""
+        self.analyzer = LexicalAnalyzer()
+        self.samples = sorted(glob.glob(os.path.join(ROOT, "codigo*.lpd")))
+
+    def test_hits_misses_and_evictions(self):
+        """Teste: Os contadores refletem acertos, falhas e descartes da memória LRU."""
+        cache = TokenCache(self.analyzer, max_entries=2)
+        texts = ["A := 1;", "B := 2;", "C := 3;"]
+        for text in texts:
+            self.assertEqual(cache.tokenize(text), self.analyzer.scan(text))
+        self.assertEqual(cache.tokenize(texts[2]), self.analyzer.scan(texts[2]))
+        self.assertEqual(cache.tokenize(texts[0]), self.analyzer.scan(texts[0]))
+        self.assertEqual(cache.stats(), {"hits": 1, "disk_hits": 0, "misses": 4, "evictions": 2, "entries": 2})
+
+    def test_returns_copies(self):
+        """Teste: Alterar a lista devolvida não altera o resultado em cache."""
+        cache = TokenCache(self.analyzer)
+        cache.tokenize("A := 1;").clear()
+        self.assertEqual(cache.tokenize("A := 1;"), self.analyzer.scan("A := 1;"))
+
+    def test_disk_round_trip(self):
+        """Teste: Uma nova instância reaproveita os resultados gravados em disco sem analisar os arquivos."""
+        with tempfile.TemporaryDirectory() as directory:
+            cold = TokenCache(self.analyzer, directory=directory)
+            expected = [cold.tokenize_file(path) for path in self.samples]
+
+            warm = TokenCache(self.analyzer, directory=directory)
+            self.analyzer.scanner.scan_buffer = None
+            self.assertEqual([warm.tokenize_file(path) for path in self.samples], expected)
+            self.assertEqual(warm.disk_hits, len(self.samples))
+            self.assertEqual(warm.misses, 0)
+
+    def test_pack_unpack(self):
+        """Teste: O formato binário preserva lexemas não ASCII, tokens e linhas."""
+        tokens = self.analyzer.scan("program Ação;\nA := 'é' + 12;\n\n\"ü\"")
+        self.assertEqual(unpack_tokens(pack_tokens(tokens, self.analyzer.tokens), self.analyzer.tokens), tokens)
+
+    def test_invalidated_by_token_table(self):
+        """Teste: Alterar `LexicalAnalyzer.tokens` invalida os resultados anteriores."""
+        cache = TokenCache(self.analyzer)
+        cache.tokenize("x := 1;")
+        self.analyzer.tokens.insert(0, Token("x", Token.SPROGRAM))
+        self.assertEqual(cache.tokenize("x := 1;")[0][1].type, Token.SPROGRAM)
+        self.assertEqual(cache.misses, 2)
+
+    def test_error_policies(self):
+        """Teste: Os diagnósticos e o token de erro são restaurados, e cada política tem suas próprias entradas."""
+        text = "x := 1 @ 2;\ny := ? {"
+        with tempfile.TemporaryDirectory() as directory:
+            skip = TokenCache(self.analyzer, directory=directory)
+            skip.tokenize(text)
+            analyzer = LexicalAnalyzer(error_policy="token")
+            expected = analyzer.scan(text)
+            diagnostics = list(analyzer.diagnostics)
+            for cache in (TokenCache(analyzer, directory=directory), TokenCache(analyzer, directory=directory)):
+                for _ in range(2):
+                    analyzer.diagnostics.clear()
+                    self.assertEqual(cache.tokenize(text), expected)
+                    self.assertEqual(list(analyzer.diagnostics), diagnostics)
+                    self.assertEqual(analyzer.unterminated_comment, (2, 8))
+            self.assertEqual(cache.disk_hits, 1)
+            with self.assertRaises(LexicalError):
+                TokenCache(LexicalAnalyzer(error_policy="abort"), directory=directory).tokenize(text)
+
+
+if __name__ == '__main__':
+    unittest.main()
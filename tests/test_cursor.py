@@ -0,0 +1,113 @@
+"""
+Módulo de Testes do Cursor de Tokens
+
+Este módulo verifica o `TokenCursor`: a antecipação, o consumo, a comparação de tipos por número, o
+recuo até uma marca e os limites do buffer circular, além de `LexicalAnalyzer.cursor`.
+
+Classes:
+    - TestTokenCursor: Testa o cursor sobre os tokens de um código fonte.
+"""
+
+import io
+import unittest
+from analyzer.analyzer import LexicalAnalyzer
+from analyzer.cursor import EOF, TokenCursor, UnexpectedToken
+from analyzer.tokens import Token, TokenType
+
+CODE = ("program Teste;\n"
+        "var a, b: int;\n"
+        "begin\n"
+        "  a := 1;\n"
+        "  if a > b then writed(a)\n"
+        "end.")
+
+
+class TestTokenCursor(unittest.TestCase):
+    """Testes de `TokenCursor`."""
+
+    def setUp(self):
+        """Configura o analisador e os tokens esperados."""
+        self.analyzer = LexicalAnalyzer()
+        self.tokens = self.analyzer.tokenize(CODE)
+
+    def test_sequence(self):
+        """Teste: `advance` produz os mesmos tokens de `tokenize` e retorna `None` no fim."""
+        cursor = self.analyzer.cursor(io.StringIO(CODE), chunk_size=7)
+        consumed = []
+        while not cursor.at_end:
+            consumed.append(cursor.advance())
+        self.assertEqual(consumed, self.tokens)
+        self.assertEqual(cursor.position, len(self.tokens))
+        self.assertIsNone(cursor.advance())
+        self.assertIsNone(cursor.peek())
+        self.assertEqual(cursor.kind(), EOF)
+
+    def test_peek(self):
+        """Teste: `peek` e `kind` consultam tokens à frente sem consumi-los."""
+        cursor = TokenCursor(self.tokens, lookahead=3, backtrack=0)
+        self.assertEqual(cursor.peek(2), self.tokens[2])
+        self.assertEqual([cursor.kind(k) for k in range(3)], [token.type.id for _, token, _ in self.tokens[:3]])
+        self.assertEqual(cursor.position, 0)
+        self.assertTrue(cursor.check(Token.SPROGRAM.id))
+        self.assertTrue(cursor.check(Token.SPONTO_VIRGULA.id, 2))
+        self.assertFalse(cursor.check(Token.SIDENTIFICADOR.id))
+        # A antecipação é limitada pelo tamanho do buffer.
+        with self.assertRaises(ValueError):
+            cursor.peek(64)
+
+    def test_expect(self):
+        """Teste: `accept` e `expect` consomem apenas o tipo informado, como objeto ou número."""
+        cursor = TokenCursor(self.tokens)
+        self.assertIsNone(cursor.accept(Token.SVAR.id))
+        self.assertEqual(cursor.expect(Token.SPROGRAM)[0], "program")
+        self.assertEqual(cursor.expect(Token.SIDENTIFICADOR.id)[0], "Teste")
+        self.assertEqual(cursor.accept(Token.SPONTO_VIRGULA.id)[2], 1)
+        with self.assertRaises(UnexpectedToken) as raised:
+            cursor.expect(Token.SBEGIN)
+        self.assertEqual((raised.exception.expected, raised.exception.line), (Token.SBEGIN.id, 2))
+        self.assertIn("sbegin", str(raised.exception))
+        # O token encontrado não é consumido.
+        self.assertEqual(cursor.expect(Token.SVAR)[0], "var")
+        with self.assertRaises(UnexpectedToken) as raised:
+            TokenCursor([]).expect(Token.SPONTO)
+        self.assertIsNone(raised.exception.found)
+
+    def test_backtracking(self):
+        """Teste: `reset` volta a uma marca dentro do recuo garantido e rejeita as que saíram do buffer."""
+        cursor = TokenCursor(iter(self.tokens), lookahead=2, backtrack=6)
+        mark = cursor.mark()
+        first = [cursor.advance() for _ in range(6)]
+        cursor.reset(mark)
+        self.assertEqual([cursor.advance() for _ in range(6)], first)
+        for _ in range(10):
+            cursor.advance()
+        with self.assertRaises(ValueError):
+            cursor.reset(mark)
+        later = cursor.mark()
+        token = cursor.peek()
+        cursor.advance()
+        cursor.reset(later)
+        self.assertEqual(cursor.advance(), token)
+
+    def test_bounded(self):
+        """Teste: O cursor lê da fonte apenas os tokens que cabem no buffer."""
+        source = iter(self.tokens * 100)
+        cursor = TokenCursor(source, lookahead=4, backtrack=4)
+        cursor.advance()
+        self.assertEqual(len(self.tokens) * 100 - len(list(source)), 4)
+
+    def test_validation(self):
+        """Teste: Antecipação nula e recuo negativo são rejeitados."""
+        with self.assertRaises(ValueError):
+            TokenCursor([], lookahead=0)
+        with self.assertRaises(ValueError):
+            TokenCursor([], backtrack=-1)
+
+    def test_type_ids(self):
+        """Teste: Cada tipo de token tem um número exclusivo."""
+        types = [value for value in vars(Token).values() if isinstance(value, TokenType)]
+        self.assertEqual(len({token_type.id for token_type in types}), len(types))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,157 @@
+"""
+Módulo de Testes dos Erros Léxicos
+
+Este módulo verifica o registro dos erros léxicos em `LexicalAnalyzer.diagnostics`: as posições
+dos lexemas desconhecidos, dos literais de texto e dos comentários não fechados, a equivalência
+entre os motores de análise, o limite do buffer e as políticas `"skip"`, `"token"` e `"abort"`.
+
+Classes:
+    - TestDiagnosticBuffer: Testa o buffer limitado de diagnósticos.
+    - TestLexicalErrors: Testa os erros registrados pela análise.
+"""
+
+import io
+import os
+import tempfile
+import unittest
+from analyzer.analyzer import LexicalAnalyzer
+from analyzer.diagnostics import Diagnostic, DiagnosticBuffer, LexicalError
+from analyzer.tokens import Token
+
+CODE = ("program Teste;\n"
+        "{ comentário de\n"
+        "  várias linhas } a := @b;\n"
+        "writec(\"sem fim);\n"
+        "c := 1 ? 2 { aberto\n"
+        "fim")
+
+EXPECTED = [
+    Diagnostic("unknown-lexeme", "Lexema desconhecido: '@'", 3, 24),
+    Diagnostic("unterminated-string", 'Literal de texto não fechado: "', 4, 8),
+    Diagnostic("unknown-lexeme", "Lexema desconhecido: '?'", 5, 8),
+    Diagnostic("unterminated-comment", "Comentário não fechado.", 5, 12),
+]
+
+
+def analyses(analyzer, text=CODE):
+    """Retorna o resultado de cada motor de análise e os diagnósticos registrados por ele."""
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, "erros.lpd")
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(text)
+    engines = {
+        "tokenize": lambda: analyzer.tokenize(text),
+        "scan": lambda: analyzer.scan(text),
+        "scan_stream": lambda: list(analyzer.scan_stream(text)),
+        "tokenize_file": lambda: analyzer.tokenize_file(path),
+        "iter_tokens": lambda: list(analyzer.iter_tokens(io.StringIO(text), chunk_size=5)),
+    }
+    results = {}
+    for name, engine in engines.items():
+        results[name] = engine(), list(analyzer.diagnostics)
+    os.remove(path)
+    os.rmdir(directory)
+    return results
+
+
+class TestDiagnosticBuffer(unittest.TestCase):
+    """Testes de `DiagnosticBuffer`."""
+
+    def test_limit(self):
+        """Teste: Além do limite, os erros são apenas contados."""
+        buffer = DiagnosticBuffer(limit=2)
+        for column in range(1, 5):
+            buffer.add("unknown-lexeme", "x", 1, column)
+        self.assertEqual(len(buffer), 2)
+        self.assertEqual(buffer.count, 4)
+        self.assertEqual(buffer.dropped, 2)
+        buffer.clear()
+        self.assertEqual((len(buffer), buffer.count), (0, 0))
+
+    def test_validation(self):
+        """Teste: Políticas e limites inválidos são rejeitados."""
+        with self.assertRaises(ValueError):
+            DiagnosticBuffer("ignore")
+        with self.assertRaises(ValueError):
+            DiagnosticBuffer(limit=0)
+        with self.assertRaises(ValueError):
+            LexicalAnalyzer(error_policy="abort", max_errors=0)
+
+
+class TestLexicalErrors(unittest.TestCase):
+    """Testes dos erros léxicos registrados pelo `LexicalAnalyzer`."""
+
+    def test_positions(self):
+        """Teste: Todos os motores registram os mesmos erros, com linha e coluna."""
+        for name, (_, diagnostics) in analyses(LexicalAnalyzer()).items():
+            with self.subTest(engine=name):
+                self.assertEqual(diagnostics, EXPECTED)
+
+    def test_skip(self):
+        """Teste: Com a política padrão, o resultado não muda e os lexemas desconhecidos são descartados."""
+        results = analyses(LexicalAnalyzer())
+        expected = results["tokenize"][0]
+        self.assertNotIn(Token.SERRO, [token.type for _, token, _ in expected])
+        for name, (tokens, _) in results.items():
+            with self.subTest(engine=name):
+                self.assertEqual(tokens, expected)
+
+    def test_error_tokens(self):
+        """Teste: Com a política `"token"`, os lexemas desconhecidos são emitidos como `serro`, em ordem."""
+        results = analyses(LexicalAnalyzer(error_policy="token"))
+        expected = results["tokenize"][0]
+        errors = [(lexeme, line) for lexeme, token, line in expected if token.type is Token.SERRO]
+        self.assertEqual(errors, [("@", 3), ('"', 4), ("?", 5)])
+        for name, (tokens, diagnostics) in results.items():
+            with self.subTest(engine=name):
+                self.assertEqual(tokens, expected)
+                self.assertEqual(diagnostics, EXPECTED)
+
+    def test_abort(self):
+        """Teste: Com a política `"abort"`, a análise é interrompida no N-ésimo erro, já com as colunas."""
+        analyzer = LexicalAnalyzer(error_policy="abort", max_errors=2)
+        for engine in (analyzer.tokenize, analyzer.scan, analyzer.scan_stream):
+            with self.subTest(engine=engine.__name__):
+                with self.assertRaises(LexicalError) as raised:
+                    engine(CODE)
+                self.assertEqual(raised.exception.diagnostics, EXPECTED[:2])
+                self.assertEqual(raised.exception.count, 2)
+        # O comentário não fechado também conta como erro.
+        closed = CODE.replace("{ aberto", "")
+        self.assertEqual(LexicalAnalyzer(error_policy="abort", max_errors=4).scan(closed), LexicalAnalyzer().scan(closed))
+        with self.assertRaises(LexicalError):
+            LexicalAnalyzer(error_policy="abort", max_errors=4).scan(CODE)
+
+    def test_bounded(self):
+        """Teste: O buffer guarda no máximo `max_diagnostics` erros, com as colunas calculadas."""
+        analyzer = LexicalAnalyzer(max_diagnostics=3)
+        analyzer.scan("a := @;\n" * 10)
+        self.assertEqual(len(analyzer.diagnostics), 3)
+        self.assertEqual(analyzer.diagnostics.count, 10)
+        self.assertEqual([(d.line, d.column) for d in analyzer.diagnostics], [(1, 6), (2, 6), (3, 6)])
+
+    def test_cleared(self):
+        """Teste: Cada análise começa com o buffer vazio; entradas sem erros não registram diagnósticos."""
+        analyzer = LexicalAnalyzer()
+        analyzer.scan(CODE)
+        analyzer.scan("program Teste; begin a := 1 end.")
+        self.assertEqual(list(analyzer.diagnostics), [])
+
+    def test_non_ascii_block(self):
+        """Teste: Um bloco varrido novamente como texto não duplica os erros do mapeamento em memória."""
+        # O comentário faz o bloco ser varrido primeiro como bytes, até o lexema não ASCII.
+        text = "a := @; { é }\nação := 1 ? 2;\n"
+        with tempfile.NamedTemporaryFile("w", suffix=".lpd", encoding="utf-8", delete=False) as file:
+            file.write(text)
+        self.addCleanup(os.remove, file.name)
+        analyzer = LexicalAnalyzer()
+        analyzer.tokenize_file(file.name)
+        from_file = list(analyzer.diagnostics)
+        analyzer.tokenize(text)
+        self.assertEqual(from_file, list(analyzer.diagnostics))
+        self.assertEqual([(d.message, d.line, d.column) for d in from_file],
+                         [("Lexema desconhecido: '@'", 1, 6), ("Lexema desconhecido: '?'", 2, 11)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+"""
+Módulo de Testes da Exportação
+
+Este módulo verifica que os formatos de `analyzer.export` preservam os tokens de
+`LexicalAnalyzer.tokenize` e só incluem o código fonte completo quando pedido.
+
+Classes:
+    - TestExport: Lê de volta cada formato exportado e compara com a análise de referência.
+"""
+
+import csv
+import io
+import json
+import os
+import tempfile
+import unittest
+from analyzer.analyzer import LexicalAnalyzer
+from analyzer.export import export_file, read_binary, write_binary
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TestExport(unittest.TestCase):
+    """Testes de `export_file` e dos formatos de exportação."""
+
+    def setUp(self):
+        """Inicializa o analisador e os tokens de referência de um exemplo."""
+        self.analyzer = LexicalAnalyzer()
+        self.path = os.path.join(ROOT, "codigo1.lpd")
+        with open(self.path, "r", encoding="utf-8") as file:
+            self.code = file.read()
+        self.expected = [(lexeme, token.type.name, line) for lexeme, token, line in self.analyzer.tokenize(self.code)]
+        self.directory = tempfile.TemporaryDirectory()
+        self.output = os.path.join(self.directory.name, "saida")
+
+    def tearDown(self):
+        """Remove o diretório temporário."""
+        self.directory.cleanup()
+
+    def test_csv(self):
+        """Teste: O CSV contém um token por linha e, por padrão, não inclui o código fonte."""
+        self.assertEqual(export_file(self.analyzer, self.path, self.output, "csv"), len(self.expected))
+        with open(self.output, newline="", encoding="utf-8") as file:
+            rows = list(csv.reader(file))
+        self.assertEqual(rows[0], ["Token", "Tipo", "Linha"])
+        self.assertEqual([(lexeme, name, int(line)) for lexeme, name, line in rows[1:]], self.expected)
+
+        export_file(self.analyzer, self.path, self.output, "csv", include_source=True)
+        with open(self.output, newline="", encoding="utf-8") as file:
+            rows = list(csv.reader(file))
+        self.assertEqual(rows[1][0], self.code)
+
+    def test_jsonl(self):
+        """Teste: Cada linha do JSON Lines é um objeto com lexema, tipo e linha."""
+        export_file(self.analyzer, self.path, self.output, "jsonl")
+        with open(self.output, encoding="utf-8") as file:
+            objects = [json.loads(line) for line in file]
+        self.assertEqual([(o["lexeme"], o["type"], o["line"]) for o in objects], self.expected)
+
+    def test_binary(self):
+        """Teste: O formato binário é lido de volta sem perdas, inclusive lexemas não ASCII e linhas distantes."""
+        export_file(self.analyzer, self.path, self.output, "binary", include_source=True)
+        with open(self.output, "rb") as file:
+            self.assertEqual(read_binary(file), (self.code, self.expected))
+
+        tokens = self.analyzer.tokenize("'é' \"ção\"" + "\n" * 1000 + "fim")
+        buffer = io.BytesIO()
+        write_binary(tokens, buffer, self.analyzer.tokens)
+        buffer.seek(0)
+        self.assertEqual(read_binary(buffer), (None, [(lexeme, token.type.name, line) for lexeme, token, line in tokens]))
+
+    def test_invalid_format(self):
+        """Teste: Um formato desconhecido é rejeitado."""
+        with self.assertRaises(ValueError):
+            export_file(self.analyzer, self.path, self.output, "xml")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+"""
+Módulo de Testes da Análise Incremental
+
+Este módulo verifica que `IncrementalTokenizer` mantém, após cada edição, os mesmos tokens que
+`LexicalAnalyzer.tokenize` produziria sobre o buffer completo, e que a diferença retornada descreve
+corretamente os tokens alterados.
+
+Classes:
+    - TestIncrementalTokenizer: Testa as edições incrementais contra a implementação de referência.
+"""
+
+import random
+import unittest
+from analyzer.analyzer import LexicalAnalyzer
+from analyzer.incremental import IncrementalTokenizer
+
+
+class TestIncrementalTokenizer(unittest.TestCase):
+    """Testes diferenciais entre `IncrementalTokenizer` e `tokenize`."""
+
+    def setUp(self):
+        """Inicializa o analisador léxico antes de cada teste."""
+        self.analyzer = LexicalAnalyzer()
+
+    def assertDiff(self, old, new, diff):
+        """Verifica que `new` é `old` com os tokens removidos substituídos pelos inseridos."""
+        before = [token for token in old if token[2] < diff.first_line]
+        self.assertEqual(new[:len(before)], before)
+        self.assertEqual(new[len(before):len(before) + len(diff.inserted)], diff.inserted)
+        self.assertEqual(old[len(before):len(before) + len(diff.removed)], diff.removed)
+        after = [(lexeme, token, line + diff.line_delta) for lexeme, token, line in old[len(before) + len(diff.removed):]]
+        self.assertEqual(new[len(before) + len(diff.inserted):], after)
+
+    def test_open_and_close_comment(self):
+        """Teste: Abrir e fechar um comentário de várias linhas reanalisa as linhas afetadas."""
+        text = "program A;\nvar int B;\nB := 1;\nwrited(B);\n"
+        tokenizer = IncrementalTokenizer(text, self.analyzer)
+
+        old = tokenizer.tokens()
+        diff = tokenizer.edit((1, 0), (1, 0), "{ ")
+        self.assertEqual(tokenizer.tokens(), self.analyzer.tokenize(tokenizer.text))
+        self.assertDiff(old, tokenizer.tokens(), diff)
+
+        old = tokenizer.tokens()
+        diff = tokenizer.edit((2, 7), (2, 7), " }")
+        self.assertEqual(tokenizer.text, "program A;\n{ var int B;\nB := 1; }\nwrited(B);\n")
+        self.assertEqual(tokenizer.tokens(), self.analyzer.tokenize(tokenizer.text))
+        self.assertDiff(old, tokenizer.tokens(), diff)
+        self.assertEqual(diff.line_delta, 0)
+
+    def test_random_edits(self):
+        """Teste: Sequências de edições aleatórias mantêm os tokens iguais aos de `tokenize`."""
+        pieces = ["A", "div", "1", " ", "\n", "\r\n", ":=", "{", "}", "{ x\n y }", "'a'", "\"b\"", "'", ";", "é"]
+        rng = random.Random(0)
+        for _ in range(300):
+            tokenizer = IncrementalTokenizer("".join(rng.choice(pieces) for _ in range(rng.randint(0, 30))), self.analyzer)
+            for _ in range(5):
+                lines = tokenizer.text.splitlines(keepends=True) or [""]
+                line = rng.randrange(len(lines))
+                content = lines[line].rstrip("\r\n")
+                start = rng.randint(0, len(content))
+                end_line = min(len(lines) - 1, line + rng.randint(0, 1))
+                end_content = lines[end_line].rstrip("\r\n")
+                end = rng.randint(start if end_line == line else 0, len(end_content))
+
+                old = tokenizer.tokens()
+                diff = tokenizer.edit((line, start), (end_line, end), "".join(rng.choice(pieces) for _ in range(rng.randint(0, 3))))
+                new = tokenizer.tokens()
+                self.assertEqual(new, self.analyzer.tokenize(tokenizer.text))
+                self.assertDiff(old, new, diff)
+
+
+if __name__ == '__main__':
+    unittest.main()
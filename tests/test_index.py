@@ -0,0 +1,117 @@
+"""
+Módulo de Testes do Índice de Identificadores
+
+Este módulo verifica o `IdentifierIndex`: as ocorrências com linha e coluna, as consultas exatas e
+por prefixo, a atualização incremental, a persistência com compactação e o descarte de índices
+inválidos.
+
+Classes:
+    - TestIdentifierIndex: Testa o índice sobre uma árvore temporária de arquivos `.lpd`.
+"""
+
+import os
+import tempfile
+import unittest
+from analyzer.analyzer import LexicalAnalyzer
+from analyzer.index import IdentifierIndex
+from analyzer.spec import DIALECTS
+from analyzer.tokens import Token
+
+MAIN = "program Principal;\nvar Contador, Conta: int;\nbegin\n  Contador := Contador + Conta\nend."
+LIBRARY = "program Biblioteca;\nvar Passo: int;\nbegin { Contador } Passo := 2 end."
+
+
+class TestIdentifierIndex(unittest.TestCase):
+    """Testes de `IdentifierIndex`."""
+
+    def setUp(self):
+        """Cria uma árvore com dois arquivos `.lpd` e indexa-a."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.root = self.directory.name
+        self.main = self.write("principal.lpd", MAIN)
+        self.library = self.write("biblioteca.lpd", LIBRARY)
+        self.index_path = os.path.join(self.root, "indice.lpdx")
+        self.index = IdentifierIndex(self.index_path)
+        self.index.refresh([self.root])
+
+    def write(self, name, text):
+        """Grava um arquivo da árvore e retorna seu caminho."""
+        path = os.path.normpath(os.path.join(self.root, name))
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(text)
+        return path
+
+    def test_find(self):
+        """Teste: As ocorrências têm a linha e a coluna de `TokenStream.span`, e comentários são ignorados."""
+        self.assertEqual(self.index.find("Contador"), [(self.main, 2, 5), (self.main, 4, 3), (self.main, 4, 15)])
+        self.assertEqual(self.index.files("Passo"), [self.library])
+        self.assertEqual(self.index.find("Inexistente"), [])
+        stream = LexicalAnalyzer().scan_stream(MAIN)
+        expected = sorted((self.main, span.line, span.column) for span, (_, token, _) in zip(stream.spans(), stream)
+                          if token.type is Token.SIDENTIFICADOR)
+        found = sorted(occurrence for name in self.index.identifiers() for occurrence in self.index.find(name)
+                       if occurrence[0] == self.main)
+        self.assertEqual(found, expected)
+
+    def test_prefix(self):
+        """Teste: As consultas por prefixo retornam os identificadores em ordem."""
+        self.assertEqual(self.index.identifiers("Cont"), ["Conta", "Contador"])
+        self.assertEqual(self.index.identifiers("Cont", limit=1), ["Conta"])
+        self.assertEqual(list(self.index.search("Pa")), ["Passo"])
+        self.assertEqual(self.index.identifiers("Z"), [])
+
+    def test_incremental(self):
+        """Teste: Apenas os arquivos alterados são reanalisados, e as ocorrências antigas deixam de aparecer."""
+        self.assertFalse(self.index.refresh([self.root]))
+        self.write("biblioteca.lpd", LIBRARY.replace("Passo", "Contador"))
+        update = self.index.refresh([self.root])
+        self.assertEqual(update.modified, [self.library])
+        self.assertEqual(self.index.files("Contador"), sorted([self.main, self.library]))
+        self.assertEqual(self.index.identifiers("Pa"), [])
+        os.remove(self.main)
+        self.assertEqual(self.index.refresh([self.root]).removed, [self.main])
+        self.assertEqual(self.index.find("Conta"), [])
+        self.assertEqual(len(self.index), 1)
+
+    def test_persistence(self):
+        """Teste: O índice gravado é reaberto com as mesmas ocorrências, inclusive após a compactação."""
+        self.index.save()
+        reopened = IdentifierIndex(self.index_path)
+        self.assertFalse(reopened.discarded)
+        for name in self.index.identifiers():
+            self.assertEqual(reopened.find(name), self.index.find(name))
+
+        self.write("biblioteca.lpd", LIBRARY + "\nNovo := 1;")
+        self.write("extra.lpd", "program Extra; begin Contador := 1 end.")
+        reopened.refresh([self.root])
+        reopened.save()
+        self.assertEqual(reopened.stats()["removed"], 0)
+        again = IdentifierIndex(self.index_path)
+        self.assertEqual(again.find("Novo"), [(self.library, 4, 1)])
+        self.assertEqual(len(again.files("Contador")), 2)
+        self.assertEqual(again.stats(), reopened.stats())
+        self.assertFalse(again.refresh([self.root]))
+
+    def test_discarded(self):
+        """Teste: Um índice corrompido ou de outra tabela de tokens é descartado na abertura."""
+        self.index.save()
+        other = IdentifierIndex(self.index_path, LexicalAnalyzer(spec=DIALECTS["lpd-for"]))
+        self.assertTrue(other.discarded)
+        self.assertEqual(len(other), 0)
+        with open(self.index_path, "r+b") as file:
+            file.truncate(40)
+        self.assertTrue(IdentifierIndex(self.index_path).discarded)
+
+    def test_failures(self):
+        """Teste: Um arquivo que não é UTF-8 é registrado sem ocorrências, sem interromper os demais."""
+        path = os.path.join(self.root, "binario.lpd")
+        with open(path, "wb") as file:
+            file.write(b"\xff\xfe")
+        self.assertEqual(self.index.refresh([self.root]).failed, [path])
+        self.assertIn(path, self.index)
+        self.assertFalse(self.index.refresh([self.root]))
+
+
+if __name__ == '__main__':
+    unittest.main()
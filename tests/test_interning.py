@@ -0,0 +1,89 @@
+"""
+Módulo de Testes da Internação de Lexemas
+
+Este módulo verifica que os motores de análise internam os lexemas no `InternPool` do analisador e
+que o tamanho e a taxa de acerto do conjunto são contabilizados.
+
+Classes:
+    - TestInternPool: Testa o conjunto de lexemas e sua integração com o `LexicalAnalyzer`.
+"""
+
+import io
+import os
+import tempfile
+import unittest
+from analyzer.analyzer import LexicalAnalyzer
+from analyzer.interning import InternPool
+
+CODE = "program Teste;\nvar int Contador;\nbegin\n    Contador := Contador + 1;\n    Contador := Contador + 1;\nend.\n"
+
+
+class TestInternPool(unittest.TestCase):
+    """Testes de `InternPool`."""
+
+    def engines(self, analyzer):
+        """Retorna os motores de análise que produzem listas de tuplas, cada um aplicado a `CODE`."""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "teste.lpd")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(CODE)
+        return {
+            "tokenize": lambda: analyzer.tokenize(CODE),
+            "scan": lambda: analyzer.scan(CODE),
+            "tokenize_file": lambda: analyzer.tokenize_file(path),
+            "iter_tokens": lambda: list(analyzer.iter_tokens(io.StringIO(CODE), chunk_size=8)),
+        }
+
+    def test_repeated_lexemes_share_one_object(self):
+        """Teste: Todas as ocorrências de um lexema são o mesmo objeto, inclusive entre motores."""
+        analyzer = LexicalAnalyzer()
+        canonical = None
+        for name, engine in self.engines(analyzer).items():
+            lexemes = [lexeme for lexeme, _, _ in engine() if lexeme == "Contador"]
+            self.assertEqual(len(lexemes), 5, name)
+            canonical = canonical or lexemes[0]
+            self.assertTrue(all(lexeme is canonical for lexeme in lexemes), name)
+
+    def test_keywords_are_token_lexemes(self):
+        """Teste: Palavras reservadas e operadores do resultado são o próprio lexema do `Token`."""
+        analyzer = LexicalAnalyzer()
+        for lexeme, token, _ in analyzer.tokenize(CODE) + analyzer.scan(CODE):
+            if not token.use_regex:
+                self.assertIs(lexeme, token.lexeme)
+
+    def test_statistics(self):
+        """Teste: O tamanho e a taxa de acerto do conjunto contam os lexemas emitidos."""
+        pool = InternPool()
+        analyzer = LexicalAnalyzer(pool)
+        seeded = len(pool)
+        tokens = analyzer.tokenize(CODE)
+        self.assertEqual(pool.requests, len(tokens))
+        # Apenas os identificadores e números são novos: `Teste`, `Contador` e `1`.
+        self.assertEqual(pool.misses, 3)
+        self.assertEqual(len(pool), seeded + 3)
+        analyzer.scan(CODE)
+        self.assertEqual(pool.requests, 2 * len(tokens))
+        self.assertEqual(pool.misses, 3)
+        self.assertAlmostEqual(pool.hit_rate, 1 - 3 / (2 * len(tokens)))
+        self.assertEqual(pool.summary()["hits"], pool.hits)
+
+    def test_shared_pool(self):
+        """Teste: Analisadores com o mesmo conjunto produzem os mesmos objetos."""
+        pool = InternPool()
+        first = LexicalAnalyzer(pool).scan(CODE)
+        second = LexicalAnalyzer(pool).tokenize(CODE)
+        self.assertTrue(all(a[0] is b[0] for a, b in zip(first, second)))
+
+    def test_disabled(self):
+        """Teste: Com `limit=0`, nenhum lexema é guardado e o resultado não muda."""
+        pool = InternPool(limit=0)
+        analyzer = LexicalAnalyzer(pool)
+        expected = [(lexeme, token.type, line) for lexeme, token, line in LexicalAnalyzer().tokenize(CODE)]
+        self.assertEqual([(lexeme, token.type, line) for lexeme, token, line in analyzer.tokenize(CODE)], expected)
+        self.assertEqual(len(pool), 0)
+        self.assertEqual(pool.intern("Contador"), "Contador")
+
+
+if __name__ == '__main__':
+    unittest.main()
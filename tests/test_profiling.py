@@ -0,0 +1,80 @@
+"""
+Módulo de Testes da Instrumentação
+
+Este módulo verifica que a instrumentação do `LexicalAnalyzer` não altera os tokens produzidos e
+que as medições são exportadas como `dict` e no formato do `cProfile`.
+
+Classes:
+    - TestProfiler: Testa as medições do `Profiler` em cada modo de análise.
+"""
+
+import io
+import os
+import pstats
+import tempfile
+import unittest
+from analyzer.analyzer import LexicalAnalyzer
+from analyzer.profiling import Profiler
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TestProfiler(unittest.TestCase):
+    """Testes de `Profiler` e de `LexicalAnalyzer.enable_profiling`."""
+
+    def setUp(self):
+        """Inicializa o analisador e lê um dos exemplos."""
+        self.analyzer = LexicalAnalyzer()
+        self.path = os.path.join(ROOT, "codigo2.lpd")
+        with open(self.path, "r", encoding="utf-8") as file:
+            self.code = file.read()
+        self.expected = self.analyzer.tokenize(self.code)
+
+    def test_disabled_by_default(self):
+        """Teste: A instrumentação começa desativada e pode ser desligada."""
+        self.assertIsNone(self.analyzer.profiler)
+        profiler = self.analyzer.enable_profiling()
+        self.assertIs(self.analyzer.disable_profiling(), profiler)
+        self.assertIsNone(self.analyzer.profiler)
+
+    def test_tokenize_stages(self):
+        """Teste: `tokenize` instrumentado produz os mesmos tokens e registra cada etapa."""
+        profiler = self.analyzer.enable_profiling(Profiler(slow_line_limit=3))
+        self.assertEqual(self.analyzer.tokenize(self.code), self.expected)
+        summary = profiler.summary()
+        self.assertEqual(set(summary["stages"]), {"splitlines", "findall", "classify"})
+        self.assertEqual(sum(summary["tokens_by_type"].values()), len(self.expected))
+        self.assertGreaterEqual(summary["classify_calls"], len(self.expected))
+        self.assertEqual(len(summary["slowest_lines"]), 3)
+        seconds = [line["seconds"] for line in summary["slowest_lines"]]
+        self.assertEqual(seconds, sorted(seconds, reverse=True))
+
+    def test_other_modes(self):
+        """Teste: `scan`, `tokenize_file` e `iter_tokens` instrumentados produzem os mesmos tokens."""
+        profiler = self.analyzer.enable_profiling()
+        self.assertEqual(self.analyzer.scan(self.code), self.expected)
+        self.assertEqual(self.analyzer.tokenize_file(self.path), self.expected)
+        self.assertEqual(list(self.analyzer.iter_tokens(io.StringIO(self.code), chunk_size=64)), self.expected)
+        self.assertEqual(sum(profiler.tokens_by_type.values()), 3 * len(self.expected))
+        self.assertIn("scan_buffer", profiler.stage_calls)
+        self.assertGreater(profiler.stage_calls["scan"], 1)
+
+    def test_hooks_and_pstats(self):
+        """Teste: Os hooks recebem cada medição e o perfil é legível por `pstats`."""
+        profiler = Profiler()
+        stages = []
+        profiler.add_hook(lambda stage, seconds: stages.append(stage))
+        self.analyzer.enable_profiling(profiler)
+        self.analyzer.scan(self.code)
+        self.assertEqual(stages, ["scan"])
+
+        stats = pstats.Stats(profiler)
+        self.assertEqual(stats.total_calls, 1)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "perfil.prof")
+            profiler.dump_stats(path)
+            self.assertEqual(pstats.Stats(path).total_calls, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
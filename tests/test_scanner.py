@@ -0,0 +1,163 @@
+"""
+Módulo de Testes do Motor de Varredura
+
+Este módulo verifica que `LexicalAnalyzer.scan`, `LexicalAnalyzer.iter_tokens` e
+`LexicalAnalyzer.tokenize_file` produzem exatamente a mesma saída que `LexicalAnalyzer.tokenize`.
+
+Classes:
+    - TestScanner: Compara o motor de passagem única com a implementação de referência.
+    - TestIterTokens: Compara a análise em blocos com a implementação de referência.
+    - TestTokenizeFile: Compara a leitura mapeada em memória com a leitura completa do arquivo.
+    - TestComments: Verifica o tratamento de comentários durante a varredura.
+"""
+
+import glob
+import io
+import os
+import random
+import tempfile
+import time
+import unittest
+from analyzer.analyzer import LexicalAnalyzer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TestScanner(unittest.TestCase):
+    """Testes diferenciais entre `scan` e `tokenize`."""
+
+    def setUp(self):
+        """Inicializa o analisador léxico antes de cada teste."""
+        self.analyzer = LexicalAnalyzer()
+
+    def test_samples(self):
+        """Teste: Os exemplos `codigo*.lpd` produzem a mesma saída nos dois motores."""
+        for path in sorted(glob.glob(os.path.join(ROOT, "codigo*.lpd"))):
+            with open(path, "r", encoding="utf-8") as file:
+                code = file.read()
+            self.assertEqual(self.analyzer.scan(code), self.analyzer.tokenize(code), path)
+
+    def test_line_breaks(self):
+        """Teste: Quebras de linha reconhecidas por `str.splitlines` são contadas da mesma forma."""
+        text = "a\r\nb\rc\x85d 'e\x0bf' \"g\x1ch\" i"
+        self.assertEqual(self.analyzer.scan(text), self.analyzer.tokenize(text))
+
+    def test_random_inputs(self):
+        """Teste: Entradas aleatórias produzem a mesma saída nos dois motores."""
+        alphabet = "ab1_ {}'\"\n\r:=<>!/.;é\x85\t9"
+        rng = random.Random(0)
+        for _ in range(2000):
+            text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+            self.assertEqual(self.analyzer.scan(text), self.analyzer.tokenize(text), repr(text))
+
+
+class TestIterTokens(unittest.TestCase):
+    """Testes diferenciais entre `iter_tokens` e `tokenize`."""
+
+    def setUp(self):
+        """Inicializa o analisador léxico antes de cada teste."""
+        self.analyzer = LexicalAnalyzer()
+
+    def test_samples_from_path(self):
+        """Teste: Os exemplos lidos pelo caminho produzem a mesma saída que `tokenize`."""
+        for path in sorted(glob.glob(os.path.join(ROOT, "codigo*.lpd"))):
+            with open(path, "r", encoding="utf-8") as file:
+                code = file.read()
+            self.assertEqual(list(self.analyzer.iter_tokens(path, chunk_size=16)), self.analyzer.tokenize(code), path)
+
+    def test_chunk_boundaries(self):
+        """Teste: Comentários e literais que atravessam o limite entre blocos são tratados corretamente."""
+        text = "A := 'B'; { comentário\n de várias\n linhas } C := \"texto longo\";\n{ aberto\nD"
+        for chunk_size in (1, 2, 5, 64):
+            self.assertEqual(list(self.analyzer.iter_tokens(io.StringIO(text), chunk_size)), self.analyzer.tokenize(text))
+            stream = io.BytesIO(text.encode("utf-8"))
+            self.assertEqual(list(self.analyzer.iter_tokens(stream, chunk_size)), self.analyzer.tokenize(text))
+
+
+class TestTokenizeFile(unittest.TestCase):
+    """Testes diferenciais entre os modos de `tokenize_file`."""
+
+    def setUp(self):
+        """Inicializa o analisador léxico antes de cada teste."""
+        self.analyzer = LexicalAnalyzer()
+
+    def test_samples(self):
+        """Teste: Os exemplos produzem a mesma saída com e sem mapeamento em memória."""
+        for path in sorted(glob.glob(os.path.join(ROOT, "codigo*.lpd"))):
+            expected = self.analyzer.tokenize_file(path, mmap=False)
+            for block_size in (8, 256, 1 << 20):
+                self.assertEqual(self.analyzer.tokenize_file(path, block_size=block_size), expected, path)
+
+    def test_utf8_and_line_endings(self):
+        """Teste: Caracteres não ASCII e quebras `\\r\\n` são tratados como na leitura em modo texto."""
+        text = "program Ação;\r\nvar int Número; { comentário\r\n}\r\nA := 'é';\r{ x }\nB := \"ü\";\n"
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "exemplo.lpd")
+            with open(path, "w", encoding="utf-8", newline="") as file:
+                file.write(text)
+            expected = self.analyzer.tokenize_file(path, mmap=False)
+            for block_size in (1, 8, 1 << 20):
+                self.assertEqual(self.analyzer.tokenize_file(path, block_size=block_size), expected)
+
+
+class TestComments(unittest.TestCase):
+    """Testes dos comentários em todos os motores de análise."""
+
+    def setUp(self):
+        """Inicializa o analisador léxico antes de cada teste."""
+        self.analyzer = LexicalAnalyzer()
+
+    def analyze(self, text):
+        """Analisa o texto com cada motor, retornando os tokens e o comentário não fechado de cada um."""
+        results = []
+        for engine in (self.analyzer.tokenize, self.analyzer.scan, lambda text: self.analyzer.scan_stream(text).to_list(),
+                       lambda text: list(self.analyzer.iter_tokens(io.StringIO(text), chunk_size=3))):
+            results.append((engine(text), self.analyzer.unterminated_comment))
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "exemplo.lpd")
+            with open(path, "w", encoding="utf-8", newline="") as file:
+                file.write(text)
+            results.append((self.analyzer.tokenize_file(path, block_size=4), self.analyzer.unterminated_comment))
+        for result in results[1:]:
+            self.assertEqual(result, results[0])
+        return results[0]
+
+    def test_line_numbers_preserved(self):
+        """Teste: As quebras de linha dentro de comentários continuam sendo contadas."""
+        tokens, unterminated = self.analyze("A := 1; { comentário\nde duas linhas }\nB := 2;")
+        self.assertEqual([(lexeme, line) for lexeme, _, line in tokens],
+                         [("A", 1), (":=", 1), ("1", 1), (";", 1), ("B", 3), (":=", 3), ("2", 3), (";", 3)])
+        self.assertIsNone(unterminated)
+
+    def test_brace_inside_text(self):
+        """Teste: Um `{` dentro de um literal de texto não inicia um comentário."""
+        tokens, unterminated = self.analyze("writec(\"{ não é comentário\"); A := '{';\nB")
+        self.assertEqual([lexeme for lexeme, _, _ in tokens],
+                         ["writec", "(", "\"{ não é comentário\"", ")", ";", "A", ":=", "'{'", ";", "B"])
+        self.assertIsNone(unterminated)
+
+    def test_unterminated_comment(self):
+        """Teste: Um comentário sem `}` se estende até o fim e tem sua posição registrada."""
+        tokens, unterminated = self.analyze("A := 1;\nB := 2; { aberto\nC := 3;\n")
+        self.assertEqual([lexeme for lexeme, _, _ in tokens], ["A", ":=", "1", ";", "B", ":=", "2", ";"])
+        self.assertEqual(unterminated, (2, 9))
+
+    def test_remove_comments_keeps_positions(self):
+        """Teste: `remove_comments` mantém o tamanho, as linhas e as colunas do código."""
+        text = "A { x\ny } B \"{\" { z"
+        result = self.analyzer.remove_comments(text)
+        self.assertEqual(result, "A    \n    B \"{\"    ")
+        self.assertEqual(len(result), len(text))
+
+    def test_many_unclosed_braces(self):
+        """Teste: Milhares de `{` sem fechamento são analisados em tempo linear."""
+        text = "A := 1;\n" + "{\n" * 50000 + "{" * 200000
+        start = time.perf_counter()
+        tokens, unterminated = self.analyze(text)
+        self.assertLess(time.perf_counter() - start, 10)
+        self.assertEqual(len(tokens), 4)
+        self.assertEqual(unterminated, (2, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,226 @@
+"""
+Módulo de Testes do Modo Servidor
+
+Este módulo verifica o protocolo do `LexingServer`: respostas equivalentes a `scan`, erros por
+pedido, prazos esgotados, agrupamento de pedidos concorrentes em lotes, o limite de tamanho das linhas
+e a política de erros léxicos com e sem pool de processos.
+
+Classes:
+    - TestParseAddress: Testa a interpretação dos endereços.
+    - TestLexingServer: Testa o servidor com uma thread de análise e com um pool de processos.
+"""
+
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+from analyzer.analyzer import LexicalAnalyzer
+from analyzer.server import LexingServer, parse_address
+
+CODE = "program Teste;\nvar int Contador;\nbegin\n    Contador := Contador + 1;\nend.\n"
+
+
+class TestParseAddress(unittest.TestCase):
+    """Testes de `parse_address`."""
+
+    def test_addresses(self):
+        """Teste: Endereços TCP, com host padrão, e de socket Unix."""
+        self.assertEqual(parse_address("localhost:8765"), ("tcp", ("localhost", 8765)))
+        self.assertEqual(parse_address(":8765"), ("tcp", ("127.0.0.1", 8765)))
+        self.assertEqual(parse_address("8765"), ("tcp", ("127.0.0.1", 8765)))
+        self.assertEqual(parse_address("unix:/tmp/lpd.sock"), ("unix", "/tmp/lpd.sock"))
+        with self.assertRaises(ValueError):
+            parse_address("localhost:porta")
+
+
+class TestLexingServer(unittest.IsolatedAsyncioTestCase):
+    """Testes de `LexingServer`."""
+
+    async def start(self, **options):
+        """Inicia um servidor em uma porta livre e retorna uma conexão com ele."""
+        options.setdefault("workers", 0)
+        server = LexingServer(**options)
+        await server.start("127.0.0.1:0")
+        self.addAsyncCleanup(server.close)
+        reader, writer = await asyncio.open_connection("127.0.0.1", server.sockets[0].getsockname()[1])
+        self.addCleanup(writer.close)
+        return server, reader, writer
+
+    @staticmethod
+    async def request(reader, writer, **fields):
+        """Envia um pedido e retorna a resposta."""
+        writer.write(json.dumps(fields).encode("utf-8") + b"\n")
+        await writer.drain()
+        return json.loads(await reader.readline())
+
+    def expected(self, text=CODE):
+        """Retorna os tokens esperados no formato do protocolo."""
+        return [[lexeme, token.type.name, line] for lexeme, token, line in LexicalAnalyzer().scan(text)]
+
+    async def test_text_request(self):
+        """Teste: Os tokens da resposta equivalem aos de `scan`, com o `id` do pedido."""
+        _, reader, writer = await self.start()
+        response = await self.request(reader, writer, id=7, text=CODE)
+        self.assertEqual(response, {"id": 7, "tokens": self.expected(), "unterminated_comment": None})
+        response = await self.request(reader, writer, id="b", text="begin { sem fim")
+        self.assertEqual(response["unterminated_comment"], [1, 7])
+
+    async def test_path_request(self):
+        """Teste: Pedidos com `path` analisam o arquivo; arquivos inexistentes geram um erro."""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "teste.lpd")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(CODE)
+        server, reader, writer = await self.start()
+        response = await self.request(reader, writer, id=1, path=path)
+        self.assertEqual(response["tokens"], self.expected())
+
+    async def test_executor_failure(self):
+        """Teste: Uma falha do executor chega ao cliente como erro da análise, com a mensagem original."""
+        server, reader, writer = await self.start()
+
+        def broken(jobs):
+            raise RuntimeError("pool interrompido")
+
+        server._job_function = lambda: broken
+        response = await self.request(reader, writer, id=5, text=CODE)
+        self.assertEqual(response, {"id": 5, "error": "RuntimeError: pool interrompido"})
+        self.assertEqual(server.stats["errors"], 1)
+
+    async def test_error_policy(self):
+        """Teste: A política de erros vale com e sem pool, e as respostas trazem os diagnósticos."""
+        text = "x := 1 @ 2;\ny := ?;\n"
+        for workers in (0, 1):
+            analyzer = LexicalAnalyzer(error_policy="token")
+            expected = [[lexeme, token.type.name, line] for lexeme, token, line in analyzer.scan(text)]
+            diagnostics = [{"code": d.code, "message": d.message, "line": d.line, "column": d.column}
+                           for d in analyzer.diagnostics]
+            _, reader, writer = await self.start(analyzer=analyzer, workers=workers)
+            response = await self.request(reader, writer, id=1, text=text)
+            self.assertEqual(response["tokens"], expected)
+            self.assertIn(["@", "serro", 1], response["tokens"])
+            self.assertEqual(response["diagnostics"], diagnostics)
+
+            _, reader, writer = await self.start(analyzer=LexicalAnalyzer(error_policy="abort"), workers=workers)
+            response = await self.request(reader, writer, id=2, text=text)
+            self.assertIn("LexicalError", response["error"])
+            self.assertEqual(response["diagnostics"], diagnostics[:1])
+        response = await self.request(reader, writer, id=2, path=path + ".inexistente")
+        self.assertIn("FileNotFoundError", response["error"])
+        self.assertEqual(server.stats["errors"], 1)
+
+    async def test_invalid_requests(self):
+        """Teste: Pedidos inválidos recebem um erro e a conexão continua atendendo."""
+        _, reader, writer = await self.start()
+        writer.write(b"nao e json\n")
+        response = json.loads(await reader.readline())
+        self.assertEqual(response["id"], None)
+        self.assertIn("Pedido inválido", response["error"])
+        response = await self.request(reader, writer, id=3)
+        self.assertIn("'text' ou 'path'", response["error"])
+        for timeout in ("5", True, -1, float("nan"), [1]):
+            response = await self.request(reader, writer, id=5, text=CODE, timeout=timeout)
+            self.assertEqual(response["id"], 5)
+            self.assertIn("Pedido inválido: 'timeout'", response["error"])
+        response = await self.request(reader, writer, id=4, text=CODE)
+        self.assertEqual(response["tokens"], self.expected())
+
+    async def test_error_policy(self):
+        """Teste: A política de erros vale com e sem pool, e as respostas trazem os diagnósticos."""
+        text = "x := 1 @ 2;\ny := ?;\n"
+        for workers in (0, 1):
+            analyzer = LexicalAnalyzer(error_policy="token")
+            expected = [[lexeme, token.type.name, line] for lexeme, token, line in analyzer.scan(text)]
+            diagnostics = [{"code": d.code, "message": d.message, "line": d.line, "column": d.column}
+                           for d in analyzer.diagnostics]
+            _, reader, writer = await self.start(analyzer=analyzer, workers=workers)
+            response = await self.request(reader, writer, id=1, text=text)
+            self.assertEqual(response["tokens"], expected)
+            self.assertIn(["@", "serro", 1], response["tokens"])
+            self.assertEqual(response["diagnostics"], diagnostics)
+
+            _, reader, writer = await self.start(analyzer=LexicalAnalyzer(error_policy="abort"), workers=workers)
+            response = await self.request(reader, writer, id=2, text=text)
+            self.assertIn("LexicalError", response["error"])
+            self.assertEqual(response["diagnostics"], diagnostics[:1])
+
+    async def test_timeout(self):
+        """Teste: Um pedido cujo prazo se esgota recebe um erro sem afetar os demais."""
+        server, reader, writer = await self.start()
+        response = await self.request(reader, writer, id=5, text=CODE * 2000, timeout=0)
+        self.assertEqual(response, {"id": 5, "error": "Prazo esgotado."})
+        self.assertEqual(server.stats["timeouts"], 1)
+        response = await self.request(reader, writer, id=6, text=CODE)
+        self.assertEqual(response["tokens"], self.expected())
+
+    async def test_error_policy(self):
+        """Teste: A política de erros vale com e sem pool, e as respostas trazem os diagnósticos."""
+        text = "x := 1 @ 2;\ny := ?;\n"
+        for workers in (0, 1):
+            analyzer = LexicalAnalyzer(error_policy="token")
+            expected = [[lexeme, token.type.name, line] for lexeme, token, line in analyzer.scan(text)]
+            diagnostics = [{"code": d.code, "message": d.message, "line": d.line, "column": d.column}
+                           for d in analyzer.diagnostics]
+            _, reader, writer = await self.start(analyzer=analyzer, workers=workers)
+            response = await self.request(reader, writer, id=1, text=text)
+            self.assertEqual(response["tokens"], expected)
+            self.assertIn(["@", "serro", 1], response["tokens"])
+            self.assertEqual(response["diagnostics"], diagnostics)
+
+            _, reader, writer = await self.start(analyzer=LexicalAnalyzer(error_policy="abort"), workers=workers)
+            response = await self.request(reader, writer, id=2, text=text)
+            self.assertIn("LexicalError", response["error"])
+            self.assertEqual(response["diagnostics"], diagnostics[:1])
+
+    async def test_batching(self):
+        """Teste: Pedidos concorrentes são agrupados em lotes e todos são respondidos."""
+        server, reader, writer = await self.start(batch_delay=0.05, batch_size=16)
+        for number in range(32):
+            writer.write(json.dumps({"id": number, "text": CODE}).encode("utf-8") + b"\n")
+        await writer.drain()
+        responses = [json.loads(await reader.readline()) for _ in range(32)]
+        self.assertEqual(sorted(response["id"] for response in responses), list(range(32)))
+        self.assertTrue(all(response["tokens"] == self.expected() for response in responses))
+        self.assertLess(server.stats["batches"], 32)
+        response = await self.request(reader, writer, id="s", op="stats")
+        self.assertEqual(response["stats"]["requests"], 32)
+
+    async def test_line_limit(self):
+        """Teste: Uma linha maior que o limite recebe um erro e encerra a conexão."""
+        _, reader, writer = await self.start(limit=1024)
+        writer.write(json.dumps({"id": 1, "text": "x" * 4096}).encode("utf-8") + b"\n")
+        await writer.drain()
+        response = json.loads(await reader.readline())
+        self.assertIn("1024 bytes", response["error"])
+        self.assertEqual(await reader.read(), b"")
+
+    async def test_process_pool(self):
+        """Teste: Com um pool de processos, as respostas são as mesmas."""
+        _, reader, writer = await self.start(workers=1)
+        response = await self.request(reader, writer, id=1, text=CODE)
+        self.assertEqual(response["tokens"], self.expected())
+
+    async def test_error_policy(self):
+        """Teste: A política de erros vale com e sem pool, e as respostas trazem os diagnósticos."""
+        text = "x := 1 @ 2;\ny := ?;\n"
+        for workers in (0, 1):
+            analyzer = LexicalAnalyzer(error_policy="token")
+            expected = [[lexeme, token.type.name, line] for lexeme, token, line in analyzer.scan(text)]
+            diagnostics = [{"code": d.code, "message": d.message, "line": d.line, "column": d.column}
+                           for d in analyzer.diagnostics]
+            _, reader, writer = await self.start(analyzer=analyzer, workers=workers)
+            response = await self.request(reader, writer, id=1, text=text)
+            self.assertEqual(response["tokens"], expected)
+            self.assertIn(["@", "serro", 1], response["tokens"])
+            self.assertEqual(response["diagnostics"], diagnostics)
+
+            _, reader, writer = await self.start(analyzer=LexicalAnalyzer(error_policy="abort"), workers=workers)
+            response = await self.request(reader, writer, id=2, text=text)
+            self.assertIn("LexicalError", response["error"])
+            self.assertEqual(response["diagnostics"], diagnostics[:1])
+
+
+if __name__ == '__main__':
+    unittest.main()
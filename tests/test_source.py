@@ -0,0 +1,91 @@
+"""
+Módulo de Testes do Índice de Linhas
+
+Este módulo verifica que `SourceIndex` converte posições em linhas, colunas e bytes de acordo com
+`str.splitlines` e que `TokenStream.span` localiza cada token no código original.
+
+Classes:
+    - TestSourceIndex: Testa a conversão de posições e a fatia de linhas.
+    - TestTokenSpans: Testa as posições dos tokens e o registro de declarações na `SymbolTable`.
+"""
+
+import random
+import unittest
+from analyzer.analyzer import LexicalAnalyzer, SymbolTable, Token
+from analyzer.source import SourceIndex
+
+
+class TestSourceIndex(unittest.TestCase):
+    """Testes de `SourceIndex`."""
+
+    def test_lines_match_splitlines(self):
+        """Teste: As linhas do índice são as mesmas de `str.splitlines`."""
+        alphabet = "ab \n\r\x0b\x85 é"
+        rng = random.Random(0)
+        for _ in range(300):
+            text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 30)))
+            index = SourceIndex(text)
+            lines = [index.line(number) for number in range(1, len(index) + 1)]
+            self.assertEqual(lines[:len(text.splitlines())], text.splitlines(), repr(text))
+            self.assertEqual("".join(index.line(number, keepends=True) for number in range(1, len(index) + 1)), text)
+
+    def test_position_roundtrip(self):
+        """Teste: `position` e `offset` são inversos e as posições em bytes seguem o UTF-8."""
+        text = "program é;\r\nvar x: int;\n\n  fim ç"
+        index = SourceIndex(text)
+        self.assertEqual(index.position(0), (1, 1))
+        self.assertEqual(index.position(text.index("var")), (2, 1))
+        self.assertEqual(index.position(text.index("fim")), (4, 3))
+        self.assertEqual(index.position(len(text)), (5, 2))
+        for offset in range(len(text) + 1):
+            line, column = index.position(offset)
+            if column <= len(index.line(line)) + 1:
+                self.assertEqual(index.offset(line, column), offset)
+            self.assertEqual(index.byte_offset(offset), len(text[:offset].encode("utf-8")))
+
+    def test_invalid_positions(self):
+        """Teste: Posições, linhas e colunas fora do texto são rejeitadas."""
+        index = SourceIndex("a\nbc")
+        for call in (lambda: index.position(-1), lambda: index.position(5), lambda: index.line(3),
+                     lambda: index.offset(2, 4), lambda: index.span(3, 2)):
+            with self.assertRaises(ValueError):
+                call()
+
+
+class TestTokenSpans(unittest.TestCase):
+    """Testes das posições dos tokens."""
+
+    def setUp(self):
+        """Inicializa o analisador léxico antes de cada teste."""
+        self.analyzer = LexicalAnalyzer()
+
+    def test_spans(self):
+        """Teste: Cada token é localizado pela linha, coluna e posição em bytes do lexema."""
+        text = "program ação; { comentário\nlongo }\nvar x := 'é';\n"
+        stream = self.analyzer.scan_stream(text)
+        encoded = text.encode("utf-8")
+        index = SourceIndex(text)
+        for position, span in enumerate(stream.spans()):
+            lexeme, _, line = stream[position]
+            self.assertEqual(span, stream.span(position))
+            self.assertEqual((span.line, span.end_line), (line, line))
+            self.assertEqual(index.line(line)[span.column - 1:span.end_column - 1], lexeme)
+            self.assertEqual(encoded[span.start_byte:span.end_byte].decode("utf-8"), lexeme)
+        self.assertEqual((stream.span(1).line, stream.span(1).column, stream.span(1).end_column), (1, 9, 13))
+        self.assertEqual((stream.span(4).line, stream.span(4).column), (3, 5))
+
+    def test_symbol_sites(self):
+        """Teste: A `SymbolTable` registra a linha e a coluna da declaração com o índice."""
+        text = "var\n  x, y: int;"
+        stream = self.analyzer.scan_stream(text)
+        table = SymbolTable(stream.index)
+        for position, (lexeme, token, _) in enumerate(stream):
+            if token.type is Token.SIDENTIFICADOR:
+                table.add_symbol(lexeme, token.type, stream.starts[position])
+        self.assertEqual(table.get_site("x"), (2, 3))
+        self.assertEqual(table.get_site("y"), (2, 6))
+        self.assertIsNone(table.get_site("z"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+"""
+Módulo de Testes da Especificação de Tokens
+
+Este módulo verifica a especificação declarativa `TokenSpec`: a validação, o cache das tabelas
+compiladas, a derivação das expressões de separação a partir dos operadores e os dialetos.
+
+Classes:
+    - TestTokenSpec: Testa a construção e a compilação de especificações.
+    - TestDialects: Testa a análise com os dialetos `LPD_FOR` e `LPD_CASELESS`.
+"""
+
+import unittest
+from analyzer.analyzer import LexicalAnalyzer
+from analyzer.spec import DIALECTS, LPD, LPD_CASELESS, LPD_FOR, TokenSpec
+from analyzer.tokens import Token, token_type
+
+
+def kinds(tokens):
+    """Retorna os pares `(lexema, nome do tipo)` de uma lista de tokens."""
+    return [(lexeme, token.type.name) for lexeme, token, _ in tokens]
+
+
+class TestTokenSpec(unittest.TestCase):
+    """Testes de `TokenSpec`."""
+
+    def test_compiled_once(self):
+        """Teste: A tabela é compilada uma única vez por conteúdo e compartilhada entre analisadores."""
+        self.assertIs(LPD.compile(), LPD.compile())
+        self.assertIs(LPD.extend("copia").compile(), LPD.compile())
+        first, second = LexicalAnalyzer(), LexicalAnalyzer()
+        self.assertIsNot(first.tokens, second.tokens)
+        self.assertTrue(all(a is b for a, b in zip(first.tokens, second.tokens)))
+
+    def test_types_are_shared(self):
+        """Teste: Os tipos da especificação são os próprios tipos de `Token`."""
+        types = {token.type for token in LPD.compile()}
+        self.assertIn(Token.SIDENTIFICADOR, types)
+        self.assertIn(Token.SATRIBUICAO, types)
+        self.assertIs(token_type("sfor"), token_type("sfor"))
+
+    def test_priority(self):
+        """Teste: Palavras reservadas e operadores precedem as classes regex, na ordem declarada."""
+        table = LPD.compile()
+        regex = [token.use_regex for token in table]
+        self.assertEqual(regex, sorted(regex))
+        self.assertEqual([token.type for token in table if token.use_regex],
+                         [Token.SIDENTIFICADOR, Token.SNUMERO, Token.STEXTO])
+
+    def test_validation(self):
+        """Teste: Lexemas inválidos ou repetidos e expressões inválidas são rejeitados."""
+        with self.assertRaises(ValueError):
+            TokenSpec("x", keywords=[("não-palavra", "sx")])
+        for operator in ("", "a+", "< =", "{", "'"):
+            with self.assertRaises(ValueError):
+                TokenSpec("x", operators=[(operator, "sx")])
+        with self.assertRaises(ValueError):
+            TokenSpec("x", keywords=[("Begin", "sbegin"), ("begin", "sbegin")], case_sensitive=False)
+        with self.assertRaises(ValueError):
+            TokenSpec("x", patterns=[("(", "sx")])
+
+    def test_extend(self):
+        """Teste: Um dialeto redefine, acrescenta e remove entradas sem alterar a especificação original."""
+        spec = LPD.extend("x", operators=[("=", "satribuição"), ("**", "spotencia")], remove=["!="])
+        lexemes = dict(spec.operators)
+        self.assertEqual(lexemes["="], "satribuição")
+        self.assertEqual(lexemes["**"], "spotencia")
+        self.assertNotIn("!=", lexemes)
+        self.assertEqual(dict(LPD.operators)["="], "sigual")
+        self.assertEqual([lexeme for lexeme, _ in spec.operators].index("="),
+                         [lexeme for lexeme, _ in LPD.operators].index("="))
+
+    def test_equal_and_different(self):
+        """Teste: `=` e `!=` são reconhecidos, como os demais operadores da tabela."""
+        analyzer = LexicalAnalyzer()
+        code = "if a = b then c := d != e"
+        expected = [("if", "sif"), ("a", "sidentificador"), ("=", "sigual"), ("b", "sidentificador"),
+                    ("then", "sthen"), ("c", "sidentificador"), (":=", "satribuição"), ("d", "sidentificador"),
+                    ("!=", "sdiferente"), ("e", "sidentificador")]
+        self.assertEqual(kinds(analyzer.tokenize(code)), expected)
+        self.assertEqual(kinds(analyzer.scan(code)), expected)
+
+    def test_operators_follow_table(self):
+        """Teste: Um operador acrescentado à tabela passa a ser separado como um único lexema."""
+        analyzer = LexicalAnalyzer(spec=LPD.extend("x", operators=[("**", "spotencia")]))
+        self.assertIn("**", analyzer.operators)
+        self.assertEqual(kinds(analyzer.scan("a ** 2")), [("a", "sidentificador"), ("**", "spotencia"), ("2", "snúmero")])
+        self.assertEqual(kinds(LexicalAnalyzer().scan("a ** 2")),
+                         [("a", "sidentificador"), ("*", "svezes"), ("*", "svezes"), ("2", "snúmero")])
+
+        analyzer = LexicalAnalyzer()
+        analyzer.tokens.insert(0, Token("..", token_type("sintervalo")))
+        analyzer.build_index()
+        self.assertEqual(kinds(analyzer.tokenize("1..2")), [("1", "snúmero"), ("..", "sintervalo"), ("2", "snúmero")])
+        self.assertEqual(kinds(analyzer.scan("1..2")), kinds(analyzer.tokenize("1..2")))
+
+
+class TestDialects(unittest.TestCase):
+    """Testes dos dialetos."""
+
+    def test_registry(self):
+        """Teste: Os dialetos estão disponíveis pelo nome."""
+        self.assertIs(DIALECTS["lpd"], LPD)
+        self.assertIs(DIALECTS["lpd-for"], LPD_FOR)
+        self.assertIs(DIALECTS["lpd-caseless"], LPD_CASELESS)
+
+    def test_for(self):
+        """Teste: `for` e `to` são palavras reservadas apenas no dialeto `lpd-for`."""
+        code = "for i := 1 to 10 do writed(i);"
+        self.assertEqual(kinds(LexicalAnalyzer(spec=LPD_FOR).scan(code))[:5],
+                         [("for", "sfor"), ("i", "sidentificador"), (":=", "satribuição"), ("1", "snúmero"), ("to", "sto")])
+        self.assertEqual(kinds(LexicalAnalyzer().scan(code))[0], ("for", "sidentificador"))
+
+    def test_caseless(self):
+        """Teste: Sem diferenciar maiúsculas, `BEGIN` é palavra reservada e o lexema original é mantido."""
+        code = "PROGRAM Teste; BEGIN Contador := 1 End."
+        analyzer = LexicalAnalyzer(spec=LPD_CASELESS)
+        expected = [("PROGRAM", "sprogram"), ("Teste", "sidentificador"), (";", "sponto_virgula"), ("BEGIN", "sbegin"),
+                    ("Contador", "sidentificador"), (":=", "satribuição"), ("1", "snúmero"), ("End", "send"), (".", "sponto")]
+        self.assertEqual(kinds(analyzer.scan(code)), expected)
+        self.assertEqual(kinds(analyzer.tokenize(code)), expected)
+        self.assertEqual(kinds(LexicalAnalyzer().scan(code))[0], ("PROGRAM", "sidentificador"))
+
+    def test_fingerprint(self):
+        """Teste: Dialetos diferentes têm impressões digitais diferentes, e portanto caches separados."""
+        fingerprints = {LexicalAnalyzer(spec=spec).fingerprint() for spec in DIALECTS.values()}
+        self.assertEqual(len(fingerprints), len(DIALECTS))
+
+
+if __name__ == '__main__':
+    unittest.main()
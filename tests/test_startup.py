@@ -0,0 +1,48 @@
+"""
+Módulo de Testes da Inicialização da Linha de Comando
+
+Este módulo verifica que a análise de um arquivo pequeno pela linha de comando não importa as
+dependências adiadas (`tabulate`, `asyncio`, pool de processos, `hashlib`, pandas e NumPy) e que a
+lista de formatos de `main.py` acompanha a do módulo de exportação. O tempo total é verificado por
+`benchmarks/bench_startup.py`, que não faz parte dos testes por depender da máquina.
+
+Classes:
+    - TestStartup: Testa as importações feitas pela linha de comando.
+"""
+
+import subprocess
+import sys
+import unittest
+from analyzer.export import FORMATS
+from benchmarks.bench_startup import MAIN, heavy_modules, parse_importtime
+from benchmarks.samples import sample_paths
+from main import EXPORT_FORMATS
+
+
+class TestStartup(unittest.TestCase):
+    """Testes da inicialização de `main.py`."""
+
+    def test_export_formats(self):
+        """Teste: Os formatos de `--format` são os do módulo de exportação."""
+        self.assertEqual(list(EXPORT_FORMATS), list(FORMATS))
+
+    def test_parse_importtime(self):
+        """Teste: A saída de `-X importtime` é convertida em tempos por módulo, com o recuo preservado."""
+        output = ("import time: self [us] | cumulative | imported package\n"
+                  "import time:       120 |        300 |   _json\n"
+                  "import time:       180 |        480 | json\n")
+        times = parse_importtime(output)
+        self.assertEqual(times, {"  _json": (120, 300), "json": (180, 480)})
+        self.assertEqual(heavy_modules(["json", "  asyncio.events", "concurrent.futures.process", "concurrent"]),
+                         ["asyncio.events", "concurrent.futures.process"])
+
+    def test_no_heavy_imports(self):
+        """Teste: Analisar um arquivo com `--format none` não importa as dependências adiadas."""
+        process = subprocess.run([sys.executable, "-X", "importtime", MAIN, sample_paths()[0], "--format", "none"],
+                                 check=True, capture_output=True, text=True)
+        self.assertIn("tokens encontrados", process.stderr)
+        self.assertEqual(heavy_modules(parse_importtime(process.stderr)), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
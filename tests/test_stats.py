@@ -0,0 +1,76 @@
+"""
+Módulo de Testes das Estatísticas de Tokens
+
+Este módulo verifica a classe `TokenStatistics`, comparando os relatórios vetorizados com contagens
+feitas diretamente sobre a saída de `LexicalAnalyzer.tokenize`.
+
+Classes:
+    - TestTokenStatistics: Testa as contagens por tipo, por linha e de identificadores.
+"""
+
+import glob
+import os
+import unittest
+from collections import Counter
+from analyzer.analyzer import LexicalAnalyzer, Token
+from analyzer.stats import TokenStatistics
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TestTokenStatistics(unittest.TestCase):
+    """Testes de `TokenStatistics`."""
+
+    def setUp(self):
+        """Inicializa o analisador, as estatísticas dos exemplos e os tokens de referência."""
+        self.analyzer = LexicalAnalyzer()
+        self.stats = TokenStatistics(self.analyzer)
+        self.expected = {}
+        for path in sorted(glob.glob(os.path.join(ROOT, "codigo*.lpd"))):
+            self.stats.add_file(path)
+            with open(path, "r", encoding="utf-8") as file:
+                self.expected[path] = self.analyzer.tokenize(file.read())
+
+    def test_type_counts(self):
+        """Teste: As contagens por tipo coincidem com as da lista de tuplas."""
+        counts = Counter(token.type.name for tokens in self.expected.values() for _, token, _ in tokens)
+        self.assertEqual({name: count for name, count in self.stats.type_counts().items() if count}, dict(counts))
+
+    def test_line_density(self):
+        """Teste: A quantidade de tokens por linha coincide com a da lista de tuplas."""
+        density = self.stats.line_density()["tokens"]
+        counts = Counter((path, line) for path, tokens in self.expected.items() for _, _, line in tokens)
+        self.assertEqual(dict(density.items()), dict(counts))
+        longest = self.stats.longest_lines(1, by="tokens")
+        self.assertEqual(longest["tokens"].iloc[0], max(counts.values()))
+
+    def test_identifier_frequencies(self):
+        """Teste: A frequência de identificadores coincide com a da lista de tuplas."""
+        counts = Counter(lexeme for tokens in self.expected.values() for lexeme, token, _ in tokens
+                         if token.type is Token.SIDENTIFICADOR)
+        self.assertEqual(dict(self.stats.identifier_frequencies().items()), dict(counts))
+        self.assertEqual(len(self.stats.identifier_frequencies(top=3)), 3)
+
+    def test_empty_and_foreign_streams(self):
+        """Teste: Estatísticas vazias funcionam e tokens de outra tabela são rejeitados."""
+        empty = TokenStatistics(self.analyzer)
+        empty.add(self.analyzer.scan_stream(""))
+        self.assertEqual(empty.type_counts().sum(), 0)
+        self.assertEqual(len(empty.identifier_frequencies()), 0)
+        with self.assertRaises(ValueError):
+            empty.add(LexicalAnalyzer().scan_stream("a"))
+
+    def test_error_tokens(self):
+        """Teste: Com a política de erros `"token"`, os tokens de erro são contados com o tipo `serro`."""
+        analyzer = LexicalAnalyzer(error_policy="token")
+        stats = TokenStatistics(analyzer)
+        stats.add(analyzer.scan_stream("x := 1 @ 2;\n"), "f")
+        stats.add(analyzer.scan_stream("y := ?;\n"), "g")
+        self.assertEqual(stats.type_counts()["serro"], 2)
+        self.assertEqual(stats.type_counts_by_file()["serro"].to_dict(), {"f": 1, "g": 1})
+        with self.assertRaises(ValueError):
+            stats.add(self.analyzer.scan_stream("a"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+"""
+Módulo de Testes da Representação Colunar
+
+Este módulo verifica que `LexicalAnalyzer.scan_stream` produz os mesmos tokens que
+`LexicalAnalyzer.tokenize` e que `TokenStream` se comporta como a lista de tuplas.
+
+Classes:
+    - TestTokenStream: Testa a iteração, o acesso por índice e os lexemas do `TokenStream`.
+"""
+
+import glob
+import os
+import random
+import unittest
+from analyzer.analyzer import LexicalAnalyzer, Token
+from analyzer.stream import TokenStream
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TestTokenStream(unittest.TestCase):
+    """Testes de `TokenStream` e `scan_stream`."""
+
+    def setUp(self):
+        """Inicializa o analisador léxico antes de cada teste."""
+        self.analyzer = LexicalAnalyzer()
+
+    def test_samples(self):
+        """Teste: Os exemplos produzem os mesmos tokens que `tokenize`."""
+        for path in sorted(glob.glob(os.path.join(ROOT, "codigo*.lpd"))):
+            with open(path, "r", encoding="utf-8") as file:
+                code = file.read()
+            self.assertEqual(self.analyzer.scan_stream(code).to_list(), self.analyzer.tokenize(code), path)
+
+    def test_random_inputs(self):
+        """Teste: Entradas aleatórias produzem os mesmos tokens que `tokenize`."""
+        alphabet = "ab1_ {}'\"\n\r:=<>!/.;é\x85\t9"
+        rng = random.Random(0)
+        for _ in range(500):
+            text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+            self.assertEqual(self.analyzer.scan_stream(text), self.analyzer.tokenize(text), repr(text))
+
+    def test_sequence_interface(self):
+        """Teste: Índices, fatias e desempacotamento seguem o formato das tuplas."""
+        stream = self.analyzer.scan_stream("program teste; { comentário }\nA := 'b';")
+        expected = self.analyzer.tokenize("program teste; { comentário }\nA := 'b';")
+        self.assertIsInstance(stream, TokenStream)
+        self.assertEqual(len(stream), len(expected))
+        self.assertEqual(stream[0], ("program", stream[0][1], 1))
+        self.assertIs(stream[0][1].type, Token.SPROGRAM)
+        self.assertEqual(stream[-1], expected[-1])
+        self.assertEqual(stream[1:3], expected[1:3])
+        self.assertEqual(stream.lexeme(3), "A")
+        self.assertEqual([line for _, _, line in stream], [line for _, _, line in expected])
+        self.assertEqual(stream.nbytes, len(stream) * 14)
+
+    def test_slots(self):
+        """Teste: `Token` e `TokenType` não aceitam atributos fora de `__slots__`."""
+        with self.assertRaises(AttributeError):
+            Token.SPROGRAM.extra = 1
+        with self.assertRaises(AttributeError):
+            self.analyzer.tokens[0].extra = 1
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+"""
+Módulo de Testes do Modo de Observação
+
+Este módulo verifica o `TreeWatcher`: a análise inicial de uma árvore, a reanálise apenas dos
+arquivos alterados, o descarte das alterações de metadados sem mudança de conteúdo, a remoção de
+arquivos e as consultas ao índice.
+
+Classes:
+    - TestTreeWatcher: Testa a observação de uma árvore temporária de arquivos `.lpd`.
+"""
+
+import os
+import tempfile
+import threading
+import unittest
+from analyzer.analyzer import LexicalAnalyzer
+from analyzer.watch import TreeWatcher
+
+MAIN = "program Principal;\nvar Total: int;\nbegin\n  Total := 1;\n  Total := Total + Passo\nend."
+LIBRARY = "program Biblioteca;\nvar Passo: int;\nbegin Passo := 2 end."
+
+
+class TestTreeWatcher(unittest.TestCase):
+    """Testes de `TreeWatcher`."""
+
+    def setUp(self):
+        """Cria uma árvore com dois arquivos `.lpd` e um arquivo ignorado."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.root = self.directory.name
+        os.mkdir(os.path.join(self.root, "lib"))
+        self.main = self.write("principal.lpd", MAIN)
+        self.library = self.write(os.path.join("lib", "biblioteca.lpd"), LIBRARY)
+        self.write("notas.txt", "Total")
+        self.watcher = TreeWatcher([self.root])
+
+    def write(self, name, text, mtime_ns=None):
+        """Grava um arquivo da árvore, opcionalmente com um `mtime` fixo, e retorna seu caminho."""
+        path = os.path.normpath(os.path.join(self.root, name))
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(text)
+        if mtime_ns is not None:
+            os.utime(path, ns=(mtime_ns, mtime_ns))
+        return path
+
+    def test_initial(self):
+        """Teste: A primeira atualização analisa todos os arquivos com a extensão observada."""
+        update = self.watcher.refresh()
+        self.assertEqual(sorted(update.added), sorted([self.main, self.library]))
+        self.assertEqual(update.scanned, 2)
+        self.assertEqual(self.watcher.files[self.main].tokens, len(LexicalAnalyzer().scan(MAIN)))
+        self.assertEqual(self.watcher.files_using("Passo"), sorted([self.main, self.library]))
+        self.assertEqual(self.watcher.occurrences("Total"), {self.main: [2, 4, 5]})
+        counts = self.watcher.type_counts()
+        self.assertEqual(counts["sprogram"], 2)
+        self.assertEqual(counts["sidentificador"], 9)
+        self.assertEqual(self.watcher.type_counts(self.library)["sidentificador"], 3)
+
+    def test_unchanged(self):
+        """Teste: Arquivos inalterados, ou alterados apenas nos metadados, não são reanalisados."""
+        self.watcher.refresh()
+        self.assertFalse(self.watcher.refresh())
+        os.utime(self.main, ns=(1, 1))
+        update = self.watcher.refresh()
+        self.assertFalse(update)
+        self.assertEqual(update.touched, [self.main])
+        self.assertEqual(self.watcher.analyses, 2)
+
+    def test_modified(self):
+        """Teste: Apenas o arquivo alterado é reanalisado, e o índice reflete o novo conteúdo."""
+        self.watcher.refresh()
+        self.write("principal.lpd", MAIN.replace("Passo", "Incremento"))
+        update = self.watcher.refresh()
+        self.assertEqual((update.modified, update.added, update.removed), ([self.main], [], []))
+        self.assertEqual(self.watcher.analyses, 3)
+        self.assertEqual(self.watcher.files_using("Passo"), [self.library])
+        self.assertEqual(self.watcher.files_using("Incremento"), [self.main])
+
+    def test_same_mtime(self):
+        """Teste: Uma alteração recente é detectada mesmo que o `mtime` e o tamanho não mudem."""
+        self.watcher.refresh()
+        stat = os.stat(self.main)
+        self.write("principal.lpd", MAIN.replace("Passo", "Valor"), mtime_ns=stat.st_mtime_ns)
+        self.assertEqual(self.watcher.refresh().modified, [self.main])
+        self.assertEqual(self.watcher.files_using("Valor"), [self.main])
+
+    def test_added_and_removed(self):
+        """Teste: Arquivos novos são analisados e os removidos deixam o índice."""
+        self.watcher.refresh()
+        os.remove(self.library)
+        extra = self.write("extra.lpd", "program Extra; begin Passo := 3 end.")
+        update = self.watcher.refresh()
+        self.assertEqual((update.added, update.removed), ([extra], [self.library]))
+        self.assertEqual(self.watcher.files_using("Passo"), sorted([self.main, extra]))
+        self.assertEqual(self.watcher.files_using("Biblioteca"), [])
+        self.assertEqual(self.watcher.type_counts()["sprogram"], 2)
+        os.remove(extra)
+        os.remove(self.main)
+        self.watcher.refresh()
+        self.assertEqual((self.watcher.files, self.watcher.type_counts()), ({}, {}))
+
+    def test_failures(self):
+        """Teste: Um arquivo que não é UTF-8 é registrado com erro, sem interromper os demais."""
+        path = os.path.join(self.root, "binario.lpd")
+        with open(path, "wb") as file:
+            file.write(b"\xff\xfe")
+        update = self.watcher.refresh()
+        self.assertEqual(update.failed, [path])
+        self.assertIsNotNone(self.watcher.files[path].error)
+        self.assertEqual(len(update.added), 3)
+
+    @unittest.skipUnless(hasattr(os, "symlink"), "links simbólicos indisponíveis")
+    def test_symlink_loop(self):
+        """Teste: Um link simbólico para um diretório ancestral não faz o percurso entrar em ciclo."""
+        try:
+            os.symlink(self.root, os.path.join(self.root, "lib", "raiz"), target_is_directory=True)
+        except OSError:
+            self.skipTest("sem permissão para criar links simbólicos")
+        update = self.watcher.refresh()
+        self.assertEqual(sorted(update.added), sorted([self.main, self.library]))
+
+    def test_watch(self):
+        """Teste: `watch` produz a atualização inicial e termina quando o evento é sinalizado."""
+        stop = threading.Event()
+        updates = self.watcher.watch(interval=0.01, stop=stop)
+        self.assertEqual(len(next(updates).added), 2)
+        stop.set()
+        self.assertEqual(list(updates), [])
+
+
+if __name__ == '__main__':
+    unittest.main()